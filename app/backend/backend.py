@@ -1,19 +1,23 @@
 # ============================================================================
 # IMPORTS
 # ============================================================================
-import json
 import asyncio
 import threading
 import time
-import queue
 import logging
 import math
+import functools
 from typing import Optional
+import numpy as np
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds, BrainFlowError
-from brainflow.data_filter import DataFilter, FilterTypes, AggOperations
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import fft as sp_fft
+from scipy.signal import butter, sosfiltfilt
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -28,59 +32,100 @@ WINDOW_SECONDS = 3   # Use 3 seconds of data
 # ============================================================================
 # BRAINFLOW FUNCTIONS (only called when connect button is pressed)
 # ============================================================================
-def calculate_alpha_beta_ratio(data, eeg_channels, sampling_rate):
+def design_bandpass(sampling_rate):
+    """1-50 Hz 4th-order Butterworth band-pass as second-order sections."""
+    return butter(4, [1.0, 50.0], btype="band", fs=sampling_rate, output="sos")
+
+@functools.lru_cache(maxsize=8)
+def _welch_layout(sampling_rate, nperseg):
+    """Frequency axis and one-sided density scale for welch_psd (read-only, cached)."""
+    freqs = np.fft.rfftfreq(nperseg, 1.0 / sampling_rate)
+    scale = np.full(freqs.shape[0], 2.0 / (sampling_rate * nperseg))
+    scale[0] /= 2.0  # DC has no negative-frequency twin
+    if nperseg % 2 == 0:
+        scale[-1] /= 2.0  # neither does Nyquist
+    freqs.flags.writeable = False
+    scale.flags.writeable = False
+    return freqs, scale
+
+def welch_psd(eeg, sampling_rate, nperseg=256, noverlap=128):
+    """One-sided Welch PSD of each row of eeg (boxcar window, no detrend).
+    
+    Matches scipy.signal.welch(eeg, sampling_rate, window="boxcar", nperseg=nperseg,
+    noverlap=noverlap, detrend=False, axis=1), but every segment of every channel
+    goes through one batched rfft instead of welch's per-call setup.
+    """
+    nperseg = min(nperseg, eeg.shape[1])
+    step = nperseg - min(noverlap, nperseg - 1)
+    freqs, scale = _welch_layout(sampling_rate, nperseg)
+    segments = sliding_window_view(eeg, nperseg, axis=1)[:, ::step]  # (channels, segs, nperseg) view
+    spec = np.abs(sp_fft.rfft(segments, axis=-1))
+    spec *= spec
+    psd = spec.mean(axis=1)
+    psd *= scale
+    return freqs, psd
+
+@functools.lru_cache(maxsize=8)
+def band_edges(sampling_rate, nperseg):
+    """PSD bin offsets splitting alpha/beta into [8, 13) | {13} | (13, 30] Hz.
+    
+    Alpha is 8-13 Hz and beta 13-30 Hz, both inclusive, so they share the 13 Hz bin;
+    the middle segment is empty when no bin sits exactly on 13 Hz.
+    """
+    freqs = np.fft.rfftfreq(nperseg, 1.0 / sampling_rate)
+    a_lo, edge_lo = np.searchsorted(freqs, [8.0, 13.0], side="left")
+    edge_hi, b_hi = np.searchsorted(freqs, [13.0, 30.0], side="right")
+    return int(a_lo), int(edge_lo), int(edge_hi), int(b_hi)
+
+def calculate_alpha_beta_ratio(data, eeg_channels, sampling_rate, band_sos=None):
     """Calculate alpha/beta ratio from EEG data."""
+    # Only the frontal pair feeds the ratio: take just the AF7/AF8 rows (channel
+    # order TP9, AF7, AF8, TP10) out of the full board array
+    return frontal_alpha_beta_ratio(data[list(eeg_channels[1:3])], sampling_rate, band_sos)
+
+def frontal_alpha_beta_ratio(frontal, sampling_rate, band_sos=None):
+    """Alpha/beta ratio from the (AF7, AF8) rows alone; frontal is left untouched."""
     try:
-        if data.shape[1] == 0:
+        if frontal.shape[1] == 0:
             return None
+        if band_sos is None:
+            band_sos = design_bandpass(sampling_rate)
         
-        bands = {}
-        for ch in eeg_channels:
-            DataFilter.detrend(data[ch], AggOperations.MEAN.value)
-            DataFilter.perform_bandpass(data[ch], sampling_rate, 1.0, 50.0, 4, FilterTypes.BUTTERWORTH.value, 0)
-            psd = DataFilter.get_psd_welch(data[ch], nfft=256, overlap=128, sampling_rate=sampling_rate, window=0)
-            bands[ch] = {
-                "alpha": DataFilter.get_band_power(psd, 8.0, 13.0),
-                "beta": DataFilter.get_band_power(psd, 13.0, 30.0),
-            }
+        # detrend into a fresh float64 block, then band-pass both rows at once
+        eeg = np.subtract(frontal, frontal.mean(axis=1, keepdims=True), dtype=np.float64)
+        eeg = sosfiltfilt(band_sos, eeg, axis=1)
         
-        TP9, AF7, AF8, TP10 = eeg_channels[0], eeg_channels[1], eeg_channels[2], eeg_channels[3]
-        total_alpha = bands[AF7]["alpha"] + bands[AF8]["alpha"]
-        total_beta = bands[AF7]["beta"] + bands[AF8]["beta"]
+        nperseg = min(256, eeg.shape[1])
+        _, psd = welch_psd(eeg, sampling_rate, nperseg=nperseg, noverlap=128)
+        df = sampling_rate / nperseg
+        # Sum [8, 13) | {13} | (13, 30] Hz in one reduceat pass over fixed bin offsets
+        a_lo, edge_lo, edge_hi, b_hi = band_edges(sampling_rate, nperseg)
+        below, edge, above = np.add.reduceat(psd[:, :b_hi], [a_lo, edge_lo, edge_hi], axis=1).T
+        if edge_lo == edge_hi:
+            edge = 0.0
+        
+        total_alpha = (below + edge).sum() * df  # AF7 + AF8
+        total_beta = (edge + above).sum() * df
         
         if total_beta < 1e-6:
             return None
         
-        return total_alpha / (total_beta + 1e-6)
+        return float(total_alpha / (total_beta + 1e-6))  # plain float, not np.float64
     except Exception as e:
         logger.error(f"Error calculating ratio: {e}")
         return None
 
-def ratio_to_focus_percentage(ratio):
-    """Convert alpha/beta ratio to focus percentage (0-100%)."""
+def ratio_to_focus_percentage(ratio, midpoint=0.7):
+    """Convert alpha/beta ratio to focus percentage (0-100%).
+    
+    Inverted sigmoid centred on the calibrated midpoint; steepness controls
+    how quickly focus changes near it.
+    """
     if ratio is None:
         return 0.0
-    
-    # Map ratio [0.2, 3.0] to [100%, 0%] (inverted)
-    # ratio = max(0.2, min(3.0, ratio))
-    # normalized = 1.0 - ((ratio - 0.2) / 2.8)
-    # return max(0.0, min(100.0, normalized * 100.0))
-
-    # Parameters (dynamic midpoint learned via calibration)
-    try:
-        _mp = getattr(device_state, "calibration_midpoint", None)
-        if _mp is None and hasattr(device_state, "calibration"):
-            _mp = device_state.calibration.get("midpoint", 0.7)
-        midpoint = float(_mp) if _mp is not None else 0.7
-    except Exception:
-        midpoint = 0.7
-    steepness = 3.0     # controls how quickly focus changes near midpoint
-
-    focus_score = 1 / (1 + math.exp(steepness * (ratio - midpoint)))
-
-    # Scale to 0–100%
-    focus_percent = focus_score * 100
-    return round(focus_percent, 2)
+    steepness = 3.0
+    z = min(steepness * (ratio - midpoint), 50.0)  # keep exp() in range for outlier ratios
+    return round(100.0 / (1.0 + math.exp(z)), 2)
 
 # ============================================================================
 # DEVICE STATE
@@ -94,9 +139,15 @@ class DeviceState:
         self.alpha_beta_ratio = 0.0
         self.eeg_channels = None
         self.sampling_rate = 256
-        self.websocket_clients = []
+        self.band_sos = None
+        # Rolling AF7/AF8 buffer (2 rows x 2 windows) fed with only the newly read samples
+        self.eeg_buf: Optional[np.ndarray] = None
+        self.eeg_fill = 0
+        self.websocket_clients = set()
         self.streaming_thread: Optional[threading.Thread] = None
-        self.update_queue = queue.Queue()
+        # Set at startup; the streaming thread hands updates to the loop
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.update_queue: Optional[asyncio.Queue] = None
         # Calibration state
         self.calibration = {
             "phase": None,        # None | "relax" | "task"
@@ -105,31 +156,80 @@ class DeviceState:
             "task": [],          # list of ratios
             "midpoint": 0.7,
         }
-        self.calibration_midpoint = None
+        self.calibration_midpoint = 0.7  # copy of calibration["midpoint"] read by the worker
 
 device_state = DeviceState()
 
+def _enqueue_update(message: dict):
+    # Runs on the event loop; when the consumer falls behind, drop the stalest update
+    q = device_state.update_queue
+    if q.full():
+        q.get_nowait()
+    q.put_nowait(message)
+
+def publish_update(message: dict):
+    """Thread-safe hand-off of a focus update to the event loop."""
+    loop = device_state.loop
+    if loop is None or device_state.update_queue is None:
+        return
+    try:
+        loop.call_soon_threadsafe(_enqueue_update, message)
+    except RuntimeError:
+        pass  # loop already closed
+
+def push_eeg_samples(new_eeg, window):
+    """Append freshly read EEG samples (channels, k) to the rolling buffer.
+    
+    The buffer holds two windows; when it runs out of room the tail needed for the
+    next window is moved to the front, so the newest `window` samples are always one
+    contiguous slice. Returns that slice once a full window is available, else None.
+    """
+    n_ch, k = new_eeg.shape
+    buf = device_state.eeg_buf
+    if buf is None or buf.shape != (n_ch, 2 * window):
+        buf = device_state.eeg_buf = np.empty((n_ch, 2 * window))
+        device_state.eeg_fill = 0
+    fill = device_state.eeg_fill
+    
+    if k >= window:
+        buf[:, :window] = new_eeg[:, -window:]
+        fill = window
+    else:
+        if fill + k > buf.shape[1]:
+            keep = min(fill, window - k)
+            buf[:, :keep] = buf[:, fill - keep:fill]
+            fill = keep
+        buf[:, fill:fill + k] = new_eeg
+        fill += k
+    
+    device_state.eeg_fill = fill
+    return buf[:, fill - window:fill] if fill >= window else None
+
 def streaming_worker():
     """Background thread - only runs after connect button is pressed."""
     logger.info("Streaming worker started")
+    next_tick = time.monotonic()
     while device_state.is_streaming and device_state.is_connected:
         try:
             if device_state.board is None:
                 time.sleep(UPDATE_INTERVAL)
                 continue
             
+            # Read only what arrived since the last tick (this drains BrainFlow's
+            # buffer) and slide its AF7/AF8 rows into the rolling window
             samples_needed = int(device_state.sampling_rate * WINDOW_SECONDS)
-            data = device_state.board.get_current_board_data(samples_needed)
+            data = device_state.board.get_board_data()
+            frontal = push_eeg_samples(data[list(device_state.eeg_channels[1:3])], samples_needed)
             
-            if data.shape[1] < samples_needed:
+            if frontal is None:
                 time.sleep(0.1)
                 continue
             
-            ratio = calculate_alpha_beta_ratio(data, device_state.eeg_channels, device_state.sampling_rate)
+            ratio = frontal_alpha_beta_ratio(frontal, device_state.sampling_rate, device_state.band_sos)
             
             if ratio is not None:
                 device_state.alpha_beta_ratio = ratio
-                device_state.focus_percentage = ratio_to_focus_percentage(ratio)
+                device_state.focus_percentage = ratio_to_focus_percentage(ratio, device_state.calibration_midpoint)
                 # If calibration is active, collect samples for the current phase
                 try:
                     cal = device_state.calibration
@@ -141,16 +241,19 @@ def streaming_worker():
                 except Exception:
                     pass
                 
-                try:
-                    device_state.update_queue.put_nowait({
-                        "focus_percentage": device_state.focus_percentage,
-                        "alpha_beta_ratio": device_state.alpha_beta_ratio,
-                        "timestamp": time.time()
-                    })
-                except queue.Full:
-                    pass
+                publish_update({
+                    "focus_percentage": device_state.focus_percentage,
+                    "alpha_beta_ratio": device_state.alpha_beta_ratio,
+                    "timestamp": time.time()
+                })
             
-            time.sleep(UPDATE_INTERVAL)
+            # Sleep to the next deadline so processing time doesn't stretch the cadence;
+            # after a stall, restart the schedule from now instead of bursting to catch up
+            now = time.monotonic()
+            next_tick += UPDATE_INTERVAL
+            if next_tick <= now:
+                next_tick = now + UPDATE_INTERVAL
+            time.sleep(next_tick - now)
         except Exception as e:
             logger.error(f"Streaming error: {e}")
             time.sleep(1.0)
@@ -159,7 +262,7 @@ def streaming_worker():
 # ============================================================================
 # FASTAPI APP
 # ============================================================================
-app = FastAPI(title="Muse 2 Focus Tracker")
+app = FastAPI(title="Muse 2 Focus Tracker", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -172,6 +275,9 @@ app.add_middleware(
 # ============================================================================
 # WEBSOCKET HELPERS
 # ============================================================================
+KEEPALIVE_MSG = orjson.dumps({"type": "keepalive"}).decode()
+BROADCAST_BATCH = 50  # clients per gather before yielding back to the event loop
+
 async def broadcast_to_clients(message: dict):
     """Broadcast to all WebSocket clients."""
     if not device_state.websocket_clients:
@@ -183,31 +289,35 @@ async def broadcast_to_clients(message: dict):
         "timestamp": message["timestamp"]
     }
     
-    disconnected = []
-    for client in device_state.websocket_clients:
-        try:
-            await client.send_json(formatted)
-        except:
-            disconnected.append(client)
+    # Serialize once, then send to clients concurrently in batches, yielding to the
+    # event loop between batches; failed sends mark the client as gone
+    blob = orjson.dumps(formatted, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    clients = list(device_state.websocket_clients)
+    gone = []
+    for i in range(0, len(clients), BROADCAST_BATCH):
+        batch = clients[i:i + BROADCAST_BATCH]
+        results = await asyncio.gather(*(client.send_text(blob) for client in batch),
+                                       return_exceptions=True)
+        gone.extend(client for client, result in zip(batch, results) if isinstance(result, Exception))
+        if i + BROADCAST_BATCH < len(clients):
+            await asyncio.sleep(0)
     
-    for client in disconnected:
-        if client in device_state.websocket_clients:
-            device_state.websocket_clients.remove(client)
+    for client in gone:
+        device_state.websocket_clients.discard(client)
 
 async def process_update_queue():
     """Process updates from streaming worker."""
     while True:
+        message = await device_state.update_queue.get()
         try:
-            message = device_state.update_queue.get(timeout=0.1)
             await broadcast_to_clients(message)
-        except queue.Empty:
-            await asyncio.sleep(0.1)
         except Exception as e:
             logger.error(f"Queue error: {e}")
-            await asyncio.sleep(0.1)
 
 @app.on_event("startup")
 async def startup():
+    device_state.loop = asyncio.get_running_loop()
+    device_state.update_queue = asyncio.Queue(maxsize=8)
     asyncio.create_task(process_update_queue())
 
 # ============================================================================
@@ -258,6 +368,8 @@ async def connect_device(request: ConnectRequest):
         device_state.is_connected = True
         device_state.eeg_channels = eeg_channels
         device_state.sampling_rate = sampling_rate
+        device_state.band_sos = design_bandpass(sampling_rate)
+        device_state.eeg_buf = None
         device_state.is_streaming = True
         
         # Start streaming worker (runs BrainFlow processing)
@@ -312,27 +424,26 @@ async def get_focus():
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for live focus updates."""
     await websocket.accept()
-    device_state.websocket_clients.append(websocket)
+    device_state.websocket_clients.add(websocket)
     
     try:
-        await websocket.send_json({
+        await websocket.send_text(orjson.dumps({
             "focus_percentage": round(device_state.focus_percentage, 2),
             "alpha_beta_ratio": round(device_state.alpha_beta_ratio, 4),
             "is_connected": device_state.is_connected
-        })
+        }, option=orjson.OPT_SERIALIZE_NUMPY).decode())
         
         while True:
             try:
                 await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
             except asyncio.TimeoutError:
-                await websocket.send_json({"type": "keepalive"})
+                await websocket.send_text(KEEPALIVE_MSG)
             except WebSocketDisconnect:
                 break
-    except:
-        pass
+    except Exception as e:
+        logger.debug(f"Focus WebSocket closed: {e}")
     finally:
-        if websocket in device_state.websocket_clients:
-            device_state.websocket_clients.remove(websocket)
+        device_state.websocket_clients.discard(websocket)
 
 @app.on_event("shutdown")
 async def shutdown():
@@ -348,8 +459,9 @@ async def shutdown():
 
 
 # ================= RL MUSIC SERVICE =====================
-from rl_music import MusicSession
+from rl_music import MusicSession, CHUNK_SEC
 music_sessions = {}
+MUSIC_LEAD_SEC = 0.5  # how far ahead of real time the client buffer is kept
 
 @app.websocket("/ws/music")
 async def music_ws(ws: WebSocket):
@@ -362,13 +474,49 @@ async def music_ws(ws: WebSocket):
     recv_task = None
     stop_flag = False
 
+    # PCM is pulled from the session on a helper thread so the event loop never blocks on it
+    loop = asyncio.get_running_loop()
+    # one chunk in flight: together with the session queue this stays near MUSIC_LEAD_SEC
+    chunks: asyncio.Queue = asyncio.Queue(maxsize=1)
+    render_stop = threading.Event()
+
+    def render_loop():
+        # put() waits while the send queue is full (back-pressure)
+        try:
+            while not render_stop.is_set():
+                data = session.next_chunk()
+                fut = asyncio.run_coroutine_threadsafe(chunks.put(data), loop)
+                while not render_stop.is_set():
+                    try:
+                        fut.result(timeout=0.5)
+                        break
+                    except TimeoutError:
+                        continue
+                fut.cancel()
+        except Exception:
+            if render_stop.is_set():
+                return
+            logger.exception("Music render thread failed")
+            # None tells the sender to stop, which closes the socket
+            try:
+                asyncio.run_coroutine_threadsafe(chunks.put(None), loop)
+            except RuntimeError:
+                pass
+
     async def sender():
-        # stream binary PCM chunks forever until closed
+        # stream binary PCM chunks paced to real time (plus a small lead) until closed
         try:
+            deadline = loop.time()
             while True:
-                data = session.next_chunk()
+                data = await chunks.get()
+                if data is None:
+                    break
                 await ws.send_bytes(data)
-                await asyncio.sleep(0.0)  # yield
+                # play-out end time of what the client holds; restart from now after an underrun
+                deadline = max(deadline, loop.time()) + CHUNK_SEC
+                delay = deadline - loop.time() - MUSIC_LEAD_SEC
+                if delay > 0:
+                    await asyncio.sleep(delay)
         except Exception as e:
             pass
 
@@ -378,14 +526,14 @@ async def music_ws(ws: WebSocket):
             while True:
                 msg = await ws.receive_text()
                 try:
-                    payload = json.loads(msg)
+                    payload = orjson.loads(msg)
                 except Exception:
                     continue
                 t = payload.get("type")
                 if t == "focus":
                     session.set_focus(float(payload.get("value", 0.0)))
                 elif t == "volume":
-                    session.volume = float(payload.get("value", 0.8))
+                    session.set_volume(float(payload.get("value", 0.8)))
                 elif t == "skip":
                     session.skip()
                 elif t == "profile":
@@ -408,13 +556,16 @@ async def music_ws(ws: WebSocket):
             pass
 
     try:
+        threading.Thread(target=render_loop, daemon=True).start()
         send_task = asyncio.create_task(sender())
         recv_task = asyncio.create_task(receiver())
         await asyncio.wait([send_task, recv_task], return_when=asyncio.FIRST_COMPLETED)
     finally:
+        render_stop.set()
         if send_task: send_task.cancel()
         if recv_task: recv_task.cancel()
         music_sessions.pop(client_id, None)
+        await asyncio.to_thread(session.close)  # joins the generator; keep it off the event loop
         try:
             await ws.close()
         except Exception:
@@ -1,10 +1,11 @@
 # app/backend/rl_music.py
 # Ultra-slow ambient engine (numpy-only) with rare, crossfaded texture changes, based on reinforcement learning from BCI input to optimize flow state.
 
-import time, threading, queue, logging, math
+import time, threading, queue, logging, math, functools, random
 from dataclasses import dataclass, field
 from typing import Dict, Optional, List
 import numpy as np
+from scipy.signal import lfilter
 
 log = logging.getLogger("rl_music")
 log.setLevel(logging.INFO)
@@ -13,6 +14,12 @@ log.setLevel(logging.INFO)
 OUT_SR = 48_000
 CHUNK_SEC = 0.25
 CHUNK_SAMPLES = int(OUT_SR * CHUNK_SEC)
+QUEUE_CHUNKS = 2  # rendered-ahead chunks per session; keeps focus/volume latency ~0.5 s
+
+TWO_PI = 2.0 * np.pi
+
+# Shared sample-index ramp (renders never ask for more than one chunk)
+_IDX = np.arange(CHUNK_SAMPLES, dtype=np.float32)
 
 # ===== Textures (very soft sines w/ subtle harmonics) =====
 # name, vibrato semitones, detune cents, brightness [0..1]
@@ -22,24 +29,67 @@ TEXTURE_MODES = [
     ("glassy",    0.010, 12.0, 0.18),
 ]
 
+# Pad vibrato LFO rate (one period is tabulated per sample rate)
+VIB_RATE_HZ = 0.07
+
 # ===== RL (very conservative) =====
 RL_EPSILON = 0.06     # small exploration chance
 RL_DELAY_BARS = 8     # wait after a change (let the fade settle)
 RL_EVAL_BARS  = 8     # average focus over this many bars
 RL_UPDATE_PROB = 0.33 # sparse updates
 
+# Equal-tempered frequency of every MIDI note
+_HZ = 440.0 * 2.0 ** ((np.arange(128) - 69.0) / 12.0)
+
 def _hz(midi_note: float) -> float:
+    m = int(midi_note)
+    if m == midi_note and 0 <= m < 128:
+        return float(_HZ[m])
     return 440.0 * (2.0 ** ((midi_note - 69.0) / 12.0))
 
-def _softclip(x: np.ndarray, drive: float = 1.0) -> np.ndarray:
-    return np.tanh(x * drive, dtype=np.float32)
+def _aligned_empty(shape, dtype=np.float32, align: int = 64) -> np.ndarray:
+    """Uninitialized array whose data starts on an `align`-byte boundary (SIMD-friendly)."""
+    dt = np.dtype(dtype)
+    count = int(np.prod(shape))
+    raw = np.empty(count * dt.itemsize + align, dtype=np.uint8)
+    off = (-raw.ctypes.data) % align
+    return raw[off:off + count * dt.itemsize].view(dt).reshape(shape)
+
+def _idx(n: int) -> np.ndarray:
+    return _IDX[:n] if n <= CHUNK_SAMPLES else np.arange(n, dtype=np.float32)
+
+@functools.lru_cache(maxsize=8)
+def _fade_ramp(length: int) -> np.ndarray:
+    """Shared read-only 0 -> 1 ramp, sliced by position during a fade."""
+    ramp = np.linspace(0.0, 1.0, length, dtype=np.float32)
+    ramp.setflags(write=False)
+    return ramp
+
+@functools.lru_cache(maxsize=4)
+def _vib_table(sr: int) -> np.ndarray:
+    """One period of the pad vibrato LFO at sample rate sr (read-only)."""
+    size = int(round(sr / VIB_RATE_HZ))
+    tab = np.sin(TWO_PI * np.arange(size) / size).astype(np.float32)
+    tab.setflags(write=False)
+    return tab
+
+def _softclip(x: np.ndarray, drive: float = 1.0, out: Optional[np.ndarray] = None) -> np.ndarray:
+    if drive != 1.0:
+        x = np.multiply(x, np.float32(drive), out=out, dtype=np.float32)
+        out = x
+    return np.tanh(x, out=out)
 
 class SmoothParam:
     def __init__(self, initial: float, tau_s: float, sr: int):
         self.value = float(initial)
         self.alpha = math.exp(-1.0 / max(1, int(tau_s * sr)))
+        self._apn = self.alpha ** CHUNK_SAMPLES  # decay over one chunk, the usual step size
     def step(self, target: float, n: int) -> float:
-        self.value = self.value * (self.alpha ** n) + target * (1 - (self.alpha ** n))
+        an = self._apn if n == CHUNK_SAMPLES else self.alpha ** n
+        self.value = self.value * an + target * (1 - an)
+        return self.value
+    def step_chunk(self, target: float) -> float:
+        self.value = self.value * self._apn + target * (1 - self._apn)
         return self.value
 
 class OnePoleLPF:
@@ -47,26 +97,18 @@ class OnePoleLPF:
         rc = 1.0 / (2.0 * math.pi * max(10.0, cutoff_hz))
         self.a = math.exp(-1.0 / (rc * sr))
         self.y = 0.0
+        # y[i] = a*y[i-1] + (1-a)*x[i] as an IIR (b, a) pair for lfilter
+        self._b = np.array([1.0 - self.a], dtype=np.float32)
+        self._a = np.array([1.0, -self.a], dtype=np.float32)
     def process(self, x: np.ndarray) -> np.ndarray:
-        out = np.empty_like(x, dtype=np.float32)
-        a = self.a; y = float(self.y)
         xv = x.astype(np.float32, copy=False)
-        for i in range(xv.shape[0]):
-            y = a * y + (1.0 - a) * float(xv[i])
-            out[i] = y
-        self.y = y
-        return out
-
-class SineOsc:
-    def __init__(self, sr: int):
-        self.sr = sr
-        self.phase = 0.0
-    def render_inst(self, f_inst: np.ndarray) -> np.ndarray:
-        inc = 2*np.pi * f_inst / self.sr
-        ph = np.cumsum(inc, dtype=np.float32) + self.phase
-        y = np.sin(ph, dtype=np.float32)
-        self.phase = float(ph[-1] % (2*np.pi))
-        return y
+        if xv.shape[0] == 0:
+            return xv.copy()
+        # carry the previous output across chunks via the filter state
+        zi = np.array([self.a * self.y], dtype=np.float32)
+        out, _ = lfilter(self._b, self._a, xv, zi=zi)
+        self.y = float(out[-1])
+        return out.astype(np.float32, copy=False)
 
 class HarmPad:
     """Detuned multi-sine pad with faint 2nd harmonic. Super gentle."""
@@ -75,29 +117,62 @@ class HarmPad:
         self.vibr = 0.015
         self.detune_cents = 8.0
         self.bright = 0.12
-        self._vib_phase = 0.0
+        self._vib_tab = _vib_table(sr)
+        self._vib_idx = 0
+        self._det_mul = self._detune_factors(self.detune_cents)
+        # per-voice oscillator phase, carried across renders (one slot per chord note)
+        self._phase = np.zeros(4, dtype=np.float64)
+        # persistent work buffers: rows 0..3 hold voice phases, rows 4..7 their 2nd harmonics
+        self._ph = _aligned_empty((8, CHUNK_SAMPLES))
+        self._vib = _aligned_empty(CHUNK_SAMPLES)
+        self._mix = np.empty(8, np.float32)
+    @staticmethod
+    def _detune_factors(detune_cents: float) -> np.ndarray:
+        # pitch multipliers for the five detune slots (voice j uses slot j; at most 4 voices)
+        dets = np.array([-detune_cents, -detune_cents*0.5, 0.0,
+                         +detune_cents*0.5, +detune_cents]) / 100.0
+        return 2.0 ** dets
     def set_mode_params(self, vibr: float, detune_cents: float, bright: float):
         self.vibr = float(vibr); self.detune_cents = float(detune_cents); self.bright = float(bright)
-    def render(self, chord_midi: List[int], n: int) -> np.ndarray:
-        if not chord_midi: return np.zeros(n, np.float32)
-        out = np.zeros(n, np.float32)
-        t = (np.arange(n, dtype=np.float32)) / self.sr
-        vib = np.sin(2*np.pi*0.07*t + self._vib_phase).astype(np.float32) * self.vibr  # slower vibrato
-        self._vib_phase += 2*np.pi*0.07*(n/self.sr)
-        dets = np.array([-self.detune_cents, -self.detune_cents*0.5, 0.0,
-                          +self.detune_cents*0.5, +self.detune_cents], dtype=np.float32)/100.0
-        for i, note in enumerate(chord_midi[:4]):
-            f0 = _hz(note)
-            sem = vib + dets[i % len(dets)]*12.0
-            f_inst = f0 * (2.0 ** (sem / 12.0))
-            s1 = SineOsc(self.sr).render_inst(f_inst)
-            if self.bright > 0.0:
-                s2 = SineOsc(self.sr).render_inst(2.0*f_inst) * (0.20 * self.bright)
-                out += (s1 + s2).astype(np.float32)
-            else:
-                out += s1
-        out *= (0.16 / min(4, len(chord_midi)))
-        return out.astype(np.float32)
+        self._det_mul = self._detune_factors(self.detune_cents)
+    def render(self, chord_midi: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Render len(out) samples of the pad into out (overwritten) and return it."""
+        n = out.shape[0]
+        notes = chord_midi[:4]
+        k = len(notes)
+        if k == 0:
+            out.fill(0.0)
+            return out
+        if n > self._ph.shape[1]:
+            self._ph = _aligned_empty((8, n)); self._vib = _aligned_empty(n)
+        vib = self._vib[:n]
+        # slow vibrato read from the LFO table (a plain slice unless it wraps)
+        i = self._vib_idx
+        size = self._vib_tab.shape[0]
+        lfo = self._vib_tab[i:i+n] if i + n <= size else self._vib_tab.take(np.arange(i, i + n), mode="wrap")
+        self._vib_idx = (i + n) % size
+        # vibrato pitch multiplier 2**(vib/12), shared by every voice
+        np.multiply(lfo, np.float32(self.vibr / 12.0), out=vib)
+        np.exp2(vib, out=vib)
+        # all voices at once as a (voices, n) block: f0 * detune * vibrato * 2pi/sr, integrated
+        inc = (_HZ[notes] * self._det_mul[:k] * (TWO_PI / self.sr)).astype(np.float32)
+        rows = 2 * k if self.bright > 0.0 else k
+        block = self._ph[:rows, :n]
+        ph = block[:k]; harm = self._ph[k:2*k, :n]
+        np.multiply(inc[:, None], vib, out=harm)
+        np.cumsum(harm, axis=1, out=ph)
+        ph += self._phase[:k, None].astype(np.float32)
+        self._phase[:k] = ph[:, -1].astype(np.float64) % TWO_PI
+        # one phase ramp drives both the fundamental and its faint 2nd harmonic
+        if rows > k:
+            np.multiply(ph, np.float32(2.0), out=harm)
+        np.sin(block, out=block)
+        # weighted sum over rows: fundamentals at unit gain, harmonics at 0.2*bright
+        mix = self._mix[:rows]
+        mix[:k] = 0.16 / min(4, k)
+        mix[k:] = 0.16 / min(4, k) * 0.20 * self.bright
+        np.dot(mix, block, out=out)
+        return out
 
 class DroneOvertone:
     """
@@ -110,11 +185,16 @@ class DroneOvertone:
         self.sr = sr
         self.attack = math.exp(-1.0 / (1.0 * sr))   # 1s
         self.release = math.exp(-1.0 / (4.0 * sr))  # 4s
+        # attack**(i+1) for one chunk, so the envelope needs no per-sample loop
+        self._attack_pows = (self.attack ** np.arange(1, CHUNK_SAMPLES + 1)).astype(np.float32)
+        self._release_chunk = self.release ** CHUNK_SAMPLES
         self.env = 0.0
         self.phase = 0.0
         self.freq = 0.0
         self.gain = 0.06
         self.lpf = OnePoleLPF(sr, cutoff_hz=cutoff)
+        self._buf = _aligned_empty(CHUNK_SAMPLES)
+        self._env = _aligned_empty(CHUNK_SAMPLES)
     def set_freq(self, hz: float):
         # start a very gentle attack toward the new frequency
         self.freq = max(1.0, float(hz))
@@ -122,33 +202,38 @@ class DroneOvertone:
     def render(self, n: int) -> np.ndarray:
         if self.freq <= 0.0:
             return np.zeros(n, np.float32)
-        ph = self.phase + 2*np.pi*self.freq*np.arange(n, dtype=np.float32)/self.sr
-        s = np.sin(ph, dtype=np.float32)
-        # apply slow AR envelope (per-sample)
-        env = np.empty(n, np.float32); e = float(self.env)
-        for i in range(n):
-            # approach 1.0 slowly (attack), then multiply by slow release
-            e = 1.0 - (1.0 - e)*self.attack
-            env[i] = e
-        self.env = e * (self.release ** n)
-        y = self.lpf.process(s * env * self.gain)
-        self.phase = float(ph[-1] % (2*np.pi))
-        return y
+        if n > self._buf.shape[0]:
+            self._buf = _aligned_empty(n); self._env = _aligned_empty(n)
+        s = self._buf[:n]; env = self._env[:n]
+        inc = TWO_PI * self.freq / self.sr
+        np.multiply(_idx(n), np.float32(inc), out=s)
+        s += np.float32(self.phase)
+        self.phase = (self.phase + (n - 1) * inc) % TWO_PI
+        np.sin(s, out=s)
+        # slow AR envelope: closed form of e = 1 - (1 - e)*attack per sample,
+        # then the whole chunk's release applied to the carried state
+        pows = self._attack_pows[:n] if n <= CHUNK_SAMPLES else (self.attack ** np.arange(1, n + 1)).astype(np.float32)
+        np.multiply(pows, np.float32(self.env - 1.0), out=env)
+        env += np.float32(1.0)
+        self.env = float(env[-1]) * (self._release_chunk if n == CHUNK_SAMPLES else self.release ** n)
+        s *= env
+        s *= np.float32(self.gain)
+        return self.lpf.process(s)
 
 @dataclass
 class Bandit:
     epsilon: float = RL_EPSILON
-    values: Dict[int, float] = field(default_factory=lambda: {i: 0.0 for i in range(len(TEXTURE_MODES))})
-    counts: Dict[int, int] = field(default_factory=lambda: {i: 0 for i in range(len(TEXTURE_MODES))})
+    # per-texture running mean reward and pull count, indexed by TEXTURE_MODES position
+    values: np.ndarray = field(default_factory=lambda: np.zeros(len(TEXTURE_MODES), np.float64))
+    counts: np.ndarray = field(default_factory=lambda: np.zeros(len(TEXTURE_MODES), np.int32))
+    _rng: random.Random = field(default_factory=random.Random, repr=False)
     def select(self) -> int:
-        import random
-        if random.random() < self.epsilon or all(c == 0 for c in self.counts.values()):
-            return random.randrange(0, len(TEXTURE_MODES))
-        return max(self.values, key=self.values.get)
+        if self._rng.random() < self.epsilon or not self.counts.any():
+            return self._rng.randrange(0, len(TEXTURE_MODES))
+        return int(self.values.argmax())
     def update(self, idx: int, reward: float):
-        c = self.counts[idx] + 1
-        self.counts[idx] = c
-        self.values[idx] = self.values[idx] + (reward - self.values[idx]) / c
+        self.counts[idx] += 1
+        self.values[idx] += (reward - self.values[idx]) / self.counts[idx]
 
 class Engine:
     def __init__(self, sr: int = OUT_SR):
@@ -162,7 +247,7 @@ class Engine:
         # Key & progression (slow rotation)
         self.key_root = 48  # C3
         self.scale = [0,2,3,5,7,10]
-        self.chord_prog = self._make_progression()
+        self.chord_prog: np.ndarray = self._make_progression()  # (chords, 4) MIDI notes; row 0 sounds
         self.bars_per_chord = 8   # 8 bars per chord (~40s)
         self._bar_in_chord = 0
 
@@ -181,6 +266,9 @@ class Engine:
         self.xf_active = False
         self.xf_pos = 0
         self.xf_total = int(20.0 * sr)  # 20s morphs
+        # incoming pad render target and weight ramp during a crossfade, reused every chunk
+        self._scratch_padB = _aligned_empty(CHUNK_SAMPLES)
+        self._scratch_w = _aligned_empty(CHUNK_SAMPLES)
 
         # Drone overtone instead of arpeggio
         self.drone = DroneOvertone(sr, cutoff=600.0)
@@ -196,9 +284,11 @@ class Engine:
 
         # Startup fade
         self.fade_in_left = int(2.0 * sr)
+        self._fade_in = _fade_ramp(self.fade_in_left)
 
         # RL state (rare, delayed)
         self.bandit = Bandit()
+        self._rng = np.random.default_rng()
         self.focus_bar_hist: List[float] = []
         self.eval_queue: List[Dict[str, int]] = []
         self._focus_avg = 50.0
@@ -207,18 +297,21 @@ class Engine:
 
     # grid helpers
     def _sp16(self): return int(self.sr * 60.0 / max(1, self.tempo_bpm) / 4.0)
+    def _single_span(self, n: int) -> bool:
+        # no 16th-step edge inside the next n samples
+        return 0 < self.into and self.into + n < self.sp16
     def _make_progression(self):
         degs = [0, 3, 4, 2]
         roots = [(self.key_root + self.scale[d%len(self.scale)]) for d in degs]
-        return [[r, r+3, r+7, r+12] for r in roots]
+        return np.array([[r, r+3, r+7, r+12] for r in roots], dtype=np.int16)
 
     # focus -> master loudness (only; keep tempo fixed)
     def set_focus(self, f: float):
         f = float(np.clip(f, 0.0, 100.0))
-        fs = self.focus_s.step(f, CHUNK_SAMPLES)
+        fs = self.focus_s.step_chunk(f)
         self._focus_avg = 0.99 * self._focus_avg + 0.01 * fs
         target_master = 0.26 * (1.0 - 0.55*(fs/100.0))  # ~0.26 -> ~0.117
-        self.master.step(target_master, CHUNK_SAMPLES)
+        self.master.step_chunk(target_master)
 
         # If focus tanks and we held long enough, begin a *long* morph (still rare)
         if fs < 35.0 and not self.xf_active and self.bars_held >= self.hold_bars//2:
@@ -254,7 +347,7 @@ class Engine:
             avgf = float(np.mean(window))
             reward = ((avgf - 50.0) / 50.0) + 0.2 * np.sign(avgf - self._focus_avg)
             reward = float(np.clip(reward, -1.0, 1.0))
-            if np.random.rand() < RL_UPDATE_PROB:
+            if self._rng.random() < RL_UPDATE_PROB:
                 self.bandit.update(it["idx"], reward)
         self.eval_queue = keep
 
@@ -284,64 +377,86 @@ class Engine:
         if self.bars_held >= self.hold_bars and not self.xf_active:
             self._begin_texture_change(longer=True)
 
+    def _render_span(self, out: np.ndarray, master: np.float32) -> None:
+        """Mix pad (with any crossfade) and drone for one span of a chunk into out."""
+        take = out.shape[0]
+        chord = self.chord_prog[0]
+
+        # Pad with long crossfade: pad = padA + w*(padB - padA), rendered straight into out
+        pad = self.padA.render(chord, out)
+        if self.xf_active:
+            padB = self.padB.render(chord, self._scratch_padB[:take])
+            w_start = self.xf_pos / max(1, self.xf_total)
+            w_end   = (self.xf_pos + take) / max(1, self.xf_total)
+            # w_start..w_end inclusive (same points as linspace) from the shared index ramp
+            w = self._scratch_w[:take]
+            np.multiply(_idx(take), np.float32((w_end - w_start) / max(1, take - 1)), out=w)
+            w += np.float32(w_start)
+            padB -= pad
+            padB *= w
+            pad += padB
+            self.xf_pos += take
+            if self.xf_pos >= self.xf_total:
+                self.padA, self.padB = self.padB, self.padA
+                self.padB.set_mode_params(*TEXTURE_MODES[self.tex_idx][1:])
+                self.xf_active = False
+                self.xf_pos = 0
+
+        # Very soft drone; master gain folded into the mix: (pad*0.95 + drone) * master
+        pad *= master * np.float32(0.95)
+        drone = self.drone.render(take)
+        drone *= master
+        pad += drone
+
     def render_chunk(self) -> np.ndarray:
         n = CHUNK_SAMPLES
-        out = np.zeros(n, np.float32)
-        remain = n; idx = 0
-
-        while remain > 0:
-            step_left = self.sp16 - self.into
-            take = min(remain, step_left)
-
-            # bar boundary (every 16 steps)
-            if self.into == 0 and self.bar_step16 % 16 == 0:
-                # advance bar-in-chord; rotate only every N bars
-                self._bar_in_chord = (self._bar_in_chord + 1) % max(1, self.bars_per_chord)
-                if self._bar_in_chord == 0:
-                    self.chord_prog = self.chord_prog[1:] + self.chord_prog[:1]
-                self._maybe_change_bar()
-
-            chord = self.chord_prog[0]
-
-            # Pad with long crossfade
-            padA = HarmPad.render(self.padA, chord, take)
-            if self.xf_active:
-                padB = HarmPad.render(self.padB, chord, take)
-                w_start = self.xf_pos / max(1, self.xf_total)
-                w_end   = (self.xf_pos + take) / max(1, self.xf_total)
-                w = np.linspace(w_start, w_end, take, dtype=np.float32)
-                pad = (1.0 - w) * padA + w * padB
-                self.xf_pos += take
-                if self.xf_pos >= self.xf_total:
-                    self.padA, self.padB = self.padB, self.padA
-                    self.padB.set_mode_params(*TEXTURE_MODES[self.tex_idx][1:])
-                    self.xf_active = False
-                    self.xf_pos = 0
-            else:
-                pad = padA
-
-            # Very soft drone
-            drone = self.drone.render(take)
-
-            out[idx:idx+take] += (pad * 0.95 + drone * 1.0).astype(np.float32)
-
-            self.into += take
-            if self.into >= self.sp16:
-                self.into = 0
-                self.bar_step16 = (self.bar_step16 + 1) % 16
-
-            idx += take; remain -= take
-
-        # Master loudness (focus-ducked) + gentle limiter
-        out = _softclip(out * float(self.master.value), drive=1.0)
+        out = _aligned_empty(n)  # every sample is written by a pad render below
+        master = np.float32(self.master.value)  # focus-ducked loudness, fixed for the chunk
+
+        if self._single_span(n):
+            # common case: no 16th-step edge inside this chunk, so render it in one span
+            self._render_span(out, master)
+            self.into += n
+        else:
+            remain = n; idx = 0
+            while remain > 0:
+                step_left = self.sp16 - self.into
+                take = min(remain, step_left)
+
+                # bar boundary (every 16 steps)
+                if self.into == 0 and self.bar_step16 % 16 == 0:
+                    # advance bar-in-chord; rotate only every N bars
+                    self._bar_in_chord = (self._bar_in_chord + 1) % max(1, self.bars_per_chord)
+                    if self._bar_in_chord == 0:
+                        self.chord_prog = np.roll(self.chord_prog, -1, axis=0)
+                    self._maybe_change_bar()
+
+                self._render_span(out[idx:idx+take], master)
+
+                self.into += take
+                if self.into >= self.sp16:
+                    self.into = 0
+                    self.bar_step16 = (self.bar_step16 + 1) % 16
+
+                idx += take; remain -= take
+
+        # Gentle limiter, in place
+        _softclip(out, out=out)
 
         # startup fade
         if self.fade_in_left > 0:
             k = min(n, self.fade_in_left)
-            out[:k] *= np.linspace(0.0, 1.0, k, dtype=np.float32)
+            pos = self._fade_in.shape[0] - self.fade_in_left
+            out[:k] *= self._fade_in[pos:pos+k]
             self.fade_in_left -= k
 
-        return out.astype(np.float32)
+        return out
+
+    def render_chunk_i16(self) -> np.ndarray:
+        """render_chunk() quantized to full-scale int16 (the limiter keeps it within +-1)."""
+        out = self.render_chunk()
+        out *= np.float32(32767.0)
+        return out.astype(np.int16)
 
     # ===== Profile adaptation helpers =====
     def set_texture_index(self, idx: int):
@@ -435,7 +550,7 @@ class Engine:
 class MusicSession:
     volume: float = 0.8
     last_focus: float = 0.0
-    _q: "queue.Queue[bytes]" = field(default_factory=lambda: queue.Queue(maxsize=16))
+    _q: "queue.Queue[np.ndarray]" = field(default_factory=lambda: queue.Queue(maxsize=QUEUE_CHUNKS))  # int16 chunks
     _stop: threading.Event = field(default_factory=threading.Event)
     _gen_thread: Optional[threading.Thread] = None
     _engine: Engine = field(default_factory=lambda: Engine(OUT_SR))
@@ -463,16 +578,16 @@ class MusicSession:
         self._ensure_thread()
 
     def next_chunk(self) -> bytes:
+        """Next chunk of mono PCM as little-endian int16 bytes."""
         self._ensure_thread()
         try:
             data = self._q.get(timeout=1.0)
         except queue.Empty:
-            return (np.zeros(CHUNK_SAMPLES, dtype=np.float32) * self.volume).tobytes()
-        if self.volume != 1.0:
-            arr = np.frombuffer(data, dtype=np.float32).copy()
-            arr *= np.float32(self.volume)
-            return arr.tobytes()
-        return data
+            return np.zeros(CHUNK_SAMPLES, dtype="<i2").tobytes()
+        # the queued int16 chunk is ours alone: apply the volume in place
+        if self.volume < 1.0:
+            np.multiply(data, np.float32(self.volume), out=data, casting="unsafe")
+        return data.astype("<i2", copy=False).tobytes()
 
     def _start_thread(self):
         self._stop.clear()
@@ -480,6 +595,8 @@ class MusicSession:
         self._gen_thread.start()
 
     def _ensure_thread(self):
+        if self._stop.is_set():
+            return  # closed; do not revive the generator
         t = self._gen_thread
         if t is None or not t.is_alive():
             self._start_thread()
@@ -488,15 +605,19 @@ class MusicSession:
         log.info("Ambient generator thread starting.")
         try:
             while not self._stop.is_set():
-                if self._q.qsize() > 8:
+                free = self._q.maxsize - self._q.qsize()
+                if free <= 0:
                     time.sleep(0.02)
                     continue
-                self._engine.set_focus(self.last_focus)
-                chunk = self._engine.render_chunk().astype(np.float32)
-                try:
-                    self._q.put_nowait(chunk.tobytes())
-                except queue.Full:
-                    time.sleep(0.005)
+                # top the queue up in a short burst, never past its QUEUE_CHUNKS depth
+                for _ in range(min(4, free)):
+                    self._engine.set_focus(self.last_focus)
+                    chunk = self._engine.render_chunk_i16()
+                    try:
+                        self._q.put_nowait(chunk)
+                    except queue.Full:
+                        time.sleep(0.005)
+                        break
         except Exception as e:
             log.exception("Generator crashed: %s", e)
         finally:
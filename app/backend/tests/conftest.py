@@ -0,0 +1,5 @@
+import os
+import sys
+
+# backend.py and rl_music.py are run as top-level modules from app/backend
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
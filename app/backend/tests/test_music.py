@@ -0,0 +1,132 @@
+import queue
+import random
+
+import numpy as np
+import pytest
+
+from rl_music import CHUNK_SAMPLES, OUT_SR, DroneOvertone, Engine, MusicSession, OnePoleLPF
+
+
+@pytest.fixture
+def session():
+    s = MusicSession()
+    yield s
+    s.close()
+
+
+def _stopped_with(s, chunk):
+    """Stop the generator and queue one known int16 chunk."""
+    s.close()
+    while True:
+        try:
+            s._q.get_nowait()
+        except queue.Empty:
+            break
+    s._q.put_nowait(chunk)
+
+
+def test_next_chunk_is_int16_pcm(session):
+    data = session.next_chunk()
+    assert len(data) == CHUNK_SAMPLES * 2
+    pcm = np.frombuffer(data, dtype="<i2")
+    assert pcm.size == CHUNK_SAMPLES
+    assert np.abs(pcm).max() > 0  # the engine actually rendered something
+
+
+def test_next_chunk_applies_volume(session):
+    chunk = np.full(CHUNK_SAMPLES, 20000, dtype=np.int16)
+    chunk[::2] = -20000
+    _stopped_with(session, chunk.copy())
+    session.set_volume(0.5)
+    pcm = np.frombuffer(session.next_chunk(), dtype="<i2")
+    np.testing.assert_array_equal(pcm, chunk // 2)
+
+
+def test_next_chunk_volume_zero_is_silent(session):
+    _stopped_with(session, np.full(CHUNK_SAMPLES, 12345, dtype=np.int16))
+    session.set_volume(0.0)
+    assert not np.frombuffer(session.next_chunk(), dtype="<i2").any()
+
+
+def test_set_volume_clips(session):
+    session.set_volume(3.0)
+    assert session.volume == 1.0
+    session.set_volume(-1.0)
+    assert session.volume == 0.0
+
+
+def _engine(cls=Engine, seed=1):
+    e = cls(OUT_SR)
+    e._rng = np.random.default_rng(seed)
+    e.bandit._rng = random.Random(seed)
+    return e
+
+
+def _run(e, chunks):
+    out = []
+    for i in range(chunks):
+        e.set_focus(20.0 if i % 50 < 25 else 80.0)
+        out.append(e.render_chunk().copy())
+    return np.concatenate(out)
+
+
+def test_lpf_matches_recurrence():
+    lpf = OnePoleLPF(OUT_SR, cutoff_hz=600.0)
+    x = np.random.default_rng(0).standard_normal((5, CHUNK_SAMPLES)).astype(np.float32)
+    got = np.concatenate([lpf.process(chunk) for chunk in x])
+    ref = np.empty(x.size)
+    y = 0.0
+    for i, v in enumerate(x.ravel()):
+        y = lpf.a * y + (1.0 - lpf.a) * v
+        ref[i] = y
+    assert got.dtype == np.float32
+    np.testing.assert_allclose(got, ref, atol=1e-6)
+
+
+def test_drone_envelope_matches_loop():
+    d = DroneOvertone(OUT_SR)
+    d.set_freq(130.8)
+    d.env = 0.3
+    e = d.env
+    for _ in range(6):
+        d.render(CHUNK_SAMPLES)
+        ref = np.empty(CHUNK_SAMPLES)
+        for i in range(CHUNK_SAMPLES):
+            e = 1.0 - (1.0 - e) * d.attack
+            ref[i] = e
+        e *= d.release ** CHUNK_SAMPLES
+        np.testing.assert_allclose(d._env[:CHUNK_SAMPLES], ref, atol=1e-5)
+        assert d.env == pytest.approx(e, abs=1e-5)
+
+
+def test_single_span_matches_split_render():
+    class SplitEngine(Engine):
+        def _single_span(self, n):
+            return False
+
+    class CountingEngine(Engine):
+        single = 0
+
+        def _single_span(self, n):
+            hit = super()._single_span(n)
+            self.single += hit
+            return hit
+
+    fast, split = _engine(CountingEngine), _engine(SplitEngine)
+    for e in (fast, split):
+        e.set_tempo(24)  # long 16th steps, so most chunks take the single-span path
+        e._begin_texture_change()  # cover the crossfade path too
+    np.testing.assert_array_equal(_run(fast, 400), _run(split, 400))
+    assert fast.single > 100
+
+
+def test_startup_fade_rises_over_two_seconds():
+    faded, plain = _engine(), _engine()
+    plain.fade_in_left = 0
+    n = int(2.0 * OUT_SR)
+    a, b = _run(faded, n // CHUNK_SAMPLES + 2), _run(plain, n // CHUNK_SAMPLES + 2)
+    np.testing.assert_array_equal(a[n:], b[n:])  # fade done after 2 s
+    ok = np.abs(b[:n]) > 1e-3
+    gain = a[:n][ok] / b[:n][ok]
+    assert gain[0] < 0.01 and gain[-1] > 0.99
+    assert np.all(np.diff(gain) > -1e-4)  # one ramp, not one per chunk
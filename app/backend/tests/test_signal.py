@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+from scipy.signal import welch
+
+import backend
+
+SR = 256
+EEG_CHANNELS = [1, 2, 3, 4]  # Muse 2 rows: TP9, AF7, AF8, TP10
+
+
+def _board_window(seed=0, seconds=3, offset=0.0):
+    """Fake BrainFlow array: 6 rows, EEG rows carry 10 Hz alpha and 20 Hz beta."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(seconds * SR) / SR
+    data = rng.standard_normal((6, t.size)) * 5
+    for row in EEG_CHANNELS:
+        data[row] += 20 * np.sin(2 * np.pi * 10 * t) + 8 * np.sin(2 * np.pi * 20 * t) + offset
+    return data
+
+
+def test_ratio_is_plain_float():
+    ratio = backend.calculate_alpha_beta_ratio(_board_window(), EEG_CHANNELS, SR,
+                                               backend.design_bandpass(SR))
+    assert type(ratio) is float
+    assert ratio > 1.0  # alpha-dominated window
+
+
+def test_ratio_ignores_dc_offset():
+    sos = backend.design_bandpass(SR)
+    plain = backend.calculate_alpha_beta_ratio(_board_window(), EEG_CHANNELS, SR, sos)
+    offset = backend.calculate_alpha_beta_ratio(_board_window(offset=800.0), EEG_CHANNELS, SR, sos)
+    assert np.isclose(plain, offset, rtol=1e-6)
+
+
+def test_ratio_empty_window():
+    assert backend.calculate_alpha_beta_ratio(np.zeros((6, 0)), EEG_CHANNELS, SR) is None
+
+
+def test_push_eeg_samples_matches_sliding_window():
+    window = 64
+    rng = np.random.default_rng(1)
+    backend.device_state.eeg_buf = None
+    seen = np.empty((4, 0))
+    try:
+        for k in [5, 30, 1, 40, 17, 64, 3, 100, 0, 63, 2, 29, 50, 8, 11] * 3:
+            chunk = rng.standard_normal((4, k))
+            seen = np.hstack([seen, chunk])
+            got = backend.push_eeg_samples(chunk, window)
+            if seen.shape[1] < window:
+                assert got is None
+            else:
+                np.testing.assert_array_equal(got, seen[:, -window:])
+    finally:
+        backend.device_state.eeg_buf = None
+
+
+@pytest.mark.parametrize("n, nperseg, noverlap", [(768, 256, 128), (700, 255, 100), (513, 64, 0)])
+def test_welch_psd_matches_scipy(n, nperseg, noverlap):
+    eeg = np.random.default_rng(2).standard_normal((2, n))
+    freqs, psd = backend.welch_psd(eeg, SR, nperseg, noverlap)
+    ref_f, ref = welch(eeg, SR, window="boxcar", nperseg=nperseg, noverlap=noverlap,
+                       detrend=False, axis=1)
+    np.testing.assert_allclose(freqs, ref_f)
+    np.testing.assert_allclose(psd, ref, rtol=1e-10, atol=1e-15)
+
+
+def test_welch_psd_short_input():
+    # fewer samples than nperseg: one segment spanning the whole input
+    eeg = np.random.default_rng(3).standard_normal((2, 100))
+    freqs, psd = backend.welch_psd(eeg, SR)
+    ref_f, ref = welch(eeg, SR, window="boxcar", nperseg=100, noverlap=99, detrend=False, axis=1)
+    np.testing.assert_allclose(freqs, ref_f)
+    np.testing.assert_allclose(psd, ref, rtol=1e-10, atol=1e-15)
+
+
+def test_band_edges_shared_13hz_bin():
+    assert backend.band_edges(256, 256) == (8, 13, 14, 31)
+
+
+@pytest.mark.parametrize("sr, nperseg", [(256, 256), (250, 256), (256, 200), (200, 128)])
+def test_band_edges_match_inclusive_bands(sr, nperseg):
+    freqs = np.fft.rfftfreq(nperseg, 1.0 / sr)
+    a_lo, edge_lo, edge_hi, b_hi = backend.band_edges(sr, nperseg)
+    alpha = np.flatnonzero((freqs >= 8) & (freqs <= 13))
+    beta = np.flatnonzero((freqs >= 13) & (freqs <= 30))
+    np.testing.assert_array_equal(np.arange(a_lo, edge_hi), alpha)
+    np.testing.assert_array_equal(np.arange(edge_lo, b_hi), beta)
+
+
+def test_band_edges_without_13hz_bin():
+    a_lo, edge_lo, edge_hi, b_hi = backend.band_edges(250, 256)
+    assert edge_lo == edge_hi  # no bin on 13 Hz, nothing shared
+
+
+def test_frontal_ratio_matches_board_ratio():
+    data = _board_window(seed=4)
+    frontal = data[EEG_CHANNELS[1:3]]
+    before = frontal.copy()
+    sos = backend.design_bandpass(SR)
+    got = backend.frontal_alpha_beta_ratio(frontal, SR, sos)
+    assert got == backend.calculate_alpha_beta_ratio(data, EEG_CHANNELS, SR, sos)
+    np.testing.assert_array_equal(frontal, before)  # the rolling buffer must not be detrended in place
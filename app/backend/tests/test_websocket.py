@@ -0,0 +1,79 @@
+import asyncio
+
+import numpy as np
+import orjson
+import pytest
+from fastapi import WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+import backend
+from test_signal import EEG_CHANNELS, SR, _board_window
+
+
+class FakeClient:
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        self.sent.append(text)
+
+    async def receive_text(self):
+        raise WebSocketDisconnect()
+
+
+def _broadcast(ratio, client):
+    backend.device_state.websocket_clients = {client}
+    try:
+        asyncio.run(backend.broadcast_to_clients({
+            "focus_percentage": backend.ratio_to_focus_percentage(ratio),
+            "alpha_beta_ratio": ratio,
+            "timestamp": 0.0,
+        }))
+    finally:
+        backend.device_state.websocket_clients = set()
+    return orjson.loads(client.sent[-1])
+
+
+def test_broadcast_real_ratio():
+    ratio = backend.calculate_alpha_beta_ratio(_board_window(), EEG_CHANNELS, SR,
+                                               backend.design_bandpass(SR))
+    msg = _broadcast(ratio, FakeClient())
+    assert msg["alpha_beta_ratio"] == round(ratio, 4)
+
+
+def test_broadcast_numpy_ratio():
+    # np.float64 must not kill the broadcast (orjson rejects numpy scalars by default)
+    client = FakeClient()
+    msg = _broadcast(np.float64(0.7), client)
+    assert msg["alpha_beta_ratio"] == 0.7
+    assert msg["focus_percentage"] == 50.0
+
+
+def test_ws_initial_message_numpy_state():
+    backend.device_state.alpha_beta_ratio = np.float64(1.25)
+    backend.device_state.focus_percentage = np.float64(62.5)
+    client = FakeClient()
+    try:
+        asyncio.run(backend.websocket_endpoint(client))
+    finally:
+        backend.device_state.alpha_beta_ratio = 0.0
+        backend.device_state.focus_percentage = 0.0
+    msg = orjson.loads(client.sent[0])
+    assert msg["alpha_beta_ratio"] == 1.25
+    assert msg["focus_percentage"] == 62.5
+    assert client not in backend.device_state.websocket_clients
+
+
+def test_music_ws_closes_when_render_fails(monkeypatch):
+    class BrokenSession(backend.MusicSession):
+        def next_chunk(self):
+            raise RuntimeError("render failed")
+
+    monkeypatch.setattr(backend, "MusicSession", BrokenSession)
+    with TestClient(backend.app) as c, c.websocket_connect("/ws/music") as ws:
+        with pytest.raises(WebSocketDisconnect):
+            ws.receive_bytes()
+    assert not backend.music_sessions
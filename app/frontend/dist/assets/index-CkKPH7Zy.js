@@ -1,182 +0,0 @@
-var Nd=e=>{throw TypeError(e)};var Za=(e,t,n)=>t.has(e)||Nd("Cannot "+n);var T=(e,t,n)=>(Za(e,t,"read from private field"),n?n.call(e):t.get(e)),oe=(e,t,n)=>t.has(e)?Nd("Cannot add the same private member more than once"):t instanceof WeakSet?t.add(e):t.set(e,n),q=(e,t,n,r)=>(Za(e,t,"write to private field"),r?r.call(e,n):t.set(e,n),n),Fe=(e,t,n)=>(Za(e,t,"access private method"),n);var Yi=(e,t,n,r)=>({set _(o){q(e,t,o,n)},get _(){return T(e,t,r)}});function r0(e,t){for(var n=0;n<t.length;n++){const r=t[n];if(typeof r!="string"&&!Array.isArray(r)){for(const o in r)if(o!=="default"&&!(o in e)){const i=Object.getOwnPropertyDescriptor(r,o);i&&Object.defineProperty(e,o,i.get?i:{enumerable:!0,get:()=>r[o]})}}}return Object.freeze(Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}))}(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const o of document.querySelectorAll('link[rel="modulepreload"]'))r(o);new MutationObserver(o=>{for(const i of o)if(i.type==="childList")for(const s of i.addedNodes)s.tagName==="LINK"&&s.rel==="modulepreload"&&r(s)}).observe(document,{childList:!0,subtree:!0});function n(o){const i={};return o.integrity&&(i.integrity=o.integrity),o.referrerPolicy&&(i.referrerPolicy=o.referrerPolicy),o.crossOrigin==="use-credentials"?i.credentials="include":o.crossOrigin==="anonymous"?i.credentials="omit":i.credentials="same-origin",i}function r(o){if(o.ep)return;o.ep=!0;const i=n(o);fetch(o.href,i)}})();function Up(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var Vp={exports:{}},wa={},Wp={exports:{}},ee={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Fi=Symbol.for("react.element"),o0=Symbol.for("react.portal"),i0=Symbol.for("react.fragment"),s0=Symbol.for("react.strict_mode"),a0=Symbol.for("react.profiler"),l0=Symbol.for("react.provider"),u0=Symbol.for("react.context"),c0=Symbol.for("react.forward_ref"),d0=Symbol.for("react.suspense"),f0=Symbol.for("react.memo"),p0=Symbol.for("react.lazy"),Td=Symbol.iterator;function h0(e){return e===null||typeof e!="object"?null:(e=Td&&e[Td]||e["@@iterator"],typeof e=="function"?e:null)}var Hp={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Kp=Object.assign,Qp={};function No(e,t,n){this.props=e,this.context=t,this.refs=Qp,this.updater=n||Hp}No.prototype.isReactComponent={};No.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};No.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function qp(){}qp.prototype=No.prototype;function Zu(e,t,n){this.props=e,this.context=t,this.refs=Qp,this.updater=n||Hp}var ec=Zu.prototype=new qp;ec.constructor=Zu;Kp(ec,No.prototype);ec.isPureReactComponent=!0;var jd=Array.isArray,Gp=Object.prototype.hasOwnProperty,tc={current:null},Yp={key:!0,ref:!0,__self:!0,__source:!0};function Xp(e,t,n){var r,o={},i=null,s=null;if(t!=null)for(r in t.ref!==void 0&&(s=t.ref),t.key!==void 0&&(i=""+t.key),t)Gp.call(t,r)&&!Yp.hasOwnProperty(r)&&(o[r]=t[r]);var a=arguments.length-2;if(a===1)o.children=n;else if(1<a){for(var l=Array(a),u=0;u<a;u++)l[u]=arguments[u+2];o.children=l}if(e&&e.defaultProps)for(r in a=e.defaultProps,a)o[r]===void 0&&(o[r]=a[r]);return{$$typeof:Fi,type:e,key:i,ref:s,props:o,_owner:tc.current}}function m0(e,t){return{$$typeof:Fi,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function nc(e){return typeof e=="object"&&e!==null&&e.$$typeof===Fi}function v0(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var _d=/\/+/g;function el(e,t){return typeof e=="object"&&e!==null&&e.key!=null?v0(""+e.key):t.toString(36)}function Cs(e,t,n,r,o){var i=typeof e;(i==="undefined"||i==="boolean")&&(e=null);var s=!1;if(e===null)s=!0;else switch(i){case"string":case"number":s=!0;break;case"object":switch(e.$$typeof){case Fi:case o0:s=!0}}if(s)return s=e,o=o(s),e=r===""?"."+el(s,0):r,jd(o)?(n="",e!=null&&(n=e.replace(_d,"$&/")+"/"),Cs(o,t,n,"",function(u){return u})):o!=null&&(nc(o)&&(o=m0(o,n+(!o.key||s&&s.key===o.key?"":(""+o.key).replace(_d,"$&/")+"/")+e)),t.push(o)),1;if(s=0,r=r===""?".":r+":",jd(e))for(var a=0;a<e.length;a++){i=e[a];var l=r+el(i,a);s+=Cs(i,t,n,l,o)}else if(l=h0(e),typeof l=="function")for(e=l.call(e),a=0;!(i=e.next()).done;)i=i.value,l=r+el(i,a++),s+=Cs(i,t,n,l,o);else if(i==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return s}function Xi(e,t,n){if(e==null)return e;var r=[],o=0;return Cs(e,r,"","",function(i){return t.call(n,i,o++)}),r}function g0(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var Ge={current:null},bs={transition:null},y0={ReactCurrentDispatcher:Ge,ReactCurrentBatchConfig:bs,ReactCurrentOwner:tc};function Jp(){throw Error("act(...) is not supported in production builds of React.")}ee.Children={map:Xi,forEach:function(e,t,n){Xi(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return Xi(e,function(){t++}),t},toArray:function(e){return Xi(e,function(t){return t})||[]},only:function(e){if(!nc(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};ee.Component=No;ee.Fragment=i0;ee.Profiler=a0;ee.PureComponent=Zu;ee.StrictMode=s0;ee.Suspense=d0;ee.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=y0;ee.act=Jp;ee.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=Kp({},e.props),o=e.key,i=e.ref,s=e._owner;if(t!=null){if(t.ref!==void 0&&(i=t.ref,s=tc.current),t.key!==void 0&&(o=""+t.key),e.type&&e.type.defaultProps)var a=e.type.defaultProps;for(l in t)Gp.call(t,l)&&!Yp.hasOwnProperty(l)&&(r[l]=t[l]===void 0&&a!==void 0?a[l]:t[l])}var l=arguments.length-2;if(l===1)r.children=n;else if(1<l){a=Array(l);for(var u=0;u<l;u++)a[u]=arguments[u+2];r.children=a}return{$$typeof:Fi,type:e.type,key:o,ref:i,props:r,_owner:s}};ee.createContext=function(e){return e={$$typeof:u0,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:l0,_context:e},e.Consumer=e};ee.createElement=Xp;ee.createFactory=function(e){var t=Xp.bind(null,e);return t.type=e,t};ee.createRef=function(){return{current:null}};ee.forwardRef=function(e){return{$$typeof:c0,render:e}};ee.isValidElement=nc;ee.lazy=function(e){return{$$typeof:p0,_payload:{_status:-1,_result:e},_init:g0}};ee.memo=function(e,t){return{$$typeof:f0,type:e,compare:t===void 0?null:t}};ee.startTransition=function(e){var t=bs.transition;bs.transition={};try{e()}finally{bs.transition=t}};ee.unstable_act=Jp;ee.useCallback=function(e,t){return Ge.current.useCallback(e,t)};ee.useContext=function(e){return Ge.current.useContext(e)};ee.useDebugValue=function(){};ee.useDeferredValue=function(e){return Ge.current.useDeferredValue(e)};ee.useEffect=function(e,t){return Ge.current.useEffect(e,t)};ee.useId=function(){return Ge.current.useId()};ee.useImperativeHandle=function(e,t,n){return Ge.current.useImperativeHandle(e,t,n)};ee.useInsertionEffect=function(e,t){return Ge.current.useInsertionEffect(e,t)};ee.useLayoutEffect=function(e,t){return Ge.current.useLayoutEffect(e,t)};ee.useMemo=function(e,t){return Ge.current.useMemo(e,t)};ee.useReducer=function(e,t,n){return Ge.current.useReducer(e,t,n)};ee.useRef=function(e){return Ge.current.useRef(e)};ee.useState=function(e){return Ge.current.useState(e)};ee.useSyncExternalStore=function(e,t,n){return Ge.current.useSyncExternalStore(e,t,n)};ee.useTransition=function(){return Ge.current.useTransition()};ee.version="18.3.1";Wp.exports=ee;var p=Wp.exports;const M=Up(p),rc=r0({__proto__:null,default:M},[p]);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var w0=p,x0=Symbol.for("react.element"),S0=Symbol.for("react.fragment"),E0=Object.prototype.hasOwnProperty,C0=w0.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,b0={key:!0,ref:!0,__self:!0,__source:!0};function Zp(e,t,n){var r,o={},i=null,s=null;n!==void 0&&(i=""+n),t.key!==void 0&&(i=""+t.key),t.ref!==void 0&&(s=t.ref);for(r in t)E0.call(t,r)&&!b0.hasOwnProperty(r)&&(o[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)o[r]===void 0&&(o[r]=t[r]);return{$$typeof:x0,type:e,key:i,ref:s,props:o,_owner:C0.current}}wa.Fragment=S0;wa.jsx=Zp;wa.jsxs=Zp;Vp.exports=wa;var v=Vp.exports,eh={exports:{}},ct={},th={exports:{}},nh={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(R,j){var F=R.length;R.push(j);e:for(;0<F;){var H=F-1>>>1,U=R[H];if(0<o(U,j))R[H]=j,R[F]=U,F=H;else break e}}function n(R){return R.length===0?null:R[0]}function r(R){if(R.length===0)return null;var j=R[0],F=R.pop();if(F!==j){R[0]=F;e:for(var H=0,U=R.length,G=U>>>1;H<G;){var X=2*(H+1)-1,he=R[X],Se=X+1,te=R[Se];if(0>o(he,F))Se<U&&0>o(te,he)?(R[H]=te,R[Se]=F,H=Se):(R[H]=he,R[X]=F,H=X);else if(Se<U&&0>o(te,F))R[H]=te,R[Se]=F,H=Se;else break e}}return j}function o(R,j){var F=R.sortIndex-j.sortIndex;return F!==0?F:R.id-j.id}if(typeof performance=="object"&&typeof performance.now=="function"){var i=performance;e.unstable_now=function(){return i.now()}}else{var s=Date,a=s.now();e.unstable_now=function(){return s.now()-a}}var l=[],u=[],d=1,c=null,h=3,f=!1,S=!1,m=!1,x=typeof setTimeout=="function"?setTimeout:null,g=typeof clearTimeout=="function"?clearTimeout:null,y=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function w(R){for(var j=n(u);j!==null;){if(j.callback===null)r(u);else if(j.startTime<=R)r(u),j.sortIndex=j.expirationTime,t(l,j);else break;j=n(u)}}function E(R){if(m=!1,w(R),!S)if(n(l)!==null)S=!0,L(C);else{var j=n(u);j!==null&&W(E,j.startTime-R)}}function C(R,j){S=!1,m&&(m=!1,g(P),P=-1),f=!0;var F=h;try{for(w(j),c=n(l);c!==null&&(!(c.expirationTime>j)||R&&!z());){var H=c.callback;if(typeof H=="function"){c.callback=null,h=c.priorityLevel;var U=H(c.expirationTime<=j);j=e.unstable_now(),typeof U=="function"?c.callback=U:c===n(l)&&r(l),w(j)}else r(l);c=n(l)}if(c!==null)var G=!0;else{var X=n(u);X!==null&&W(E,X.startTime-j),G=!1}return G}finally{c=null,h=F,f=!1}}var b=!1,k=null,P=-1,O=5,_=-1;function z(){return!(e.unstable_now()-_<O)}function I(){if(k!==null){var R=e.unstable_now();_=R;var j=!0;try{j=k(!0,R)}finally{j?D():(b=!1,k=null)}}else b=!1}var D;if(typeof y=="function")D=function(){y(I)};else if(typeof MessageChannel<"u"){var N=new MessageChannel,B=N.port2;N.port1.onmessage=I,D=function(){B.postMessage(null)}}else D=function(){x(I,0)};function L(R){k=R,b||(b=!0,D())}function W(R,j){P=x(function(){R(e.unstable_now())},j)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(R){R.callback=null},e.unstable_continueExecution=function(){S||f||(S=!0,L(C))},e.unstable_forceFrameRate=function(R){0>R||125<R?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):O=0<R?Math.floor(1e3/R):5},e.unstable_getCurrentPriorityLevel=function(){return h},e.unstable_getFirstCallbackNode=function(){return n(l)},e.unstable_next=function(R){switch(h){case 1:case 2:case 3:var j=3;break;default:j=h}var F=h;h=j;try{return R()}finally{h=F}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(R,j){switch(R){case 1:case 2:case 3:case 4:case 5:break;default:R=3}var F=h;h=R;try{return j()}finally{h=F}},e.unstable_scheduleCallback=function(R,j,F){var H=e.unstable_now();switch(typeof F=="object"&&F!==null?(F=F.delay,F=typeof F=="number"&&0<F?H+F:H):F=H,R){case 1:var U=-1;break;case 2:U=250;break;case 5:U=1073741823;break;case 4:U=1e4;break;default:U=5e3}return U=F+U,R={id:d++,callback:j,priorityLevel:R,startTime:F,expirationTime:U,sortIndex:-1},F>H?(R.sortIndex=F,t(u,R),n(l)===null&&R===n(u)&&(m?(g(P),P=-1):m=!0,W(E,F-H))):(R.sortIndex=U,t(l,R),S||f||(S=!0,L(C))),R},e.unstable_shouldYield=z,e.unstable_wrapCallback=function(R){var j=h;return function(){var F=h;h=j;try{return R.apply(this,arguments)}finally{h=F}}}})(nh);th.exports=nh;var k0=th.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var P0=p,ut=k0;function A(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var rh=new Set,ui={};function jr(e,t){wo(e,t),wo(e+"Capture",t)}function wo(e,t){for(ui[e]=t,e=0;e<t.length;e++)rh.add(t[e])}var hn=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Ul=Object.prototype.hasOwnProperty,R0=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Ad={},Od={};function N0(e){return Ul.call(Od,e)?!0:Ul.call(Ad,e)?!1:R0.test(e)?Od[e]=!0:(Ad[e]=!0,!1)}function T0(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function j0(e,t,n,r){if(t===null||typeof t>"u"||T0(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function Ye(e,t,n,r,o,i,s){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=o,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=i,this.removeEmptyString=s}var Le={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){Le[e]=new Ye(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];Le[t]=new Ye(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){Le[e]=new Ye(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){Le[e]=new Ye(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){Le[e]=new Ye(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){Le[e]=new Ye(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){Le[e]=new Ye(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){Le[e]=new Ye(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){Le[e]=new Ye(e,5,!1,e.toLowerCase(),null,!1,!1)});var oc=/[\-:]([a-z])/g;function ic(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(oc,ic);Le[t]=new Ye(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(oc,ic);Le[t]=new Ye(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(oc,ic);Le[t]=new Ye(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){Le[e]=new Ye(e,1,!1,e.toLowerCase(),null,!1,!1)});Le.xlinkHref=new Ye("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){Le[e]=new Ye(e,1,!1,e.toLowerCase(),null,!0,!0)});function sc(e,t,n,r){var o=Le.hasOwnProperty(t)?Le[t]:null;(o!==null?o.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(j0(t,n,o,r)&&(n=null),r||o===null?N0(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):o.mustUseProperty?e[o.propertyName]=n===null?o.type===3?!1:"":n:(t=o.attributeName,r=o.attributeNamespace,n===null?e.removeAttribute(t):(o=o.type,n=o===3||o===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var Sn=P0.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,Ji=Symbol.for("react.element"),Vr=Symbol.for("react.portal"),Wr=Symbol.for("react.fragment"),ac=Symbol.for("react.strict_mode"),Vl=Symbol.for("react.profiler"),oh=Symbol.for("react.provider"),ih=Symbol.for("react.context"),lc=Symbol.for("react.forward_ref"),Wl=Symbol.for("react.suspense"),Hl=Symbol.for("react.suspense_list"),uc=Symbol.for("react.memo"),On=Symbol.for("react.lazy"),sh=Symbol.for("react.offscreen"),Md=Symbol.iterator;function Fo(e){return e===null||typeof e!="object"?null:(e=Md&&e[Md]||e["@@iterator"],typeof e=="function"?e:null)}var xe=Object.assign,tl;function qo(e){if(tl===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);tl=t&&t[1]||""}return`
-`+tl+e}var nl=!1;function rl(e,t){if(!e||nl)return"";nl=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(u){var r=u}Reflect.construct(e,[],t)}else{try{t.call()}catch(u){r=u}e.call(t.prototype)}else{try{throw Error()}catch(u){r=u}e()}}catch(u){if(u&&r&&typeof u.stack=="string"){for(var o=u.stack.split(`
-`),i=r.stack.split(`
-`),s=o.length-1,a=i.length-1;1<=s&&0<=a&&o[s]!==i[a];)a--;for(;1<=s&&0<=a;s--,a--)if(o[s]!==i[a]){if(s!==1||a!==1)do if(s--,a--,0>a||o[s]!==i[a]){var l=`
-`+o[s].replace(" at new "," at ");return e.displayName&&l.includes("<anonymous>")&&(l=l.replace("<anonymous>",e.displayName)),l}while(1<=s&&0<=a);break}}}finally{nl=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?qo(e):""}function _0(e){switch(e.tag){case 5:return qo(e.type);case 16:return qo("Lazy");case 13:return qo("Suspense");case 19:return qo("SuspenseList");case 0:case 2:case 15:return e=rl(e.type,!1),e;case 11:return e=rl(e.type.render,!1),e;case 1:return e=rl(e.type,!0),e;default:return""}}function Kl(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case Wr:return"Fragment";case Vr:return"Portal";case Vl:return"Profiler";case ac:return"StrictMode";case Wl:return"Suspense";case Hl:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case ih:return(e.displayName||"Context")+".Consumer";case oh:return(e._context.displayName||"Context")+".Provider";case lc:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case uc:return t=e.displayName||null,t!==null?t:Kl(e.type)||"Memo";case On:t=e._payload,e=e._init;try{return Kl(e(t))}catch{}}return null}function A0(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return Kl(t);case 8:return t===ac?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function Zn(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function ah(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function O0(e){var t=ah(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var o=n.get,i=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return o.call(this)},set:function(s){r=""+s,i.call(this,s)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(s){r=""+s},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function Zi(e){e._valueTracker||(e._valueTracker=O0(e))}function lh(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ah(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function Bs(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function Ql(e,t){var n=t.checked;return xe({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function Id(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=Zn(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function uh(e,t){t=t.checked,t!=null&&sc(e,"checked",t,!1)}function ql(e,t){uh(e,t);var n=Zn(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?Gl(e,t.type,n):t.hasOwnProperty("defaultValue")&&Gl(e,t.type,Zn(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function Dd(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function Gl(e,t,n){(t!=="number"||Bs(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Go=Array.isArray;function to(e,t,n,r){if(e=e.options,t){t={};for(var o=0;o<n.length;o++)t["$"+n[o]]=!0;for(n=0;n<e.length;n++)o=t.hasOwnProperty("$"+e[n].value),e[n].selected!==o&&(e[n].selected=o),o&&r&&(e[n].defaultSelected=!0)}else{for(n=""+Zn(n),t=null,o=0;o<e.length;o++){if(e[o].value===n){e[o].selected=!0,r&&(e[o].defaultSelected=!0);return}t!==null||e[o].disabled||(t=e[o])}t!==null&&(t.selected=!0)}}function Yl(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(A(91));return xe({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Ld(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(A(92));if(Go(n)){if(1<n.length)throw Error(A(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:Zn(n)}}function ch(e,t){var n=Zn(t.value),r=Zn(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function Fd(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function dh(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function Xl(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?dh(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var es,fh=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,o){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,o)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(es=es||document.createElement("div"),es.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=es.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function ci(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Zo={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},M0=["Webkit","ms","Moz","O"];Object.keys(Zo).forEach(function(e){M0.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Zo[t]=Zo[e]})});function ph(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||Zo.hasOwnProperty(e)&&Zo[e]?(""+t).trim():t+"px"}function hh(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,o=ph(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,o):e[n]=o}}var I0=xe({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function Jl(e,t){if(t){if(I0[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(A(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(A(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(A(61))}if(t.style!=null&&typeof t.style!="object")throw Error(A(62))}}function Zl(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var eu=null;function cc(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var tu=null,no=null,ro=null;function zd(e){if(e=Bi(e)){if(typeof tu!="function")throw Error(A(280));var t=e.stateNode;t&&(t=ba(t),tu(e.stateNode,e.type,t))}}function mh(e){no?ro?ro.push(e):ro=[e]:no=e}function vh(){if(no){var e=no,t=ro;if(ro=no=null,zd(e),t)for(e=0;e<t.length;e++)zd(t[e])}}function gh(e,t){return e(t)}function yh(){}var ol=!1;function wh(e,t,n){if(ol)return e(t,n);ol=!0;try{return gh(e,t,n)}finally{ol=!1,(no!==null||ro!==null)&&(yh(),vh())}}function di(e,t){var n=e.stateNode;if(n===null)return null;var r=ba(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(A(231,t,typeof n));return n}var nu=!1;if(hn)try{var zo={};Object.defineProperty(zo,"passive",{get:function(){nu=!0}}),window.addEventListener("test",zo,zo),window.removeEventListener("test",zo,zo)}catch{nu=!1}function D0(e,t,n,r,o,i,s,a,l){var u=Array.prototype.slice.call(arguments,3);try{t.apply(n,u)}catch(d){this.onError(d)}}var ei=!1,Us=null,Vs=!1,ru=null,L0={onError:function(e){ei=!0,Us=e}};function F0(e,t,n,r,o,i,s,a,l){ei=!1,Us=null,D0.apply(L0,arguments)}function z0(e,t,n,r,o,i,s,a,l){if(F0.apply(this,arguments),ei){if(ei){var u=Us;ei=!1,Us=null}else throw Error(A(198));Vs||(Vs=!0,ru=u)}}function _r(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function xh(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function $d(e){if(_r(e)!==e)throw Error(A(188))}function $0(e){var t=e.alternate;if(!t){if(t=_r(e),t===null)throw Error(A(188));return t!==e?null:e}for(var n=e,r=t;;){var o=n.return;if(o===null)break;var i=o.alternate;if(i===null){if(r=o.return,r!==null){n=r;continue}break}if(o.child===i.child){for(i=o.child;i;){if(i===n)return $d(o),e;if(i===r)return $d(o),t;i=i.sibling}throw Error(A(188))}if(n.return!==r.return)n=o,r=i;else{for(var s=!1,a=o.child;a;){if(a===n){s=!0,n=o,r=i;break}if(a===r){s=!0,r=o,n=i;break}a=a.sibling}if(!s){for(a=i.child;a;){if(a===n){s=!0,n=i,r=o;break}if(a===r){s=!0,r=i,n=o;break}a=a.sibling}if(!s)throw Error(A(189))}}if(n.alternate!==r)throw Error(A(190))}if(n.tag!==3)throw Error(A(188));return n.stateNode.current===n?e:t}function Sh(e){return e=$0(e),e!==null?Eh(e):null}function Eh(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Eh(e);if(t!==null)return t;e=e.sibling}return null}var Ch=ut.unstable_scheduleCallback,Bd=ut.unstable_cancelCallback,B0=ut.unstable_shouldYield,U0=ut.unstable_requestPaint,Pe=ut.unstable_now,V0=ut.unstable_getCurrentPriorityLevel,dc=ut.unstable_ImmediatePriority,bh=ut.unstable_UserBlockingPriority,Ws=ut.unstable_NormalPriority,W0=ut.unstable_LowPriority,kh=ut.unstable_IdlePriority,xa=null,Zt=null;function H0(e){if(Zt&&typeof Zt.onCommitFiberRoot=="function")try{Zt.onCommitFiberRoot(xa,e,void 0,(e.current.flags&128)===128)}catch{}}var Dt=Math.clz32?Math.clz32:q0,K0=Math.log,Q0=Math.LN2;function q0(e){return e>>>=0,e===0?32:31-(K0(e)/Q0|0)|0}var ts=64,ns=4194304;function Yo(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Hs(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,o=e.suspendedLanes,i=e.pingedLanes,s=n&268435455;if(s!==0){var a=s&~o;a!==0?r=Yo(a):(i&=s,i!==0&&(r=Yo(i)))}else s=n&~o,s!==0?r=Yo(s):i!==0&&(r=Yo(i));if(r===0)return 0;if(t!==0&&t!==r&&!(t&o)&&(o=r&-r,i=t&-t,o>=i||o===16&&(i&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Dt(t),o=1<<n,r|=e[n],t&=~o;return r}function G0(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function Y0(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,o=e.expirationTimes,i=e.pendingLanes;0<i;){var s=31-Dt(i),a=1<<s,l=o[s];l===-1?(!(a&n)||a&r)&&(o[s]=G0(a,t)):l<=t&&(e.expiredLanes|=a),i&=~a}}function ou(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Ph(){var e=ts;return ts<<=1,!(ts&4194240)&&(ts=64),e}function il(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function zi(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Dt(t),e[t]=n}function X0(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var o=31-Dt(n),i=1<<o;t[o]=0,r[o]=-1,e[o]=-1,n&=~i}}function fc(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Dt(n),o=1<<r;o&t|e[r]&t&&(e[r]|=t),n&=~o}}var se=0;function Rh(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Nh,pc,Th,jh,_h,iu=!1,rs=[],Hn=null,Kn=null,Qn=null,fi=new Map,pi=new Map,In=[],J0="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Ud(e,t){switch(e){case"focusin":case"focusout":Hn=null;break;case"dragenter":case"dragleave":Kn=null;break;case"mouseover":case"mouseout":Qn=null;break;case"pointerover":case"pointerout":fi.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":pi.delete(t.pointerId)}}function $o(e,t,n,r,o,i){return e===null||e.nativeEvent!==i?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:i,targetContainers:[o]},t!==null&&(t=Bi(t),t!==null&&pc(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,o!==null&&t.indexOf(o)===-1&&t.push(o),e)}function Z0(e,t,n,r,o){switch(t){case"focusin":return Hn=$o(Hn,e,t,n,r,o),!0;case"dragenter":return Kn=$o(Kn,e,t,n,r,o),!0;case"mouseover":return Qn=$o(Qn,e,t,n,r,o),!0;case"pointerover":var i=o.pointerId;return fi.set(i,$o(fi.get(i)||null,e,t,n,r,o)),!0;case"gotpointercapture":return i=o.pointerId,pi.set(i,$o(pi.get(i)||null,e,t,n,r,o)),!0}return!1}function Ah(e){var t=dr(e.target);if(t!==null){var n=_r(t);if(n!==null){if(t=n.tag,t===13){if(t=xh(n),t!==null){e.blockedOn=t,_h(e.priority,function(){Th(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function ks(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=su(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);eu=r,n.target.dispatchEvent(r),eu=null}else return t=Bi(n),t!==null&&pc(t),e.blockedOn=n,!1;t.shift()}return!0}function Vd(e,t,n){ks(e)&&n.delete(t)}function ew(){iu=!1,Hn!==null&&ks(Hn)&&(Hn=null),Kn!==null&&ks(Kn)&&(Kn=null),Qn!==null&&ks(Qn)&&(Qn=null),fi.forEach(Vd),pi.forEach(Vd)}function Bo(e,t){e.blockedOn===t&&(e.blockedOn=null,iu||(iu=!0,ut.unstable_scheduleCallback(ut.unstable_NormalPriority,ew)))}function hi(e){function t(o){return Bo(o,e)}if(0<rs.length){Bo(rs[0],e);for(var n=1;n<rs.length;n++){var r=rs[n];r.blockedOn===e&&(r.blockedOn=null)}}for(Hn!==null&&Bo(Hn,e),Kn!==null&&Bo(Kn,e),Qn!==null&&Bo(Qn,e),fi.forEach(t),pi.forEach(t),n=0;n<In.length;n++)r=In[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<In.length&&(n=In[0],n.blockedOn===null);)Ah(n),n.blockedOn===null&&In.shift()}var oo=Sn.ReactCurrentBatchConfig,Ks=!0;function tw(e,t,n,r){var o=se,i=oo.transition;oo.transition=null;try{se=1,hc(e,t,n,r)}finally{se=o,oo.transition=i}}function nw(e,t,n,r){var o=se,i=oo.transition;oo.transition=null;try{se=4,hc(e,t,n,r)}finally{se=o,oo.transition=i}}function hc(e,t,n,r){if(Ks){var o=su(e,t,n,r);if(o===null)ml(e,t,r,Qs,n),Ud(e,r);else if(Z0(o,e,t,n,r))r.stopPropagation();else if(Ud(e,r),t&4&&-1<J0.indexOf(e)){for(;o!==null;){var i=Bi(o);if(i!==null&&Nh(i),i=su(e,t,n,r),i===null&&ml(e,t,r,Qs,n),i===o)break;o=i}o!==null&&r.stopPropagation()}else ml(e,t,r,null,n)}}var Qs=null;function su(e,t,n,r){if(Qs=null,e=cc(r),e=dr(e),e!==null)if(t=_r(e),t===null)e=null;else if(n=t.tag,n===13){if(e=xh(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Qs=e,null}function Oh(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(V0()){case dc:return 1;case bh:return 4;case Ws:case W0:return 16;case kh:return 536870912;default:return 16}default:return 16}}var Un=null,mc=null,Ps=null;function Mh(){if(Ps)return Ps;var e,t=mc,n=t.length,r,o="value"in Un?Un.value:Un.textContent,i=o.length;for(e=0;e<n&&t[e]===o[e];e++);var s=n-e;for(r=1;r<=s&&t[n-r]===o[i-r];r++);return Ps=o.slice(e,1<r?1-r:void 0)}function Rs(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function os(){return!0}function Wd(){return!1}function dt(e){function t(n,r,o,i,s){this._reactName=n,this._targetInst=o,this.type=r,this.nativeEvent=i,this.target=s,this.currentTarget=null;for(var a in e)e.hasOwnProperty(a)&&(n=e[a],this[a]=n?n(i):i[a]);return this.isDefaultPrevented=(i.defaultPrevented!=null?i.defaultPrevented:i.returnValue===!1)?os:Wd,this.isPropagationStopped=Wd,this}return xe(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=os)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=os)},persist:function(){},isPersistent:os}),t}var To={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},vc=dt(To),$i=xe({},To,{view:0,detail:0}),rw=dt($i),sl,al,Uo,Sa=xe({},$i,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:gc,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Uo&&(Uo&&e.type==="mousemove"?(sl=e.screenX-Uo.screenX,al=e.screenY-Uo.screenY):al=sl=0,Uo=e),sl)},movementY:function(e){return"movementY"in e?e.movementY:al}}),Hd=dt(Sa),ow=xe({},Sa,{dataTransfer:0}),iw=dt(ow),sw=xe({},$i,{relatedTarget:0}),ll=dt(sw),aw=xe({},To,{animationName:0,elapsedTime:0,pseudoElement:0}),lw=dt(aw),uw=xe({},To,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),cw=dt(uw),dw=xe({},To,{data:0}),Kd=dt(dw),fw={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},pw={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},hw={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function mw(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=hw[e])?!!t[e]:!1}function gc(){return mw}var vw=xe({},$i,{key:function(e){if(e.key){var t=fw[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Rs(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?pw[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:gc,charCode:function(e){return e.type==="keypress"?Rs(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Rs(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),gw=dt(vw),yw=xe({},Sa,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Qd=dt(yw),ww=xe({},$i,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:gc}),xw=dt(ww),Sw=xe({},To,{propertyName:0,elapsedTime:0,pseudoElement:0}),Ew=dt(Sw),Cw=xe({},Sa,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),bw=dt(Cw),kw=[9,13,27,32],yc=hn&&"CompositionEvent"in window,ti=null;hn&&"documentMode"in document&&(ti=document.documentMode);var Pw=hn&&"TextEvent"in window&&!ti,Ih=hn&&(!yc||ti&&8<ti&&11>=ti),qd=" ",Gd=!1;function Dh(e,t){switch(e){case"keyup":return kw.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Lh(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var Hr=!1;function Rw(e,t){switch(e){case"compositionend":return Lh(t);case"keypress":return t.which!==32?null:(Gd=!0,qd);case"textInput":return e=t.data,e===qd&&Gd?null:e;default:return null}}function Nw(e,t){if(Hr)return e==="compositionend"||!yc&&Dh(e,t)?(e=Mh(),Ps=mc=Un=null,Hr=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Ih&&t.locale!=="ko"?null:t.data;default:return null}}var Tw={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Yd(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Tw[e.type]:t==="textarea"}function Fh(e,t,n,r){mh(r),t=qs(t,"onChange"),0<t.length&&(n=new vc("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var ni=null,mi=null;function jw(e){Gh(e,0)}function Ea(e){var t=qr(e);if(lh(t))return e}function _w(e,t){if(e==="change")return t}var zh=!1;if(hn){var ul;if(hn){var cl="oninput"in document;if(!cl){var Xd=document.createElement("div");Xd.setAttribute("oninput","return;"),cl=typeof Xd.oninput=="function"}ul=cl}else ul=!1;zh=ul&&(!document.documentMode||9<document.documentMode)}function Jd(){ni&&(ni.detachEvent("onpropertychange",$h),mi=ni=null)}function $h(e){if(e.propertyName==="value"&&Ea(mi)){var t=[];Fh(t,mi,e,cc(e)),wh(jw,t)}}function Aw(e,t,n){e==="focusin"?(Jd(),ni=t,mi=n,ni.attachEvent("onpropertychange",$h)):e==="focusout"&&Jd()}function Ow(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return Ea(mi)}function Mw(e,t){if(e==="click")return Ea(t)}function Iw(e,t){if(e==="input"||e==="change")return Ea(t)}function Dw(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var Ft=typeof Object.is=="function"?Object.is:Dw;function vi(e,t){if(Ft(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var o=n[r];if(!Ul.call(t,o)||!Ft(e[o],t[o]))return!1}return!0}function Zd(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function ef(e,t){var n=Zd(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=Zd(n)}}function Bh(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Bh(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Uh(){for(var e=window,t=Bs();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=Bs(e.document)}return t}function wc(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function Lw(e){var t=Uh(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&Bh(n.ownerDocument.documentElement,n)){if(r!==null&&wc(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var o=n.textContent.length,i=Math.min(r.start,o);r=r.end===void 0?i:Math.min(r.end,o),!e.extend&&i>r&&(o=r,r=i,i=o),o=ef(n,i);var s=ef(n,r);o&&s&&(e.rangeCount!==1||e.anchorNode!==o.node||e.anchorOffset!==o.offset||e.focusNode!==s.node||e.focusOffset!==s.offset)&&(t=t.createRange(),t.setStart(o.node,o.offset),e.removeAllRanges(),i>r?(e.addRange(t),e.extend(s.node,s.offset)):(t.setEnd(s.node,s.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var Fw=hn&&"documentMode"in document&&11>=document.documentMode,Kr=null,au=null,ri=null,lu=!1;function tf(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;lu||Kr==null||Kr!==Bs(r)||(r=Kr,"selectionStart"in r&&wc(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),ri&&vi(ri,r)||(ri=r,r=qs(au,"onSelect"),0<r.length&&(t=new vc("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=Kr)))}function is(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var Qr={animationend:is("Animation","AnimationEnd"),animationiteration:is("Animation","AnimationIteration"),animationstart:is("Animation","AnimationStart"),transitionend:is("Transition","TransitionEnd")},dl={},Vh={};hn&&(Vh=document.createElement("div").style,"AnimationEvent"in window||(delete Qr.animationend.animation,delete Qr.animationiteration.animation,delete Qr.animationstart.animation),"TransitionEvent"in window||delete Qr.transitionend.transition);function Ca(e){if(dl[e])return dl[e];if(!Qr[e])return e;var t=Qr[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in Vh)return dl[e]=t[n];return e}var Wh=Ca("animationend"),Hh=Ca("animationiteration"),Kh=Ca("animationstart"),Qh=Ca("transitionend"),qh=new Map,nf="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function rr(e,t){qh.set(e,t),jr(t,[e])}for(var fl=0;fl<nf.length;fl++){var pl=nf[fl],zw=pl.toLowerCase(),$w=pl[0].toUpperCase()+pl.slice(1);rr(zw,"on"+$w)}rr(Wh,"onAnimationEnd");rr(Hh,"onAnimationIteration");rr(Kh,"onAnimationStart");rr("dblclick","onDoubleClick");rr("focusin","onFocus");rr("focusout","onBlur");rr(Qh,"onTransitionEnd");wo("onMouseEnter",["mouseout","mouseover"]);wo("onMouseLeave",["mouseout","mouseover"]);wo("onPointerEnter",["pointerout","pointerover"]);wo("onPointerLeave",["pointerout","pointerover"]);jr("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));jr("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));jr("onBeforeInput",["compositionend","keypress","textInput","paste"]);jr("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));jr("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));jr("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Xo="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Bw=new Set("cancel close invalid load scroll toggle".split(" ").concat(Xo));function rf(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,z0(r,t,void 0,e),e.currentTarget=null}function Gh(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],o=r.event;r=r.listeners;e:{var i=void 0;if(t)for(var s=r.length-1;0<=s;s--){var a=r[s],l=a.instance,u=a.currentTarget;if(a=a.listener,l!==i&&o.isPropagationStopped())break e;rf(o,a,u),i=l}else for(s=0;s<r.length;s++){if(a=r[s],l=a.instance,u=a.currentTarget,a=a.listener,l!==i&&o.isPropagationStopped())break e;rf(o,a,u),i=l}}}if(Vs)throw e=ru,Vs=!1,ru=null,e}function de(e,t){var n=t[pu];n===void 0&&(n=t[pu]=new Set);var r=e+"__bubble";n.has(r)||(Yh(t,e,2,!1),n.add(r))}function hl(e,t,n){var r=0;t&&(r|=4),Yh(n,e,r,t)}var ss="_reactListening"+Math.random().toString(36).slice(2);function gi(e){if(!e[ss]){e[ss]=!0,rh.forEach(function(n){n!=="selectionchange"&&(Bw.has(n)||hl(n,!1,e),hl(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[ss]||(t[ss]=!0,hl("selectionchange",!1,t))}}function Yh(e,t,n,r){switch(Oh(t)){case 1:var o=tw;break;case 4:o=nw;break;default:o=hc}n=o.bind(null,t,n,e),o=void 0,!nu||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(o=!0),r?o!==void 0?e.addEventListener(t,n,{capture:!0,passive:o}):e.addEventListener(t,n,!0):o!==void 0?e.addEventListener(t,n,{passive:o}):e.addEventListener(t,n,!1)}function ml(e,t,n,r,o){var i=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var s=r.tag;if(s===3||s===4){var a=r.stateNode.containerInfo;if(a===o||a.nodeType===8&&a.parentNode===o)break;if(s===4)for(s=r.return;s!==null;){var l=s.tag;if((l===3||l===4)&&(l=s.stateNode.containerInfo,l===o||l.nodeType===8&&l.parentNode===o))return;s=s.return}for(;a!==null;){if(s=dr(a),s===null)return;if(l=s.tag,l===5||l===6){r=i=s;continue e}a=a.parentNode}}r=r.return}wh(function(){var u=i,d=cc(n),c=[];e:{var h=qh.get(e);if(h!==void 0){var f=vc,S=e;switch(e){case"keypress":if(Rs(n)===0)break e;case"keydown":case"keyup":f=gw;break;case"focusin":S="focus",f=ll;break;case"focusout":S="blur",f=ll;break;case"beforeblur":case"afterblur":f=ll;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":f=Hd;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":f=iw;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":f=xw;break;case Wh:case Hh:case Kh:f=lw;break;case Qh:f=Ew;break;case"scroll":f=rw;break;case"wheel":f=bw;break;case"copy":case"cut":case"paste":f=cw;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":f=Qd}var m=(t&4)!==0,x=!m&&e==="scroll",g=m?h!==null?h+"Capture":null:h;m=[];for(var y=u,w;y!==null;){w=y;var E=w.stateNode;if(w.tag===5&&E!==null&&(w=E,g!==null&&(E=di(y,g),E!=null&&m.push(yi(y,E,w)))),x)break;y=y.return}0<m.length&&(h=new f(h,S,null,n,d),c.push({event:h,listeners:m}))}}if(!(t&7)){e:{if(h=e==="mouseover"||e==="pointerover",f=e==="mouseout"||e==="pointerout",h&&n!==eu&&(S=n.relatedTarget||n.fromElement)&&(dr(S)||S[mn]))break e;if((f||h)&&(h=d.window===d?d:(h=d.ownerDocument)?h.defaultView||h.parentWindow:window,f?(S=n.relatedTarget||n.toElement,f=u,S=S?dr(S):null,S!==null&&(x=_r(S),S!==x||S.tag!==5&&S.tag!==6)&&(S=null)):(f=null,S=u),f!==S)){if(m=Hd,E="onMouseLeave",g="onMouseEnter",y="mouse",(e==="pointerout"||e==="pointerover")&&(m=Qd,E="onPointerLeave",g="onPointerEnter",y="pointer"),x=f==null?h:qr(f),w=S==null?h:qr(S),h=new m(E,y+"leave",f,n,d),h.target=x,h.relatedTarget=w,E=null,dr(d)===u&&(m=new m(g,y+"enter",S,n,d),m.target=w,m.relatedTarget=x,E=m),x=E,f&&S)t:{for(m=f,g=S,y=0,w=m;w;w=zr(w))y++;for(w=0,E=g;E;E=zr(E))w++;for(;0<y-w;)m=zr(m),y--;for(;0<w-y;)g=zr(g),w--;for(;y--;){if(m===g||g!==null&&m===g.alternate)break t;m=zr(m),g=zr(g)}m=null}else m=null;f!==null&&of(c,h,f,m,!1),S!==null&&x!==null&&of(c,x,S,m,!0)}}e:{if(h=u?qr(u):window,f=h.nodeName&&h.nodeName.toLowerCase(),f==="select"||f==="input"&&h.type==="file")var C=_w;else if(Yd(h))if(zh)C=Iw;else{C=Ow;var b=Aw}else(f=h.nodeName)&&f.toLowerCase()==="input"&&(h.type==="checkbox"||h.type==="radio")&&(C=Mw);if(C&&(C=C(e,u))){Fh(c,C,n,d);break e}b&&b(e,h,u),e==="focusout"&&(b=h._wrapperState)&&b.controlled&&h.type==="number"&&Gl(h,"number",h.value)}switch(b=u?qr(u):window,e){case"focusin":(Yd(b)||b.contentEditable==="true")&&(Kr=b,au=u,ri=null);break;case"focusout":ri=au=Kr=null;break;case"mousedown":lu=!0;break;case"contextmenu":case"mouseup":case"dragend":lu=!1,tf(c,n,d);break;case"selectionchange":if(Fw)break;case"keydown":case"keyup":tf(c,n,d)}var k;if(yc)e:{switch(e){case"compositionstart":var P="onCompositionStart";break e;case"compositionend":P="onCompositionEnd";break e;case"compositionupdate":P="onCompositionUpdate";break e}P=void 0}else Hr?Dh(e,n)&&(P="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(P="onCompositionStart");P&&(Ih&&n.locale!=="ko"&&(Hr||P!=="onCompositionStart"?P==="onCompositionEnd"&&Hr&&(k=Mh()):(Un=d,mc="value"in Un?Un.value:Un.textContent,Hr=!0)),b=qs(u,P),0<b.length&&(P=new Kd(P,e,null,n,d),c.push({event:P,listeners:b}),k?P.data=k:(k=Lh(n),k!==null&&(P.data=k)))),(k=Pw?Rw(e,n):Nw(e,n))&&(u=qs(u,"onBeforeInput"),0<u.length&&(d=new Kd("onBeforeInput","beforeinput",null,n,d),c.push({event:d,listeners:u}),d.data=k))}Gh(c,t)})}function yi(e,t,n){return{instance:e,listener:t,currentTarget:n}}function qs(e,t){for(var n=t+"Capture",r=[];e!==null;){var o=e,i=o.stateNode;o.tag===5&&i!==null&&(o=i,i=di(e,n),i!=null&&r.unshift(yi(e,i,o)),i=di(e,t),i!=null&&r.push(yi(e,i,o))),e=e.return}return r}function zr(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function of(e,t,n,r,o){for(var i=t._reactName,s=[];n!==null&&n!==r;){var a=n,l=a.alternate,u=a.stateNode;if(l!==null&&l===r)break;a.tag===5&&u!==null&&(a=u,o?(l=di(n,i),l!=null&&s.unshift(yi(n,l,a))):o||(l=di(n,i),l!=null&&s.push(yi(n,l,a)))),n=n.return}s.length!==0&&e.push({event:t,listeners:s})}var Uw=/\r\n?/g,Vw=/\u0000|\uFFFD/g;function sf(e){return(typeof e=="string"?e:""+e).replace(Uw,`
-`).replace(Vw,"")}function as(e,t,n){if(t=sf(t),sf(e)!==t&&n)throw Error(A(425))}function Gs(){}var uu=null,cu=null;function du(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var fu=typeof setTimeout=="function"?setTimeout:void 0,Ww=typeof clearTimeout=="function"?clearTimeout:void 0,af=typeof Promise=="function"?Promise:void 0,Hw=typeof queueMicrotask=="function"?queueMicrotask:typeof af<"u"?function(e){return af.resolve(null).then(e).catch(Kw)}:fu;function Kw(e){setTimeout(function(){throw e})}function vl(e,t){var n=t,r=0;do{var o=n.nextSibling;if(e.removeChild(n),o&&o.nodeType===8)if(n=o.data,n==="/$"){if(r===0){e.removeChild(o),hi(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=o}while(n);hi(t)}function qn(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function lf(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var jo=Math.random().toString(36).slice(2),Yt="__reactFiber$"+jo,wi="__reactProps$"+jo,mn="__reactContainer$"+jo,pu="__reactEvents$"+jo,Qw="__reactListeners$"+jo,qw="__reactHandles$"+jo;function dr(e){var t=e[Yt];if(t)return t;for(var n=e.parentNode;n;){if(t=n[mn]||n[Yt]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=lf(e);e!==null;){if(n=e[Yt])return n;e=lf(e)}return t}e=n,n=e.parentNode}return null}function Bi(e){return e=e[Yt]||e[mn],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function qr(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(A(33))}function ba(e){return e[wi]||null}var hu=[],Gr=-1;function or(e){return{current:e}}function fe(e){0>Gr||(e.current=hu[Gr],hu[Gr]=null,Gr--)}function ue(e,t){Gr++,hu[Gr]=e.current,e.current=t}var er={},We=or(er),tt=or(!1),Cr=er;function xo(e,t){var n=e.type.contextTypes;if(!n)return er;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var o={},i;for(i in n)o[i]=t[i];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=o),o}function nt(e){return e=e.childContextTypes,e!=null}function Ys(){fe(tt),fe(We)}function uf(e,t,n){if(We.current!==er)throw Error(A(168));ue(We,t),ue(tt,n)}function Xh(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var o in r)if(!(o in t))throw Error(A(108,A0(e)||"Unknown",o));return xe({},n,r)}function Xs(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||er,Cr=We.current,ue(We,e),ue(tt,tt.current),!0}function cf(e,t,n){var r=e.stateNode;if(!r)throw Error(A(169));n?(e=Xh(e,t,Cr),r.__reactInternalMemoizedMergedChildContext=e,fe(tt),fe(We),ue(We,e)):fe(tt),ue(tt,n)}var un=null,ka=!1,gl=!1;function Jh(e){un===null?un=[e]:un.push(e)}function Gw(e){ka=!0,Jh(e)}function ir(){if(!gl&&un!==null){gl=!0;var e=0,t=se;try{var n=un;for(se=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}un=null,ka=!1}catch(o){throw un!==null&&(un=un.slice(e+1)),Ch(dc,ir),o}finally{se=t,gl=!1}}return null}var Yr=[],Xr=0,Js=null,Zs=0,vt=[],gt=0,br=null,dn=1,fn="";function ur(e,t){Yr[Xr++]=Zs,Yr[Xr++]=Js,Js=e,Zs=t}function Zh(e,t,n){vt[gt++]=dn,vt[gt++]=fn,vt[gt++]=br,br=e;var r=dn;e=fn;var o=32-Dt(r)-1;r&=~(1<<o),n+=1;var i=32-Dt(t)+o;if(30<i){var s=o-o%5;i=(r&(1<<s)-1).toString(32),r>>=s,o-=s,dn=1<<32-Dt(t)+o|n<<o|r,fn=i+e}else dn=1<<i|n<<o|r,fn=e}function xc(e){e.return!==null&&(ur(e,1),Zh(e,1,0))}function Sc(e){for(;e===Js;)Js=Yr[--Xr],Yr[Xr]=null,Zs=Yr[--Xr],Yr[Xr]=null;for(;e===br;)br=vt[--gt],vt[gt]=null,fn=vt[--gt],vt[gt]=null,dn=vt[--gt],vt[gt]=null}var at=null,st=null,ve=!1,It=null;function em(e,t){var n=yt(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function df(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,at=e,st=qn(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,at=e,st=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=br!==null?{id:dn,overflow:fn}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=yt(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,at=e,st=null,!0):!1;default:return!1}}function mu(e){return(e.mode&1)!==0&&(e.flags&128)===0}function vu(e){if(ve){var t=st;if(t){var n=t;if(!df(e,t)){if(mu(e))throw Error(A(418));t=qn(n.nextSibling);var r=at;t&&df(e,t)?em(r,n):(e.flags=e.flags&-4097|2,ve=!1,at=e)}}else{if(mu(e))throw Error(A(418));e.flags=e.flags&-4097|2,ve=!1,at=e}}}function ff(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;at=e}function ls(e){if(e!==at)return!1;if(!ve)return ff(e),ve=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!du(e.type,e.memoizedProps)),t&&(t=st)){if(mu(e))throw tm(),Error(A(418));for(;t;)em(e,t),t=qn(t.nextSibling)}if(ff(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(A(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){st=qn(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}st=null}}else st=at?qn(e.stateNode.nextSibling):null;return!0}function tm(){for(var e=st;e;)e=qn(e.nextSibling)}function So(){st=at=null,ve=!1}function Ec(e){It===null?It=[e]:It.push(e)}var Yw=Sn.ReactCurrentBatchConfig;function Vo(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(A(309));var r=n.stateNode}if(!r)throw Error(A(147,e));var o=r,i=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===i?t.ref:(t=function(s){var a=o.refs;s===null?delete a[i]:a[i]=s},t._stringRef=i,t)}if(typeof e!="string")throw Error(A(284));if(!n._owner)throw Error(A(290,e))}return e}function us(e,t){throw e=Object.prototype.toString.call(t),Error(A(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function pf(e){var t=e._init;return t(e._payload)}function nm(e){function t(g,y){if(e){var w=g.deletions;w===null?(g.deletions=[y],g.flags|=16):w.push(y)}}function n(g,y){if(!e)return null;for(;y!==null;)t(g,y),y=y.sibling;return null}function r(g,y){for(g=new Map;y!==null;)y.key!==null?g.set(y.key,y):g.set(y.index,y),y=y.sibling;return g}function o(g,y){return g=Jn(g,y),g.index=0,g.sibling=null,g}function i(g,y,w){return g.index=w,e?(w=g.alternate,w!==null?(w=w.index,w<y?(g.flags|=2,y):w):(g.flags|=2,y)):(g.flags|=1048576,y)}function s(g){return e&&g.alternate===null&&(g.flags|=2),g}function a(g,y,w,E){return y===null||y.tag!==6?(y=bl(w,g.mode,E),y.return=g,y):(y=o(y,w),y.return=g,y)}function l(g,y,w,E){var C=w.type;return C===Wr?d(g,y,w.props.children,E,w.key):y!==null&&(y.elementType===C||typeof C=="object"&&C!==null&&C.$$typeof===On&&pf(C)===y.type)?(E=o(y,w.props),E.ref=Vo(g,y,w),E.return=g,E):(E=Ms(w.type,w.key,w.props,null,g.mode,E),E.ref=Vo(g,y,w),E.return=g,E)}function u(g,y,w,E){return y===null||y.tag!==4||y.stateNode.containerInfo!==w.containerInfo||y.stateNode.implementation!==w.implementation?(y=kl(w,g.mode,E),y.return=g,y):(y=o(y,w.children||[]),y.return=g,y)}function d(g,y,w,E,C){return y===null||y.tag!==7?(y=Sr(w,g.mode,E,C),y.return=g,y):(y=o(y,w),y.return=g,y)}function c(g,y,w){if(typeof y=="string"&&y!==""||typeof y=="number")return y=bl(""+y,g.mode,w),y.return=g,y;if(typeof y=="object"&&y!==null){switch(y.$$typeof){case Ji:return w=Ms(y.type,y.key,y.props,null,g.mode,w),w.ref=Vo(g,null,y),w.return=g,w;case Vr:return y=kl(y,g.mode,w),y.return=g,y;case On:var E=y._init;return c(g,E(y._payload),w)}if(Go(y)||Fo(y))return y=Sr(y,g.mode,w,null),y.return=g,y;us(g,y)}return null}function h(g,y,w,E){var C=y!==null?y.key:null;if(typeof w=="string"&&w!==""||typeof w=="number")return C!==null?null:a(g,y,""+w,E);if(typeof w=="object"&&w!==null){switch(w.$$typeof){case Ji:return w.key===C?l(g,y,w,E):null;case Vr:return w.key===C?u(g,y,w,E):null;case On:return C=w._init,h(g,y,C(w._payload),E)}if(Go(w)||Fo(w))return C!==null?null:d(g,y,w,E,null);us(g,w)}return null}function f(g,y,w,E,C){if(typeof E=="string"&&E!==""||typeof E=="number")return g=g.get(w)||null,a(y,g,""+E,C);if(typeof E=="object"&&E!==null){switch(E.$$typeof){case Ji:return g=g.get(E.key===null?w:E.key)||null,l(y,g,E,C);case Vr:return g=g.get(E.key===null?w:E.key)||null,u(y,g,E,C);case On:var b=E._init;return f(g,y,w,b(E._payload),C)}if(Go(E)||Fo(E))return g=g.get(w)||null,d(y,g,E,C,null);us(y,E)}return null}function S(g,y,w,E){for(var C=null,b=null,k=y,P=y=0,O=null;k!==null&&P<w.length;P++){k.index>P?(O=k,k=null):O=k.sibling;var _=h(g,k,w[P],E);if(_===null){k===null&&(k=O);break}e&&k&&_.alternate===null&&t(g,k),y=i(_,y,P),b===null?C=_:b.sibling=_,b=_,k=O}if(P===w.length)return n(g,k),ve&&ur(g,P),C;if(k===null){for(;P<w.length;P++)k=c(g,w[P],E),k!==null&&(y=i(k,y,P),b===null?C=k:b.sibling=k,b=k);return ve&&ur(g,P),C}for(k=r(g,k);P<w.length;P++)O=f(k,g,P,w[P],E),O!==null&&(e&&O.alternate!==null&&k.delete(O.key===null?P:O.key),y=i(O,y,P),b===null?C=O:b.sibling=O,b=O);return e&&k.forEach(function(z){return t(g,z)}),ve&&ur(g,P),C}function m(g,y,w,E){var C=Fo(w);if(typeof C!="function")throw Error(A(150));if(w=C.call(w),w==null)throw Error(A(151));for(var b=C=null,k=y,P=y=0,O=null,_=w.next();k!==null&&!_.done;P++,_=w.next()){k.index>P?(O=k,k=null):O=k.sibling;var z=h(g,k,_.value,E);if(z===null){k===null&&(k=O);break}e&&k&&z.alternate===null&&t(g,k),y=i(z,y,P),b===null?C=z:b.sibling=z,b=z,k=O}if(_.done)return n(g,k),ve&&ur(g,P),C;if(k===null){for(;!_.done;P++,_=w.next())_=c(g,_.value,E),_!==null&&(y=i(_,y,P),b===null?C=_:b.sibling=_,b=_);return ve&&ur(g,P),C}for(k=r(g,k);!_.done;P++,_=w.next())_=f(k,g,P,_.value,E),_!==null&&(e&&_.alternate!==null&&k.delete(_.key===null?P:_.key),y=i(_,y,P),b===null?C=_:b.sibling=_,b=_);return e&&k.forEach(function(I){return t(g,I)}),ve&&ur(g,P),C}function x(g,y,w,E){if(typeof w=="object"&&w!==null&&w.type===Wr&&w.key===null&&(w=w.props.children),typeof w=="object"&&w!==null){switch(w.$$typeof){case Ji:e:{for(var C=w.key,b=y;b!==null;){if(b.key===C){if(C=w.type,C===Wr){if(b.tag===7){n(g,b.sibling),y=o(b,w.props.children),y.return=g,g=y;break e}}else if(b.elementType===C||typeof C=="object"&&C!==null&&C.$$typeof===On&&pf(C)===b.type){n(g,b.sibling),y=o(b,w.props),y.ref=Vo(g,b,w),y.return=g,g=y;break e}n(g,b);break}else t(g,b);b=b.sibling}w.type===Wr?(y=Sr(w.props.children,g.mode,E,w.key),y.return=g,g=y):(E=Ms(w.type,w.key,w.props,null,g.mode,E),E.ref=Vo(g,y,w),E.return=g,g=E)}return s(g);case Vr:e:{for(b=w.key;y!==null;){if(y.key===b)if(y.tag===4&&y.stateNode.containerInfo===w.containerInfo&&y.stateNode.implementation===w.implementation){n(g,y.sibling),y=o(y,w.children||[]),y.return=g,g=y;break e}else{n(g,y);break}else t(g,y);y=y.sibling}y=kl(w,g.mode,E),y.return=g,g=y}return s(g);case On:return b=w._init,x(g,y,b(w._payload),E)}if(Go(w))return S(g,y,w,E);if(Fo(w))return m(g,y,w,E);us(g,w)}return typeof w=="string"&&w!==""||typeof w=="number"?(w=""+w,y!==null&&y.tag===6?(n(g,y.sibling),y=o(y,w),y.return=g,g=y):(n(g,y),y=bl(w,g.mode,E),y.return=g,g=y),s(g)):n(g,y)}return x}var Eo=nm(!0),rm=nm(!1),ea=or(null),ta=null,Jr=null,Cc=null;function bc(){Cc=Jr=ta=null}function kc(e){var t=ea.current;fe(ea),e._currentValue=t}function gu(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function io(e,t){ta=e,Cc=Jr=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(et=!0),e.firstContext=null)}function xt(e){var t=e._currentValue;if(Cc!==e)if(e={context:e,memoizedValue:t,next:null},Jr===null){if(ta===null)throw Error(A(308));Jr=e,ta.dependencies={lanes:0,firstContext:e}}else Jr=Jr.next=e;return t}var fr=null;function Pc(e){fr===null?fr=[e]:fr.push(e)}function om(e,t,n,r){var o=t.interleaved;return o===null?(n.next=n,Pc(t)):(n.next=o.next,o.next=n),t.interleaved=n,vn(e,r)}function vn(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var Mn=!1;function Rc(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function im(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function pn(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Gn(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,re&2){var o=r.pending;return o===null?t.next=t:(t.next=o.next,o.next=t),r.pending=t,vn(e,n)}return o=r.interleaved,o===null?(t.next=t,Pc(r)):(t.next=o.next,o.next=t),r.interleaved=t,vn(e,n)}function Ns(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,fc(e,n)}}function hf(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var o=null,i=null;if(n=n.firstBaseUpdate,n!==null){do{var s={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};i===null?o=i=s:i=i.next=s,n=n.next}while(n!==null);i===null?o=i=t:i=i.next=t}else o=i=t;n={baseState:r.baseState,firstBaseUpdate:o,lastBaseUpdate:i,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function na(e,t,n,r){var o=e.updateQueue;Mn=!1;var i=o.firstBaseUpdate,s=o.lastBaseUpdate,a=o.shared.pending;if(a!==null){o.shared.pending=null;var l=a,u=l.next;l.next=null,s===null?i=u:s.next=u,s=l;var d=e.alternate;d!==null&&(d=d.updateQueue,a=d.lastBaseUpdate,a!==s&&(a===null?d.firstBaseUpdate=u:a.next=u,d.lastBaseUpdate=l))}if(i!==null){var c=o.baseState;s=0,d=u=l=null,a=i;do{var h=a.lane,f=a.eventTime;if((r&h)===h){d!==null&&(d=d.next={eventTime:f,lane:0,tag:a.tag,payload:a.payload,callback:a.callback,next:null});e:{var S=e,m=a;switch(h=t,f=n,m.tag){case 1:if(S=m.payload,typeof S=="function"){c=S.call(f,c,h);break e}c=S;break e;case 3:S.flags=S.flags&-65537|128;case 0:if(S=m.payload,h=typeof S=="function"?S.call(f,c,h):S,h==null)break e;c=xe({},c,h);break e;case 2:Mn=!0}}a.callback!==null&&a.lane!==0&&(e.flags|=64,h=o.effects,h===null?o.effects=[a]:h.push(a))}else f={eventTime:f,lane:h,tag:a.tag,payload:a.payload,callback:a.callback,next:null},d===null?(u=d=f,l=c):d=d.next=f,s|=h;if(a=a.next,a===null){if(a=o.shared.pending,a===null)break;h=a,a=h.next,h.next=null,o.lastBaseUpdate=h,o.shared.pending=null}}while(!0);if(d===null&&(l=c),o.baseState=l,o.firstBaseUpdate=u,o.lastBaseUpdate=d,t=o.shared.interleaved,t!==null){o=t;do s|=o.lane,o=o.next;while(o!==t)}else i===null&&(o.shared.lanes=0);Pr|=s,e.lanes=s,e.memoizedState=c}}function mf(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],o=r.callback;if(o!==null){if(r.callback=null,r=n,typeof o!="function")throw Error(A(191,o));o.call(r)}}}var Ui={},en=or(Ui),xi=or(Ui),Si=or(Ui);function pr(e){if(e===Ui)throw Error(A(174));return e}function Nc(e,t){switch(ue(Si,t),ue(xi,e),ue(en,Ui),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:Xl(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=Xl(t,e)}fe(en),ue(en,t)}function Co(){fe(en),fe(xi),fe(Si)}function sm(e){pr(Si.current);var t=pr(en.current),n=Xl(t,e.type);t!==n&&(ue(xi,e),ue(en,n))}function Tc(e){xi.current===e&&(fe(en),fe(xi))}var ye=or(0);function ra(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var yl=[];function jc(){for(var e=0;e<yl.length;e++)yl[e]._workInProgressVersionPrimary=null;yl.length=0}var Ts=Sn.ReactCurrentDispatcher,wl=Sn.ReactCurrentBatchConfig,kr=0,we=null,Te=null,Ae=null,oa=!1,oi=!1,Ei=0,Xw=0;function ze(){throw Error(A(321))}function _c(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Ft(e[n],t[n]))return!1;return!0}function Ac(e,t,n,r,o,i){if(kr=i,we=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Ts.current=e===null||e.memoizedState===null?tx:nx,e=n(r,o),oi){i=0;do{if(oi=!1,Ei=0,25<=i)throw Error(A(301));i+=1,Ae=Te=null,t.updateQueue=null,Ts.current=rx,e=n(r,o)}while(oi)}if(Ts.current=ia,t=Te!==null&&Te.next!==null,kr=0,Ae=Te=we=null,oa=!1,t)throw Error(A(300));return e}function Oc(){var e=Ei!==0;return Ei=0,e}function Kt(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Ae===null?we.memoizedState=Ae=e:Ae=Ae.next=e,Ae}function St(){if(Te===null){var e=we.alternate;e=e!==null?e.memoizedState:null}else e=Te.next;var t=Ae===null?we.memoizedState:Ae.next;if(t!==null)Ae=t,Te=e;else{if(e===null)throw Error(A(310));Te=e,e={memoizedState:Te.memoizedState,baseState:Te.baseState,baseQueue:Te.baseQueue,queue:Te.queue,next:null},Ae===null?we.memoizedState=Ae=e:Ae=Ae.next=e}return Ae}function Ci(e,t){return typeof t=="function"?t(e):t}function xl(e){var t=St(),n=t.queue;if(n===null)throw Error(A(311));n.lastRenderedReducer=e;var r=Te,o=r.baseQueue,i=n.pending;if(i!==null){if(o!==null){var s=o.next;o.next=i.next,i.next=s}r.baseQueue=o=i,n.pending=null}if(o!==null){i=o.next,r=r.baseState;var a=s=null,l=null,u=i;do{var d=u.lane;if((kr&d)===d)l!==null&&(l=l.next={lane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),r=u.hasEagerState?u.eagerState:e(r,u.action);else{var c={lane:d,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null};l===null?(a=l=c,s=r):l=l.next=c,we.lanes|=d,Pr|=d}u=u.next}while(u!==null&&u!==i);l===null?s=r:l.next=a,Ft(r,t.memoizedState)||(et=!0),t.memoizedState=r,t.baseState=s,t.baseQueue=l,n.lastRenderedState=r}if(e=n.interleaved,e!==null){o=e;do i=o.lane,we.lanes|=i,Pr|=i,o=o.next;while(o!==e)}else o===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Sl(e){var t=St(),n=t.queue;if(n===null)throw Error(A(311));n.lastRenderedReducer=e;var r=n.dispatch,o=n.pending,i=t.memoizedState;if(o!==null){n.pending=null;var s=o=o.next;do i=e(i,s.action),s=s.next;while(s!==o);Ft(i,t.memoizedState)||(et=!0),t.memoizedState=i,t.baseQueue===null&&(t.baseState=i),n.lastRenderedState=i}return[i,r]}function am(){}function lm(e,t){var n=we,r=St(),o=t(),i=!Ft(r.memoizedState,o);if(i&&(r.memoizedState=o,et=!0),r=r.queue,Mc(dm.bind(null,n,r,e),[e]),r.getSnapshot!==t||i||Ae!==null&&Ae.memoizedState.tag&1){if(n.flags|=2048,bi(9,cm.bind(null,n,r,o,t),void 0,null),Oe===null)throw Error(A(349));kr&30||um(n,t,o)}return o}function um(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=we.updateQueue,t===null?(t={lastEffect:null,stores:null},we.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function cm(e,t,n,r){t.value=n,t.getSnapshot=r,fm(t)&&pm(e)}function dm(e,t,n){return n(function(){fm(t)&&pm(e)})}function fm(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Ft(e,n)}catch{return!0}}function pm(e){var t=vn(e,1);t!==null&&Lt(t,e,1,-1)}function vf(e){var t=Kt();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:Ci,lastRenderedState:e},t.queue=e,e=e.dispatch=ex.bind(null,we,e),[t.memoizedState,e]}function bi(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=we.updateQueue,t===null?(t={lastEffect:null,stores:null},we.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function hm(){return St().memoizedState}function js(e,t,n,r){var o=Kt();we.flags|=e,o.memoizedState=bi(1|t,n,void 0,r===void 0?null:r)}function Pa(e,t,n,r){var o=St();r=r===void 0?null:r;var i=void 0;if(Te!==null){var s=Te.memoizedState;if(i=s.destroy,r!==null&&_c(r,s.deps)){o.memoizedState=bi(t,n,i,r);return}}we.flags|=e,o.memoizedState=bi(1|t,n,i,r)}function gf(e,t){return js(8390656,8,e,t)}function Mc(e,t){return Pa(2048,8,e,t)}function mm(e,t){return Pa(4,2,e,t)}function vm(e,t){return Pa(4,4,e,t)}function gm(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function ym(e,t,n){return n=n!=null?n.concat([e]):null,Pa(4,4,gm.bind(null,t,e),n)}function Ic(){}function wm(e,t){var n=St();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&_c(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function xm(e,t){var n=St();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&_c(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Sm(e,t,n){return kr&21?(Ft(n,t)||(n=Ph(),we.lanes|=n,Pr|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,et=!0),e.memoizedState=n)}function Jw(e,t){var n=se;se=n!==0&&4>n?n:4,e(!0);var r=wl.transition;wl.transition={};try{e(!1),t()}finally{se=n,wl.transition=r}}function Em(){return St().memoizedState}function Zw(e,t,n){var r=Xn(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Cm(e))bm(t,n);else if(n=om(e,t,n,r),n!==null){var o=qe();Lt(n,e,r,o),km(n,t,r)}}function ex(e,t,n){var r=Xn(e),o={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Cm(e))bm(t,o);else{var i=e.alternate;if(e.lanes===0&&(i===null||i.lanes===0)&&(i=t.lastRenderedReducer,i!==null))try{var s=t.lastRenderedState,a=i(s,n);if(o.hasEagerState=!0,o.eagerState=a,Ft(a,s)){var l=t.interleaved;l===null?(o.next=o,Pc(t)):(o.next=l.next,l.next=o),t.interleaved=o;return}}catch{}finally{}n=om(e,t,o,r),n!==null&&(o=qe(),Lt(n,e,r,o),km(n,t,r))}}function Cm(e){var t=e.alternate;return e===we||t!==null&&t===we}function bm(e,t){oi=oa=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function km(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,fc(e,n)}}var ia={readContext:xt,useCallback:ze,useContext:ze,useEffect:ze,useImperativeHandle:ze,useInsertionEffect:ze,useLayoutEffect:ze,useMemo:ze,useReducer:ze,useRef:ze,useState:ze,useDebugValue:ze,useDeferredValue:ze,useTransition:ze,useMutableSource:ze,useSyncExternalStore:ze,useId:ze,unstable_isNewReconciler:!1},tx={readContext:xt,useCallback:function(e,t){return Kt().memoizedState=[e,t===void 0?null:t],e},useContext:xt,useEffect:gf,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,js(4194308,4,gm.bind(null,t,e),n)},useLayoutEffect:function(e,t){return js(4194308,4,e,t)},useInsertionEffect:function(e,t){return js(4,2,e,t)},useMemo:function(e,t){var n=Kt();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Kt();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=Zw.bind(null,we,e),[r.memoizedState,e]},useRef:function(e){var t=Kt();return e={current:e},t.memoizedState=e},useState:vf,useDebugValue:Ic,useDeferredValue:function(e){return Kt().memoizedState=e},useTransition:function(){var e=vf(!1),t=e[0];return e=Jw.bind(null,e[1]),Kt().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=we,o=Kt();if(ve){if(n===void 0)throw Error(A(407));n=n()}else{if(n=t(),Oe===null)throw Error(A(349));kr&30||um(r,t,n)}o.memoizedState=n;var i={value:n,getSnapshot:t};return o.queue=i,gf(dm.bind(null,r,i,e),[e]),r.flags|=2048,bi(9,cm.bind(null,r,i,n,t),void 0,null),n},useId:function(){var e=Kt(),t=Oe.identifierPrefix;if(ve){var n=fn,r=dn;n=(r&~(1<<32-Dt(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=Ei++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=Xw++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},nx={readContext:xt,useCallback:wm,useContext:xt,useEffect:Mc,useImperativeHandle:ym,useInsertionEffect:mm,useLayoutEffect:vm,useMemo:xm,useReducer:xl,useRef:hm,useState:function(){return xl(Ci)},useDebugValue:Ic,useDeferredValue:function(e){var t=St();return Sm(t,Te.memoizedState,e)},useTransition:function(){var e=xl(Ci)[0],t=St().memoizedState;return[e,t]},useMutableSource:am,useSyncExternalStore:lm,useId:Em,unstable_isNewReconciler:!1},rx={readContext:xt,useCallback:wm,useContext:xt,useEffect:Mc,useImperativeHandle:ym,useInsertionEffect:mm,useLayoutEffect:vm,useMemo:xm,useReducer:Sl,useRef:hm,useState:function(){return Sl(Ci)},useDebugValue:Ic,useDeferredValue:function(e){var t=St();return Te===null?t.memoizedState=e:Sm(t,Te.memoizedState,e)},useTransition:function(){var e=Sl(Ci)[0],t=St().memoizedState;return[e,t]},useMutableSource:am,useSyncExternalStore:lm,useId:Em,unstable_isNewReconciler:!1};function jt(e,t){if(e&&e.defaultProps){t=xe({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function yu(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:xe({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var Ra={isMounted:function(e){return(e=e._reactInternals)?_r(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=qe(),o=Xn(e),i=pn(r,o);i.payload=t,n!=null&&(i.callback=n),t=Gn(e,i,o),t!==null&&(Lt(t,e,o,r),Ns(t,e,o))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=qe(),o=Xn(e),i=pn(r,o);i.tag=1,i.payload=t,n!=null&&(i.callback=n),t=Gn(e,i,o),t!==null&&(Lt(t,e,o,r),Ns(t,e,o))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=qe(),r=Xn(e),o=pn(n,r);o.tag=2,t!=null&&(o.callback=t),t=Gn(e,o,r),t!==null&&(Lt(t,e,r,n),Ns(t,e,r))}};function yf(e,t,n,r,o,i,s){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,i,s):t.prototype&&t.prototype.isPureReactComponent?!vi(n,r)||!vi(o,i):!0}function Pm(e,t,n){var r=!1,o=er,i=t.contextType;return typeof i=="object"&&i!==null?i=xt(i):(o=nt(t)?Cr:We.current,r=t.contextTypes,i=(r=r!=null)?xo(e,o):er),t=new t(n,i),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=Ra,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=o,e.__reactInternalMemoizedMaskedChildContext=i),t}function wf(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&Ra.enqueueReplaceState(t,t.state,null)}function wu(e,t,n,r){var o=e.stateNode;o.props=n,o.state=e.memoizedState,o.refs={},Rc(e);var i=t.contextType;typeof i=="object"&&i!==null?o.context=xt(i):(i=nt(t)?Cr:We.current,o.context=xo(e,i)),o.state=e.memoizedState,i=t.getDerivedStateFromProps,typeof i=="function"&&(yu(e,t,i,n),o.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof o.getSnapshotBeforeUpdate=="function"||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(t=o.state,typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount(),t!==o.state&&Ra.enqueueReplaceState(o,o.state,null),na(e,n,o,r),o.state=e.memoizedState),typeof o.componentDidMount=="function"&&(e.flags|=4194308)}function bo(e,t){try{var n="",r=t;do n+=_0(r),r=r.return;while(r);var o=n}catch(i){o=`
-Error generating stack: `+i.message+`
-`+i.stack}return{value:e,source:t,stack:o,digest:null}}function El(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function xu(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var ox=typeof WeakMap=="function"?WeakMap:Map;function Rm(e,t,n){n=pn(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){aa||(aa=!0,ju=r),xu(e,t)},n}function Nm(e,t,n){n=pn(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var o=t.value;n.payload=function(){return r(o)},n.callback=function(){xu(e,t)}}var i=e.stateNode;return i!==null&&typeof i.componentDidCatch=="function"&&(n.callback=function(){xu(e,t),typeof r!="function"&&(Yn===null?Yn=new Set([this]):Yn.add(this));var s=t.stack;this.componentDidCatch(t.value,{componentStack:s!==null?s:""})}),n}function xf(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new ox;var o=new Set;r.set(t,o)}else o=r.get(t),o===void 0&&(o=new Set,r.set(t,o));o.has(n)||(o.add(n),e=yx.bind(null,e,t,n),t.then(e,e))}function Sf(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Ef(e,t,n,r,o){return e.mode&1?(e.flags|=65536,e.lanes=o,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=pn(-1,1),t.tag=2,Gn(n,t,1))),n.lanes|=1),e)}var ix=Sn.ReactCurrentOwner,et=!1;function Ke(e,t,n,r){t.child=e===null?rm(t,null,n,r):Eo(t,e.child,n,r)}function Cf(e,t,n,r,o){n=n.render;var i=t.ref;return io(t,o),r=Ac(e,t,n,r,i,o),n=Oc(),e!==null&&!et?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~o,gn(e,t,o)):(ve&&n&&xc(t),t.flags|=1,Ke(e,t,r,o),t.child)}function bf(e,t,n,r,o){if(e===null){var i=n.type;return typeof i=="function"&&!Vc(i)&&i.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=i,Tm(e,t,i,r,o)):(e=Ms(n.type,null,r,t,t.mode,o),e.ref=t.ref,e.return=t,t.child=e)}if(i=e.child,!(e.lanes&o)){var s=i.memoizedProps;if(n=n.compare,n=n!==null?n:vi,n(s,r)&&e.ref===t.ref)return gn(e,t,o)}return t.flags|=1,e=Jn(i,r),e.ref=t.ref,e.return=t,t.child=e}function Tm(e,t,n,r,o){if(e!==null){var i=e.memoizedProps;if(vi(i,r)&&e.ref===t.ref)if(et=!1,t.pendingProps=r=i,(e.lanes&o)!==0)e.flags&131072&&(et=!0);else return t.lanes=e.lanes,gn(e,t,o)}return Su(e,t,n,r,o)}function jm(e,t,n){var r=t.pendingProps,o=r.children,i=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},ue(eo,ot),ot|=n;else{if(!(n&1073741824))return e=i!==null?i.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,ue(eo,ot),ot|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=i!==null?i.baseLanes:n,ue(eo,ot),ot|=r}else i!==null?(r=i.baseLanes|n,t.memoizedState=null):r=n,ue(eo,ot),ot|=r;return Ke(e,t,o,n),t.child}function _m(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Su(e,t,n,r,o){var i=nt(n)?Cr:We.current;return i=xo(t,i),io(t,o),n=Ac(e,t,n,r,i,o),r=Oc(),e!==null&&!et?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~o,gn(e,t,o)):(ve&&r&&xc(t),t.flags|=1,Ke(e,t,n,o),t.child)}function kf(e,t,n,r,o){if(nt(n)){var i=!0;Xs(t)}else i=!1;if(io(t,o),t.stateNode===null)_s(e,t),Pm(t,n,r),wu(t,n,r,o),r=!0;else if(e===null){var s=t.stateNode,a=t.memoizedProps;s.props=a;var l=s.context,u=n.contextType;typeof u=="object"&&u!==null?u=xt(u):(u=nt(n)?Cr:We.current,u=xo(t,u));var d=n.getDerivedStateFromProps,c=typeof d=="function"||typeof s.getSnapshotBeforeUpdate=="function";c||typeof s.UNSAFE_componentWillReceiveProps!="function"&&typeof s.componentWillReceiveProps!="function"||(a!==r||l!==u)&&wf(t,s,r,u),Mn=!1;var h=t.memoizedState;s.state=h,na(t,r,s,o),l=t.memoizedState,a!==r||h!==l||tt.current||Mn?(typeof d=="function"&&(yu(t,n,d,r),l=t.memoizedState),(a=Mn||yf(t,n,a,r,h,l,u))?(c||typeof s.UNSAFE_componentWillMount!="function"&&typeof s.componentWillMount!="function"||(typeof s.componentWillMount=="function"&&s.componentWillMount(),typeof s.UNSAFE_componentWillMount=="function"&&s.UNSAFE_componentWillMount()),typeof s.componentDidMount=="function"&&(t.flags|=4194308)):(typeof s.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=l),s.props=r,s.state=l,s.context=u,r=a):(typeof s.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{s=t.stateNode,im(e,t),a=t.memoizedProps,u=t.type===t.elementType?a:jt(t.type,a),s.props=u,c=t.pendingProps,h=s.context,l=n.contextType,typeof l=="object"&&l!==null?l=xt(l):(l=nt(n)?Cr:We.current,l=xo(t,l));var f=n.getDerivedStateFromProps;(d=typeof f=="function"||typeof s.getSnapshotBeforeUpdate=="function")||typeof s.UNSAFE_componentWillReceiveProps!="function"&&typeof s.componentWillReceiveProps!="function"||(a!==c||h!==l)&&wf(t,s,r,l),Mn=!1,h=t.memoizedState,s.state=h,na(t,r,s,o);var S=t.memoizedState;a!==c||h!==S||tt.current||Mn?(typeof f=="function"&&(yu(t,n,f,r),S=t.memoizedState),(u=Mn||yf(t,n,u,r,h,S,l)||!1)?(d||typeof s.UNSAFE_componentWillUpdate!="function"&&typeof s.componentWillUpdate!="function"||(typeof s.componentWillUpdate=="function"&&s.componentWillUpdate(r,S,l),typeof s.UNSAFE_componentWillUpdate=="function"&&s.UNSAFE_componentWillUpdate(r,S,l)),typeof s.componentDidUpdate=="function"&&(t.flags|=4),typeof s.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof s.componentDidUpdate!="function"||a===e.memoizedProps&&h===e.memoizedState||(t.flags|=4),typeof s.getSnapshotBeforeUpdate!="function"||a===e.memoizedProps&&h===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=S),s.props=r,s.state=S,s.context=l,r=u):(typeof s.componentDidUpdate!="function"||a===e.memoizedProps&&h===e.memoizedState||(t.flags|=4),typeof s.getSnapshotBeforeUpdate!="function"||a===e.memoizedProps&&h===e.memoizedState||(t.flags|=1024),r=!1)}return Eu(e,t,n,r,i,o)}function Eu(e,t,n,r,o,i){_m(e,t);var s=(t.flags&128)!==0;if(!r&&!s)return o&&cf(t,n,!1),gn(e,t,i);r=t.stateNode,ix.current=t;var a=s&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&s?(t.child=Eo(t,e.child,null,i),t.child=Eo(t,null,a,i)):Ke(e,t,a,i),t.memoizedState=r.state,o&&cf(t,n,!0),t.child}function Am(e){var t=e.stateNode;t.pendingContext?uf(e,t.pendingContext,t.pendingContext!==t.context):t.context&&uf(e,t.context,!1),Nc(e,t.containerInfo)}function Pf(e,t,n,r,o){return So(),Ec(o),t.flags|=256,Ke(e,t,n,r),t.child}var Cu={dehydrated:null,treeContext:null,retryLane:0};function bu(e){return{baseLanes:e,cachePool:null,transitions:null}}function Om(e,t,n){var r=t.pendingProps,o=ye.current,i=!1,s=(t.flags&128)!==0,a;if((a=s)||(a=e!==null&&e.memoizedState===null?!1:(o&2)!==0),a?(i=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(o|=1),ue(ye,o&1),e===null)return vu(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(s=r.children,e=r.fallback,i?(r=t.mode,i=t.child,s={mode:"hidden",children:s},!(r&1)&&i!==null?(i.childLanes=0,i.pendingProps=s):i=ja(s,r,0,null),e=Sr(e,r,n,null),i.return=t,e.return=t,i.sibling=e,t.child=i,t.child.memoizedState=bu(n),t.memoizedState=Cu,e):Dc(t,s));if(o=e.memoizedState,o!==null&&(a=o.dehydrated,a!==null))return sx(e,t,s,r,a,o,n);if(i){i=r.fallback,s=t.mode,o=e.child,a=o.sibling;var l={mode:"hidden",children:r.children};return!(s&1)&&t.child!==o?(r=t.child,r.childLanes=0,r.pendingProps=l,t.deletions=null):(r=Jn(o,l),r.subtreeFlags=o.subtreeFlags&14680064),a!==null?i=Jn(a,i):(i=Sr(i,s,n,null),i.flags|=2),i.return=t,r.return=t,r.sibling=i,t.child=r,r=i,i=t.child,s=e.child.memoizedState,s=s===null?bu(n):{baseLanes:s.baseLanes|n,cachePool:null,transitions:s.transitions},i.memoizedState=s,i.childLanes=e.childLanes&~n,t.memoizedState=Cu,r}return i=e.child,e=i.sibling,r=Jn(i,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Dc(e,t){return t=ja({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function cs(e,t,n,r){return r!==null&&Ec(r),Eo(t,e.child,null,n),e=Dc(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function sx(e,t,n,r,o,i,s){if(n)return t.flags&256?(t.flags&=-257,r=El(Error(A(422))),cs(e,t,s,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(i=r.fallback,o=t.mode,r=ja({mode:"visible",children:r.children},o,0,null),i=Sr(i,o,s,null),i.flags|=2,r.return=t,i.return=t,r.sibling=i,t.child=r,t.mode&1&&Eo(t,e.child,null,s),t.child.memoizedState=bu(s),t.memoizedState=Cu,i);if(!(t.mode&1))return cs(e,t,s,null);if(o.data==="$!"){if(r=o.nextSibling&&o.nextSibling.dataset,r)var a=r.dgst;return r=a,i=Error(A(419)),r=El(i,r,void 0),cs(e,t,s,r)}if(a=(s&e.childLanes)!==0,et||a){if(r=Oe,r!==null){switch(s&-s){case 4:o=2;break;case 16:o=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:o=32;break;case 536870912:o=268435456;break;default:o=0}o=o&(r.suspendedLanes|s)?0:o,o!==0&&o!==i.retryLane&&(i.retryLane=o,vn(e,o),Lt(r,e,o,-1))}return Uc(),r=El(Error(A(421))),cs(e,t,s,r)}return o.data==="$?"?(t.flags|=128,t.child=e.child,t=wx.bind(null,e),o._reactRetry=t,null):(e=i.treeContext,st=qn(o.nextSibling),at=t,ve=!0,It=null,e!==null&&(vt[gt++]=dn,vt[gt++]=fn,vt[gt++]=br,dn=e.id,fn=e.overflow,br=t),t=Dc(t,r.children),t.flags|=4096,t)}function Rf(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),gu(e.return,t,n)}function Cl(e,t,n,r,o){var i=e.memoizedState;i===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:o}:(i.isBackwards=t,i.rendering=null,i.renderingStartTime=0,i.last=r,i.tail=n,i.tailMode=o)}function Mm(e,t,n){var r=t.pendingProps,o=r.revealOrder,i=r.tail;if(Ke(e,t,r.children,n),r=ye.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Rf(e,n,t);else if(e.tag===19)Rf(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(ue(ye,r),!(t.mode&1))t.memoizedState=null;else switch(o){case"forwards":for(n=t.child,o=null;n!==null;)e=n.alternate,e!==null&&ra(e)===null&&(o=n),n=n.sibling;n=o,n===null?(o=t.child,t.child=null):(o=n.sibling,n.sibling=null),Cl(t,!1,o,n,i);break;case"backwards":for(n=null,o=t.child,t.child=null;o!==null;){if(e=o.alternate,e!==null&&ra(e)===null){t.child=o;break}e=o.sibling,o.sibling=n,n=o,o=e}Cl(t,!0,n,null,i);break;case"together":Cl(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function _s(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function gn(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Pr|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(A(153));if(t.child!==null){for(e=t.child,n=Jn(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=Jn(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function ax(e,t,n){switch(t.tag){case 3:Am(t),So();break;case 5:sm(t);break;case 1:nt(t.type)&&Xs(t);break;case 4:Nc(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,o=t.memoizedProps.value;ue(ea,r._currentValue),r._currentValue=o;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(ue(ye,ye.current&1),t.flags|=128,null):n&t.child.childLanes?Om(e,t,n):(ue(ye,ye.current&1),e=gn(e,t,n),e!==null?e.sibling:null);ue(ye,ye.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Mm(e,t,n);t.flags|=128}if(o=t.memoizedState,o!==null&&(o.rendering=null,o.tail=null,o.lastEffect=null),ue(ye,ye.current),r)break;return null;case 22:case 23:return t.lanes=0,jm(e,t,n)}return gn(e,t,n)}var Im,ku,Dm,Lm;Im=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};ku=function(){};Dm=function(e,t,n,r){var o=e.memoizedProps;if(o!==r){e=t.stateNode,pr(en.current);var i=null;switch(n){case"input":o=Ql(e,o),r=Ql(e,r),i=[];break;case"select":o=xe({},o,{value:void 0}),r=xe({},r,{value:void 0}),i=[];break;case"textarea":o=Yl(e,o),r=Yl(e,r),i=[];break;default:typeof o.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=Gs)}Jl(n,r);var s;n=null;for(u in o)if(!r.hasOwnProperty(u)&&o.hasOwnProperty(u)&&o[u]!=null)if(u==="style"){var a=o[u];for(s in a)a.hasOwnProperty(s)&&(n||(n={}),n[s]="")}else u!=="dangerouslySetInnerHTML"&&u!=="children"&&u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&u!=="autoFocus"&&(ui.hasOwnProperty(u)?i||(i=[]):(i=i||[]).push(u,null));for(u in r){var l=r[u];if(a=o!=null?o[u]:void 0,r.hasOwnProperty(u)&&l!==a&&(l!=null||a!=null))if(u==="style")if(a){for(s in a)!a.hasOwnProperty(s)||l&&l.hasOwnProperty(s)||(n||(n={}),n[s]="");for(s in l)l.hasOwnProperty(s)&&a[s]!==l[s]&&(n||(n={}),n[s]=l[s])}else n||(i||(i=[]),i.push(u,n)),n=l;else u==="dangerouslySetInnerHTML"?(l=l?l.__html:void 0,a=a?a.__html:void 0,l!=null&&a!==l&&(i=i||[]).push(u,l)):u==="children"?typeof l!="string"&&typeof l!="number"||(i=i||[]).push(u,""+l):u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&(ui.hasOwnProperty(u)?(l!=null&&u==="onScroll"&&de("scroll",e),i||a===l||(i=[])):(i=i||[]).push(u,l))}n&&(i=i||[]).push("style",n);var u=i;(t.updateQueue=u)&&(t.flags|=4)}};Lm=function(e,t,n,r){n!==r&&(t.flags|=4)};function Wo(e,t){if(!ve)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function $e(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var o=e.child;o!==null;)n|=o.lanes|o.childLanes,r|=o.subtreeFlags&14680064,r|=o.flags&14680064,o.return=e,o=o.sibling;else for(o=e.child;o!==null;)n|=o.lanes|o.childLanes,r|=o.subtreeFlags,r|=o.flags,o.return=e,o=o.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function lx(e,t,n){var r=t.pendingProps;switch(Sc(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return $e(t),null;case 1:return nt(t.type)&&Ys(),$e(t),null;case 3:return r=t.stateNode,Co(),fe(tt),fe(We),jc(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(ls(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,It!==null&&(Ou(It),It=null))),ku(e,t),$e(t),null;case 5:Tc(t);var o=pr(Si.current);if(n=t.type,e!==null&&t.stateNode!=null)Dm(e,t,n,r,o),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(A(166));return $e(t),null}if(e=pr(en.current),ls(t)){r=t.stateNode,n=t.type;var i=t.memoizedProps;switch(r[Yt]=t,r[wi]=i,e=(t.mode&1)!==0,n){case"dialog":de("cancel",r),de("close",r);break;case"iframe":case"object":case"embed":de("load",r);break;case"video":case"audio":for(o=0;o<Xo.length;o++)de(Xo[o],r);break;case"source":de("error",r);break;case"img":case"image":case"link":de("error",r),de("load",r);break;case"details":de("toggle",r);break;case"input":Id(r,i),de("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!i.multiple},de("invalid",r);break;case"textarea":Ld(r,i),de("invalid",r)}Jl(n,i),o=null;for(var s in i)if(i.hasOwnProperty(s)){var a=i[s];s==="children"?typeof a=="string"?r.textContent!==a&&(i.suppressHydrationWarning!==!0&&as(r.textContent,a,e),o=["children",a]):typeof a=="number"&&r.textContent!==""+a&&(i.suppressHydrationWarning!==!0&&as(r.textContent,a,e),o=["children",""+a]):ui.hasOwnProperty(s)&&a!=null&&s==="onScroll"&&de("scroll",r)}switch(n){case"input":Zi(r),Dd(r,i,!0);break;case"textarea":Zi(r),Fd(r);break;case"select":case"option":break;default:typeof i.onClick=="function"&&(r.onclick=Gs)}r=o,t.updateQueue=r,r!==null&&(t.flags|=4)}else{s=o.nodeType===9?o:o.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=dh(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=s.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=s.createElement(n,{is:r.is}):(e=s.createElement(n),n==="select"&&(s=e,r.multiple?s.multiple=!0:r.size&&(s.size=r.size))):e=s.createElementNS(e,n),e[Yt]=t,e[wi]=r,Im(e,t,!1,!1),t.stateNode=e;e:{switch(s=Zl(n,r),n){case"dialog":de("cancel",e),de("close",e),o=r;break;case"iframe":case"object":case"embed":de("load",e),o=r;break;case"video":case"audio":for(o=0;o<Xo.length;o++)de(Xo[o],e);o=r;break;case"source":de("error",e),o=r;break;case"img":case"image":case"link":de("error",e),de("load",e),o=r;break;case"details":de("toggle",e),o=r;break;case"input":Id(e,r),o=Ql(e,r),de("invalid",e);break;case"option":o=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},o=xe({},r,{value:void 0}),de("invalid",e);break;case"textarea":Ld(e,r),o=Yl(e,r),de("invalid",e);break;default:o=r}Jl(n,o),a=o;for(i in a)if(a.hasOwnProperty(i)){var l=a[i];i==="style"?hh(e,l):i==="dangerouslySetInnerHTML"?(l=l?l.__html:void 0,l!=null&&fh(e,l)):i==="children"?typeof l=="string"?(n!=="textarea"||l!=="")&&ci(e,l):typeof l=="number"&&ci(e,""+l):i!=="suppressContentEditableWarning"&&i!=="suppressHydrationWarning"&&i!=="autoFocus"&&(ui.hasOwnProperty(i)?l!=null&&i==="onScroll"&&de("scroll",e):l!=null&&sc(e,i,l,s))}switch(n){case"input":Zi(e),Dd(e,r,!1);break;case"textarea":Zi(e),Fd(e);break;case"option":r.value!=null&&e.setAttribute("value",""+Zn(r.value));break;case"select":e.multiple=!!r.multiple,i=r.value,i!=null?to(e,!!r.multiple,i,!1):r.defaultValue!=null&&to(e,!!r.multiple,r.defaultValue,!0);break;default:typeof o.onClick=="function"&&(e.onclick=Gs)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return $e(t),null;case 6:if(e&&t.stateNode!=null)Lm(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(A(166));if(n=pr(Si.current),pr(en.current),ls(t)){if(r=t.stateNode,n=t.memoizedProps,r[Yt]=t,(i=r.nodeValue!==n)&&(e=at,e!==null))switch(e.tag){case 3:as(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&as(r.nodeValue,n,(e.mode&1)!==0)}i&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[Yt]=t,t.stateNode=r}return $e(t),null;case 13:if(fe(ye),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(ve&&st!==null&&t.mode&1&&!(t.flags&128))tm(),So(),t.flags|=98560,i=!1;else if(i=ls(t),r!==null&&r.dehydrated!==null){if(e===null){if(!i)throw Error(A(318));if(i=t.memoizedState,i=i!==null?i.dehydrated:null,!i)throw Error(A(317));i[Yt]=t}else So(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;$e(t),i=!1}else It!==null&&(Ou(It),It=null),i=!0;if(!i)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||ye.current&1?je===0&&(je=3):Uc())),t.updateQueue!==null&&(t.flags|=4),$e(t),null);case 4:return Co(),ku(e,t),e===null&&gi(t.stateNode.containerInfo),$e(t),null;case 10:return kc(t.type._context),$e(t),null;case 17:return nt(t.type)&&Ys(),$e(t),null;case 19:if(fe(ye),i=t.memoizedState,i===null)return $e(t),null;if(r=(t.flags&128)!==0,s=i.rendering,s===null)if(r)Wo(i,!1);else{if(je!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(s=ra(e),s!==null){for(t.flags|=128,Wo(i,!1),r=s.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)i=n,e=r,i.flags&=14680066,s=i.alternate,s===null?(i.childLanes=0,i.lanes=e,i.child=null,i.subtreeFlags=0,i.memoizedProps=null,i.memoizedState=null,i.updateQueue=null,i.dependencies=null,i.stateNode=null):(i.childLanes=s.childLanes,i.lanes=s.lanes,i.child=s.child,i.subtreeFlags=0,i.deletions=null,i.memoizedProps=s.memoizedProps,i.memoizedState=s.memoizedState,i.updateQueue=s.updateQueue,i.type=s.type,e=s.dependencies,i.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return ue(ye,ye.current&1|2),t.child}e=e.sibling}i.tail!==null&&Pe()>ko&&(t.flags|=128,r=!0,Wo(i,!1),t.lanes=4194304)}else{if(!r)if(e=ra(s),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),Wo(i,!0),i.tail===null&&i.tailMode==="hidden"&&!s.alternate&&!ve)return $e(t),null}else 2*Pe()-i.renderingStartTime>ko&&n!==1073741824&&(t.flags|=128,r=!0,Wo(i,!1),t.lanes=4194304);i.isBackwards?(s.sibling=t.child,t.child=s):(n=i.last,n!==null?n.sibling=s:t.child=s,i.last=s)}return i.tail!==null?(t=i.tail,i.rendering=t,i.tail=t.sibling,i.renderingStartTime=Pe(),t.sibling=null,n=ye.current,ue(ye,r?n&1|2:n&1),t):($e(t),null);case 22:case 23:return Bc(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?ot&1073741824&&($e(t),t.subtreeFlags&6&&(t.flags|=8192)):$e(t),null;case 24:return null;case 25:return null}throw Error(A(156,t.tag))}function ux(e,t){switch(Sc(t),t.tag){case 1:return nt(t.type)&&Ys(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Co(),fe(tt),fe(We),jc(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Tc(t),null;case 13:if(fe(ye),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(A(340));So()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return fe(ye),null;case 4:return Co(),null;case 10:return kc(t.type._context),null;case 22:case 23:return Bc(),null;case 24:return null;default:return null}}var ds=!1,Ue=!1,cx=typeof WeakSet=="function"?WeakSet:Set,$=null;function Zr(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){Ce(e,t,r)}else n.current=null}function Pu(e,t,n){try{n()}catch(r){Ce(e,t,r)}}var Nf=!1;function dx(e,t){if(uu=Ks,e=Uh(),wc(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var o=r.anchorOffset,i=r.focusNode;r=r.focusOffset;try{n.nodeType,i.nodeType}catch{n=null;break e}var s=0,a=-1,l=-1,u=0,d=0,c=e,h=null;t:for(;;){for(var f;c!==n||o!==0&&c.nodeType!==3||(a=s+o),c!==i||r!==0&&c.nodeType!==3||(l=s+r),c.nodeType===3&&(s+=c.nodeValue.length),(f=c.firstChild)!==null;)h=c,c=f;for(;;){if(c===e)break t;if(h===n&&++u===o&&(a=s),h===i&&++d===r&&(l=s),(f=c.nextSibling)!==null)break;c=h,h=c.parentNode}c=f}n=a===-1||l===-1?null:{start:a,end:l}}else n=null}n=n||{start:0,end:0}}else n=null;for(cu={focusedElem:e,selectionRange:n},Ks=!1,$=t;$!==null;)if(t=$,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,$=e;else for(;$!==null;){t=$;try{var S=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(S!==null){var m=S.memoizedProps,x=S.memoizedState,g=t.stateNode,y=g.getSnapshotBeforeUpdate(t.elementType===t.type?m:jt(t.type,m),x);g.__reactInternalSnapshotBeforeUpdate=y}break;case 3:var w=t.stateNode.containerInfo;w.nodeType===1?w.textContent="":w.nodeType===9&&w.documentElement&&w.removeChild(w.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(A(163))}}catch(E){Ce(t,t.return,E)}if(e=t.sibling,e!==null){e.return=t.return,$=e;break}$=t.return}return S=Nf,Nf=!1,S}function ii(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var o=r=r.next;do{if((o.tag&e)===e){var i=o.destroy;o.destroy=void 0,i!==void 0&&Pu(t,n,i)}o=o.next}while(o!==r)}}function Na(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Ru(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function Fm(e){var t=e.alternate;t!==null&&(e.alternate=null,Fm(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[Yt],delete t[wi],delete t[pu],delete t[Qw],delete t[qw])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function zm(e){return e.tag===5||e.tag===3||e.tag===4}function Tf(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||zm(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Nu(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=Gs));else if(r!==4&&(e=e.child,e!==null))for(Nu(e,t,n),e=e.sibling;e!==null;)Nu(e,t,n),e=e.sibling}function Tu(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Tu(e,t,n),e=e.sibling;e!==null;)Tu(e,t,n),e=e.sibling}var Ie=null,Mt=!1;function Nn(e,t,n){for(n=n.child;n!==null;)$m(e,t,n),n=n.sibling}function $m(e,t,n){if(Zt&&typeof Zt.onCommitFiberUnmount=="function")try{Zt.onCommitFiberUnmount(xa,n)}catch{}switch(n.tag){case 5:Ue||Zr(n,t);case 6:var r=Ie,o=Mt;Ie=null,Nn(e,t,n),Ie=r,Mt=o,Ie!==null&&(Mt?(e=Ie,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):Ie.removeChild(n.stateNode));break;case 18:Ie!==null&&(Mt?(e=Ie,n=n.stateNode,e.nodeType===8?vl(e.parentNode,n):e.nodeType===1&&vl(e,n),hi(e)):vl(Ie,n.stateNode));break;case 4:r=Ie,o=Mt,Ie=n.stateNode.containerInfo,Mt=!0,Nn(e,t,n),Ie=r,Mt=o;break;case 0:case 11:case 14:case 15:if(!Ue&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){o=r=r.next;do{var i=o,s=i.destroy;i=i.tag,s!==void 0&&(i&2||i&4)&&Pu(n,t,s),o=o.next}while(o!==r)}Nn(e,t,n);break;case 1:if(!Ue&&(Zr(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(a){Ce(n,t,a)}Nn(e,t,n);break;case 21:Nn(e,t,n);break;case 22:n.mode&1?(Ue=(r=Ue)||n.memoizedState!==null,Nn(e,t,n),Ue=r):Nn(e,t,n);break;default:Nn(e,t,n)}}function jf(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new cx),t.forEach(function(r){var o=xx.bind(null,e,r);n.has(r)||(n.add(r),r.then(o,o))})}}function Nt(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var o=n[r];try{var i=e,s=t,a=s;e:for(;a!==null;){switch(a.tag){case 5:Ie=a.stateNode,Mt=!1;break e;case 3:Ie=a.stateNode.containerInfo,Mt=!0;break e;case 4:Ie=a.stateNode.containerInfo,Mt=!0;break e}a=a.return}if(Ie===null)throw Error(A(160));$m(i,s,o),Ie=null,Mt=!1;var l=o.alternate;l!==null&&(l.return=null),o.return=null}catch(u){Ce(o,t,u)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)Bm(t,e),t=t.sibling}function Bm(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Nt(t,e),Ht(e),r&4){try{ii(3,e,e.return),Na(3,e)}catch(m){Ce(e,e.return,m)}try{ii(5,e,e.return)}catch(m){Ce(e,e.return,m)}}break;case 1:Nt(t,e),Ht(e),r&512&&n!==null&&Zr(n,n.return);break;case 5:if(Nt(t,e),Ht(e),r&512&&n!==null&&Zr(n,n.return),e.flags&32){var o=e.stateNode;try{ci(o,"")}catch(m){Ce(e,e.return,m)}}if(r&4&&(o=e.stateNode,o!=null)){var i=e.memoizedProps,s=n!==null?n.memoizedProps:i,a=e.type,l=e.updateQueue;if(e.updateQueue=null,l!==null)try{a==="input"&&i.type==="radio"&&i.name!=null&&uh(o,i),Zl(a,s);var u=Zl(a,i);for(s=0;s<l.length;s+=2){var d=l[s],c=l[s+1];d==="style"?hh(o,c):d==="dangerouslySetInnerHTML"?fh(o,c):d==="children"?ci(o,c):sc(o,d,c,u)}switch(a){case"input":ql(o,i);break;case"textarea":ch(o,i);break;case"select":var h=o._wrapperState.wasMultiple;o._wrapperState.wasMultiple=!!i.multiple;var f=i.value;f!=null?to(o,!!i.multiple,f,!1):h!==!!i.multiple&&(i.defaultValue!=null?to(o,!!i.multiple,i.defaultValue,!0):to(o,!!i.multiple,i.multiple?[]:"",!1))}o[wi]=i}catch(m){Ce(e,e.return,m)}}break;case 6:if(Nt(t,e),Ht(e),r&4){if(e.stateNode===null)throw Error(A(162));o=e.stateNode,i=e.memoizedProps;try{o.nodeValue=i}catch(m){Ce(e,e.return,m)}}break;case 3:if(Nt(t,e),Ht(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{hi(t.containerInfo)}catch(m){Ce(e,e.return,m)}break;case 4:Nt(t,e),Ht(e);break;case 13:Nt(t,e),Ht(e),o=e.child,o.flags&8192&&(i=o.memoizedState!==null,o.stateNode.isHidden=i,!i||o.alternate!==null&&o.alternate.memoizedState!==null||(zc=Pe())),r&4&&jf(e);break;case 22:if(d=n!==null&&n.memoizedState!==null,e.mode&1?(Ue=(u=Ue)||d,Nt(t,e),Ue=u):Nt(t,e),Ht(e),r&8192){if(u=e.memoizedState!==null,(e.stateNode.isHidden=u)&&!d&&e.mode&1)for($=e,d=e.child;d!==null;){for(c=$=d;$!==null;){switch(h=$,f=h.child,h.tag){case 0:case 11:case 14:case 15:ii(4,h,h.return);break;case 1:Zr(h,h.return);var S=h.stateNode;if(typeof S.componentWillUnmount=="function"){r=h,n=h.return;try{t=r,S.props=t.memoizedProps,S.state=t.memoizedState,S.componentWillUnmount()}catch(m){Ce(r,n,m)}}break;case 5:Zr(h,h.return);break;case 22:if(h.memoizedState!==null){Af(c);continue}}f!==null?(f.return=h,$=f):Af(c)}d=d.sibling}e:for(d=null,c=e;;){if(c.tag===5){if(d===null){d=c;try{o=c.stateNode,u?(i=o.style,typeof i.setProperty=="function"?i.setProperty("display","none","important"):i.display="none"):(a=c.stateNode,l=c.memoizedProps.style,s=l!=null&&l.hasOwnProperty("display")?l.display:null,a.style.display=ph("display",s))}catch(m){Ce(e,e.return,m)}}}else if(c.tag===6){if(d===null)try{c.stateNode.nodeValue=u?"":c.memoizedProps}catch(m){Ce(e,e.return,m)}}else if((c.tag!==22&&c.tag!==23||c.memoizedState===null||c===e)&&c.child!==null){c.child.return=c,c=c.child;continue}if(c===e)break e;for(;c.sibling===null;){if(c.return===null||c.return===e)break e;d===c&&(d=null),c=c.return}d===c&&(d=null),c.sibling.return=c.return,c=c.sibling}}break;case 19:Nt(t,e),Ht(e),r&4&&jf(e);break;case 21:break;default:Nt(t,e),Ht(e)}}function Ht(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(zm(n)){var r=n;break e}n=n.return}throw Error(A(160))}switch(r.tag){case 5:var o=r.stateNode;r.flags&32&&(ci(o,""),r.flags&=-33);var i=Tf(e);Tu(e,i,o);break;case 3:case 4:var s=r.stateNode.containerInfo,a=Tf(e);Nu(e,a,s);break;default:throw Error(A(161))}}catch(l){Ce(e,e.return,l)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function fx(e,t,n){$=e,Um(e)}function Um(e,t,n){for(var r=(e.mode&1)!==0;$!==null;){var o=$,i=o.child;if(o.tag===22&&r){var s=o.memoizedState!==null||ds;if(!s){var a=o.alternate,l=a!==null&&a.memoizedState!==null||Ue;a=ds;var u=Ue;if(ds=s,(Ue=l)&&!u)for($=o;$!==null;)s=$,l=s.child,s.tag===22&&s.memoizedState!==null?Of(o):l!==null?(l.return=s,$=l):Of(o);for(;i!==null;)$=i,Um(i),i=i.sibling;$=o,ds=a,Ue=u}_f(e)}else o.subtreeFlags&8772&&i!==null?(i.return=o,$=i):_f(e)}}function _f(e){for(;$!==null;){var t=$;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:Ue||Na(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!Ue)if(n===null)r.componentDidMount();else{var o=t.elementType===t.type?n.memoizedProps:jt(t.type,n.memoizedProps);r.componentDidUpdate(o,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var i=t.updateQueue;i!==null&&mf(t,i,r);break;case 3:var s=t.updateQueue;if(s!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}mf(t,s,n)}break;case 5:var a=t.stateNode;if(n===null&&t.flags&4){n=a;var l=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":l.autoFocus&&n.focus();break;case"img":l.src&&(n.src=l.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var u=t.alternate;if(u!==null){var d=u.memoizedState;if(d!==null){var c=d.dehydrated;c!==null&&hi(c)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(A(163))}Ue||t.flags&512&&Ru(t)}catch(h){Ce(t,t.return,h)}}if(t===e){$=null;break}if(n=t.sibling,n!==null){n.return=t.return,$=n;break}$=t.return}}function Af(e){for(;$!==null;){var t=$;if(t===e){$=null;break}var n=t.sibling;if(n!==null){n.return=t.return,$=n;break}$=t.return}}function Of(e){for(;$!==null;){var t=$;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{Na(4,t)}catch(l){Ce(t,n,l)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var o=t.return;try{r.componentDidMount()}catch(l){Ce(t,o,l)}}var i=t.return;try{Ru(t)}catch(l){Ce(t,i,l)}break;case 5:var s=t.return;try{Ru(t)}catch(l){Ce(t,s,l)}}}catch(l){Ce(t,t.return,l)}if(t===e){$=null;break}var a=t.sibling;if(a!==null){a.return=t.return,$=a;break}$=t.return}}var px=Math.ceil,sa=Sn.ReactCurrentDispatcher,Lc=Sn.ReactCurrentOwner,wt=Sn.ReactCurrentBatchConfig,re=0,Oe=null,Ne=null,De=0,ot=0,eo=or(0),je=0,ki=null,Pr=0,Ta=0,Fc=0,si=null,Ze=null,zc=0,ko=1/0,ln=null,aa=!1,ju=null,Yn=null,fs=!1,Vn=null,la=0,ai=0,_u=null,As=-1,Os=0;function qe(){return re&6?Pe():As!==-1?As:As=Pe()}function Xn(e){return e.mode&1?re&2&&De!==0?De&-De:Yw.transition!==null?(Os===0&&(Os=Ph()),Os):(e=se,e!==0||(e=window.event,e=e===void 0?16:Oh(e.type)),e):1}function Lt(e,t,n,r){if(50<ai)throw ai=0,_u=null,Error(A(185));zi(e,n,r),(!(re&2)||e!==Oe)&&(e===Oe&&(!(re&2)&&(Ta|=n),je===4&&Dn(e,De)),rt(e,r),n===1&&re===0&&!(t.mode&1)&&(ko=Pe()+500,ka&&ir()))}function rt(e,t){var n=e.callbackNode;Y0(e,t);var r=Hs(e,e===Oe?De:0);if(r===0)n!==null&&Bd(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&Bd(n),t===1)e.tag===0?Gw(Mf.bind(null,e)):Jh(Mf.bind(null,e)),Hw(function(){!(re&6)&&ir()}),n=null;else{switch(Rh(r)){case 1:n=dc;break;case 4:n=bh;break;case 16:n=Ws;break;case 536870912:n=kh;break;default:n=Ws}n=Ym(n,Vm.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function Vm(e,t){if(As=-1,Os=0,re&6)throw Error(A(327));var n=e.callbackNode;if(so()&&e.callbackNode!==n)return null;var r=Hs(e,e===Oe?De:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=ua(e,r);else{t=r;var o=re;re|=2;var i=Hm();(Oe!==e||De!==t)&&(ln=null,ko=Pe()+500,xr(e,t));do try{vx();break}catch(a){Wm(e,a)}while(!0);bc(),sa.current=i,re=o,Ne!==null?t=0:(Oe=null,De=0,t=je)}if(t!==0){if(t===2&&(o=ou(e),o!==0&&(r=o,t=Au(e,o))),t===1)throw n=ki,xr(e,0),Dn(e,r),rt(e,Pe()),n;if(t===6)Dn(e,r);else{if(o=e.current.alternate,!(r&30)&&!hx(o)&&(t=ua(e,r),t===2&&(i=ou(e),i!==0&&(r=i,t=Au(e,i))),t===1))throw n=ki,xr(e,0),Dn(e,r),rt(e,Pe()),n;switch(e.finishedWork=o,e.finishedLanes=r,t){case 0:case 1:throw Error(A(345));case 2:cr(e,Ze,ln);break;case 3:if(Dn(e,r),(r&130023424)===r&&(t=zc+500-Pe(),10<t)){if(Hs(e,0)!==0)break;if(o=e.suspendedLanes,(o&r)!==r){qe(),e.pingedLanes|=e.suspendedLanes&o;break}e.timeoutHandle=fu(cr.bind(null,e,Ze,ln),t);break}cr(e,Ze,ln);break;case 4:if(Dn(e,r),(r&4194240)===r)break;for(t=e.eventTimes,o=-1;0<r;){var s=31-Dt(r);i=1<<s,s=t[s],s>o&&(o=s),r&=~i}if(r=o,r=Pe()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*px(r/1960))-r,10<r){e.timeoutHandle=fu(cr.bind(null,e,Ze,ln),r);break}cr(e,Ze,ln);break;case 5:cr(e,Ze,ln);break;default:throw Error(A(329))}}}return rt(e,Pe()),e.callbackNode===n?Vm.bind(null,e):null}function Au(e,t){var n=si;return e.current.memoizedState.isDehydrated&&(xr(e,t).flags|=256),e=ua(e,t),e!==2&&(t=Ze,Ze=n,t!==null&&Ou(t)),e}function Ou(e){Ze===null?Ze=e:Ze.push.apply(Ze,e)}function hx(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var o=n[r],i=o.getSnapshot;o=o.value;try{if(!Ft(i(),o))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Dn(e,t){for(t&=~Fc,t&=~Ta,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Dt(t),r=1<<n;e[n]=-1,t&=~r}}function Mf(e){if(re&6)throw Error(A(327));so();var t=Hs(e,0);if(!(t&1))return rt(e,Pe()),null;var n=ua(e,t);if(e.tag!==0&&n===2){var r=ou(e);r!==0&&(t=r,n=Au(e,r))}if(n===1)throw n=ki,xr(e,0),Dn(e,t),rt(e,Pe()),n;if(n===6)throw Error(A(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,cr(e,Ze,ln),rt(e,Pe()),null}function $c(e,t){var n=re;re|=1;try{return e(t)}finally{re=n,re===0&&(ko=Pe()+500,ka&&ir())}}function Rr(e){Vn!==null&&Vn.tag===0&&!(re&6)&&so();var t=re;re|=1;var n=wt.transition,r=se;try{if(wt.transition=null,se=1,e)return e()}finally{se=r,wt.transition=n,re=t,!(re&6)&&ir()}}function Bc(){ot=eo.current,fe(eo)}function xr(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,Ww(n)),Ne!==null)for(n=Ne.return;n!==null;){var r=n;switch(Sc(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Ys();break;case 3:Co(),fe(tt),fe(We),jc();break;case 5:Tc(r);break;case 4:Co();break;case 13:fe(ye);break;case 19:fe(ye);break;case 10:kc(r.type._context);break;case 22:case 23:Bc()}n=n.return}if(Oe=e,Ne=e=Jn(e.current,null),De=ot=t,je=0,ki=null,Fc=Ta=Pr=0,Ze=si=null,fr!==null){for(t=0;t<fr.length;t++)if(n=fr[t],r=n.interleaved,r!==null){n.interleaved=null;var o=r.next,i=n.pending;if(i!==null){var s=i.next;i.next=o,r.next=s}n.pending=r}fr=null}return e}function Wm(e,t){do{var n=Ne;try{if(bc(),Ts.current=ia,oa){for(var r=we.memoizedState;r!==null;){var o=r.queue;o!==null&&(o.pending=null),r=r.next}oa=!1}if(kr=0,Ae=Te=we=null,oi=!1,Ei=0,Lc.current=null,n===null||n.return===null){je=1,ki=t,Ne=null;break}e:{var i=e,s=n.return,a=n,l=t;if(t=De,a.flags|=32768,l!==null&&typeof l=="object"&&typeof l.then=="function"){var u=l,d=a,c=d.tag;if(!(d.mode&1)&&(c===0||c===11||c===15)){var h=d.alternate;h?(d.updateQueue=h.updateQueue,d.memoizedState=h.memoizedState,d.lanes=h.lanes):(d.updateQueue=null,d.memoizedState=null)}var f=Sf(s);if(f!==null){f.flags&=-257,Ef(f,s,a,i,t),f.mode&1&&xf(i,u,t),t=f,l=u;var S=t.updateQueue;if(S===null){var m=new Set;m.add(l),t.updateQueue=m}else S.add(l);break e}else{if(!(t&1)){xf(i,u,t),Uc();break e}l=Error(A(426))}}else if(ve&&a.mode&1){var x=Sf(s);if(x!==null){!(x.flags&65536)&&(x.flags|=256),Ef(x,s,a,i,t),Ec(bo(l,a));break e}}i=l=bo(l,a),je!==4&&(je=2),si===null?si=[i]:si.push(i),i=s;do{switch(i.tag){case 3:i.flags|=65536,t&=-t,i.lanes|=t;var g=Rm(i,l,t);hf(i,g);break e;case 1:a=l;var y=i.type,w=i.stateNode;if(!(i.flags&128)&&(typeof y.getDerivedStateFromError=="function"||w!==null&&typeof w.componentDidCatch=="function"&&(Yn===null||!Yn.has(w)))){i.flags|=65536,t&=-t,i.lanes|=t;var E=Nm(i,a,t);hf(i,E);break e}}i=i.return}while(i!==null)}Qm(n)}catch(C){t=C,Ne===n&&n!==null&&(Ne=n=n.return);continue}break}while(!0)}function Hm(){var e=sa.current;return sa.current=ia,e===null?ia:e}function Uc(){(je===0||je===3||je===2)&&(je=4),Oe===null||!(Pr&268435455)&&!(Ta&268435455)||Dn(Oe,De)}function ua(e,t){var n=re;re|=2;var r=Hm();(Oe!==e||De!==t)&&(ln=null,xr(e,t));do try{mx();break}catch(o){Wm(e,o)}while(!0);if(bc(),re=n,sa.current=r,Ne!==null)throw Error(A(261));return Oe=null,De=0,je}function mx(){for(;Ne!==null;)Km(Ne)}function vx(){for(;Ne!==null&&!B0();)Km(Ne)}function Km(e){var t=Gm(e.alternate,e,ot);e.memoizedProps=e.pendingProps,t===null?Qm(e):Ne=t,Lc.current=null}function Qm(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=ux(n,t),n!==null){n.flags&=32767,Ne=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{je=6,Ne=null;return}}else if(n=lx(n,t,ot),n!==null){Ne=n;return}if(t=t.sibling,t!==null){Ne=t;return}Ne=t=e}while(t!==null);je===0&&(je=5)}function cr(e,t,n){var r=se,o=wt.transition;try{wt.transition=null,se=1,gx(e,t,n,r)}finally{wt.transition=o,se=r}return null}function gx(e,t,n,r){do so();while(Vn!==null);if(re&6)throw Error(A(327));n=e.finishedWork;var o=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(A(177));e.callbackNode=null,e.callbackPriority=0;var i=n.lanes|n.childLanes;if(X0(e,i),e===Oe&&(Ne=Oe=null,De=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||fs||(fs=!0,Ym(Ws,function(){return so(),null})),i=(n.flags&15990)!==0,n.subtreeFlags&15990||i){i=wt.transition,wt.transition=null;var s=se;se=1;var a=re;re|=4,Lc.current=null,dx(e,n),Bm(n,e),Lw(cu),Ks=!!uu,cu=uu=null,e.current=n,fx(n),U0(),re=a,se=s,wt.transition=i}else e.current=n;if(fs&&(fs=!1,Vn=e,la=o),i=e.pendingLanes,i===0&&(Yn=null),H0(n.stateNode),rt(e,Pe()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)o=t[n],r(o.value,{componentStack:o.stack,digest:o.digest});if(aa)throw aa=!1,e=ju,ju=null,e;return la&1&&e.tag!==0&&so(),i=e.pendingLanes,i&1?e===_u?ai++:(ai=0,_u=e):ai=0,ir(),null}function so(){if(Vn!==null){var e=Rh(la),t=wt.transition,n=se;try{if(wt.transition=null,se=16>e?16:e,Vn===null)var r=!1;else{if(e=Vn,Vn=null,la=0,re&6)throw Error(A(331));var o=re;for(re|=4,$=e.current;$!==null;){var i=$,s=i.child;if($.flags&16){var a=i.deletions;if(a!==null){for(var l=0;l<a.length;l++){var u=a[l];for($=u;$!==null;){var d=$;switch(d.tag){case 0:case 11:case 15:ii(8,d,i)}var c=d.child;if(c!==null)c.return=d,$=c;else for(;$!==null;){d=$;var h=d.sibling,f=d.return;if(Fm(d),d===u){$=null;break}if(h!==null){h.return=f,$=h;break}$=f}}}var S=i.alternate;if(S!==null){var m=S.child;if(m!==null){S.child=null;do{var x=m.sibling;m.sibling=null,m=x}while(m!==null)}}$=i}}if(i.subtreeFlags&2064&&s!==null)s.return=i,$=s;else e:for(;$!==null;){if(i=$,i.flags&2048)switch(i.tag){case 0:case 11:case 15:ii(9,i,i.return)}var g=i.sibling;if(g!==null){g.return=i.return,$=g;break e}$=i.return}}var y=e.current;for($=y;$!==null;){s=$;var w=s.child;if(s.subtreeFlags&2064&&w!==null)w.return=s,$=w;else e:for(s=y;$!==null;){if(a=$,a.flags&2048)try{switch(a.tag){case 0:case 11:case 15:Na(9,a)}}catch(C){Ce(a,a.return,C)}if(a===s){$=null;break e}var E=a.sibling;if(E!==null){E.return=a.return,$=E;break e}$=a.return}}if(re=o,ir(),Zt&&typeof Zt.onPostCommitFiberRoot=="function")try{Zt.onPostCommitFiberRoot(xa,e)}catch{}r=!0}return r}finally{se=n,wt.transition=t}}return!1}function If(e,t,n){t=bo(n,t),t=Rm(e,t,1),e=Gn(e,t,1),t=qe(),e!==null&&(zi(e,1,t),rt(e,t))}function Ce(e,t,n){if(e.tag===3)If(e,e,n);else for(;t!==null;){if(t.tag===3){If(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(Yn===null||!Yn.has(r))){e=bo(n,e),e=Nm(t,e,1),t=Gn(t,e,1),e=qe(),t!==null&&(zi(t,1,e),rt(t,e));break}}t=t.return}}function yx(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=qe(),e.pingedLanes|=e.suspendedLanes&n,Oe===e&&(De&n)===n&&(je===4||je===3&&(De&130023424)===De&&500>Pe()-zc?xr(e,0):Fc|=n),rt(e,t)}function qm(e,t){t===0&&(e.mode&1?(t=ns,ns<<=1,!(ns&130023424)&&(ns=4194304)):t=1);var n=qe();e=vn(e,t),e!==null&&(zi(e,t,n),rt(e,n))}function wx(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),qm(e,n)}function xx(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,o=e.memoizedState;o!==null&&(n=o.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(A(314))}r!==null&&r.delete(t),qm(e,n)}var Gm;Gm=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||tt.current)et=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return et=!1,ax(e,t,n);et=!!(e.flags&131072)}else et=!1,ve&&t.flags&1048576&&Zh(t,Zs,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;_s(e,t),e=t.pendingProps;var o=xo(t,We.current);io(t,n),o=Ac(null,t,r,e,o,n);var i=Oc();return t.flags|=1,typeof o=="object"&&o!==null&&typeof o.render=="function"&&o.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,nt(r)?(i=!0,Xs(t)):i=!1,t.memoizedState=o.state!==null&&o.state!==void 0?o.state:null,Rc(t),o.updater=Ra,t.stateNode=o,o._reactInternals=t,wu(t,r,e,n),t=Eu(null,t,r,!0,i,n)):(t.tag=0,ve&&i&&xc(t),Ke(null,t,o,n),t=t.child),t;case 16:r=t.elementType;e:{switch(_s(e,t),e=t.pendingProps,o=r._init,r=o(r._payload),t.type=r,o=t.tag=Ex(r),e=jt(r,e),o){case 0:t=Su(null,t,r,e,n);break e;case 1:t=kf(null,t,r,e,n);break e;case 11:t=Cf(null,t,r,e,n);break e;case 14:t=bf(null,t,r,jt(r.type,e),n);break e}throw Error(A(306,r,""))}return t;case 0:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:jt(r,o),Su(e,t,r,o,n);case 1:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:jt(r,o),kf(e,t,r,o,n);case 3:e:{if(Am(t),e===null)throw Error(A(387));r=t.pendingProps,i=t.memoizedState,o=i.element,im(e,t),na(t,r,null,n);var s=t.memoizedState;if(r=s.element,i.isDehydrated)if(i={element:r,isDehydrated:!1,cache:s.cache,pendingSuspenseBoundaries:s.pendingSuspenseBoundaries,transitions:s.transitions},t.updateQueue.baseState=i,t.memoizedState=i,t.flags&256){o=bo(Error(A(423)),t),t=Pf(e,t,r,n,o);break e}else if(r!==o){o=bo(Error(A(424)),t),t=Pf(e,t,r,n,o);break e}else for(st=qn(t.stateNode.containerInfo.firstChild),at=t,ve=!0,It=null,n=rm(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(So(),r===o){t=gn(e,t,n);break e}Ke(e,t,r,n)}t=t.child}return t;case 5:return sm(t),e===null&&vu(t),r=t.type,o=t.pendingProps,i=e!==null?e.memoizedProps:null,s=o.children,du(r,o)?s=null:i!==null&&du(r,i)&&(t.flags|=32),_m(e,t),Ke(e,t,s,n),t.child;case 6:return e===null&&vu(t),null;case 13:return Om(e,t,n);case 4:return Nc(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=Eo(t,null,r,n):Ke(e,t,r,n),t.child;case 11:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:jt(r,o),Cf(e,t,r,o,n);case 7:return Ke(e,t,t.pendingProps,n),t.child;case 8:return Ke(e,t,t.pendingProps.children,n),t.child;case 12:return Ke(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,o=t.pendingProps,i=t.memoizedProps,s=o.value,ue(ea,r._currentValue),r._currentValue=s,i!==null)if(Ft(i.value,s)){if(i.children===o.children&&!tt.current){t=gn(e,t,n);break e}}else for(i=t.child,i!==null&&(i.return=t);i!==null;){var a=i.dependencies;if(a!==null){s=i.child;for(var l=a.firstContext;l!==null;){if(l.context===r){if(i.tag===1){l=pn(-1,n&-n),l.tag=2;var u=i.updateQueue;if(u!==null){u=u.shared;var d=u.pending;d===null?l.next=l:(l.next=d.next,d.next=l),u.pending=l}}i.lanes|=n,l=i.alternate,l!==null&&(l.lanes|=n),gu(i.return,n,t),a.lanes|=n;break}l=l.next}}else if(i.tag===10)s=i.type===t.type?null:i.child;else if(i.tag===18){if(s=i.return,s===null)throw Error(A(341));s.lanes|=n,a=s.alternate,a!==null&&(a.lanes|=n),gu(s,n,t),s=i.sibling}else s=i.child;if(s!==null)s.return=i;else for(s=i;s!==null;){if(s===t){s=null;break}if(i=s.sibling,i!==null){i.return=s.return,s=i;break}s=s.return}i=s}Ke(e,t,o.children,n),t=t.child}return t;case 9:return o=t.type,r=t.pendingProps.children,io(t,n),o=xt(o),r=r(o),t.flags|=1,Ke(e,t,r,n),t.child;case 14:return r=t.type,o=jt(r,t.pendingProps),o=jt(r.type,o),bf(e,t,r,o,n);case 15:return Tm(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:jt(r,o),_s(e,t),t.tag=1,nt(r)?(e=!0,Xs(t)):e=!1,io(t,n),Pm(t,r,o),wu(t,r,o,n),Eu(null,t,r,!0,e,n);case 19:return Mm(e,t,n);case 22:return jm(e,t,n)}throw Error(A(156,t.tag))};function Ym(e,t){return Ch(e,t)}function Sx(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function yt(e,t,n,r){return new Sx(e,t,n,r)}function Vc(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Ex(e){if(typeof e=="function")return Vc(e)?1:0;if(e!=null){if(e=e.$$typeof,e===lc)return 11;if(e===uc)return 14}return 2}function Jn(e,t){var n=e.alternate;return n===null?(n=yt(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Ms(e,t,n,r,o,i){var s=2;if(r=e,typeof e=="function")Vc(e)&&(s=1);else if(typeof e=="string")s=5;else e:switch(e){case Wr:return Sr(n.children,o,i,t);case ac:s=8,o|=8;break;case Vl:return e=yt(12,n,t,o|2),e.elementType=Vl,e.lanes=i,e;case Wl:return e=yt(13,n,t,o),e.elementType=Wl,e.lanes=i,e;case Hl:return e=yt(19,n,t,o),e.elementType=Hl,e.lanes=i,e;case sh:return ja(n,o,i,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case oh:s=10;break e;case ih:s=9;break e;case lc:s=11;break e;case uc:s=14;break e;case On:s=16,r=null;break e}throw Error(A(130,e==null?e:typeof e,""))}return t=yt(s,n,t,o),t.elementType=e,t.type=r,t.lanes=i,t}function Sr(e,t,n,r){return e=yt(7,e,r,t),e.lanes=n,e}function ja(e,t,n,r){return e=yt(22,e,r,t),e.elementType=sh,e.lanes=n,e.stateNode={isHidden:!1},e}function bl(e,t,n){return e=yt(6,e,null,t),e.lanes=n,e}function kl(e,t,n){return t=yt(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Cx(e,t,n,r,o){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=il(0),this.expirationTimes=il(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=il(0),this.identifierPrefix=r,this.onRecoverableError=o,this.mutableSourceEagerHydrationData=null}function Wc(e,t,n,r,o,i,s,a,l){return e=new Cx(e,t,n,a,l),t===1?(t=1,i===!0&&(t|=8)):t=0,i=yt(3,null,null,t),e.current=i,i.stateNode=e,i.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Rc(i),e}function bx(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Vr,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function Xm(e){if(!e)return er;e=e._reactInternals;e:{if(_r(e)!==e||e.tag!==1)throw Error(A(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(nt(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(A(171))}if(e.tag===1){var n=e.type;if(nt(n))return Xh(e,n,t)}return t}function Jm(e,t,n,r,o,i,s,a,l){return e=Wc(n,r,!0,e,o,i,s,a,l),e.context=Xm(null),n=e.current,r=qe(),o=Xn(n),i=pn(r,o),i.callback=t??null,Gn(n,i,o),e.current.lanes=o,zi(e,o,r),rt(e,r),e}function _a(e,t,n,r){var o=t.current,i=qe(),s=Xn(o);return n=Xm(n),t.context===null?t.context=n:t.pendingContext=n,t=pn(i,s),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=Gn(o,t,s),e!==null&&(Lt(e,o,s,i),Ns(e,o,s)),s}function ca(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function Df(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Hc(e,t){Df(e,t),(e=e.alternate)&&Df(e,t)}function kx(){return null}var Zm=typeof reportError=="function"?reportError:function(e){console.error(e)};function Kc(e){this._internalRoot=e}Aa.prototype.render=Kc.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(A(409));_a(e,t,null,null)};Aa.prototype.unmount=Kc.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Rr(function(){_a(null,e,null,null)}),t[mn]=null}};function Aa(e){this._internalRoot=e}Aa.prototype.unstable_scheduleHydration=function(e){if(e){var t=jh();e={blockedOn:null,target:e,priority:t};for(var n=0;n<In.length&&t!==0&&t<In[n].priority;n++);In.splice(n,0,e),n===0&&Ah(e)}};function Qc(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function Oa(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function Lf(){}function Px(e,t,n,r,o){if(o){if(typeof r=="function"){var i=r;r=function(){var u=ca(s);i.call(u)}}var s=Jm(t,r,e,0,null,!1,!1,"",Lf);return e._reactRootContainer=s,e[mn]=s.current,gi(e.nodeType===8?e.parentNode:e),Rr(),s}for(;o=e.lastChild;)e.removeChild(o);if(typeof r=="function"){var a=r;r=function(){var u=ca(l);a.call(u)}}var l=Wc(e,0,!1,null,null,!1,!1,"",Lf);return e._reactRootContainer=l,e[mn]=l.current,gi(e.nodeType===8?e.parentNode:e),Rr(function(){_a(t,l,n,r)}),l}function Ma(e,t,n,r,o){var i=n._reactRootContainer;if(i){var s=i;if(typeof o=="function"){var a=o;o=function(){var l=ca(s);a.call(l)}}_a(t,s,e,o)}else s=Px(n,t,e,o,r);return ca(s)}Nh=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=Yo(t.pendingLanes);n!==0&&(fc(t,n|1),rt(t,Pe()),!(re&6)&&(ko=Pe()+500,ir()))}break;case 13:Rr(function(){var r=vn(e,1);if(r!==null){var o=qe();Lt(r,e,1,o)}}),Hc(e,1)}};pc=function(e){if(e.tag===13){var t=vn(e,134217728);if(t!==null){var n=qe();Lt(t,e,134217728,n)}Hc(e,134217728)}};Th=function(e){if(e.tag===13){var t=Xn(e),n=vn(e,t);if(n!==null){var r=qe();Lt(n,e,t,r)}Hc(e,t)}};jh=function(){return se};_h=function(e,t){var n=se;try{return se=e,t()}finally{se=n}};tu=function(e,t,n){switch(t){case"input":if(ql(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var o=ba(r);if(!o)throw Error(A(90));lh(r),ql(r,o)}}}break;case"textarea":ch(e,n);break;case"select":t=n.value,t!=null&&to(e,!!n.multiple,t,!1)}};gh=$c;yh=Rr;var Rx={usingClientEntryPoint:!1,Events:[Bi,qr,ba,mh,vh,$c]},Ho={findFiberByHostInstance:dr,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},Nx={bundleType:Ho.bundleType,version:Ho.version,rendererPackageName:Ho.rendererPackageName,rendererConfig:Ho.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:Sn.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Sh(e),e===null?null:e.stateNode},findFiberByHostInstance:Ho.findFiberByHostInstance||kx,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var ps=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!ps.isDisabled&&ps.supportsFiber)try{xa=ps.inject(Nx),Zt=ps}catch{}}ct.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Rx;ct.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Qc(t))throw Error(A(200));return bx(e,t,null,n)};ct.createRoot=function(e,t){if(!Qc(e))throw Error(A(299));var n=!1,r="",o=Zm;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(o=t.onRecoverableError)),t=Wc(e,1,!1,null,null,n,!1,r,o),e[mn]=t.current,gi(e.nodeType===8?e.parentNode:e),new Kc(t)};ct.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(A(188)):(e=Object.keys(e).join(","),Error(A(268,e)));return e=Sh(t),e=e===null?null:e.stateNode,e};ct.flushSync=function(e){return Rr(e)};ct.hydrate=function(e,t,n){if(!Oa(t))throw Error(A(200));return Ma(null,e,t,!0,n)};ct.hydrateRoot=function(e,t,n){if(!Qc(e))throw Error(A(405));var r=n!=null&&n.hydratedSources||null,o=!1,i="",s=Zm;if(n!=null&&(n.unstable_strictMode===!0&&(o=!0),n.identifierPrefix!==void 0&&(i=n.identifierPrefix),n.onRecoverableError!==void 0&&(s=n.onRecoverableError)),t=Jm(t,null,e,1,n??null,o,!1,i,s),e[mn]=t.current,gi(e),r)for(e=0;e<r.length;e++)n=r[e],o=n._getVersion,o=o(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,o]:t.mutableSourceEagerHydrationData.push(n,o);return new Aa(t)};ct.render=function(e,t,n){if(!Oa(t))throw Error(A(200));return Ma(null,e,t,!1,n)};ct.unmountComponentAtNode=function(e){if(!Oa(e))throw Error(A(40));return e._reactRootContainer?(Rr(function(){Ma(null,null,e,!1,function(){e._reactRootContainer=null,e[mn]=null})}),!0):!1};ct.unstable_batchedUpdates=$c;ct.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Oa(n))throw Error(A(200));if(e==null||e._reactInternals===void 0)throw Error(A(38));return Ma(e,t,n,!1,r)};ct.version="18.3.1-next-f1338f8080-20240426";function ev(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(ev)}catch(e){console.error(e)}}ev(),eh.exports=ct;var Vi=eh.exports;const tv=Up(Vi);var nv,Ff=Vi;nv=Ff.createRoot,Ff.hydrateRoot;const Tx=1,jx=1e6;let Pl=0;function _x(){return Pl=(Pl+1)%Number.MAX_SAFE_INTEGER,Pl.toString()}const Rl=new Map,zf=e=>{if(Rl.has(e))return;const t=setTimeout(()=>{Rl.delete(e),li({type:"REMOVE_TOAST",toastId:e})},jx);Rl.set(e,t)},Ax=(e,t)=>{switch(t.type){case"ADD_TOAST":return{...e,toasts:[t.toast,...e.toasts].slice(0,Tx)};case"UPDATE_TOAST":return{...e,toasts:e.toasts.map(n=>n.id===t.toast.id?{...n,...t.toast}:n)};case"DISMISS_TOAST":{const{toastId:n}=t;return n?zf(n):e.toasts.forEach(r=>{zf(r.id)}),{...e,toasts:e.toasts.map(r=>r.id===n||n===void 0?{...r,open:!1}:r)}}case"REMOVE_TOAST":return t.toastId===void 0?{...e,toasts:[]}:{...e,toasts:e.toasts.filter(n=>n.id!==t.toastId)}}},Is=[];let Ds={toasts:[]};function li(e){Ds=Ax(Ds,e),Is.forEach(t=>{t(Ds)})}function Ox({...e}){const t=_x(),n=o=>li({type:"UPDATE_TOAST",toast:{...o,id:t}}),r=()=>li({type:"DISMISS_TOAST",toastId:t});return li({type:"ADD_TOAST",toast:{...e,id:t,open:!0,onOpenChange:o=>{o||r()}}}),{id:t,dismiss:r,update:n}}function Mx(){const[e,t]=p.useState(Ds);return p.useEffect(()=>(Is.push(t),()=>{const n=Is.indexOf(t);n>-1&&Is.splice(n,1)}),[e]),{...e,toast:Ox,dismiss:n=>li({type:"DISMISS_TOAST",toastId:n})}}function Z(e,t,{checkForDefaultPrevented:n=!0}={}){return function(o){if(e==null||e(o),n===!1||!o.defaultPrevented)return t==null?void 0:t(o)}}function $f(e,t){if(typeof e=="function")return e(t);e!=null&&(e.current=t)}function rv(...e){return t=>{let n=!1;const r=e.map(o=>{const i=$f(o,t);return!n&&typeof i=="function"&&(n=!0),i});if(n)return()=>{for(let o=0;o<r.length;o++){const i=r[o];typeof i=="function"?i():$f(e[o],null)}}}}function pe(...e){return p.useCallback(rv(...e),e)}function Ix(e,t){const n=p.createContext(t),r=i=>{const{children:s,...a}=i,l=p.useMemo(()=>a,Object.values(a));return v.jsx(n.Provider,{value:l,children:s})};r.displayName=e+"Provider";function o(i){const s=p.useContext(n);if(s)return s;if(t!==void 0)return t;throw new Error(`\`${i}\` must be used within \`${e}\``)}return[r,o]}function En(e,t=[]){let n=[];function r(i,s){const a=p.createContext(s),l=n.length;n=[...n,s];const u=c=>{var g;const{scope:h,children:f,...S}=c,m=((g=h==null?void 0:h[e])==null?void 0:g[l])||a,x=p.useMemo(()=>S,Object.values(S));return v.jsx(m.Provider,{value:x,children:f})};u.displayName=i+"Provider";function d(c,h){var m;const f=((m=h==null?void 0:h[e])==null?void 0:m[l])||a,S=p.useContext(f);if(S)return S;if(s!==void 0)return s;throw new Error(`\`${c}\` must be used within \`${i}\``)}return[u,d]}const o=()=>{const i=n.map(s=>p.createContext(s));return function(a){const l=(a==null?void 0:a[e])||i;return p.useMemo(()=>({[`__scope${e}`]:{...a,[e]:l}}),[a,l])}};return o.scopeName=e,[r,Dx(o,...t)]}function Dx(...e){const t=e[0];if(e.length===1)return t;const n=()=>{const r=e.map(o=>({useScope:o(),scopeName:o.scopeName}));return function(i){const s=r.reduce((a,{useScope:l,scopeName:u})=>{const c=l(i)[`__scope${u}`];return{...a,...c}},{});return p.useMemo(()=>({[`__scope${t.scopeName}`]:s}),[s])}};return n.scopeName=t.scopeName,n}function Pi(e){const t=Fx(e),n=p.forwardRef((r,o)=>{const{children:i,...s}=r,a=p.Children.toArray(i),l=a.find($x);if(l){const u=l.props.children,d=a.map(c=>c===l?p.Children.count(u)>1?p.Children.only(null):p.isValidElement(u)?u.props.children:null:c);return v.jsx(t,{...s,ref:o,children:p.isValidElement(u)?p.cloneElement(u,void 0,d):null})}return v.jsx(t,{...s,ref:o,children:i})});return n.displayName=`${e}.Slot`,n}var Lx=Pi("Slot");function Fx(e){const t=p.forwardRef((n,r)=>{const{children:o,...i}=n;if(p.isValidElement(o)){const s=Ux(o),a=Bx(i,o.props);return o.type!==p.Fragment&&(a.ref=r?rv(r,s):s),p.cloneElement(o,a)}return p.Children.count(o)>1?p.Children.only(null):null});return t.displayName=`${e}.SlotClone`,t}var ov=Symbol("radix.slottable");function zx(e){const t=({children:n})=>v.jsx(v.Fragment,{children:n});return t.displayName=`${e}.Slottable`,t.__radixId=ov,t}function $x(e){return p.isValidElement(e)&&typeof e.type=="function"&&"__radixId"in e.type&&e.type.__radixId===ov}function Bx(e,t){const n={...t};for(const r in t){const o=e[r],i=t[r];/^on[A-Z]/.test(r)?o&&i?n[r]=(...a)=>{const l=i(...a);return o(...a),l}:o&&(n[r]=o):r==="style"?n[r]={...o,...i}:r==="className"&&(n[r]=[o,i].filter(Boolean).join(" "))}return{...e,...n}}function Ux(e){var r,o;let t=(r=Object.getOwnPropertyDescriptor(e.props,"ref"))==null?void 0:r.get,n=t&&"isReactWarning"in t&&t.isReactWarning;return n?e.ref:(t=(o=Object.getOwnPropertyDescriptor(e,"ref"))==null?void 0:o.get,n=t&&"isReactWarning"in t&&t.isReactWarning,n?e.props.ref:e.props.ref||e.ref)}function qc(e){const t=e+"CollectionProvider",[n,r]=En(t),[o,i]=n(t,{collectionRef:{current:null},itemMap:new Map}),s=m=>{const{scope:x,children:g}=m,y=M.useRef(null),w=M.useRef(new Map).current;return v.jsx(o,{scope:x,itemMap:w,collectionRef:y,children:g})};s.displayName=t;const a=e+"CollectionSlot",l=Pi(a),u=M.forwardRef((m,x)=>{const{scope:g,children:y}=m,w=i(a,g),E=pe(x,w.collectionRef);return v.jsx(l,{ref:E,children:y})});u.displayName=a;const d=e+"CollectionItemSlot",c="data-radix-collection-item",h=Pi(d),f=M.forwardRef((m,x)=>{const{scope:g,children:y,...w}=m,E=M.useRef(null),C=pe(x,E),b=i(d,g);return M.useEffect(()=>(b.itemMap.set(E,{ref:E,...w}),()=>void b.itemMap.delete(E))),v.jsx(h,{[c]:"",ref:C,children:y})});f.displayName=d;function S(m){const x=i(e+"CollectionConsumer",m);return M.useCallback(()=>{const y=x.collectionRef.current;if(!y)return[];const w=Array.from(y.querySelectorAll(`[${c}]`));return Array.from(x.itemMap.values()).sort((b,k)=>w.indexOf(b.ref.current)-w.indexOf(k.ref.current))},[x.collectionRef,x.itemMap])}return[{Provider:s,Slot:u,ItemSlot:f},S,r]}var Vx=["a","button","div","form","h2","h3","img","input","label","li","nav","ol","p","select","span","svg","ul"],ie=Vx.reduce((e,t)=>{const n=Pi(`Primitive.${t}`),r=p.forwardRef((o,i)=>{const{asChild:s,...a}=o,l=s?n:t;return typeof window<"u"&&(window[Symbol.for("radix-ui")]=!0),v.jsx(l,{...a,ref:i})});return r.displayName=`Primitive.${t}`,{...e,[t]:r}},{});function iv(e,t){e&&Vi.flushSync(()=>e.dispatchEvent(t))}function zt(e){const t=p.useRef(e);return p.useEffect(()=>{t.current=e}),p.useMemo(()=>(...n)=>{var r;return(r=t.current)==null?void 0:r.call(t,...n)},[])}function Wx(e,t=globalThis==null?void 0:globalThis.document){const n=zt(e);p.useEffect(()=>{const r=o=>{o.key==="Escape"&&n(o)};return t.addEventListener("keydown",r,{capture:!0}),()=>t.removeEventListener("keydown",r,{capture:!0})},[n,t])}var Hx="DismissableLayer",Mu="dismissableLayer.update",Kx="dismissableLayer.pointerDownOutside",Qx="dismissableLayer.focusOutside",Bf,sv=p.createContext({layers:new Set,layersWithOutsidePointerEventsDisabled:new Set,branches:new Set}),Ia=p.forwardRef((e,t)=>{const{disableOutsidePointerEvents:n=!1,onEscapeKeyDown:r,onPointerDownOutside:o,onFocusOutside:i,onInteractOutside:s,onDismiss:a,...l}=e,u=p.useContext(sv),[d,c]=p.useState(null),h=(d==null?void 0:d.ownerDocument)??(globalThis==null?void 0:globalThis.document),[,f]=p.useState({}),S=pe(t,k=>c(k)),m=Array.from(u.layers),[x]=[...u.layersWithOutsidePointerEventsDisabled].slice(-1),g=m.indexOf(x),y=d?m.indexOf(d):-1,w=u.layersWithOutsidePointerEventsDisabled.size>0,E=y>=g,C=Gx(k=>{const P=k.target,O=[...u.branches].some(_=>_.contains(P));!E||O||(o==null||o(k),s==null||s(k),k.defaultPrevented||a==null||a())},h),b=Yx(k=>{const P=k.target;[...u.branches].some(_=>_.contains(P))||(i==null||i(k),s==null||s(k),k.defaultPrevented||a==null||a())},h);return Wx(k=>{y===u.layers.size-1&&(r==null||r(k),!k.defaultPrevented&&a&&(k.preventDefault(),a()))},h),p.useEffect(()=>{if(d)return n&&(u.layersWithOutsidePointerEventsDisabled.size===0&&(Bf=h.body.style.pointerEvents,h.body.style.pointerEvents="none"),u.layersWithOutsidePointerEventsDisabled.add(d)),u.layers.add(d),Uf(),()=>{n&&u.layersWithOutsidePointerEventsDisabled.size===1&&(h.body.style.pointerEvents=Bf)}},[d,h,n,u]),p.useEffect(()=>()=>{d&&(u.layers.delete(d),u.layersWithOutsidePointerEventsDisabled.delete(d),Uf())},[d,u]),p.useEffect(()=>{const k=()=>f({});return document.addEventListener(Mu,k),()=>document.removeEventListener(Mu,k)},[]),v.jsx(ie.div,{...l,ref:S,style:{pointerEvents:w?E?"auto":"none":void 0,...e.style},onFocusCapture:Z(e.onFocusCapture,b.onFocusCapture),onBlurCapture:Z(e.onBlurCapture,b.onBlurCapture),onPointerDownCapture:Z(e.onPointerDownCapture,C.onPointerDownCapture)})});Ia.displayName=Hx;var qx="DismissableLayerBranch",av=p.forwardRef((e,t)=>{const n=p.useContext(sv),r=p.useRef(null),o=pe(t,r);return p.useEffect(()=>{const i=r.current;if(i)return n.branches.add(i),()=>{n.branches.delete(i)}},[n.branches]),v.jsx(ie.div,{...e,ref:o})});av.displayName=qx;function Gx(e,t=globalThis==null?void 0:globalThis.document){const n=zt(e),r=p.useRef(!1),o=p.useRef(()=>{});return p.useEffect(()=>{const i=a=>{if(a.target&&!r.current){let l=function(){lv(Kx,n,u,{discrete:!0})};const u={originalEvent:a};a.pointerType==="touch"?(t.removeEventListener("click",o.current),o.current=l,t.addEventListener("click",o.current,{once:!0})):l()}else t.removeEventListener("click",o.current);r.current=!1},s=window.setTimeout(()=>{t.addEventListener("pointerdown",i)},0);return()=>{window.clearTimeout(s),t.removeEventListener("pointerdown",i),t.removeEventListener("click",o.current)}},[t,n]),{onPointerDownCapture:()=>r.current=!0}}function Yx(e,t=globalThis==null?void 0:globalThis.document){const n=zt(e),r=p.useRef(!1);return p.useEffect(()=>{const o=i=>{i.target&&!r.current&&lv(Qx,n,{originalEvent:i},{discrete:!1})};return t.addEventListener("focusin",o),()=>t.removeEventListener("focusin",o)},[t,n]),{onFocusCapture:()=>r.current=!0,onBlurCapture:()=>r.current=!1}}function Uf(){const e=new CustomEvent(Mu);document.dispatchEvent(e)}function lv(e,t,n,{discrete:r}){const o=n.originalEvent.target,i=new CustomEvent(e,{bubbles:!1,cancelable:!0,detail:n});t&&o.addEventListener(e,t,{once:!0}),r?iv(o,i):o.dispatchEvent(i)}var Xx=Ia,Jx=av,yn=globalThis!=null&&globalThis.document?p.useLayoutEffect:()=>{},Zx="Portal",Gc=p.forwardRef((e,t)=>{var a;const{container:n,...r}=e,[o,i]=p.useState(!1);yn(()=>i(!0),[]);const s=n||o&&((a=globalThis==null?void 0:globalThis.document)==null?void 0:a.body);return s?tv.createPortal(v.jsx(ie.div,{...r,ref:t}),s):null});Gc.displayName=Zx;function e1(e,t){return p.useReducer((n,r)=>t[n][r]??n,e)}var Ar=e=>{const{present:t,children:n}=e,r=t1(t),o=typeof n=="function"?n({present:r.isPresent}):p.Children.only(n),i=pe(r.ref,n1(o));return typeof n=="function"||r.isPresent?p.cloneElement(o,{ref:i}):null};Ar.displayName="Presence";function t1(e){const[t,n]=p.useState(),r=p.useRef(null),o=p.useRef(e),i=p.useRef("none"),s=e?"mounted":"unmounted",[a,l]=e1(s,{mounted:{UNMOUNT:"unmounted",ANIMATION_OUT:"unmountSuspended"},unmountSuspended:{MOUNT:"mounted",ANIMATION_END:"unmounted"},unmounted:{MOUNT:"mounted"}});return p.useEffect(()=>{const u=hs(r.current);i.current=a==="mounted"?u:"none"},[a]),yn(()=>{const u=r.current,d=o.current;if(d!==e){const h=i.current,f=hs(u);e?l("MOUNT"):f==="none"||(u==null?void 0:u.display)==="none"?l("UNMOUNT"):l(d&&h!==f?"ANIMATION_OUT":"UNMOUNT"),o.current=e}},[e,l]),yn(()=>{if(t){let u;const d=t.ownerDocument.defaultView??window,c=f=>{const m=hs(r.current).includes(f.animationName);if(f.target===t&&m&&(l("ANIMATION_END"),!o.current)){const x=t.style.animationFillMode;t.style.animationFillMode="forwards",u=d.setTimeout(()=>{t.style.animationFillMode==="forwards"&&(t.style.animationFillMode=x)})}},h=f=>{f.target===t&&(i.current=hs(r.current))};return t.addEventListener("animationstart",h),t.addEventListener("animationcancel",c),t.addEventListener("animationend",c),()=>{d.clearTimeout(u),t.removeEventListener("animationstart",h),t.removeEventListener("animationcancel",c),t.removeEventListener("animationend",c)}}else l("ANIMATION_END")},[t,l]),{isPresent:["mounted","unmountSuspended"].includes(a),ref:p.useCallback(u=>{r.current=u?getComputedStyle(u):null,n(u)},[])}}function hs(e){return(e==null?void 0:e.animationName)||"none"}function n1(e){var r,o;let t=(r=Object.getOwnPropertyDescriptor(e.props,"ref"))==null?void 0:r.get,n=t&&"isReactWarning"in t&&t.isReactWarning;return n?e.ref:(t=(o=Object.getOwnPropertyDescriptor(e,"ref"))==null?void 0:o.get,n=t&&"isReactWarning"in t&&t.isReactWarning,n?e.props.ref:e.props.ref||e.ref)}var r1=rc[" useInsertionEffect ".trim().toString()]||yn;function Wi({prop:e,defaultProp:t,onChange:n=()=>{},caller:r}){const[o,i,s]=o1({defaultProp:t,onChange:n}),a=e!==void 0,l=a?e:o;{const d=p.useRef(e!==void 0);p.useEffect(()=>{const c=d.current;c!==a&&console.warn(`${r} is changing from ${c?"controlled":"uncontrolled"} to ${a?"controlled":"uncontrolled"}. Components should not switch from controlled to uncontrolled (or vice versa). Decide between using a controlled or uncontrolled value for the lifetime of the component.`),d.current=a},[a,r])}const u=p.useCallback(d=>{var c;if(a){const h=i1(d)?d(e):d;h!==e&&((c=s.current)==null||c.call(s,h))}else i(d)},[a,e,i,s]);return[l,u]}function o1({defaultProp:e,onChange:t}){const[n,r]=p.useState(e),o=p.useRef(n),i=p.useRef(t);return r1(()=>{i.current=t},[t]),p.useEffect(()=>{var s;o.current!==n&&((s=i.current)==null||s.call(i,n),o.current=n)},[n,o]),[n,r,i]}function i1(e){return typeof e=="function"}var s1=Object.freeze({position:"absolute",border:0,width:1,height:1,padding:0,margin:-1,overflow:"hidden",clip:"rect(0, 0, 0, 0)",whiteSpace:"nowrap",wordWrap:"normal"}),a1="VisuallyHidden",Da=p.forwardRef((e,t)=>v.jsx(ie.span,{...e,ref:t,style:{...s1,...e.style}}));Da.displayName=a1;var l1=Da,Yc="ToastProvider",[Xc,u1,c1]=qc("Toast"),[uv,dR]=En("Toast",[c1]),[d1,La]=uv(Yc),cv=e=>{const{__scopeToast:t,label:n="Notification",duration:r=5e3,swipeDirection:o="right",swipeThreshold:i=50,children:s}=e,[a,l]=p.useState(null),[u,d]=p.useState(0),c=p.useRef(!1),h=p.useRef(!1);return n.trim()||console.error(`Invalid prop \`label\` supplied to \`${Yc}\`. Expected non-empty \`string\`.`),v.jsx(Xc.Provider,{scope:t,children:v.jsx(d1,{scope:t,label:n,duration:r,swipeDirection:o,swipeThreshold:i,toastCount:u,viewport:a,onViewportChange:l,onToastAdd:p.useCallback(()=>d(f=>f+1),[]),onToastRemove:p.useCallback(()=>d(f=>f-1),[]),isFocusedToastEscapeKeyDownRef:c,isClosePausedRef:h,children:s})})};cv.displayName=Yc;var dv="ToastViewport",f1=["F8"],Iu="toast.viewportPause",Du="toast.viewportResume",fv=p.forwardRef((e,t)=>{const{__scopeToast:n,hotkey:r=f1,label:o="Notifications ({hotkey})",...i}=e,s=La(dv,n),a=u1(n),l=p.useRef(null),u=p.useRef(null),d=p.useRef(null),c=p.useRef(null),h=pe(t,c,s.onViewportChange),f=r.join("+").replace(/Key/g,"").replace(/Digit/g,""),S=s.toastCount>0;p.useEffect(()=>{const x=g=>{var w;r.length!==0&&r.every(E=>g[E]||g.code===E)&&((w=c.current)==null||w.focus())};return document.addEventListener("keydown",x),()=>document.removeEventListener("keydown",x)},[r]),p.useEffect(()=>{const x=l.current,g=c.current;if(S&&x&&g){const y=()=>{if(!s.isClosePausedRef.current){const b=new CustomEvent(Iu);g.dispatchEvent(b),s.isClosePausedRef.current=!0}},w=()=>{if(s.isClosePausedRef.current){const b=new CustomEvent(Du);g.dispatchEvent(b),s.isClosePausedRef.current=!1}},E=b=>{!x.contains(b.relatedTarget)&&w()},C=()=>{x.contains(document.activeElement)||w()};return x.addEventListener("focusin",y),x.addEventListener("focusout",E),x.addEventListener("pointermove",y),x.addEventListener("pointerleave",C),window.addEventListener("blur",y),window.addEventListener("focus",w),()=>{x.removeEventListener("focusin",y),x.removeEventListener("focusout",E),x.removeEventListener("pointermove",y),x.removeEventListener("pointerleave",C),window.removeEventListener("blur",y),window.removeEventListener("focus",w)}}},[S,s.isClosePausedRef]);const m=p.useCallback(({tabbingDirection:x})=>{const y=a().map(w=>{const E=w.ref.current,C=[E,...k1(E)];return x==="forwards"?C:C.reverse()});return(x==="forwards"?y.reverse():y).flat()},[a]);return p.useEffect(()=>{const x=c.current;if(x){const g=y=>{var C,b,k;const w=y.altKey||y.ctrlKey||y.metaKey;if(y.key==="Tab"&&!w){const P=document.activeElement,O=y.shiftKey;if(y.target===x&&O){(C=u.current)==null||C.focus();return}const I=m({tabbingDirection:O?"backwards":"forwards"}),D=I.findIndex(N=>N===P);Nl(I.slice(D+1))?y.preventDefault():O?(b=u.current)==null||b.focus():(k=d.current)==null||k.focus()}};return x.addEventListener("keydown",g),()=>x.removeEventListener("keydown",g)}},[a,m]),v.jsxs(Jx,{ref:l,role:"region","aria-label":o.replace("{hotkey}",f),tabIndex:-1,style:{pointerEvents:S?void 0:"none"},children:[S&&v.jsx(Lu,{ref:u,onFocusFromOutsideViewport:()=>{const x=m({tabbingDirection:"forwards"});Nl(x)}}),v.jsx(Xc.Slot,{scope:n,children:v.jsx(ie.ol,{tabIndex:-1,...i,ref:h})}),S&&v.jsx(Lu,{ref:d,onFocusFromOutsideViewport:()=>{const x=m({tabbingDirection:"backwards"});Nl(x)}})]})});fv.displayName=dv;var pv="ToastFocusProxy",Lu=p.forwardRef((e,t)=>{const{__scopeToast:n,onFocusFromOutsideViewport:r,...o}=e,i=La(pv,n);return v.jsx(Da,{"aria-hidden":!0,tabIndex:0,...o,ref:t,style:{position:"fixed"},onFocus:s=>{var u;const a=s.relatedTarget;!((u=i.viewport)!=null&&u.contains(a))&&r()}})});Lu.displayName=pv;var Hi="Toast",p1="toast.swipeStart",h1="toast.swipeMove",m1="toast.swipeCancel",v1="toast.swipeEnd",hv=p.forwardRef((e,t)=>{const{forceMount:n,open:r,defaultOpen:o,onOpenChange:i,...s}=e,[a,l]=Wi({prop:r,defaultProp:o??!0,onChange:i,caller:Hi});return v.jsx(Ar,{present:n||a,children:v.jsx(w1,{open:a,...s,ref:t,onClose:()=>l(!1),onPause:zt(e.onPause),onResume:zt(e.onResume),onSwipeStart:Z(e.onSwipeStart,u=>{u.currentTarget.setAttribute("data-swipe","start")}),onSwipeMove:Z(e.onSwipeMove,u=>{const{x:d,y:c}=u.detail.delta;u.currentTarget.setAttribute("data-swipe","move"),u.currentTarget.style.setProperty("--radix-toast-swipe-move-x",`${d}px`),u.currentTarget.style.setProperty("--radix-toast-swipe-move-y",`${c}px`)}),onSwipeCancel:Z(e.onSwipeCancel,u=>{u.currentTarget.setAttribute("data-swipe","cancel"),u.currentTarget.style.removeProperty("--radix-toast-swipe-move-x"),u.currentTarget.style.removeProperty("--radix-toast-swipe-move-y"),u.currentTarget.style.removeProperty("--radix-toast-swipe-end-x"),u.currentTarget.style.removeProperty("--radix-toast-swipe-end-y")}),onSwipeEnd:Z(e.onSwipeEnd,u=>{const{x:d,y:c}=u.detail.delta;u.currentTarget.setAttribute("data-swipe","end"),u.currentTarget.style.removeProperty("--radix-toast-swipe-move-x"),u.currentTarget.style.removeProperty("--radix-toast-swipe-move-y"),u.currentTarget.style.setProperty("--radix-toast-swipe-end-x",`${d}px`),u.currentTarget.style.setProperty("--radix-toast-swipe-end-y",`${c}px`),l(!1)})})})});hv.displayName=Hi;var[g1,y1]=uv(Hi,{onClose(){}}),w1=p.forwardRef((e,t)=>{const{__scopeToast:n,type:r="foreground",duration:o,open:i,onClose:s,onEscapeKeyDown:a,onPause:l,onResume:u,onSwipeStart:d,onSwipeMove:c,onSwipeCancel:h,onSwipeEnd:f,...S}=e,m=La(Hi,n),[x,g]=p.useState(null),y=pe(t,N=>g(N)),w=p.useRef(null),E=p.useRef(null),C=o||m.duration,b=p.useRef(0),k=p.useRef(C),P=p.useRef(0),{onToastAdd:O,onToastRemove:_}=m,z=zt(()=>{var B;(x==null?void 0:x.contains(document.activeElement))&&((B=m.viewport)==null||B.focus()),s()}),I=p.useCallback(N=>{!N||N===1/0||(window.clearTimeout(P.current),b.current=new Date().getTime(),P.current=window.setTimeout(z,N))},[z]);p.useEffect(()=>{const N=m.viewport;if(N){const B=()=>{I(k.current),u==null||u()},L=()=>{const W=new Date().getTime()-b.current;k.current=k.current-W,window.clearTimeout(P.current),l==null||l()};return N.addEventListener(Iu,L),N.addEventListener(Du,B),()=>{N.removeEventListener(Iu,L),N.removeEventListener(Du,B)}}},[m.viewport,C,l,u,I]),p.useEffect(()=>{i&&!m.isClosePausedRef.current&&I(C)},[i,C,m.isClosePausedRef,I]),p.useEffect(()=>(O(),()=>_()),[O,_]);const D=p.useMemo(()=>x?Sv(x):null,[x]);return m.viewport?v.jsxs(v.Fragment,{children:[D&&v.jsx(x1,{__scopeToast:n,role:"status","aria-live":r==="foreground"?"assertive":"polite","aria-atomic":!0,children:D}),v.jsx(g1,{scope:n,onClose:z,children:Vi.createPortal(v.jsx(Xc.ItemSlot,{scope:n,children:v.jsx(Xx,{asChild:!0,onEscapeKeyDown:Z(a,()=>{m.isFocusedToastEscapeKeyDownRef.current||z(),m.isFocusedToastEscapeKeyDownRef.current=!1}),children:v.jsx(ie.li,{role:"status","aria-live":"off","aria-atomic":!0,tabIndex:0,"data-state":i?"open":"closed","data-swipe-direction":m.swipeDirection,...S,ref:y,style:{userSelect:"none",touchAction:"none",...e.style},onKeyDown:Z(e.onKeyDown,N=>{N.key==="Escape"&&(a==null||a(N.nativeEvent),N.nativeEvent.defaultPrevented||(m.isFocusedToastEscapeKeyDownRef.current=!0,z()))}),onPointerDown:Z(e.onPointerDown,N=>{N.button===0&&(w.current={x:N.clientX,y:N.clientY})}),onPointerMove:Z(e.onPointerMove,N=>{if(!w.current)return;const B=N.clientX-w.current.x,L=N.clientY-w.current.y,W=!!E.current,R=["left","right"].includes(m.swipeDirection),j=["left","up"].includes(m.swipeDirection)?Math.min:Math.max,F=R?j(0,B):0,H=R?0:j(0,L),U=N.pointerType==="touch"?10:2,G={x:F,y:H},X={originalEvent:N,delta:G};W?(E.current=G,ms(h1,c,X,{discrete:!1})):Vf(G,m.swipeDirection,U)?(E.current=G,ms(p1,d,X,{discrete:!1}),N.target.setPointerCapture(N.pointerId)):(Math.abs(B)>U||Math.abs(L)>U)&&(w.current=null)}),onPointerUp:Z(e.onPointerUp,N=>{const B=E.current,L=N.target;if(L.hasPointerCapture(N.pointerId)&&L.releasePointerCapture(N.pointerId),E.current=null,w.current=null,B){const W=N.currentTarget,R={originalEvent:N,delta:B};Vf(B,m.swipeDirection,m.swipeThreshold)?ms(v1,f,R,{discrete:!0}):ms(m1,h,R,{discrete:!0}),W.addEventListener("click",j=>j.preventDefault(),{once:!0})}})})})}),m.viewport)})]}):null}),x1=e=>{const{__scopeToast:t,children:n,...r}=e,o=La(Hi,t),[i,s]=p.useState(!1),[a,l]=p.useState(!1);return C1(()=>s(!0)),p.useEffect(()=>{const u=window.setTimeout(()=>l(!0),1e3);return()=>window.clearTimeout(u)},[]),a?null:v.jsx(Gc,{asChild:!0,children:v.jsx(Da,{...r,children:i&&v.jsxs(v.Fragment,{children:[o.label," ",n]})})})},S1="ToastTitle",mv=p.forwardRef((e,t)=>{const{__scopeToast:n,...r}=e;return v.jsx(ie.div,{...r,ref:t})});mv.displayName=S1;var E1="ToastDescription",vv=p.forwardRef((e,t)=>{const{__scopeToast:n,...r}=e;return v.jsx(ie.div,{...r,ref:t})});vv.displayName=E1;var gv="ToastAction",yv=p.forwardRef((e,t)=>{const{altText:n,...r}=e;return n.trim()?v.jsx(xv,{altText:n,asChild:!0,children:v.jsx(Jc,{...r,ref:t})}):(console.error(`Invalid prop \`altText\` supplied to \`${gv}\`. Expected non-empty \`string\`.`),null)});yv.displayName=gv;var wv="ToastClose",Jc=p.forwardRef((e,t)=>{const{__scopeToast:n,...r}=e,o=y1(wv,n);return v.jsx(xv,{asChild:!0,children:v.jsx(ie.button,{type:"button",...r,ref:t,onClick:Z(e.onClick,o.onClose)})})});Jc.displayName=wv;var xv=p.forwardRef((e,t)=>{const{__scopeToast:n,altText:r,...o}=e;return v.jsx(ie.div,{"data-radix-toast-announce-exclude":"","data-radix-toast-announce-alt":r||void 0,...o,ref:t})});function Sv(e){const t=[];return Array.from(e.childNodes).forEach(r=>{if(r.nodeType===r.TEXT_NODE&&r.textContent&&t.push(r.textContent),b1(r)){const o=r.ariaHidden||r.hidden||r.style.display==="none",i=r.dataset.radixToastAnnounceExclude==="";if(!o)if(i){const s=r.dataset.radixToastAnnounceAlt;s&&t.push(s)}else t.push(...Sv(r))}}),t}function ms(e,t,n,{discrete:r}){const o=n.originalEvent.currentTarget,i=new CustomEvent(e,{bubbles:!0,cancelable:!0,detail:n});t&&o.addEventListener(e,t,{once:!0}),r?iv(o,i):o.dispatchEvent(i)}var Vf=(e,t,n=0)=>{const r=Math.abs(e.x),o=Math.abs(e.y),i=r>o;return t==="left"||t==="right"?i&&r>n:!i&&o>n};function C1(e=()=>{}){const t=zt(e);yn(()=>{let n=0,r=0;return n=window.requestAnimationFrame(()=>r=window.requestAnimationFrame(t)),()=>{window.cancelAnimationFrame(n),window.cancelAnimationFrame(r)}},[t])}function b1(e){return e.nodeType===e.ELEMENT_NODE}function k1(e){const t=[],n=document.createTreeWalker(e,NodeFilter.SHOW_ELEMENT,{acceptNode:r=>{const o=r.tagName==="INPUT"&&r.type==="hidden";return r.disabled||r.hidden||o?NodeFilter.FILTER_SKIP:r.tabIndex>=0?NodeFilter.FILTER_ACCEPT:NodeFilter.FILTER_SKIP}});for(;n.nextNode();)t.push(n.currentNode);return t}function Nl(e){const t=document.activeElement;return e.some(n=>n===t?!0:(n.focus(),document.activeElement!==t))}var P1=cv,Ev=fv,Cv=hv,bv=mv,kv=vv,Pv=yv,Rv=Jc;function Nv(e){var t,n,r="";if(typeof e=="string"||typeof e=="number")r+=e;else if(typeof e=="object")if(Array.isArray(e)){var o=e.length;for(t=0;t<o;t++)e[t]&&(n=Nv(e[t]))&&(r&&(r+=" "),r+=n)}else for(n in e)e[n]&&(r&&(r+=" "),r+=n);return r}function Tv(){for(var e,t,n=0,r="",o=arguments.length;n<o;n++)(e=arguments[n])&&(t=Nv(e))&&(r&&(r+=" "),r+=t);return r}const Wf=e=>typeof e=="boolean"?`${e}`:e===0?"0":e,Hf=Tv,Zc=(e,t)=>n=>{var r;if((t==null?void 0:t.variants)==null)return Hf(e,n==null?void 0:n.class,n==null?void 0:n.className);const{variants:o,defaultVariants:i}=t,s=Object.keys(o).map(u=>{const d=n==null?void 0:n[u],c=i==null?void 0:i[u];if(d===null)return null;const h=Wf(d)||Wf(c);return o[u][h]}),a=n&&Object.entries(n).reduce((u,d)=>{let[c,h]=d;return h===void 0||(u[c]=h),u},{}),l=t==null||(r=t.compoundVariants)===null||r===void 0?void 0:r.reduce((u,d)=>{let{class:c,className:h,...f}=d;return Object.entries(f).every(S=>{let[m,x]=S;return Array.isArray(x)?x.includes({...i,...a}[m]):{...i,...a}[m]===x})?[...u,c,h]:u},[]);return Hf(e,s,l,n==null?void 0:n.class,n==null?void 0:n.className)};/**
- * @license lucide-react v0.462.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const R1=e=>e.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase(),jv=(...e)=>e.filter((t,n,r)=>!!t&&t.trim()!==""&&r.indexOf(t)===n).join(" ").trim();/**
- * @license lucide-react v0.462.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */var N1={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};/**
- * @license lucide-react v0.462.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const T1=p.forwardRef(({color:e="currentColor",size:t=24,strokeWidth:n=2,absoluteStrokeWidth:r,className:o="",children:i,iconNode:s,...a},l)=>p.createElement("svg",{ref:l,...N1,width:t,height:t,stroke:e,strokeWidth:r?Number(n)*24/Number(t):n,className:jv("lucide",o),...a},[...s.map(([u,d])=>p.createElement(u,d)),...Array.isArray(i)?i:[i]]));/**
- * @license lucide-react v0.462.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const rn=(e,t)=>{const n=p.forwardRef(({className:r,...o},i)=>p.createElement(T1,{ref:i,iconNode:t,className:jv(`lucide-${R1(e)}`,r),...o}));return n.displayName=`${e}`,n};/**
- * @license lucide-react v0.462.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const j1=rn("Bluetooth",[["path",{d:"m7 7 10 10-5 5V2l5 5L7 17",key:"1q5490"}]]);/**
- * @license lucide-react v0.462.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Kf=rn("Brain",[["path",{d:"M12 5a3 3 0 1 0-5.997.125 4 4 0 0 0-2.526 5.77 4 4 0 0 0 .556 6.588A4 4 0 1 0 12 18Z",key:"l5xja"}],["path",{d:"M12 5a3 3 0 1 1 5.997.125 4 4 0 0 1 2.526 5.77 4 4 0 0 1-.556 6.588A4 4 0 1 1 12 18Z",key:"ep3f8r"}],["path",{d:"M15 13a4.5 4.5 0 0 1-3-4 4.5 4.5 0 0 1-3 4",key:"1p4c4q"}],["path",{d:"M17.599 6.5a3 3 0 0 0 .399-1.375",key:"tmeiqw"}],["path",{d:"M6.003 5.125A3 3 0 0 0 6.401 6.5",key:"105sqy"}],["path",{d:"M3.477 10.896a4 4 0 0 1 .585-.396",key:"ql3yin"}],["path",{d:"M19.938 10.5a4 4 0 0 1 .585.396",key:"1qfode"}],["path",{d:"M6 18a4 4 0 0 1-1.967-.516",key:"2e4loj"}],["path",{d:"M19.967 17.484A4 4 0 0 1 18 18",key:"159ez6"}]]);/**
- * @license lucide-react v0.462.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const _1=rn("CircleCheck",[["circle",{cx:"12",cy:"12",r:"10",key:"1mglay"}],["path",{d:"m9 12 2 2 4-4",key:"dzmm74"}]]);/**
- * @license lucide-react v0.462.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const A1=rn("Circle",[["circle",{cx:"12",cy:"12",r:"10",key:"1mglay"}]]);/**
- * @license lucide-react v0.462.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const O1=rn("LoaderCircle",[["path",{d:"M21 12a9 9 0 1 1-6.219-8.56",key:"13zald"}]]);/**
- * @license lucide-react v0.462.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const M1=rn("Pause",[["rect",{x:"14",y:"4",width:"4",height:"16",rx:"1",key:"zuxfzm"}],["rect",{x:"6",y:"4",width:"4",height:"16",rx:"1",key:"1okwgv"}]]);/**
- * @license lucide-react v0.462.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const I1=rn("Play",[["polygon",{points:"6 3 20 12 6 21 6 3",key:"1oa8hb"}]]);/**
- * @license lucide-react v0.462.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const D1=rn("Volume2",[["path",{d:"M11 4.702a.705.705 0 0 0-1.203-.498L6.413 7.587A1.4 1.4 0 0 1 5.416 8H3a1 1 0 0 0-1 1v6a1 1 0 0 0 1 1h2.416a1.4 1.4 0 0 1 .997.413l3.383 3.384A.705.705 0 0 0 11 19.298z",key:"uqj9uw"}],["path",{d:"M16 9a5 5 0 0 1 0 6",key:"1q6k2b"}],["path",{d:"M19.364 18.364a9 9 0 0 0 0-12.728",key:"ijwkga"}]]);/**
- * @license lucide-react v0.462.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Qf=rn("Waves",[["path",{d:"M2 6c.6.5 1.2 1 2.5 1C7 7 7 5 9.5 5c2.6 0 2.4 2 5 2 2.5 0 2.5-2 5-2 1.3 0 1.9.5 2.5 1",key:"knzxuh"}],["path",{d:"M2 12c.6.5 1.2 1 2.5 1 2.5 0 2.5-2 5-2 2.6 0 2.4 2 5 2 2.5 0 2.5-2 5-2 1.3 0 1.9.5 2.5 1",key:"2jd2cc"}],["path",{d:"M2 18c.6.5 1.2 1 2.5 1 2.5 0 2.5-2 5-2 2.6 0 2.4 2 5 2 2.5 0 2.5-2 5-2 1.3 0 1.9.5 2.5 1",key:"rd2r6e"}]]);/**
- * @license lucide-react v0.462.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const _v=rn("X",[["path",{d:"M18 6 6 18",key:"1bl5f8"}],["path",{d:"m6 6 12 12",key:"d8bk6v"}]]),ed="-",L1=e=>{const t=z1(e),{conflictingClassGroups:n,conflictingClassGroupModifiers:r}=e;return{getClassGroupId:s=>{const a=s.split(ed);return a[0]===""&&a.length!==1&&a.shift(),Av(a,t)||F1(s)},getConflictingClassGroupIds:(s,a)=>{const l=n[s]||[];return a&&r[s]?[...l,...r[s]]:l}}},Av=(e,t)=>{var s;if(e.length===0)return t.classGroupId;const n=e[0],r=t.nextPart.get(n),o=r?Av(e.slice(1),r):void 0;if(o)return o;if(t.validators.length===0)return;const i=e.join(ed);return(s=t.validators.find(({validator:a})=>a(i)))==null?void 0:s.classGroupId},qf=/^\[(.+)\]$/,F1=e=>{if(qf.test(e)){const t=qf.exec(e)[1],n=t==null?void 0:t.substring(0,t.indexOf(":"));if(n)return"arbitrary.."+n}},z1=e=>{const{theme:t,prefix:n}=e,r={nextPart:new Map,validators:[]};return B1(Object.entries(e.classGroups),n).forEach(([i,s])=>{Fu(s,r,i,t)}),r},Fu=(e,t,n,r)=>{e.forEach(o=>{if(typeof o=="string"){const i=o===""?t:Gf(t,o);i.classGroupId=n;return}if(typeof o=="function"){if($1(o)){Fu(o(r),t,n,r);return}t.validators.push({validator:o,classGroupId:n});return}Object.entries(o).forEach(([i,s])=>{Fu(s,Gf(t,i),n,r)})})},Gf=(e,t)=>{let n=e;return t.split(ed).forEach(r=>{n.nextPart.has(r)||n.nextPart.set(r,{nextPart:new Map,validators:[]}),n=n.nextPart.get(r)}),n},$1=e=>e.isThemeGetter,B1=(e,t)=>t?e.map(([n,r])=>{const o=r.map(i=>typeof i=="string"?t+i:typeof i=="object"?Object.fromEntries(Object.entries(i).map(([s,a])=>[t+s,a])):i);return[n,o]}):e,U1=e=>{if(e<1)return{get:()=>{},set:()=>{}};let t=0,n=new Map,r=new Map;const o=(i,s)=>{n.set(i,s),t++,t>e&&(t=0,r=n,n=new Map)};return{get(i){let s=n.get(i);if(s!==void 0)return s;if((s=r.get(i))!==void 0)return o(i,s),s},set(i,s){n.has(i)?n.set(i,s):o(i,s)}}},Ov="!",V1=e=>{const{separator:t,experimentalParseClassName:n}=e,r=t.length===1,o=t[0],i=t.length,s=a=>{const l=[];let u=0,d=0,c;for(let x=0;x<a.length;x++){let g=a[x];if(u===0){if(g===o&&(r||a.slice(x,x+i)===t)){l.push(a.slice(d,x)),d=x+i;continue}if(g==="/"){c=x;continue}}g==="["?u++:g==="]"&&u--}const h=l.length===0?a:a.substring(d),f=h.startsWith(Ov),S=f?h.substring(1):h,m=c&&c>d?c-d:void 0;return{modifiers:l,hasImportantModifier:f,baseClassName:S,maybePostfixModifierPosition:m}};return n?a=>n({className:a,parseClassName:s}):s},W1=e=>{if(e.length<=1)return e;const t=[];let n=[];return e.forEach(r=>{r[0]==="["?(t.push(...n.sort(),r),n=[]):n.push(r)}),t.push(...n.sort()),t},H1=e=>({cache:U1(e.cacheSize),parseClassName:V1(e),...L1(e)}),K1=/\s+/,Q1=(e,t)=>{const{parseClassName:n,getClassGroupId:r,getConflictingClassGroupIds:o}=t,i=[],s=e.trim().split(K1);let a="";for(let l=s.length-1;l>=0;l-=1){const u=s[l],{modifiers:d,hasImportantModifier:c,baseClassName:h,maybePostfixModifierPosition:f}=n(u);let S=!!f,m=r(S?h.substring(0,f):h);if(!m){if(!S){a=u+(a.length>0?" "+a:a);continue}if(m=r(h),!m){a=u+(a.length>0?" "+a:a);continue}S=!1}const x=W1(d).join(":"),g=c?x+Ov:x,y=g+m;if(i.includes(y))continue;i.push(y);const w=o(m,S);for(let E=0;E<w.length;++E){const C=w[E];i.push(g+C)}a=u+(a.length>0?" "+a:a)}return a};function q1(){let e=0,t,n,r="";for(;e<arguments.length;)(t=arguments[e++])&&(n=Mv(t))&&(r&&(r+=" "),r+=n);return r}const Mv=e=>{if(typeof e=="string")return e;let t,n="";for(let r=0;r<e.length;r++)e[r]&&(t=Mv(e[r]))&&(n&&(n+=" "),n+=t);return n};function G1(e,...t){let n,r,o,i=s;function s(l){const u=t.reduce((d,c)=>c(d),e());return n=H1(u),r=n.cache.get,o=n.cache.set,i=a,a(l)}function a(l){const u=r(l);if(u)return u;const d=Q1(l,n);return o(l,d),d}return function(){return i(q1.apply(null,arguments))}}const ce=e=>{const t=n=>n[e]||[];return t.isThemeGetter=!0,t},Iv=/^\[(?:([a-z-]+):)?(.+)\]$/i,Y1=/^\d+\/\d+$/,X1=new Set(["px","full","screen"]),J1=/^(\d+(\.\d+)?)?(xs|sm|md|lg|xl)$/,Z1=/\d+(%|px|r?em|[sdl]?v([hwib]|min|max)|pt|pc|in|cm|mm|cap|ch|ex|r?lh|cq(w|h|i|b|min|max))|\b(calc|min|max|clamp)\(.+\)|^0$/,eS=/^(rgba?|hsla?|hwb|(ok)?(lab|lch))\(.+\)$/,tS=/^(inset_)?-?((\d+)?\.?(\d+)[a-z]+|0)_-?((\d+)?\.?(\d+)[a-z]+|0)/,nS=/^(url|image|image-set|cross-fade|element|(repeating-)?(linear|radial|conic)-gradient)\(.+\)$/,sn=e=>ao(e)||X1.has(e)||Y1.test(e),Tn=e=>_o(e,"length",cS),ao=e=>!!e&&!Number.isNaN(Number(e)),Tl=e=>_o(e,"number",ao),Ko=e=>!!e&&Number.isInteger(Number(e)),rS=e=>e.endsWith("%")&&ao(e.slice(0,-1)),Y=e=>Iv.test(e),jn=e=>J1.test(e),oS=new Set(["length","size","percentage"]),iS=e=>_o(e,oS,Dv),sS=e=>_o(e,"position",Dv),aS=new Set(["image","url"]),lS=e=>_o(e,aS,fS),uS=e=>_o(e,"",dS),Qo=()=>!0,_o=(e,t,n)=>{const r=Iv.exec(e);return r?r[1]?typeof t=="string"?r[1]===t:t.has(r[1]):n(r[2]):!1},cS=e=>Z1.test(e)&&!eS.test(e),Dv=()=>!1,dS=e=>tS.test(e),fS=e=>nS.test(e),pS=()=>{const e=ce("colors"),t=ce("spacing"),n=ce("blur"),r=ce("brightness"),o=ce("borderColor"),i=ce("borderRadius"),s=ce("borderSpacing"),a=ce("borderWidth"),l=ce("contrast"),u=ce("grayscale"),d=ce("hueRotate"),c=ce("invert"),h=ce("gap"),f=ce("gradientColorStops"),S=ce("gradientColorStopPositions"),m=ce("inset"),x=ce("margin"),g=ce("opacity"),y=ce("padding"),w=ce("saturate"),E=ce("scale"),C=ce("sepia"),b=ce("skew"),k=ce("space"),P=ce("translate"),O=()=>["auto","contain","none"],_=()=>["auto","hidden","clip","visible","scroll"],z=()=>["auto",Y,t],I=()=>[Y,t],D=()=>["",sn,Tn],N=()=>["auto",ao,Y],B=()=>["bottom","center","left","left-bottom","left-top","right","right-bottom","right-top","top"],L=()=>["solid","dashed","dotted","double","none"],W=()=>["normal","multiply","screen","overlay","darken","lighten","color-dodge","color-burn","hard-light","soft-light","difference","exclusion","hue","saturation","color","luminosity"],R=()=>["start","end","center","between","around","evenly","stretch"],j=()=>["","0",Y],F=()=>["auto","avoid","all","avoid-page","page","left","right","column"],H=()=>[ao,Y];return{cacheSize:500,separator:":",theme:{colors:[Qo],spacing:[sn,Tn],blur:["none","",jn,Y],brightness:H(),borderColor:[e],borderRadius:["none","","full",jn,Y],borderSpacing:I(),borderWidth:D(),contrast:H(),grayscale:j(),hueRotate:H(),invert:j(),gap:I(),gradientColorStops:[e],gradientColorStopPositions:[rS,Tn],inset:z(),margin:z(),opacity:H(),padding:I(),saturate:H(),scale:H(),sepia:j(),skew:H(),space:I(),translate:I()},classGroups:{aspect:[{aspect:["auto","square","video",Y]}],container:["container"],columns:[{columns:[jn]}],"break-after":[{"break-after":F()}],"break-before":[{"break-before":F()}],"break-inside":[{"break-inside":["auto","avoid","avoid-page","avoid-column"]}],"box-decoration":[{"box-decoration":["slice","clone"]}],box:[{box:["border","content"]}],display:["block","inline-block","inline","flex","inline-flex","table","inline-table","table-caption","table-cell","table-column","table-column-group","table-footer-group","table-header-group","table-row-group","table-row","flow-root","grid","inline-grid","contents","list-item","hidden"],float:[{float:["right","left","none","start","end"]}],clear:[{clear:["left","right","both","none","start","end"]}],isolation:["isolate","isolation-auto"],"object-fit":[{object:["contain","cover","fill","none","scale-down"]}],"object-position":[{object:[...B(),Y]}],overflow:[{overflow:_()}],"overflow-x":[{"overflow-x":_()}],"overflow-y":[{"overflow-y":_()}],overscroll:[{overscroll:O()}],"overscroll-x":[{"overscroll-x":O()}],"overscroll-y":[{"overscroll-y":O()}],position:["static","fixed","absolute","relative","sticky"],inset:[{inset:[m]}],"inset-x":[{"inset-x":[m]}],"inset-y":[{"inset-y":[m]}],start:[{start:[m]}],end:[{end:[m]}],top:[{top:[m]}],right:[{right:[m]}],bottom:[{bottom:[m]}],left:[{left:[m]}],visibility:["visible","invisible","collapse"],z:[{z:["auto",Ko,Y]}],basis:[{basis:z()}],"flex-direction":[{flex:["row","row-reverse","col","col-reverse"]}],"flex-wrap":[{flex:["wrap","wrap-reverse","nowrap"]}],flex:[{flex:["1","auto","initial","none",Y]}],grow:[{grow:j()}],shrink:[{shrink:j()}],order:[{order:["first","last","none",Ko,Y]}],"grid-cols":[{"grid-cols":[Qo]}],"col-start-end":[{col:["auto",{span:["full",Ko,Y]},Y]}],"col-start":[{"col-start":N()}],"col-end":[{"col-end":N()}],"grid-rows":[{"grid-rows":[Qo]}],"row-start-end":[{row:["auto",{span:[Ko,Y]},Y]}],"row-start":[{"row-start":N()}],"row-end":[{"row-end":N()}],"grid-flow":[{"grid-flow":["row","col","dense","row-dense","col-dense"]}],"auto-cols":[{"auto-cols":["auto","min","max","fr",Y]}],"auto-rows":[{"auto-rows":["auto","min","max","fr",Y]}],gap:[{gap:[h]}],"gap-x":[{"gap-x":[h]}],"gap-y":[{"gap-y":[h]}],"justify-content":[{justify:["normal",...R()]}],"justify-items":[{"justify-items":["start","end","center","stretch"]}],"justify-self":[{"justify-self":["auto","start","end","center","stretch"]}],"align-content":[{content:["normal",...R(),"baseline"]}],"align-items":[{items:["start","end","center","baseline","stretch"]}],"align-self":[{self:["auto","start","end","center","stretch","baseline"]}],"place-content":[{"place-content":[...R(),"baseline"]}],"place-items":[{"place-items":["start","end","center","baseline","stretch"]}],"place-self":[{"place-self":["auto","start","end","center","stretch"]}],p:[{p:[y]}],px:[{px:[y]}],py:[{py:[y]}],ps:[{ps:[y]}],pe:[{pe:[y]}],pt:[{pt:[y]}],pr:[{pr:[y]}],pb:[{pb:[y]}],pl:[{pl:[y]}],m:[{m:[x]}],mx:[{mx:[x]}],my:[{my:[x]}],ms:[{ms:[x]}],me:[{me:[x]}],mt:[{mt:[x]}],mr:[{mr:[x]}],mb:[{mb:[x]}],ml:[{ml:[x]}],"space-x":[{"space-x":[k]}],"space-x-reverse":["space-x-reverse"],"space-y":[{"space-y":[k]}],"space-y-reverse":["space-y-reverse"],w:[{w:["auto","min","max","fit","svw","lvw","dvw",Y,t]}],"min-w":[{"min-w":[Y,t,"min","max","fit"]}],"max-w":[{"max-w":[Y,t,"none","full","min","max","fit","prose",{screen:[jn]},jn]}],h:[{h:[Y,t,"auto","min","max","fit","svh","lvh","dvh"]}],"min-h":[{"min-h":[Y,t,"min","max","fit","svh","lvh","dvh"]}],"max-h":[{"max-h":[Y,t,"min","max","fit","svh","lvh","dvh"]}],size:[{size:[Y,t,"auto","min","max","fit"]}],"font-size":[{text:["base",jn,Tn]}],"font-smoothing":["antialiased","subpixel-antialiased"],"font-style":["italic","not-italic"],"font-weight":[{font:["thin","extralight","light","normal","medium","semibold","bold","extrabold","black",Tl]}],"font-family":[{font:[Qo]}],"fvn-normal":["normal-nums"],"fvn-ordinal":["ordinal"],"fvn-slashed-zero":["slashed-zero"],"fvn-figure":["lining-nums","oldstyle-nums"],"fvn-spacing":["proportional-nums","tabular-nums"],"fvn-fraction":["diagonal-fractions","stacked-fractions"],tracking:[{tracking:["tighter","tight","normal","wide","wider","widest",Y]}],"line-clamp":[{"line-clamp":["none",ao,Tl]}],leading:[{leading:["none","tight","snug","normal","relaxed","loose",sn,Y]}],"list-image":[{"list-image":["none",Y]}],"list-style-type":[{list:["none","disc","decimal",Y]}],"list-style-position":[{list:["inside","outside"]}],"placeholder-color":[{placeholder:[e]}],"placeholder-opacity":[{"placeholder-opacity":[g]}],"text-alignment":[{text:["left","center","right","justify","start","end"]}],"text-color":[{text:[e]}],"text-opacity":[{"text-opacity":[g]}],"text-decoration":["underline","overline","line-through","no-underline"],"text-decoration-style":[{decoration:[...L(),"wavy"]}],"text-decoration-thickness":[{decoration:["auto","from-font",sn,Tn]}],"underline-offset":[{"underline-offset":["auto",sn,Y]}],"text-decoration-color":[{decoration:[e]}],"text-transform":["uppercase","lowercase","capitalize","normal-case"],"text-overflow":["truncate","text-ellipsis","text-clip"],"text-wrap":[{text:["wrap","nowrap","balance","pretty"]}],indent:[{indent:I()}],"vertical-align":[{align:["baseline","top","middle","bottom","text-top","text-bottom","sub","super",Y]}],whitespace:[{whitespace:["normal","nowrap","pre","pre-line","pre-wrap","break-spaces"]}],break:[{break:["normal","words","all","keep"]}],hyphens:[{hyphens:["none","manual","auto"]}],content:[{content:["none",Y]}],"bg-attachment":[{bg:["fixed","local","scroll"]}],"bg-clip":[{"bg-clip":["border","padding","content","text"]}],"bg-opacity":[{"bg-opacity":[g]}],"bg-origin":[{"bg-origin":["border","padding","content"]}],"bg-position":[{bg:[...B(),sS]}],"bg-repeat":[{bg:["no-repeat",{repeat:["","x","y","round","space"]}]}],"bg-size":[{bg:["auto","cover","contain",iS]}],"bg-image":[{bg:["none",{"gradient-to":["t","tr","r","br","b","bl","l","tl"]},lS]}],"bg-color":[{bg:[e]}],"gradient-from-pos":[{from:[S]}],"gradient-via-pos":[{via:[S]}],"gradient-to-pos":[{to:[S]}],"gradient-from":[{from:[f]}],"gradient-via":[{via:[f]}],"gradient-to":[{to:[f]}],rounded:[{rounded:[i]}],"rounded-s":[{"rounded-s":[i]}],"rounded-e":[{"rounded-e":[i]}],"rounded-t":[{"rounded-t":[i]}],"rounded-r":[{"rounded-r":[i]}],"rounded-b":[{"rounded-b":[i]}],"rounded-l":[{"rounded-l":[i]}],"rounded-ss":[{"rounded-ss":[i]}],"rounded-se":[{"rounded-se":[i]}],"rounded-ee":[{"rounded-ee":[i]}],"rounded-es":[{"rounded-es":[i]}],"rounded-tl":[{"rounded-tl":[i]}],"rounded-tr":[{"rounded-tr":[i]}],"rounded-br":[{"rounded-br":[i]}],"rounded-bl":[{"rounded-bl":[i]}],"border-w":[{border:[a]}],"border-w-x":[{"border-x":[a]}],"border-w-y":[{"border-y":[a]}],"border-w-s":[{"border-s":[a]}],"border-w-e":[{"border-e":[a]}],"border-w-t":[{"border-t":[a]}],"border-w-r":[{"border-r":[a]}],"border-w-b":[{"border-b":[a]}],"border-w-l":[{"border-l":[a]}],"border-opacity":[{"border-opacity":[g]}],"border-style":[{border:[...L(),"hidden"]}],"divide-x":[{"divide-x":[a]}],"divide-x-reverse":["divide-x-reverse"],"divide-y":[{"divide-y":[a]}],"divide-y-reverse":["divide-y-reverse"],"divide-opacity":[{"divide-opacity":[g]}],"divide-style":[{divide:L()}],"border-color":[{border:[o]}],"border-color-x":[{"border-x":[o]}],"border-color-y":[{"border-y":[o]}],"border-color-s":[{"border-s":[o]}],"border-color-e":[{"border-e":[o]}],"border-color-t":[{"border-t":[o]}],"border-color-r":[{"border-r":[o]}],"border-color-b":[{"border-b":[o]}],"border-color-l":[{"border-l":[o]}],"divide-color":[{divide:[o]}],"outline-style":[{outline:["",...L()]}],"outline-offset":[{"outline-offset":[sn,Y]}],"outline-w":[{outline:[sn,Tn]}],"outline-color":[{outline:[e]}],"ring-w":[{ring:D()}],"ring-w-inset":["ring-inset"],"ring-color":[{ring:[e]}],"ring-opacity":[{"ring-opacity":[g]}],"ring-offset-w":[{"ring-offset":[sn,Tn]}],"ring-offset-color":[{"ring-offset":[e]}],shadow:[{shadow:["","inner","none",jn,uS]}],"shadow-color":[{shadow:[Qo]}],opacity:[{opacity:[g]}],"mix-blend":[{"mix-blend":[...W(),"plus-lighter","plus-darker"]}],"bg-blend":[{"bg-blend":W()}],filter:[{filter:["","none"]}],blur:[{blur:[n]}],brightness:[{brightness:[r]}],contrast:[{contrast:[l]}],"drop-shadow":[{"drop-shadow":["","none",jn,Y]}],grayscale:[{grayscale:[u]}],"hue-rotate":[{"hue-rotate":[d]}],invert:[{invert:[c]}],saturate:[{saturate:[w]}],sepia:[{sepia:[C]}],"backdrop-filter":[{"backdrop-filter":["","none"]}],"backdrop-blur":[{"backdrop-blur":[n]}],"backdrop-brightness":[{"backdrop-brightness":[r]}],"backdrop-contrast":[{"backdrop-contrast":[l]}],"backdrop-grayscale":[{"backdrop-grayscale":[u]}],"backdrop-hue-rotate":[{"backdrop-hue-rotate":[d]}],"backdrop-invert":[{"backdrop-invert":[c]}],"backdrop-opacity":[{"backdrop-opacity":[g]}],"backdrop-saturate":[{"backdrop-saturate":[w]}],"backdrop-sepia":[{"backdrop-sepia":[C]}],"border-collapse":[{border:["collapse","separate"]}],"border-spacing":[{"border-spacing":[s]}],"border-spacing-x":[{"border-spacing-x":[s]}],"border-spacing-y":[{"border-spacing-y":[s]}],"table-layout":[{table:["auto","fixed"]}],caption:[{caption:["top","bottom"]}],transition:[{transition:["none","all","","colors","opacity","shadow","transform",Y]}],duration:[{duration:H()}],ease:[{ease:["linear","in","out","in-out",Y]}],delay:[{delay:H()}],animate:[{animate:["none","spin","ping","pulse","bounce",Y]}],transform:[{transform:["","gpu","none"]}],scale:[{scale:[E]}],"scale-x":[{"scale-x":[E]}],"scale-y":[{"scale-y":[E]}],rotate:[{rotate:[Ko,Y]}],"translate-x":[{"translate-x":[P]}],"translate-y":[{"translate-y":[P]}],"skew-x":[{"skew-x":[b]}],"skew-y":[{"skew-y":[b]}],"transform-origin":[{origin:["center","top","top-right","right","bottom-right","bottom","bottom-left","left","top-left",Y]}],accent:[{accent:["auto",e]}],appearance:[{appearance:["none","auto"]}],cursor:[{cursor:["auto","default","pointer","wait","text","move","help","not-allowed","none","context-menu","progress","cell","crosshair","vertical-text","alias","copy","no-drop","grab","grabbing","all-scroll","col-resize","row-resize","n-resize","e-resize","s-resize","w-resize","ne-resize","nw-resize","se-resize","sw-resize","ew-resize","ns-resize","nesw-resize","nwse-resize","zoom-in","zoom-out",Y]}],"caret-color":[{caret:[e]}],"pointer-events":[{"pointer-events":["none","auto"]}],resize:[{resize:["none","y","x",""]}],"scroll-behavior":[{scroll:["auto","smooth"]}],"scroll-m":[{"scroll-m":I()}],"scroll-mx":[{"scroll-mx":I()}],"scroll-my":[{"scroll-my":I()}],"scroll-ms":[{"scroll-ms":I()}],"scroll-me":[{"scroll-me":I()}],"scroll-mt":[{"scroll-mt":I()}],"scroll-mr":[{"scroll-mr":I()}],"scroll-mb":[{"scroll-mb":I()}],"scroll-ml":[{"scroll-ml":I()}],"scroll-p":[{"scroll-p":I()}],"scroll-px":[{"scroll-px":I()}],"scroll-py":[{"scroll-py":I()}],"scroll-ps":[{"scroll-ps":I()}],"scroll-pe":[{"scroll-pe":I()}],"scroll-pt":[{"scroll-pt":I()}],"scroll-pr":[{"scroll-pr":I()}],"scroll-pb":[{"scroll-pb":I()}],"scroll-pl":[{"scroll-pl":I()}],"snap-align":[{snap:["start","end","center","align-none"]}],"snap-stop":[{snap:["normal","always"]}],"snap-type":[{snap:["none","x","y","both"]}],"snap-strictness":[{snap:["mandatory","proximity"]}],touch:[{touch:["auto","none","manipulation"]}],"touch-x":[{"touch-pan":["x","left","right"]}],"touch-y":[{"touch-pan":["y","up","down"]}],"touch-pz":["touch-pinch-zoom"],select:[{select:["none","text","all","auto"]}],"will-change":[{"will-change":["auto","scroll","contents","transform",Y]}],fill:[{fill:[e,"none"]}],"stroke-w":[{stroke:[sn,Tn,Tl]}],stroke:[{stroke:[e,"none"]}],sr:["sr-only","not-sr-only"],"forced-color-adjust":[{"forced-color-adjust":["auto","none"]}]},conflictingClassGroups:{overflow:["overflow-x","overflow-y"],overscroll:["overscroll-x","overscroll-y"],inset:["inset-x","inset-y","start","end","top","right","bottom","left"],"inset-x":["right","left"],"inset-y":["top","bottom"],flex:["basis","grow","shrink"],gap:["gap-x","gap-y"],p:["px","py","ps","pe","pt","pr","pb","pl"],px:["pr","pl"],py:["pt","pb"],m:["mx","my","ms","me","mt","mr","mb","ml"],mx:["mr","ml"],my:["mt","mb"],size:["w","h"],"font-size":["leading"],"fvn-normal":["fvn-ordinal","fvn-slashed-zero","fvn-figure","fvn-spacing","fvn-fraction"],"fvn-ordinal":["fvn-normal"],"fvn-slashed-zero":["fvn-normal"],"fvn-figure":["fvn-normal"],"fvn-spacing":["fvn-normal"],"fvn-fraction":["fvn-normal"],"line-clamp":["display","overflow"],rounded:["rounded-s","rounded-e","rounded-t","rounded-r","rounded-b","rounded-l","rounded-ss","rounded-se","rounded-ee","rounded-es","rounded-tl","rounded-tr","rounded-br","rounded-bl"],"rounded-s":["rounded-ss","rounded-es"],"rounded-e":["rounded-se","rounded-ee"],"rounded-t":["rounded-tl","rounded-tr"],"rounded-r":["rounded-tr","rounded-br"],"rounded-b":["rounded-br","rounded-bl"],"rounded-l":["rounded-tl","rounded-bl"],"border-spacing":["border-spacing-x","border-spacing-y"],"border-w":["border-w-s","border-w-e","border-w-t","border-w-r","border-w-b","border-w-l"],"border-w-x":["border-w-r","border-w-l"],"border-w-y":["border-w-t","border-w-b"],"border-color":["border-color-s","border-color-e","border-color-t","border-color-r","border-color-b","border-color-l"],"border-color-x":["border-color-r","border-color-l"],"border-color-y":["border-color-t","border-color-b"],"scroll-m":["scroll-mx","scroll-my","scroll-ms","scroll-me","scroll-mt","scroll-mr","scroll-mb","scroll-ml"],"scroll-mx":["scroll-mr","scroll-ml"],"scroll-my":["scroll-mt","scroll-mb"],"scroll-p":["scroll-px","scroll-py","scroll-ps","scroll-pe","scroll-pt","scroll-pr","scroll-pb","scroll-pl"],"scroll-px":["scroll-pr","scroll-pl"],"scroll-py":["scroll-pt","scroll-pb"],touch:["touch-x","touch-y","touch-pz"],"touch-x":["touch"],"touch-y":["touch"],"touch-pz":["touch"]},conflictingClassGroupModifiers:{"font-size":["leading"]}}},hS=G1(pS);function Me(...e){return hS(Tv(e))}const mS=P1,Lv=p.forwardRef(({className:e,...t},n)=>v.jsx(Ev,{ref:n,className:Me("fixed top-0 z-[100] flex max-h-screen w-full flex-col-reverse p-4 sm:bottom-0 sm:right-0 sm:top-auto sm:flex-col md:max-w-[420px]",e),...t}));Lv.displayName=Ev.displayName;const vS=Zc("group pointer-events-auto relative flex w-full items-center justify-between space-x-4 overflow-hidden rounded-md border p-6 pr-8 shadow-lg transition-all data-[swipe=cancel]:translate-x-0 data-[swipe=end]:translate-x-[var(--radix-toast-swipe-end-x)] data-[swipe=move]:translate-x-[var(--radix-toast-swipe-move-x)] data-[swipe=move]:transition-none data-[state=open]:animate-in data-[state=closed]:animate-out data-[swipe=end]:animate-out data-[state=closed]:fade-out-80 data-[state=closed]:slide-out-to-right-full data-[state=open]:slide-in-from-top-full data-[state=open]:sm:slide-in-from-bottom-full",{variants:{variant:{default:"border bg-background text-foreground",destructive:"destructive group border-destructive bg-destructive text-destructive-foreground"}},defaultVariants:{variant:"default"}}),Fv=p.forwardRef(({className:e,variant:t,...n},r)=>v.jsx(Cv,{ref:r,className:Me(vS({variant:t}),e),...n}));Fv.displayName=Cv.displayName;const gS=p.forwardRef(({className:e,...t},n)=>v.jsx(Pv,{ref:n,className:Me("inline-flex h-8 shrink-0 items-center justify-center rounded-md border bg-transparent px-3 text-sm font-medium ring-offset-background transition-colors group-[.destructive]:border-muted/40 hover:bg-secondary group-[.destructive]:hover:border-destructive/30 group-[.destructive]:hover:bg-destructive group-[.destructive]:hover:text-destructive-foreground focus:outline-none focus:ring-2 focus:ring-ring focus:ring-offset-2 group-[.destructive]:focus:ring-destructive disabled:pointer-events-none disabled:opacity-50",e),...t}));gS.displayName=Pv.displayName;const zv=p.forwardRef(({className:e,...t},n)=>v.jsx(Rv,{ref:n,className:Me("absolute right-2 top-2 rounded-md p-1 text-foreground/50 opacity-0 transition-opacity group-hover:opacity-100 group-[.destructive]:text-red-300 hover:text-foreground group-[.destructive]:hover:text-red-50 focus:opacity-100 focus:outline-none focus:ring-2 group-[.destructive]:focus:ring-red-400 group-[.destructive]:focus:ring-offset-red-600",e),"toast-close":"",...t,children:v.jsx(_v,{className:"h-4 w-4"})}));zv.displayName=Rv.displayName;const $v=p.forwardRef(({className:e,...t},n)=>v.jsx(bv,{ref:n,className:Me("text-sm font-semibold",e),...t}));$v.displayName=bv.displayName;const Bv=p.forwardRef(({className:e,...t},n)=>v.jsx(kv,{ref:n,className:Me("text-sm opacity-90",e),...t}));Bv.displayName=kv.displayName;function yS(){const{toasts:e}=Mx();return v.jsxs(mS,{children:[e.map(function({id:t,title:n,description:r,action:o,...i}){return v.jsxs(Fv,{...i,children:[v.jsxs("div",{className:"grid gap-1",children:[n&&v.jsx($v,{children:n}),r&&v.jsx(Bv,{children:r})]}),o,v.jsx(zv,{})]},t)}),v.jsx(Lv,{})]})}var Yf=["light","dark"],wS="(prefers-color-scheme: dark)",xS=p.createContext(void 0),SS={setTheme:e=>{},themes:[]},ES=()=>{var e;return(e=p.useContext(xS))!=null?e:SS};p.memo(({forcedTheme:e,storageKey:t,attribute:n,enableSystem:r,enableColorScheme:o,defaultTheme:i,value:s,attrs:a,nonce:l})=>{let u=i==="system",d=n==="class"?`var d=document.documentElement,c=d.classList;${`c.remove(${a.map(S=>`'${S}'`).join(",")})`};`:`var d=document.documentElement,n='${n}',s='setAttribute';`,c=o?Yf.includes(i)&&i?`if(e==='light'||e==='dark'||!e)d.style.colorScheme=e||'${i}'`:"if(e==='light'||e==='dark')d.style.colorScheme=e":"",h=(S,m=!1,x=!0)=>{let g=s?s[S]:S,y=m?S+"|| ''":`'${g}'`,w="";return o&&x&&!m&&Yf.includes(S)&&(w+=`d.style.colorScheme = '${S}';`),n==="class"?m||g?w+=`c.add(${y})`:w+="null":g&&(w+=`d[s](n,${y})`),w},f=e?`!function(){${d}${h(e)}}()`:r?`!function(){try{${d}var e=localStorage.getItem('${t}');if('system'===e||(!e&&${u})){var t='${wS}',m=window.matchMedia(t);if(m.media!==t||m.matches){${h("dark")}}else{${h("light")}}}else if(e){${s?`var x=${JSON.stringify(s)};`:""}${h(s?"x[e]":"e",!0)}}${u?"":"else{"+h(i,!1,!1)+"}"}${c}}catch(e){}}()`:`!function(){try{${d}var e=localStorage.getItem('${t}');if(e){${s?`var x=${JSON.stringify(s)};`:""}${h(s?"x[e]":"e",!0)}}else{${h(i,!1,!1)};}${c}}catch(t){}}();`;return p.createElement("script",{nonce:l,dangerouslySetInnerHTML:{__html:f}})});var CS=e=>{switch(e){case"success":return PS;case"info":return NS;case"warning":return RS;case"error":return TS;default:return null}},bS=Array(12).fill(0),kS=({visible:e,className:t})=>M.createElement("div",{className:["sonner-loading-wrapper",t].filter(Boolean).join(" "),"data-visible":e},M.createElement("div",{className:"sonner-spinner"},bS.map((n,r)=>M.createElement("div",{className:"sonner-loading-bar",key:`spinner-bar-${r}`})))),PS=M.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 20 20",fill:"currentColor",height:"20",width:"20"},M.createElement("path",{fillRule:"evenodd",d:"M10 18a8 8 0 100-16 8 8 0 000 16zm3.857-9.809a.75.75 0 00-1.214-.882l-3.483 4.79-1.88-1.88a.75.75 0 10-1.06 1.061l2.5 2.5a.75.75 0 001.137-.089l4-5.5z",clipRule:"evenodd"})),RS=M.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 24 24",fill:"currentColor",height:"20",width:"20"},M.createElement("path",{fillRule:"evenodd",d:"M9.401 3.003c1.155-2 4.043-2 5.197 0l7.355 12.748c1.154 2-.29 4.5-2.599 4.5H4.645c-2.309 0-3.752-2.5-2.598-4.5L9.4 3.003zM12 8.25a.75.75 0 01.75.75v3.75a.75.75 0 01-1.5 0V9a.75.75 0 01.75-.75zm0 8.25a.75.75 0 100-1.5.75.75 0 000 1.5z",clipRule:"evenodd"})),NS=M.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 20 20",fill:"currentColor",height:"20",width:"20"},M.createElement("path",{fillRule:"evenodd",d:"M18 10a8 8 0 11-16 0 8 8 0 0116 0zm-7-4a1 1 0 11-2 0 1 1 0 012 0zM9 9a.75.75 0 000 1.5h.253a.25.25 0 01.244.304l-.459 2.066A1.75 1.75 0 0010.747 15H11a.75.75 0 000-1.5h-.253a.25.25 0 01-.244-.304l.459-2.066A1.75 1.75 0 009.253 9H9z",clipRule:"evenodd"})),TS=M.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 20 20",fill:"currentColor",height:"20",width:"20"},M.createElement("path",{fillRule:"evenodd",d:"M18 10a8 8 0 11-16 0 8 8 0 0116 0zm-8-5a.75.75 0 01.75.75v4.5a.75.75 0 01-1.5 0v-4.5A.75.75 0 0110 5zm0 10a1 1 0 100-2 1 1 0 000 2z",clipRule:"evenodd"})),jS=M.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",width:"12",height:"12",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.5",strokeLinecap:"round",strokeLinejoin:"round"},M.createElement("line",{x1:"18",y1:"6",x2:"6",y2:"18"}),M.createElement("line",{x1:"6",y1:"6",x2:"18",y2:"18"})),_S=()=>{let[e,t]=M.useState(document.hidden);return M.useEffect(()=>{let n=()=>{t(document.hidden)};return document.addEventListener("visibilitychange",n),()=>window.removeEventListener("visibilitychange",n)},[]),e},zu=1,AS=class{constructor(){this.subscribe=e=>(this.subscribers.push(e),()=>{let t=this.subscribers.indexOf(e);this.subscribers.splice(t,1)}),this.publish=e=>{this.subscribers.forEach(t=>t(e))},this.addToast=e=>{this.publish(e),this.toasts=[...this.toasts,e]},this.create=e=>{var t;let{message:n,...r}=e,o=typeof(e==null?void 0:e.id)=="number"||((t=e.id)==null?void 0:t.length)>0?e.id:zu++,i=this.toasts.find(a=>a.id===o),s=e.dismissible===void 0?!0:e.dismissible;return this.dismissedToasts.has(o)&&this.dismissedToasts.delete(o),i?this.toasts=this.toasts.map(a=>a.id===o?(this.publish({...a,...e,id:o,title:n}),{...a,...e,id:o,dismissible:s,title:n}):a):this.addToast({title:n,...r,dismissible:s,id:o}),o},this.dismiss=e=>(this.dismissedToasts.add(e),e||this.toasts.forEach(t=>{this.subscribers.forEach(n=>n({id:t.id,dismiss:!0}))}),this.subscribers.forEach(t=>t({id:e,dismiss:!0})),e),this.message=(e,t)=>this.create({...t,message:e}),this.error=(e,t)=>this.create({...t,message:e,type:"error"}),this.success=(e,t)=>this.create({...t,type:"success",message:e}),this.info=(e,t)=>this.create({...t,type:"info",message:e}),this.warning=(e,t)=>this.create({...t,type:"warning",message:e}),this.loading=(e,t)=>this.create({...t,type:"loading",message:e}),this.promise=(e,t)=>{if(!t)return;let n;t.loading!==void 0&&(n=this.create({...t,promise:e,type:"loading",message:t.loading,description:typeof t.description!="function"?t.description:void 0}));let r=e instanceof Promise?e:e(),o=n!==void 0,i,s=r.then(async l=>{if(i=["resolve",l],M.isValidElement(l))o=!1,this.create({id:n,type:"default",message:l});else if(MS(l)&&!l.ok){o=!1;let u=typeof t.error=="function"?await t.error(`HTTP error! status: ${l.status}`):t.error,d=typeof t.description=="function"?await t.description(`HTTP error! status: ${l.status}`):t.description;this.create({id:n,type:"error",message:u,description:d})}else if(t.success!==void 0){o=!1;let u=typeof t.success=="function"?await t.success(l):t.success,d=typeof t.description=="function"?await t.description(l):t.description;this.create({id:n,type:"success",message:u,description:d})}}).catch(async l=>{if(i=["reject",l],t.error!==void 0){o=!1;let u=typeof t.error=="function"?await t.error(l):t.error,d=typeof t.description=="function"?await t.description(l):t.description;this.create({id:n,type:"error",message:u,description:d})}}).finally(()=>{var l;o&&(this.dismiss(n),n=void 0),(l=t.finally)==null||l.call(t)}),a=()=>new Promise((l,u)=>s.then(()=>i[0]==="reject"?u(i[1]):l(i[1])).catch(u));return typeof n!="string"&&typeof n!="number"?{unwrap:a}:Object.assign(n,{unwrap:a})},this.custom=(e,t)=>{let n=(t==null?void 0:t.id)||zu++;return this.create({jsx:e(n),id:n,...t}),n},this.getActiveToasts=()=>this.toasts.filter(e=>!this.dismissedToasts.has(e.id)),this.subscribers=[],this.toasts=[],this.dismissedToasts=new Set}},Xe=new AS,OS=(e,t)=>{let n=(t==null?void 0:t.id)||zu++;return Xe.addToast({title:e,...t,id:n}),n},MS=e=>e&&typeof e=="object"&&"ok"in e&&typeof e.ok=="boolean"&&"status"in e&&typeof e.status=="number",IS=OS,DS=()=>Xe.toasts,LS=()=>Xe.getActiveToasts(),ke=Object.assign(IS,{success:Xe.success,info:Xe.info,warning:Xe.warning,error:Xe.error,custom:Xe.custom,message:Xe.message,promise:Xe.promise,dismiss:Xe.dismiss,loading:Xe.loading},{getHistory:DS,getToasts:LS});function FS(e,{insertAt:t}={}){if(typeof document>"u")return;let n=document.head||document.getElementsByTagName("head")[0],r=document.createElement("style");r.type="text/css",t==="top"&&n.firstChild?n.insertBefore(r,n.firstChild):n.appendChild(r),r.styleSheet?r.styleSheet.cssText=e:r.appendChild(document.createTextNode(e))}FS(`:where(html[dir="ltr"]),:where([data-sonner-toaster][dir="ltr"]){--toast-icon-margin-start: -3px;--toast-icon-margin-end: 4px;--toast-svg-margin-start: -1px;--toast-svg-margin-end: 0px;--toast-button-margin-start: auto;--toast-button-margin-end: 0;--toast-close-button-start: 0;--toast-close-button-end: unset;--toast-close-button-transform: translate(-35%, -35%)}:where(html[dir="rtl"]),:where([data-sonner-toaster][dir="rtl"]){--toast-icon-margin-start: 4px;--toast-icon-margin-end: -3px;--toast-svg-margin-start: 0px;--toast-svg-margin-end: -1px;--toast-button-margin-start: 0;--toast-button-margin-end: auto;--toast-close-button-start: unset;--toast-close-button-end: 0;--toast-close-button-transform: translate(35%, -35%)}:where([data-sonner-toaster]){position:fixed;width:var(--width);font-family:ui-sans-serif,system-ui,-apple-system,BlinkMacSystemFont,Segoe UI,Roboto,Helvetica Neue,Arial,Noto Sans,sans-serif,Apple Color Emoji,Segoe UI Emoji,Segoe UI Symbol,Noto Color Emoji;--gray1: hsl(0, 0%, 99%);--gray2: hsl(0, 0%, 97.3%);--gray3: hsl(0, 0%, 95.1%);--gray4: hsl(0, 0%, 93%);--gray5: hsl(0, 0%, 90.9%);--gray6: hsl(0, 0%, 88.7%);--gray7: hsl(0, 0%, 85.8%);--gray8: hsl(0, 0%, 78%);--gray9: hsl(0, 0%, 56.1%);--gray10: hsl(0, 0%, 52.3%);--gray11: hsl(0, 0%, 43.5%);--gray12: hsl(0, 0%, 9%);--border-radius: 8px;box-sizing:border-box;padding:0;margin:0;list-style:none;outline:none;z-index:999999999;transition:transform .4s ease}:where([data-sonner-toaster][data-lifted="true"]){transform:translateY(-10px)}@media (hover: none) and (pointer: coarse){:where([data-sonner-toaster][data-lifted="true"]){transform:none}}:where([data-sonner-toaster][data-x-position="right"]){right:var(--offset-right)}:where([data-sonner-toaster][data-x-position="left"]){left:var(--offset-left)}:where([data-sonner-toaster][data-x-position="center"]){left:50%;transform:translate(-50%)}:where([data-sonner-toaster][data-y-position="top"]){top:var(--offset-top)}:where([data-sonner-toaster][data-y-position="bottom"]){bottom:var(--offset-bottom)}:where([data-sonner-toast]){--y: translateY(100%);--lift-amount: calc(var(--lift) * var(--gap));z-index:var(--z-index);position:absolute;opacity:0;transform:var(--y);filter:blur(0);touch-action:none;transition:transform .4s,opacity .4s,height .4s,box-shadow .2s;box-sizing:border-box;outline:none;overflow-wrap:anywhere}:where([data-sonner-toast][data-styled="true"]){padding:16px;background:var(--normal-bg);border:1px solid var(--normal-border);color:var(--normal-text);border-radius:var(--border-radius);box-shadow:0 4px 12px #0000001a;width:var(--width);font-size:13px;display:flex;align-items:center;gap:6px}:where([data-sonner-toast]:focus-visible){box-shadow:0 4px 12px #0000001a,0 0 0 2px #0003}:where([data-sonner-toast][data-y-position="top"]){top:0;--y: translateY(-100%);--lift: 1;--lift-amount: calc(1 * var(--gap))}:where([data-sonner-toast][data-y-position="bottom"]){bottom:0;--y: translateY(100%);--lift: -1;--lift-amount: calc(var(--lift) * var(--gap))}:where([data-sonner-toast]) :where([data-description]){font-weight:400;line-height:1.4;color:inherit}:where([data-sonner-toast]) :where([data-title]){font-weight:500;line-height:1.5;color:inherit}:where([data-sonner-toast]) :where([data-icon]){display:flex;height:16px;width:16px;position:relative;justify-content:flex-start;align-items:center;flex-shrink:0;margin-left:var(--toast-icon-margin-start);margin-right:var(--toast-icon-margin-end)}:where([data-sonner-toast][data-promise="true"]) :where([data-icon])>svg{opacity:0;transform:scale(.8);transform-origin:center;animation:sonner-fade-in .3s ease forwards}:where([data-sonner-toast]) :where([data-icon])>*{flex-shrink:0}:where([data-sonner-toast]) :where([data-icon]) svg{margin-left:var(--toast-svg-margin-start);margin-right:var(--toast-svg-margin-end)}:where([data-sonner-toast]) :where([data-content]){display:flex;flex-direction:column;gap:2px}[data-sonner-toast][data-styled=true] [data-button]{border-radius:4px;padding-left:8px;padding-right:8px;height:24px;font-size:12px;color:var(--normal-bg);background:var(--normal-text);margin-left:var(--toast-button-margin-start);margin-right:var(--toast-button-margin-end);border:none;cursor:pointer;outline:none;display:flex;align-items:center;flex-shrink:0;transition:opacity .4s,box-shadow .2s}:where([data-sonner-toast]) :where([data-button]):focus-visible{box-shadow:0 0 0 2px #0006}:where([data-sonner-toast]) :where([data-button]):first-of-type{margin-left:var(--toast-button-margin-start);margin-right:var(--toast-button-margin-end)}:where([data-sonner-toast]) :where([data-cancel]){color:var(--normal-text);background:rgba(0,0,0,.08)}:where([data-sonner-toast][data-theme="dark"]) :where([data-cancel]){background:rgba(255,255,255,.3)}:where([data-sonner-toast]) :where([data-close-button]){position:absolute;left:var(--toast-close-button-start);right:var(--toast-close-button-end);top:0;height:20px;width:20px;display:flex;justify-content:center;align-items:center;padding:0;color:var(--gray12);border:1px solid var(--gray4);transform:var(--toast-close-button-transform);border-radius:50%;cursor:pointer;z-index:1;transition:opacity .1s,background .2s,border-color .2s}[data-sonner-toast] [data-close-button]{background:var(--gray1)}:where([data-sonner-toast]) :where([data-close-button]):focus-visible{box-shadow:0 4px 12px #0000001a,0 0 0 2px #0003}:where([data-sonner-toast]) :where([data-disabled="true"]){cursor:not-allowed}:where([data-sonner-toast]):hover :where([data-close-button]):hover{background:var(--gray2);border-color:var(--gray5)}:where([data-sonner-toast][data-swiping="true"]):before{content:"";position:absolute;left:-50%;right:-50%;height:100%;z-index:-1}:where([data-sonner-toast][data-y-position="top"][data-swiping="true"]):before{bottom:50%;transform:scaleY(3) translateY(50%)}:where([data-sonner-toast][data-y-position="bottom"][data-swiping="true"]):before{top:50%;transform:scaleY(3) translateY(-50%)}:where([data-sonner-toast][data-swiping="false"][data-removed="true"]):before{content:"";position:absolute;inset:0;transform:scaleY(2)}:where([data-sonner-toast]):after{content:"";position:absolute;left:0;height:calc(var(--gap) + 1px);bottom:100%;width:100%}:where([data-sonner-toast][data-mounted="true"]){--y: translateY(0);opacity:1}:where([data-sonner-toast][data-expanded="false"][data-front="false"]){--scale: var(--toasts-before) * .05 + 1;--y: translateY(calc(var(--lift-amount) * var(--toasts-before))) scale(calc(-1 * var(--scale)));height:var(--front-toast-height)}:where([data-sonner-toast])>*{transition:opacity .4s}:where([data-sonner-toast][data-expanded="false"][data-front="false"][data-styled="true"])>*{opacity:0}:where([data-sonner-toast][data-visible="false"]){opacity:0;pointer-events:none}:where([data-sonner-toast][data-mounted="true"][data-expanded="true"]){--y: translateY(calc(var(--lift) * var(--offset)));height:var(--initial-height)}:where([data-sonner-toast][data-removed="true"][data-front="true"][data-swipe-out="false"]){--y: translateY(calc(var(--lift) * -100%));opacity:0}:where([data-sonner-toast][data-removed="true"][data-front="false"][data-swipe-out="false"][data-expanded="true"]){--y: translateY(calc(var(--lift) * var(--offset) + var(--lift) * -100%));opacity:0}:where([data-sonner-toast][data-removed="true"][data-front="false"][data-swipe-out="false"][data-expanded="false"]){--y: translateY(40%);opacity:0;transition:transform .5s,opacity .2s}:where([data-sonner-toast][data-removed="true"][data-front="false"]):before{height:calc(var(--initial-height) + 20%)}[data-sonner-toast][data-swiping=true]{transform:var(--y) translateY(var(--swipe-amount-y, 0px)) translate(var(--swipe-amount-x, 0px));transition:none}[data-sonner-toast][data-swiped=true]{user-select:none}[data-sonner-toast][data-swipe-out=true][data-y-position=bottom],[data-sonner-toast][data-swipe-out=true][data-y-position=top]{animation-duration:.2s;animation-timing-function:ease-out;animation-fill-mode:forwards}[data-sonner-toast][data-swipe-out=true][data-swipe-direction=left]{animation-name:swipe-out-left}[data-sonner-toast][data-swipe-out=true][data-swipe-direction=right]{animation-name:swipe-out-right}[data-sonner-toast][data-swipe-out=true][data-swipe-direction=up]{animation-name:swipe-out-up}[data-sonner-toast][data-swipe-out=true][data-swipe-direction=down]{animation-name:swipe-out-down}@keyframes swipe-out-left{0%{transform:var(--y) translate(var(--swipe-amount-x));opacity:1}to{transform:var(--y) translate(calc(var(--swipe-amount-x) - 100%));opacity:0}}@keyframes swipe-out-right{0%{transform:var(--y) translate(var(--swipe-amount-x));opacity:1}to{transform:var(--y) translate(calc(var(--swipe-amount-x) + 100%));opacity:0}}@keyframes swipe-out-up{0%{transform:var(--y) translateY(var(--swipe-amount-y));opacity:1}to{transform:var(--y) translateY(calc(var(--swipe-amount-y) - 100%));opacity:0}}@keyframes swipe-out-down{0%{transform:var(--y) translateY(var(--swipe-amount-y));opacity:1}to{transform:var(--y) translateY(calc(var(--swipe-amount-y) + 100%));opacity:0}}@media (max-width: 600px){[data-sonner-toaster]{position:fixed;right:var(--mobile-offset-right);left:var(--mobile-offset-left);width:100%}[data-sonner-toaster][dir=rtl]{left:calc(var(--mobile-offset-left) * -1)}[data-sonner-toaster] [data-sonner-toast]{left:0;right:0;width:calc(100% - var(--mobile-offset-left) * 2)}[data-sonner-toaster][data-x-position=left]{left:var(--mobile-offset-left)}[data-sonner-toaster][data-y-position=bottom]{bottom:var(--mobile-offset-bottom)}[data-sonner-toaster][data-y-position=top]{top:var(--mobile-offset-top)}[data-sonner-toaster][data-x-position=center]{left:var(--mobile-offset-left);right:var(--mobile-offset-right);transform:none}}[data-sonner-toaster][data-theme=light]{--normal-bg: #fff;--normal-border: var(--gray4);--normal-text: var(--gray12);--success-bg: hsl(143, 85%, 96%);--success-border: hsl(145, 92%, 91%);--success-text: hsl(140, 100%, 27%);--info-bg: hsl(208, 100%, 97%);--info-border: hsl(221, 91%, 91%);--info-text: hsl(210, 92%, 45%);--warning-bg: hsl(49, 100%, 97%);--warning-border: hsl(49, 91%, 91%);--warning-text: hsl(31, 92%, 45%);--error-bg: hsl(359, 100%, 97%);--error-border: hsl(359, 100%, 94%);--error-text: hsl(360, 100%, 45%)}[data-sonner-toaster][data-theme=light] [data-sonner-toast][data-invert=true]{--normal-bg: #000;--normal-border: hsl(0, 0%, 20%);--normal-text: var(--gray1)}[data-sonner-toaster][data-theme=dark] [data-sonner-toast][data-invert=true]{--normal-bg: #fff;--normal-border: var(--gray3);--normal-text: var(--gray12)}[data-sonner-toaster][data-theme=dark]{--normal-bg: #000;--normal-bg-hover: hsl(0, 0%, 12%);--normal-border: hsl(0, 0%, 20%);--normal-border-hover: hsl(0, 0%, 25%);--normal-text: var(--gray1);--success-bg: hsl(150, 100%, 6%);--success-border: hsl(147, 100%, 12%);--success-text: hsl(150, 86%, 65%);--info-bg: hsl(215, 100%, 6%);--info-border: hsl(223, 100%, 12%);--info-text: hsl(216, 87%, 65%);--warning-bg: hsl(64, 100%, 6%);--warning-border: hsl(60, 100%, 12%);--warning-text: hsl(46, 87%, 65%);--error-bg: hsl(358, 76%, 10%);--error-border: hsl(357, 89%, 16%);--error-text: hsl(358, 100%, 81%)}[data-sonner-toaster][data-theme=dark] [data-sonner-toast] [data-close-button]{background:var(--normal-bg);border-color:var(--normal-border);color:var(--normal-text)}[data-sonner-toaster][data-theme=dark] [data-sonner-toast] [data-close-button]:hover{background:var(--normal-bg-hover);border-color:var(--normal-border-hover)}[data-rich-colors=true][data-sonner-toast][data-type=success],[data-rich-colors=true][data-sonner-toast][data-type=success] [data-close-button]{background:var(--success-bg);border-color:var(--success-border);color:var(--success-text)}[data-rich-colors=true][data-sonner-toast][data-type=info],[data-rich-colors=true][data-sonner-toast][data-type=info] [data-close-button]{background:var(--info-bg);border-color:var(--info-border);color:var(--info-text)}[data-rich-colors=true][data-sonner-toast][data-type=warning],[data-rich-colors=true][data-sonner-toast][data-type=warning] [data-close-button]{background:var(--warning-bg);border-color:var(--warning-border);color:var(--warning-text)}[data-rich-colors=true][data-sonner-toast][data-type=error],[data-rich-colors=true][data-sonner-toast][data-type=error] [data-close-button]{background:var(--error-bg);border-color:var(--error-border);color:var(--error-text)}.sonner-loading-wrapper{--size: 16px;height:var(--size);width:var(--size);position:absolute;inset:0;z-index:10}.sonner-loading-wrapper[data-visible=false]{transform-origin:center;animation:sonner-fade-out .2s ease forwards}.sonner-spinner{position:relative;top:50%;left:50%;height:var(--size);width:var(--size)}.sonner-loading-bar{animation:sonner-spin 1.2s linear infinite;background:var(--gray11);border-radius:6px;height:8%;left:-10%;position:absolute;top:-3.9%;width:24%}.sonner-loading-bar:nth-child(1){animation-delay:-1.2s;transform:rotate(.0001deg) translate(146%)}.sonner-loading-bar:nth-child(2){animation-delay:-1.1s;transform:rotate(30deg) translate(146%)}.sonner-loading-bar:nth-child(3){animation-delay:-1s;transform:rotate(60deg) translate(146%)}.sonner-loading-bar:nth-child(4){animation-delay:-.9s;transform:rotate(90deg) translate(146%)}.sonner-loading-bar:nth-child(5){animation-delay:-.8s;transform:rotate(120deg) translate(146%)}.sonner-loading-bar:nth-child(6){animation-delay:-.7s;transform:rotate(150deg) translate(146%)}.sonner-loading-bar:nth-child(7){animation-delay:-.6s;transform:rotate(180deg) translate(146%)}.sonner-loading-bar:nth-child(8){animation-delay:-.5s;transform:rotate(210deg) translate(146%)}.sonner-loading-bar:nth-child(9){animation-delay:-.4s;transform:rotate(240deg) translate(146%)}.sonner-loading-bar:nth-child(10){animation-delay:-.3s;transform:rotate(270deg) translate(146%)}.sonner-loading-bar:nth-child(11){animation-delay:-.2s;transform:rotate(300deg) translate(146%)}.sonner-loading-bar:nth-child(12){animation-delay:-.1s;transform:rotate(330deg) translate(146%)}@keyframes sonner-fade-in{0%{opacity:0;transform:scale(.8)}to{opacity:1;transform:scale(1)}}@keyframes sonner-fade-out{0%{opacity:1;transform:scale(1)}to{opacity:0;transform:scale(.8)}}@keyframes sonner-spin{0%{opacity:1}to{opacity:.15}}@media (prefers-reduced-motion){[data-sonner-toast],[data-sonner-toast]>*,.sonner-loading-bar{transition:none!important;animation:none!important}}.sonner-loader{position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);transform-origin:center;transition:opacity .2s,transform .2s}.sonner-loader[data-visible=false]{opacity:0;transform:scale(.8) translate(-50%,-50%)}
-`);function vs(e){return e.label!==void 0}var zS=3,$S="32px",BS="16px",Xf=4e3,US=356,VS=14,WS=20,HS=200;function Tt(...e){return e.filter(Boolean).join(" ")}function KS(e){let[t,n]=e.split("-"),r=[];return t&&r.push(t),n&&r.push(n),r}var QS=e=>{var t,n,r,o,i,s,a,l,u,d,c;let{invert:h,toast:f,unstyled:S,interacting:m,setHeights:x,visibleToasts:g,heights:y,index:w,toasts:E,expanded:C,removeToast:b,defaultRichColors:k,closeButton:P,style:O,cancelButtonStyle:_,actionButtonStyle:z,className:I="",descriptionClassName:D="",duration:N,position:B,gap:L,loadingIcon:W,expandByDefault:R,classNames:j,icons:F,closeButtonAriaLabel:H="Close toast",pauseWhenPageIsHidden:U}=e,[G,X]=M.useState(null),[he,Se]=M.useState(null),[te,Et]=M.useState(!1),[Ct,bt]=M.useState(!1),[Vt,Cn]=M.useState(!1),[Wt,Or]=M.useState(!1),[Mr,Ir]=M.useState(!1),[Lo,sr]=M.useState(0),[bn,qi]=M.useState(0),ar=M.useRef(f.duration||N||Xf),Gi=M.useRef(null),K=M.useRef(null),V=w===0,ne=w+1<=g,J=f.type,le=f.dismissible!==!1,be=f.className||"",ft=f.descriptionClassName||"",Re=M.useMemo(()=>y.findIndex(Q=>Q.toastId===f.id)||0,[y,f.id]),ge=M.useMemo(()=>{var Q;return(Q=f.closeButton)!=null?Q:P},[f.closeButton,P]),pt=M.useMemo(()=>f.duration||N||Xf,[f.duration,N]),Dr=M.useRef(0),Lr=M.useRef(0),kd=M.useRef(0),Fr=M.useRef(null),[Zy,e0]=B.split("-"),Pd=M.useMemo(()=>y.reduce((Q,ae,me)=>me>=Re?Q:Q+ae.height,0),[y,Re]),Rd=_S(),t0=f.invert||h,Ja=J==="loading";Lr.current=M.useMemo(()=>Re*L+Pd,[Re,Pd]),M.useEffect(()=>{ar.current=pt},[pt]),M.useEffect(()=>{Et(!0)},[]),M.useEffect(()=>{let Q=K.current;if(Q){let ae=Q.getBoundingClientRect().height;return qi(ae),x(me=>[{toastId:f.id,height:ae,position:f.position},...me]),()=>x(me=>me.filter(kt=>kt.toastId!==f.id))}},[x,f.id]),M.useLayoutEffect(()=>{if(!te)return;let Q=K.current,ae=Q.style.height;Q.style.height="auto";let me=Q.getBoundingClientRect().height;Q.style.height=ae,qi(me),x(kt=>kt.find(Pt=>Pt.toastId===f.id)?kt.map(Pt=>Pt.toastId===f.id?{...Pt,height:me}:Pt):[{toastId:f.id,height:me,position:f.position},...kt])},[te,f.title,f.description,x,f.id]);let kn=M.useCallback(()=>{bt(!0),sr(Lr.current),x(Q=>Q.filter(ae=>ae.toastId!==f.id)),setTimeout(()=>{b(f)},HS)},[f,b,x,Lr]);M.useEffect(()=>{if(f.promise&&J==="loading"||f.duration===1/0||f.type==="loading")return;let Q;return C||m||U&&Rd?(()=>{if(kd.current<Dr.current){let ae=new Date().getTime()-Dr.current;ar.current=ar.current-ae}kd.current=new Date().getTime()})():ar.current!==1/0&&(Dr.current=new Date().getTime(),Q=setTimeout(()=>{var ae;(ae=f.onAutoClose)==null||ae.call(f,f),kn()},ar.current)),()=>clearTimeout(Q)},[C,m,f,J,U,Rd,kn]),M.useEffect(()=>{f.delete&&kn()},[kn,f.delete]);function n0(){var Q,ae,me;return F!=null&&F.loading?M.createElement("div",{className:Tt(j==null?void 0:j.loader,(Q=f==null?void 0:f.classNames)==null?void 0:Q.loader,"sonner-loader"),"data-visible":J==="loading"},F.loading):W?M.createElement("div",{className:Tt(j==null?void 0:j.loader,(ae=f==null?void 0:f.classNames)==null?void 0:ae.loader,"sonner-loader"),"data-visible":J==="loading"},W):M.createElement(kS,{className:Tt(j==null?void 0:j.loader,(me=f==null?void 0:f.classNames)==null?void 0:me.loader),visible:J==="loading"})}return M.createElement("li",{tabIndex:0,ref:K,className:Tt(I,be,j==null?void 0:j.toast,(t=f==null?void 0:f.classNames)==null?void 0:t.toast,j==null?void 0:j.default,j==null?void 0:j[J],(n=f==null?void 0:f.classNames)==null?void 0:n[J]),"data-sonner-toast":"","data-rich-colors":(r=f.richColors)!=null?r:k,"data-styled":!(f.jsx||f.unstyled||S),"data-mounted":te,"data-promise":!!f.promise,"data-swiped":Mr,"data-removed":Ct,"data-visible":ne,"data-y-position":Zy,"data-x-position":e0,"data-index":w,"data-front":V,"data-swiping":Vt,"data-dismissible":le,"data-type":J,"data-invert":t0,"data-swipe-out":Wt,"data-swipe-direction":he,"data-expanded":!!(C||R&&te),style:{"--index":w,"--toasts-before":w,"--z-index":E.length-w,"--offset":`${Ct?Lo:Lr.current}px`,"--initial-height":R?"auto":`${bn}px`,...O,...f.style},onDragEnd:()=>{Cn(!1),X(null),Fr.current=null},onPointerDown:Q=>{Ja||!le||(Gi.current=new Date,sr(Lr.current),Q.target.setPointerCapture(Q.pointerId),Q.target.tagName!=="BUTTON"&&(Cn(!0),Fr.current={x:Q.clientX,y:Q.clientY}))},onPointerUp:()=>{var Q,ae,me,kt;if(Wt||!le)return;Fr.current=null;let Pt=Number(((Q=K.current)==null?void 0:Q.style.getPropertyValue("--swipe-amount-x").replace("px",""))||0),Pn=Number(((ae=K.current)==null?void 0:ae.style.getPropertyValue("--swipe-amount-y").replace("px",""))||0),lr=new Date().getTime()-((me=Gi.current)==null?void 0:me.getTime()),Rt=G==="x"?Pt:Pn,Rn=Math.abs(Rt)/lr;if(Math.abs(Rt)>=WS||Rn>.11){sr(Lr.current),(kt=f.onDismiss)==null||kt.call(f,f),Se(G==="x"?Pt>0?"right":"left":Pn>0?"down":"up"),kn(),Or(!0),Ir(!1);return}Cn(!1),X(null)},onPointerMove:Q=>{var ae,me,kt,Pt;if(!Fr.current||!le||((ae=window.getSelection())==null?void 0:ae.toString().length)>0)return;let Pn=Q.clientY-Fr.current.y,lr=Q.clientX-Fr.current.x,Rt=(me=e.swipeDirections)!=null?me:KS(B);!G&&(Math.abs(lr)>1||Math.abs(Pn)>1)&&X(Math.abs(lr)>Math.abs(Pn)?"x":"y");let Rn={x:0,y:0};G==="y"?(Rt.includes("top")||Rt.includes("bottom"))&&(Rt.includes("top")&&Pn<0||Rt.includes("bottom")&&Pn>0)&&(Rn.y=Pn):G==="x"&&(Rt.includes("left")||Rt.includes("right"))&&(Rt.includes("left")&&lr<0||Rt.includes("right")&&lr>0)&&(Rn.x=lr),(Math.abs(Rn.x)>0||Math.abs(Rn.y)>0)&&Ir(!0),(kt=K.current)==null||kt.style.setProperty("--swipe-amount-x",`${Rn.x}px`),(Pt=K.current)==null||Pt.style.setProperty("--swipe-amount-y",`${Rn.y}px`)}},ge&&!f.jsx?M.createElement("button",{"aria-label":H,"data-disabled":Ja,"data-close-button":!0,onClick:Ja||!le?()=>{}:()=>{var Q;kn(),(Q=f.onDismiss)==null||Q.call(f,f)},className:Tt(j==null?void 0:j.closeButton,(o=f==null?void 0:f.classNames)==null?void 0:o.closeButton)},(i=F==null?void 0:F.close)!=null?i:jS):null,f.jsx||p.isValidElement(f.title)?f.jsx?f.jsx:typeof f.title=="function"?f.title():f.title:M.createElement(M.Fragment,null,J||f.icon||f.promise?M.createElement("div",{"data-icon":"",className:Tt(j==null?void 0:j.icon,(s=f==null?void 0:f.classNames)==null?void 0:s.icon)},f.promise||f.type==="loading"&&!f.icon?f.icon||n0():null,f.type!=="loading"?f.icon||(F==null?void 0:F[J])||CS(J):null):null,M.createElement("div",{"data-content":"",className:Tt(j==null?void 0:j.content,(a=f==null?void 0:f.classNames)==null?void 0:a.content)},M.createElement("div",{"data-title":"",className:Tt(j==null?void 0:j.title,(l=f==null?void 0:f.classNames)==null?void 0:l.title)},typeof f.title=="function"?f.title():f.title),f.description?M.createElement("div",{"data-description":"",className:Tt(D,ft,j==null?void 0:j.description,(u=f==null?void 0:f.classNames)==null?void 0:u.description)},typeof f.description=="function"?f.description():f.description):null),p.isValidElement(f.cancel)?f.cancel:f.cancel&&vs(f.cancel)?M.createElement("button",{"data-button":!0,"data-cancel":!0,style:f.cancelButtonStyle||_,onClick:Q=>{var ae,me;vs(f.cancel)&&le&&((me=(ae=f.cancel).onClick)==null||me.call(ae,Q),kn())},className:Tt(j==null?void 0:j.cancelButton,(d=f==null?void 0:f.classNames)==null?void 0:d.cancelButton)},f.cancel.label):null,p.isValidElement(f.action)?f.action:f.action&&vs(f.action)?M.createElement("button",{"data-button":!0,"data-action":!0,style:f.actionButtonStyle||z,onClick:Q=>{var ae,me;vs(f.action)&&((me=(ae=f.action).onClick)==null||me.call(ae,Q),!Q.defaultPrevented&&kn())},className:Tt(j==null?void 0:j.actionButton,(c=f==null?void 0:f.classNames)==null?void 0:c.actionButton)},f.action.label):null))};function Jf(){if(typeof window>"u"||typeof document>"u")return"ltr";let e=document.documentElement.getAttribute("dir");return e==="auto"||!e?window.getComputedStyle(document.documentElement).direction:e}function qS(e,t){let n={};return[e,t].forEach((r,o)=>{let i=o===1,s=i?"--mobile-offset":"--offset",a=i?BS:$S;function l(u){["top","right","bottom","left"].forEach(d=>{n[`${s}-${d}`]=typeof u=="number"?`${u}px`:u})}typeof r=="number"||typeof r=="string"?l(r):typeof r=="object"?["top","right","bottom","left"].forEach(u=>{r[u]===void 0?n[`${s}-${u}`]=a:n[`${s}-${u}`]=typeof r[u]=="number"?`${r[u]}px`:r[u]}):l(a)}),n}var GS=p.forwardRef(function(e,t){let{invert:n,position:r="bottom-right",hotkey:o=["altKey","KeyT"],expand:i,closeButton:s,className:a,offset:l,mobileOffset:u,theme:d="light",richColors:c,duration:h,style:f,visibleToasts:S=zS,toastOptions:m,dir:x=Jf(),gap:g=VS,loadingIcon:y,icons:w,containerAriaLabel:E="Notifications",pauseWhenPageIsHidden:C}=e,[b,k]=M.useState([]),P=M.useMemo(()=>Array.from(new Set([r].concat(b.filter(U=>U.position).map(U=>U.position)))),[b,r]),[O,_]=M.useState([]),[z,I]=M.useState(!1),[D,N]=M.useState(!1),[B,L]=M.useState(d!=="system"?d:typeof window<"u"&&window.matchMedia&&window.matchMedia("(prefers-color-scheme: dark)").matches?"dark":"light"),W=M.useRef(null),R=o.join("+").replace(/Key/g,"").replace(/Digit/g,""),j=M.useRef(null),F=M.useRef(!1),H=M.useCallback(U=>{k(G=>{var X;return(X=G.find(he=>he.id===U.id))!=null&&X.delete||Xe.dismiss(U.id),G.filter(({id:he})=>he!==U.id)})},[]);return M.useEffect(()=>Xe.subscribe(U=>{if(U.dismiss){k(G=>G.map(X=>X.id===U.id?{...X,delete:!0}:X));return}setTimeout(()=>{tv.flushSync(()=>{k(G=>{let X=G.findIndex(he=>he.id===U.id);return X!==-1?[...G.slice(0,X),{...G[X],...U},...G.slice(X+1)]:[U,...G]})})})}),[]),M.useEffect(()=>{if(d!=="system"){L(d);return}if(d==="system"&&(window.matchMedia&&window.matchMedia("(prefers-color-scheme: dark)").matches?L("dark"):L("light")),typeof window>"u")return;let U=window.matchMedia("(prefers-color-scheme: dark)");try{U.addEventListener("change",({matches:G})=>{L(G?"dark":"light")})}catch{U.addListener(({matches:X})=>{try{L(X?"dark":"light")}catch(he){console.error(he)}})}},[d]),M.useEffect(()=>{b.length<=1&&I(!1)},[b]),M.useEffect(()=>{let U=G=>{var X,he;o.every(Se=>G[Se]||G.code===Se)&&(I(!0),(X=W.current)==null||X.focus()),G.code==="Escape"&&(document.activeElement===W.current||(he=W.current)!=null&&he.contains(document.activeElement))&&I(!1)};return document.addEventListener("keydown",U),()=>document.removeEventListener("keydown",U)},[o]),M.useEffect(()=>{if(W.current)return()=>{j.current&&(j.current.focus({preventScroll:!0}),j.current=null,F.current=!1)}},[W.current]),M.createElement("section",{ref:t,"aria-label":`${E} ${R}`,tabIndex:-1,"aria-live":"polite","aria-relevant":"additions text","aria-atomic":"false",suppressHydrationWarning:!0},P.map((U,G)=>{var X;let[he,Se]=U.split("-");return b.length?M.createElement("ol",{key:U,dir:x==="auto"?Jf():x,tabIndex:-1,ref:W,className:a,"data-sonner-toaster":!0,"data-theme":B,"data-y-position":he,"data-lifted":z&&b.length>1&&!i,"data-x-position":Se,style:{"--front-toast-height":`${((X=O[0])==null?void 0:X.height)||0}px`,"--width":`${US}px`,"--gap":`${g}px`,...f,...qS(l,u)},onBlur:te=>{F.current&&!te.currentTarget.contains(te.relatedTarget)&&(F.current=!1,j.current&&(j.current.focus({preventScroll:!0}),j.current=null))},onFocus:te=>{te.target instanceof HTMLElement&&te.target.dataset.dismissible==="false"||F.current||(F.current=!0,j.current=te.relatedTarget)},onMouseEnter:()=>I(!0),onMouseMove:()=>I(!0),onMouseLeave:()=>{D||I(!1)},onDragEnd:()=>I(!1),onPointerDown:te=>{te.target instanceof HTMLElement&&te.target.dataset.dismissible==="false"||N(!0)},onPointerUp:()=>N(!1)},b.filter(te=>!te.position&&G===0||te.position===U).map((te,Et)=>{var Ct,bt;return M.createElement(QS,{key:te.id,icons:w,index:Et,toast:te,defaultRichColors:c,duration:(Ct=m==null?void 0:m.duration)!=null?Ct:h,className:m==null?void 0:m.className,descriptionClassName:m==null?void 0:m.descriptionClassName,invert:n,visibleToasts:S,closeButton:(bt=m==null?void 0:m.closeButton)!=null?bt:s,interacting:D,position:U,style:m==null?void 0:m.style,unstyled:m==null?void 0:m.unstyled,classNames:m==null?void 0:m.classNames,cancelButtonStyle:m==null?void 0:m.cancelButtonStyle,actionButtonStyle:m==null?void 0:m.actionButtonStyle,removeToast:H,toasts:b.filter(Vt=>Vt.position==te.position),heights:O.filter(Vt=>Vt.position==te.position),setHeights:_,expandByDefault:i,gap:g,loadingIcon:y,expanded:z,pauseWhenPageIsHidden:C,swipeDirections:e.swipeDirections})})):null}))});const YS=({...e})=>{const{theme:t="system"}=ES();return v.jsx(GS,{theme:t,className:"toaster group",toastOptions:{classNames:{toast:"group toast group-[.toaster]:bg-background group-[.toaster]:text-foreground group-[.toaster]:border-border group-[.toaster]:shadow-lg",description:"group-[.toast]:text-muted-foreground",actionButton:"group-[.toast]:bg-primary group-[.toast]:text-primary-foreground",cancelButton:"group-[.toast]:bg-muted group-[.toast]:text-muted-foreground"}},...e})};var XS=rc[" useId ".trim().toString()]||(()=>{}),JS=0;function Ls(e){const[t,n]=p.useState(XS());return yn(()=>{n(r=>r??String(JS++))},[e]),t?`radix-${t}`:""}const ZS=["top","right","bottom","left"],tr=Math.min,it=Math.max,da=Math.round,gs=Math.floor,tn=e=>({x:e,y:e}),eE={left:"right",right:"left",bottom:"top",top:"bottom"},tE={start:"end",end:"start"};function $u(e,t,n){return it(e,tr(t,n))}function wn(e,t){return typeof e=="function"?e(t):e}function xn(e){return e.split("-")[0]}function Ao(e){return e.split("-")[1]}function td(e){return e==="x"?"y":"x"}function nd(e){return e==="y"?"height":"width"}const nE=new Set(["top","bottom"]);function Jt(e){return nE.has(xn(e))?"y":"x"}function rd(e){return td(Jt(e))}function rE(e,t,n){n===void 0&&(n=!1);const r=Ao(e),o=rd(e),i=nd(o);let s=o==="x"?r===(n?"end":"start")?"right":"left":r==="start"?"bottom":"top";return t.reference[i]>t.floating[i]&&(s=fa(s)),[s,fa(s)]}function oE(e){const t=fa(e);return[Bu(e),t,Bu(t)]}function Bu(e){return e.replace(/start|end/g,t=>tE[t])}const Zf=["left","right"],ep=["right","left"],iE=["top","bottom"],sE=["bottom","top"];function aE(e,t,n){switch(e){case"top":case"bottom":return n?t?ep:Zf:t?Zf:ep;case"left":case"right":return t?iE:sE;default:return[]}}function lE(e,t,n,r){const o=Ao(e);let i=aE(xn(e),n==="start",r);return o&&(i=i.map(s=>s+"-"+o),t&&(i=i.concat(i.map(Bu)))),i}function fa(e){return e.replace(/left|right|bottom|top/g,t=>eE[t])}function uE(e){return{top:0,right:0,bottom:0,left:0,...e}}function Uv(e){return typeof e!="number"?uE(e):{top:e,right:e,bottom:e,left:e}}function pa(e){const{x:t,y:n,width:r,height:o}=e;return{width:r,height:o,top:n,left:t,right:t+r,bottom:n+o,x:t,y:n}}function tp(e,t,n){let{reference:r,floating:o}=e;const i=Jt(t),s=rd(t),a=nd(s),l=xn(t),u=i==="y",d=r.x+r.width/2-o.width/2,c=r.y+r.height/2-o.height/2,h=r[a]/2-o[a]/2;let f;switch(l){case"top":f={x:d,y:r.y-o.height};break;case"bottom":f={x:d,y:r.y+r.height};break;case"right":f={x:r.x+r.width,y:c};break;case"left":f={x:r.x-o.width,y:c};break;default:f={x:r.x,y:r.y}}switch(Ao(t)){case"start":f[s]-=h*(n&&u?-1:1);break;case"end":f[s]+=h*(n&&u?-1:1);break}return f}const cE=async(e,t,n)=>{const{placement:r="bottom",strategy:o="absolute",middleware:i=[],platform:s}=n,a=i.filter(Boolean),l=await(s.isRTL==null?void 0:s.isRTL(t));let u=await s.getElementRects({reference:e,floating:t,strategy:o}),{x:d,y:c}=tp(u,r,l),h=r,f={},S=0;for(let m=0;m<a.length;m++){const{name:x,fn:g}=a[m],{x:y,y:w,data:E,reset:C}=await g({x:d,y:c,initialPlacement:r,placement:h,strategy:o,middlewareData:f,rects:u,platform:s,elements:{reference:e,floating:t}});d=y??d,c=w??c,f={...f,[x]:{...f[x],...E}},C&&S<=50&&(S++,typeof C=="object"&&(C.placement&&(h=C.placement),C.rects&&(u=C.rects===!0?await s.getElementRects({reference:e,floating:t,strategy:o}):C.rects),{x:d,y:c}=tp(u,h,l)),m=-1)}return{x:d,y:c,placement:h,strategy:o,middlewareData:f}};async function Ri(e,t){var n;t===void 0&&(t={});const{x:r,y:o,platform:i,rects:s,elements:a,strategy:l}=e,{boundary:u="clippingAncestors",rootBoundary:d="viewport",elementContext:c="floating",altBoundary:h=!1,padding:f=0}=wn(t,e),S=Uv(f),x=a[h?c==="floating"?"reference":"floating":c],g=pa(await i.getClippingRect({element:(n=await(i.isElement==null?void 0:i.isElement(x)))==null||n?x:x.contextElement||await(i.getDocumentElement==null?void 0:i.getDocumentElement(a.floating)),boundary:u,rootBoundary:d,strategy:l})),y=c==="floating"?{x:r,y:o,width:s.floating.width,height:s.floating.height}:s.reference,w=await(i.getOffsetParent==null?void 0:i.getOffsetParent(a.floating)),E=await(i.isElement==null?void 0:i.isElement(w))?await(i.getScale==null?void 0:i.getScale(w))||{x:1,y:1}:{x:1,y:1},C=pa(i.convertOffsetParentRelativeRectToViewportRelativeRect?await i.convertOffsetParentRelativeRectToViewportRelativeRect({elements:a,rect:y,offsetParent:w,strategy:l}):y);return{top:(g.top-C.top+S.top)/E.y,bottom:(C.bottom-g.bottom+S.bottom)/E.y,left:(g.left-C.left+S.left)/E.x,right:(C.right-g.right+S.right)/E.x}}const dE=e=>({name:"arrow",options:e,async fn(t){const{x:n,y:r,placement:o,rects:i,platform:s,elements:a,middlewareData:l}=t,{element:u,padding:d=0}=wn(e,t)||{};if(u==null)return{};const c=Uv(d),h={x:n,y:r},f=rd(o),S=nd(f),m=await s.getDimensions(u),x=f==="y",g=x?"top":"left",y=x?"bottom":"right",w=x?"clientHeight":"clientWidth",E=i.reference[S]+i.reference[f]-h[f]-i.floating[S],C=h[f]-i.reference[f],b=await(s.getOffsetParent==null?void 0:s.getOffsetParent(u));let k=b?b[w]:0;(!k||!await(s.isElement==null?void 0:s.isElement(b)))&&(k=a.floating[w]||i.floating[S]);const P=E/2-C/2,O=k/2-m[S]/2-1,_=tr(c[g],O),z=tr(c[y],O),I=_,D=k-m[S]-z,N=k/2-m[S]/2+P,B=$u(I,N,D),L=!l.arrow&&Ao(o)!=null&&N!==B&&i.reference[S]/2-(N<I?_:z)-m[S]/2<0,W=L?N<I?N-I:N-D:0;return{[f]:h[f]+W,data:{[f]:B,centerOffset:N-B-W,...L&&{alignmentOffset:W}},reset:L}}}),fE=function(e){return e===void 0&&(e={}),{name:"flip",options:e,async fn(t){var n,r;const{placement:o,middlewareData:i,rects:s,initialPlacement:a,platform:l,elements:u}=t,{mainAxis:d=!0,crossAxis:c=!0,fallbackPlacements:h,fallbackStrategy:f="bestFit",fallbackAxisSideDirection:S="none",flipAlignment:m=!0,...x}=wn(e,t);if((n=i.arrow)!=null&&n.alignmentOffset)return{};const g=xn(o),y=Jt(a),w=xn(a)===a,E=await(l.isRTL==null?void 0:l.isRTL(u.floating)),C=h||(w||!m?[fa(a)]:oE(a)),b=S!=="none";!h&&b&&C.push(...lE(a,m,S,E));const k=[a,...C],P=await Ri(t,x),O=[];let _=((r=i.flip)==null?void 0:r.overflows)||[];if(d&&O.push(P[g]),c){const N=rE(o,s,E);O.push(P[N[0]],P[N[1]])}if(_=[..._,{placement:o,overflows:O}],!O.every(N=>N<=0)){var z,I;const N=(((z=i.flip)==null?void 0:z.index)||0)+1,B=k[N];if(B&&(!(c==="alignment"?y!==Jt(B):!1)||_.every(R=>R.overflows[0]>0&&Jt(R.placement)===y)))return{data:{index:N,overflows:_},reset:{placement:B}};let L=(I=_.filter(W=>W.overflows[0]<=0).sort((W,R)=>W.overflows[1]-R.overflows[1])[0])==null?void 0:I.placement;if(!L)switch(f){case"bestFit":{var D;const W=(D=_.filter(R=>{if(b){const j=Jt(R.placement);return j===y||j==="y"}return!0}).map(R=>[R.placement,R.overflows.filter(j=>j>0).reduce((j,F)=>j+F,0)]).sort((R,j)=>R[1]-j[1])[0])==null?void 0:D[0];W&&(L=W);break}case"initialPlacement":L=a;break}if(o!==L)return{reset:{placement:L}}}return{}}}};function np(e,t){return{top:e.top-t.height,right:e.right-t.width,bottom:e.bottom-t.height,left:e.left-t.width}}function rp(e){return ZS.some(t=>e[t]>=0)}const pE=function(e){return e===void 0&&(e={}),{name:"hide",options:e,async fn(t){const{rects:n}=t,{strategy:r="referenceHidden",...o}=wn(e,t);switch(r){case"referenceHidden":{const i=await Ri(t,{...o,elementContext:"reference"}),s=np(i,n.reference);return{data:{referenceHiddenOffsets:s,referenceHidden:rp(s)}}}case"escaped":{const i=await Ri(t,{...o,altBoundary:!0}),s=np(i,n.floating);return{data:{escapedOffsets:s,escaped:rp(s)}}}default:return{}}}}},Vv=new Set(["left","top"]);async function hE(e,t){const{placement:n,platform:r,elements:o}=e,i=await(r.isRTL==null?void 0:r.isRTL(o.floating)),s=xn(n),a=Ao(n),l=Jt(n)==="y",u=Vv.has(s)?-1:1,d=i&&l?-1:1,c=wn(t,e);let{mainAxis:h,crossAxis:f,alignmentAxis:S}=typeof c=="number"?{mainAxis:c,crossAxis:0,alignmentAxis:null}:{mainAxis:c.mainAxis||0,crossAxis:c.crossAxis||0,alignmentAxis:c.alignmentAxis};return a&&typeof S=="number"&&(f=a==="end"?S*-1:S),l?{x:f*d,y:h*u}:{x:h*u,y:f*d}}const mE=function(e){return e===void 0&&(e=0),{name:"offset",options:e,async fn(t){var n,r;const{x:o,y:i,placement:s,middlewareData:a}=t,l=await hE(t,e);return s===((n=a.offset)==null?void 0:n.placement)&&(r=a.arrow)!=null&&r.alignmentOffset?{}:{x:o+l.x,y:i+l.y,data:{...l,placement:s}}}}},vE=function(e){return e===void 0&&(e={}),{name:"shift",options:e,async fn(t){const{x:n,y:r,placement:o}=t,{mainAxis:i=!0,crossAxis:s=!1,limiter:a={fn:x=>{let{x:g,y}=x;return{x:g,y}}},...l}=wn(e,t),u={x:n,y:r},d=await Ri(t,l),c=Jt(xn(o)),h=td(c);let f=u[h],S=u[c];if(i){const x=h==="y"?"top":"left",g=h==="y"?"bottom":"right",y=f+d[x],w=f-d[g];f=$u(y,f,w)}if(s){const x=c==="y"?"top":"left",g=c==="y"?"bottom":"right",y=S+d[x],w=S-d[g];S=$u(y,S,w)}const m=a.fn({...t,[h]:f,[c]:S});return{...m,data:{x:m.x-n,y:m.y-r,enabled:{[h]:i,[c]:s}}}}}},gE=function(e){return e===void 0&&(e={}),{options:e,fn(t){const{x:n,y:r,placement:o,rects:i,middlewareData:s}=t,{offset:a=0,mainAxis:l=!0,crossAxis:u=!0}=wn(e,t),d={x:n,y:r},c=Jt(o),h=td(c);let f=d[h],S=d[c];const m=wn(a,t),x=typeof m=="number"?{mainAxis:m,crossAxis:0}:{mainAxis:0,crossAxis:0,...m};if(l){const w=h==="y"?"height":"width",E=i.reference[h]-i.floating[w]+x.mainAxis,C=i.reference[h]+i.reference[w]-x.mainAxis;f<E?f=E:f>C&&(f=C)}if(u){var g,y;const w=h==="y"?"width":"height",E=Vv.has(xn(o)),C=i.reference[c]-i.floating[w]+(E&&((g=s.offset)==null?void 0:g[c])||0)+(E?0:x.crossAxis),b=i.reference[c]+i.reference[w]+(E?0:((y=s.offset)==null?void 0:y[c])||0)-(E?x.crossAxis:0);S<C?S=C:S>b&&(S=b)}return{[h]:f,[c]:S}}}},yE=function(e){return e===void 0&&(e={}),{name:"size",options:e,async fn(t){var n,r;const{placement:o,rects:i,platform:s,elements:a}=t,{apply:l=()=>{},...u}=wn(e,t),d=await Ri(t,u),c=xn(o),h=Ao(o),f=Jt(o)==="y",{width:S,height:m}=i.floating;let x,g;c==="top"||c==="bottom"?(x=c,g=h===(await(s.isRTL==null?void 0:s.isRTL(a.floating))?"start":"end")?"left":"right"):(g=c,x=h==="end"?"top":"bottom");const y=m-d.top-d.bottom,w=S-d.left-d.right,E=tr(m-d[x],y),C=tr(S-d[g],w),b=!t.middlewareData.shift;let k=E,P=C;if((n=t.middlewareData.shift)!=null&&n.enabled.x&&(P=w),(r=t.middlewareData.shift)!=null&&r.enabled.y&&(k=y),b&&!h){const _=it(d.left,0),z=it(d.right,0),I=it(d.top,0),D=it(d.bottom,0);f?P=S-2*(_!==0||z!==0?_+z:it(d.left,d.right)):k=m-2*(I!==0||D!==0?I+D:it(d.top,d.bottom))}await l({...t,availableWidth:P,availableHeight:k});const O=await s.getDimensions(a.floating);return S!==O.width||m!==O.height?{reset:{rects:!0}}:{}}}};function Fa(){return typeof window<"u"}function Oo(e){return Wv(e)?(e.nodeName||"").toLowerCase():"#document"}function lt(e){var t;return(e==null||(t=e.ownerDocument)==null?void 0:t.defaultView)||window}function on(e){var t;return(t=(Wv(e)?e.ownerDocument:e.document)||window.document)==null?void 0:t.documentElement}function Wv(e){return Fa()?e instanceof Node||e instanceof lt(e).Node:!1}function $t(e){return Fa()?e instanceof Element||e instanceof lt(e).Element:!1}function nn(e){return Fa()?e instanceof HTMLElement||e instanceof lt(e).HTMLElement:!1}function op(e){return!Fa()||typeof ShadowRoot>"u"?!1:e instanceof ShadowRoot||e instanceof lt(e).ShadowRoot}const wE=new Set(["inline","contents"]);function Ki(e){const{overflow:t,overflowX:n,overflowY:r,display:o}=Bt(e);return/auto|scroll|overlay|hidden|clip/.test(t+r+n)&&!wE.has(o)}const xE=new Set(["table","td","th"]);function SE(e){return xE.has(Oo(e))}const EE=[":popover-open",":modal"];function za(e){return EE.some(t=>{try{return e.matches(t)}catch{return!1}})}const CE=["transform","translate","scale","rotate","perspective"],bE=["transform","translate","scale","rotate","perspective","filter"],kE=["paint","layout","strict","content"];function od(e){const t=id(),n=$t(e)?Bt(e):e;return CE.some(r=>n[r]?n[r]!=="none":!1)||(n.containerType?n.containerType!=="normal":!1)||!t&&(n.backdropFilter?n.backdropFilter!=="none":!1)||!t&&(n.filter?n.filter!=="none":!1)||bE.some(r=>(n.willChange||"").includes(r))||kE.some(r=>(n.contain||"").includes(r))}function PE(e){let t=nr(e);for(;nn(t)&&!Po(t);){if(od(t))return t;if(za(t))return null;t=nr(t)}return null}function id(){return typeof CSS>"u"||!CSS.supports?!1:CSS.supports("-webkit-backdrop-filter","none")}const RE=new Set(["html","body","#document"]);function Po(e){return RE.has(Oo(e))}function Bt(e){return lt(e).getComputedStyle(e)}function $a(e){return $t(e)?{scrollLeft:e.scrollLeft,scrollTop:e.scrollTop}:{scrollLeft:e.scrollX,scrollTop:e.scrollY}}function nr(e){if(Oo(e)==="html")return e;const t=e.assignedSlot||e.parentNode||op(e)&&e.host||on(e);return op(t)?t.host:t}function Hv(e){const t=nr(e);return Po(t)?e.ownerDocument?e.ownerDocument.body:e.body:nn(t)&&Ki(t)?t:Hv(t)}function Ni(e,t,n){var r;t===void 0&&(t=[]),n===void 0&&(n=!0);const o=Hv(e),i=o===((r=e.ownerDocument)==null?void 0:r.body),s=lt(o);if(i){const a=Uu(s);return t.concat(s,s.visualViewport||[],Ki(o)?o:[],a&&n?Ni(a):[])}return t.concat(o,Ni(o,[],n))}function Uu(e){return e.parent&&Object.getPrototypeOf(e.parent)?e.frameElement:null}function Kv(e){const t=Bt(e);let n=parseFloat(t.width)||0,r=parseFloat(t.height)||0;const o=nn(e),i=o?e.offsetWidth:n,s=o?e.offsetHeight:r,a=da(n)!==i||da(r)!==s;return a&&(n=i,r=s),{width:n,height:r,$:a}}function sd(e){return $t(e)?e:e.contextElement}function lo(e){const t=sd(e);if(!nn(t))return tn(1);const n=t.getBoundingClientRect(),{width:r,height:o,$:i}=Kv(t);let s=(i?da(n.width):n.width)/r,a=(i?da(n.height):n.height)/o;return(!s||!Number.isFinite(s))&&(s=1),(!a||!Number.isFinite(a))&&(a=1),{x:s,y:a}}const NE=tn(0);function Qv(e){const t=lt(e);return!id()||!t.visualViewport?NE:{x:t.visualViewport.offsetLeft,y:t.visualViewport.offsetTop}}function TE(e,t,n){return t===void 0&&(t=!1),!n||t&&n!==lt(e)?!1:t}function Nr(e,t,n,r){t===void 0&&(t=!1),n===void 0&&(n=!1);const o=e.getBoundingClientRect(),i=sd(e);let s=tn(1);t&&(r?$t(r)&&(s=lo(r)):s=lo(e));const a=TE(i,n,r)?Qv(i):tn(0);let l=(o.left+a.x)/s.x,u=(o.top+a.y)/s.y,d=o.width/s.x,c=o.height/s.y;if(i){const h=lt(i),f=r&&$t(r)?lt(r):r;let S=h,m=Uu(S);for(;m&&r&&f!==S;){const x=lo(m),g=m.getBoundingClientRect(),y=Bt(m),w=g.left+(m.clientLeft+parseFloat(y.paddingLeft))*x.x,E=g.top+(m.clientTop+parseFloat(y.paddingTop))*x.y;l*=x.x,u*=x.y,d*=x.x,c*=x.y,l+=w,u+=E,S=lt(m),m=Uu(S)}}return pa({width:d,height:c,x:l,y:u})}function ad(e,t){const n=$a(e).scrollLeft;return t?t.left+n:Nr(on(e)).left+n}function qv(e,t,n){n===void 0&&(n=!1);const r=e.getBoundingClientRect(),o=r.left+t.scrollLeft-(n?0:ad(e,r)),i=r.top+t.scrollTop;return{x:o,y:i}}function jE(e){let{elements:t,rect:n,offsetParent:r,strategy:o}=e;const i=o==="fixed",s=on(r),a=t?za(t.floating):!1;if(r===s||a&&i)return n;let l={scrollLeft:0,scrollTop:0},u=tn(1);const d=tn(0),c=nn(r);if((c||!c&&!i)&&((Oo(r)!=="body"||Ki(s))&&(l=$a(r)),nn(r))){const f=Nr(r);u=lo(r),d.x=f.x+r.clientLeft,d.y=f.y+r.clientTop}const h=s&&!c&&!i?qv(s,l,!0):tn(0);return{width:n.width*u.x,height:n.height*u.y,x:n.x*u.x-l.scrollLeft*u.x+d.x+h.x,y:n.y*u.y-l.scrollTop*u.y+d.y+h.y}}function _E(e){return Array.from(e.getClientRects())}function AE(e){const t=on(e),n=$a(e),r=e.ownerDocument.body,o=it(t.scrollWidth,t.clientWidth,r.scrollWidth,r.clientWidth),i=it(t.scrollHeight,t.clientHeight,r.scrollHeight,r.clientHeight);let s=-n.scrollLeft+ad(e);const a=-n.scrollTop;return Bt(r).direction==="rtl"&&(s+=it(t.clientWidth,r.clientWidth)-o),{width:o,height:i,x:s,y:a}}function OE(e,t){const n=lt(e),r=on(e),o=n.visualViewport;let i=r.clientWidth,s=r.clientHeight,a=0,l=0;if(o){i=o.width,s=o.height;const u=id();(!u||u&&t==="fixed")&&(a=o.offsetLeft,l=o.offsetTop)}return{width:i,height:s,x:a,y:l}}const ME=new Set(["absolute","fixed"]);function IE(e,t){const n=Nr(e,!0,t==="fixed"),r=n.top+e.clientTop,o=n.left+e.clientLeft,i=nn(e)?lo(e):tn(1),s=e.clientWidth*i.x,a=e.clientHeight*i.y,l=o*i.x,u=r*i.y;return{width:s,height:a,x:l,y:u}}function ip(e,t,n){let r;if(t==="viewport")r=OE(e,n);else if(t==="document")r=AE(on(e));else if($t(t))r=IE(t,n);else{const o=Qv(e);r={x:t.x-o.x,y:t.y-o.y,width:t.width,height:t.height}}return pa(r)}function Gv(e,t){const n=nr(e);return n===t||!$t(n)||Po(n)?!1:Bt(n).position==="fixed"||Gv(n,t)}function DE(e,t){const n=t.get(e);if(n)return n;let r=Ni(e,[],!1).filter(a=>$t(a)&&Oo(a)!=="body"),o=null;const i=Bt(e).position==="fixed";let s=i?nr(e):e;for(;$t(s)&&!Po(s);){const a=Bt(s),l=od(s);!l&&a.position==="fixed"&&(o=null),(i?!l&&!o:!l&&a.position==="static"&&!!o&&ME.has(o.position)||Ki(s)&&!l&&Gv(e,s))?r=r.filter(d=>d!==s):o=a,s=nr(s)}return t.set(e,r),r}function LE(e){let{element:t,boundary:n,rootBoundary:r,strategy:o}=e;const s=[...n==="clippingAncestors"?za(t)?[]:DE(t,this._c):[].concat(n),r],a=s[0],l=s.reduce((u,d)=>{const c=ip(t,d,o);return u.top=it(c.top,u.top),u.right=tr(c.right,u.right),u.bottom=tr(c.bottom,u.bottom),u.left=it(c.left,u.left),u},ip(t,a,o));return{width:l.right-l.left,height:l.bottom-l.top,x:l.left,y:l.top}}function FE(e){const{width:t,height:n}=Kv(e);return{width:t,height:n}}function zE(e,t,n){const r=nn(t),o=on(t),i=n==="fixed",s=Nr(e,!0,i,t);let a={scrollLeft:0,scrollTop:0};const l=tn(0);function u(){l.x=ad(o)}if(r||!r&&!i)if((Oo(t)!=="body"||Ki(o))&&(a=$a(t)),r){const f=Nr(t,!0,i,t);l.x=f.x+t.clientLeft,l.y=f.y+t.clientTop}else o&&u();i&&!r&&o&&u();const d=o&&!r&&!i?qv(o,a):tn(0),c=s.left+a.scrollLeft-l.x-d.x,h=s.top+a.scrollTop-l.y-d.y;return{x:c,y:h,width:s.width,height:s.height}}function jl(e){return Bt(e).position==="static"}function sp(e,t){if(!nn(e)||Bt(e).position==="fixed")return null;if(t)return t(e);let n=e.offsetParent;return on(e)===n&&(n=n.ownerDocument.body),n}function Yv(e,t){const n=lt(e);if(za(e))return n;if(!nn(e)){let o=nr(e);for(;o&&!Po(o);){if($t(o)&&!jl(o))return o;o=nr(o)}return n}let r=sp(e,t);for(;r&&SE(r)&&jl(r);)r=sp(r,t);return r&&Po(r)&&jl(r)&&!od(r)?n:r||PE(e)||n}const $E=async function(e){const t=this.getOffsetParent||Yv,n=this.getDimensions,r=await n(e.floating);return{reference:zE(e.reference,await t(e.floating),e.strategy),floating:{x:0,y:0,width:r.width,height:r.height}}};function BE(e){return Bt(e).direction==="rtl"}const UE={convertOffsetParentRelativeRectToViewportRelativeRect:jE,getDocumentElement:on,getClippingRect:LE,getOffsetParent:Yv,getElementRects:$E,getClientRects:_E,getDimensions:FE,getScale:lo,isElement:$t,isRTL:BE};function Xv(e,t){return e.x===t.x&&e.y===t.y&&e.width===t.width&&e.height===t.height}function VE(e,t){let n=null,r;const o=on(e);function i(){var a;clearTimeout(r),(a=n)==null||a.disconnect(),n=null}function s(a,l){a===void 0&&(a=!1),l===void 0&&(l=1),i();const u=e.getBoundingClientRect(),{left:d,top:c,width:h,height:f}=u;if(a||t(),!h||!f)return;const S=gs(c),m=gs(o.clientWidth-(d+h)),x=gs(o.clientHeight-(c+f)),g=gs(d),w={rootMargin:-S+"px "+-m+"px "+-x+"px "+-g+"px",threshold:it(0,tr(1,l))||1};let E=!0;function C(b){const k=b[0].intersectionRatio;if(k!==l){if(!E)return s();k?s(!1,k):r=setTimeout(()=>{s(!1,1e-7)},1e3)}k===1&&!Xv(u,e.getBoundingClientRect())&&s(),E=!1}try{n=new IntersectionObserver(C,{...w,root:o.ownerDocument})}catch{n=new IntersectionObserver(C,w)}n.observe(e)}return s(!0),i}function WE(e,t,n,r){r===void 0&&(r={});const{ancestorScroll:o=!0,ancestorResize:i=!0,elementResize:s=typeof ResizeObserver=="function",layoutShift:a=typeof IntersectionObserver=="function",animationFrame:l=!1}=r,u=sd(e),d=o||i?[...u?Ni(u):[],...Ni(t)]:[];d.forEach(g=>{o&&g.addEventListener("scroll",n,{passive:!0}),i&&g.addEventListener("resize",n)});const c=u&&a?VE(u,n):null;let h=-1,f=null;s&&(f=new ResizeObserver(g=>{let[y]=g;y&&y.target===u&&f&&(f.unobserve(t),cancelAnimationFrame(h),h=requestAnimationFrame(()=>{var w;(w=f)==null||w.observe(t)})),n()}),u&&!l&&f.observe(u),f.observe(t));let S,m=l?Nr(e):null;l&&x();function x(){const g=Nr(e);m&&!Xv(m,g)&&n(),m=g,S=requestAnimationFrame(x)}return n(),()=>{var g;d.forEach(y=>{o&&y.removeEventListener("scroll",n),i&&y.removeEventListener("resize",n)}),c==null||c(),(g=f)==null||g.disconnect(),f=null,l&&cancelAnimationFrame(S)}}const HE=mE,KE=vE,QE=fE,qE=yE,GE=pE,ap=dE,YE=gE,XE=(e,t,n)=>{const r=new Map,o={platform:UE,...n},i={...o.platform,_c:r};return cE(e,t,{...o,platform:i})};var JE=typeof document<"u",ZE=function(){},Fs=JE?p.useLayoutEffect:ZE;function ha(e,t){if(e===t)return!0;if(typeof e!=typeof t)return!1;if(typeof e=="function"&&e.toString()===t.toString())return!0;let n,r,o;if(e&&t&&typeof e=="object"){if(Array.isArray(e)){if(n=e.length,n!==t.length)return!1;for(r=n;r--!==0;)if(!ha(e[r],t[r]))return!1;return!0}if(o=Object.keys(e),n=o.length,n!==Object.keys(t).length)return!1;for(r=n;r--!==0;)if(!{}.hasOwnProperty.call(t,o[r]))return!1;for(r=n;r--!==0;){const i=o[r];if(!(i==="_owner"&&e.$$typeof)&&!ha(e[i],t[i]))return!1}return!0}return e!==e&&t!==t}function Jv(e){return typeof window>"u"?1:(e.ownerDocument.defaultView||window).devicePixelRatio||1}function lp(e,t){const n=Jv(e);return Math.round(t*n)/n}function _l(e){const t=p.useRef(e);return Fs(()=>{t.current=e}),t}function eC(e){e===void 0&&(e={});const{placement:t="bottom",strategy:n="absolute",middleware:r=[],platform:o,elements:{reference:i,floating:s}={},transform:a=!0,whileElementsMounted:l,open:u}=e,[d,c]=p.useState({x:0,y:0,strategy:n,placement:t,middlewareData:{},isPositioned:!1}),[h,f]=p.useState(r);ha(h,r)||f(r);const[S,m]=p.useState(null),[x,g]=p.useState(null),y=p.useCallback(R=>{R!==b.current&&(b.current=R,m(R))},[]),w=p.useCallback(R=>{R!==k.current&&(k.current=R,g(R))},[]),E=i||S,C=s||x,b=p.useRef(null),k=p.useRef(null),P=p.useRef(d),O=l!=null,_=_l(l),z=_l(o),I=_l(u),D=p.useCallback(()=>{if(!b.current||!k.current)return;const R={placement:t,strategy:n,middleware:h};z.current&&(R.platform=z.current),XE(b.current,k.current,R).then(j=>{const F={...j,isPositioned:I.current!==!1};N.current&&!ha(P.current,F)&&(P.current=F,Vi.flushSync(()=>{c(F)}))})},[h,t,n,z,I]);Fs(()=>{u===!1&&P.current.isPositioned&&(P.current.isPositioned=!1,c(R=>({...R,isPositioned:!1})))},[u]);const N=p.useRef(!1);Fs(()=>(N.current=!0,()=>{N.current=!1}),[]),Fs(()=>{if(E&&(b.current=E),C&&(k.current=C),E&&C){if(_.current)return _.current(E,C,D);D()}},[E,C,D,_,O]);const B=p.useMemo(()=>({reference:b,floating:k,setReference:y,setFloating:w}),[y,w]),L=p.useMemo(()=>({reference:E,floating:C}),[E,C]),W=p.useMemo(()=>{const R={position:n,left:0,top:0};if(!L.floating)return R;const j=lp(L.floating,d.x),F=lp(L.floating,d.y);return a?{...R,transform:"translate("+j+"px, "+F+"px)",...Jv(L.floating)>=1.5&&{willChange:"transform"}}:{position:n,left:j,top:F}},[n,a,L.floating,d.x,d.y]);return p.useMemo(()=>({...d,update:D,refs:B,elements:L,floatingStyles:W}),[d,D,B,L,W])}const tC=e=>{function t(n){return{}.hasOwnProperty.call(n,"current")}return{name:"arrow",options:e,fn(n){const{element:r,padding:o}=typeof e=="function"?e(n):e;return r&&t(r)?r.current!=null?ap({element:r.current,padding:o}).fn(n):{}:r?ap({element:r,padding:o}).fn(n):{}}}},nC=(e,t)=>({...HE(e),options:[e,t]}),rC=(e,t)=>({...KE(e),options:[e,t]}),oC=(e,t)=>({...YE(e),options:[e,t]}),iC=(e,t)=>({...QE(e),options:[e,t]}),sC=(e,t)=>({...qE(e),options:[e,t]}),aC=(e,t)=>({...GE(e),options:[e,t]}),lC=(e,t)=>({...tC(e),options:[e,t]});var uC="Arrow",Zv=p.forwardRef((e,t)=>{const{children:n,width:r=10,height:o=5,...i}=e;return v.jsx(ie.svg,{...i,ref:t,width:r,height:o,viewBox:"0 0 30 10",preserveAspectRatio:"none",children:e.asChild?n:v.jsx("polygon",{points:"0,0 30,0 15,10"})})});Zv.displayName=uC;var cC=Zv;function ld(e){const[t,n]=p.useState(void 0);return yn(()=>{if(e){n({width:e.offsetWidth,height:e.offsetHeight});const r=new ResizeObserver(o=>{if(!Array.isArray(o)||!o.length)return;const i=o[0];let s,a;if("borderBoxSize"in i){const l=i.borderBoxSize,u=Array.isArray(l)?l[0]:l;s=u.inlineSize,a=u.blockSize}else s=e.offsetWidth,a=e.offsetHeight;n({width:s,height:a})});return r.observe(e,{box:"border-box"}),()=>r.unobserve(e)}else n(void 0)},[e]),t}var eg="Popper",[tg,ng]=En(eg),[fR,rg]=tg(eg),og="PopperAnchor",ig=p.forwardRef((e,t)=>{const{__scopePopper:n,virtualRef:r,...o}=e,i=rg(og,n),s=p.useRef(null),a=pe(t,s);return p.useEffect(()=>{i.onAnchorChange((r==null?void 0:r.current)||s.current)}),r?null:v.jsx(ie.div,{...o,ref:a})});ig.displayName=og;var ud="PopperContent",[dC,fC]=tg(ud),sg=p.forwardRef((e,t)=>{var te,Et,Ct,bt,Vt,Cn;const{__scopePopper:n,side:r="bottom",sideOffset:o=0,align:i="center",alignOffset:s=0,arrowPadding:a=0,avoidCollisions:l=!0,collisionBoundary:u=[],collisionPadding:d=0,sticky:c="partial",hideWhenDetached:h=!1,updatePositionStrategy:f="optimized",onPlaced:S,...m}=e,x=rg(ud,n),[g,y]=p.useState(null),w=pe(t,Wt=>y(Wt)),[E,C]=p.useState(null),b=ld(E),k=(b==null?void 0:b.width)??0,P=(b==null?void 0:b.height)??0,O=r+(i!=="center"?"-"+i:""),_=typeof d=="number"?d:{top:0,right:0,bottom:0,left:0,...d},z=Array.isArray(u)?u:[u],I=z.length>0,D={padding:_,boundary:z.filter(hC),altBoundary:I},{refs:N,floatingStyles:B,placement:L,isPositioned:W,middlewareData:R}=eC({strategy:"fixed",placement:O,whileElementsMounted:(...Wt)=>WE(...Wt,{animationFrame:f==="always"}),elements:{reference:x.anchor},middleware:[nC({mainAxis:o+P,alignmentAxis:s}),l&&rC({mainAxis:!0,crossAxis:!1,limiter:c==="partial"?oC():void 0,...D}),l&&iC({...D}),sC({...D,apply:({elements:Wt,rects:Or,availableWidth:Mr,availableHeight:Ir})=>{const{width:Lo,height:sr}=Or.reference,bn=Wt.floating.style;bn.setProperty("--radix-popper-available-width",`${Mr}px`),bn.setProperty("--radix-popper-available-height",`${Ir}px`),bn.setProperty("--radix-popper-anchor-width",`${Lo}px`),bn.setProperty("--radix-popper-anchor-height",`${sr}px`)}}),E&&lC({element:E,padding:a}),mC({arrowWidth:k,arrowHeight:P}),h&&aC({strategy:"referenceHidden",...D})]}),[j,F]=ug(L),H=zt(S);yn(()=>{W&&(H==null||H())},[W,H]);const U=(te=R.arrow)==null?void 0:te.x,G=(Et=R.arrow)==null?void 0:Et.y,X=((Ct=R.arrow)==null?void 0:Ct.centerOffset)!==0,[he,Se]=p.useState();return yn(()=>{g&&Se(window.getComputedStyle(g).zIndex)},[g]),v.jsx("div",{ref:N.setFloating,"data-radix-popper-content-wrapper":"",style:{...B,transform:W?B.transform:"translate(0, -200%)",minWidth:"max-content",zIndex:he,"--radix-popper-transform-origin":[(bt=R.transformOrigin)==null?void 0:bt.x,(Vt=R.transformOrigin)==null?void 0:Vt.y].join(" "),...((Cn=R.hide)==null?void 0:Cn.referenceHidden)&&{visibility:"hidden",pointerEvents:"none"}},dir:e.dir,children:v.jsx(dC,{scope:n,placedSide:j,onArrowChange:C,arrowX:U,arrowY:G,shouldHideArrow:X,children:v.jsx(ie.div,{"data-side":j,"data-align":F,...m,ref:w,style:{...m.style,animation:W?void 0:"none"}})})})});sg.displayName=ud;var ag="PopperArrow",pC={top:"bottom",right:"left",bottom:"top",left:"right"},lg=p.forwardRef(function(t,n){const{__scopePopper:r,...o}=t,i=fC(ag,r),s=pC[i.placedSide];return v.jsx("span",{ref:i.onArrowChange,style:{position:"absolute",left:i.arrowX,top:i.arrowY,[s]:0,transformOrigin:{top:"",right:"0 0",bottom:"center 0",left:"100% 0"}[i.placedSide],transform:{top:"translateY(100%)",right:"translateY(50%) rotate(90deg) translateX(-50%)",bottom:"rotate(180deg)",left:"translateY(50%) rotate(-90deg) translateX(50%)"}[i.placedSide],visibility:i.shouldHideArrow?"hidden":void 0},children:v.jsx(cC,{...o,ref:n,style:{...o.style,display:"block"}})})});lg.displayName=ag;function hC(e){return e!==null}var mC=e=>({name:"transformOrigin",options:e,fn(t){var x,g,y;const{placement:n,rects:r,middlewareData:o}=t,s=((x=o.arrow)==null?void 0:x.centerOffset)!==0,a=s?0:e.arrowWidth,l=s?0:e.arrowHeight,[u,d]=ug(n),c={start:"0%",center:"50%",end:"100%"}[d],h=(((g=o.arrow)==null?void 0:g.x)??0)+a/2,f=(((y=o.arrow)==null?void 0:y.y)??0)+l/2;let S="",m="";return u==="bottom"?(S=s?c:`${h}px`,m=`${-l}px`):u==="top"?(S=s?c:`${h}px`,m=`${r.floating.height+l}px`):u==="right"?(S=`${-l}px`,m=s?c:`${f}px`):u==="left"&&(S=`${r.floating.width+l}px`,m=s?c:`${f}px`),{data:{x:S,y:m}}}});function ug(e){const[t,n="center"]=e.split("-");return[t,n]}var vC=ig,gC=sg,yC=lg,[Ba,pR]=En("Tooltip",[ng]),cd=ng(),cg="TooltipProvider",wC=700,up="tooltip.open",[xC,dg]=Ba(cg),fg=e=>{const{__scopeTooltip:t,delayDuration:n=wC,skipDelayDuration:r=300,disableHoverableContent:o=!1,children:i}=e,s=p.useRef(!0),a=p.useRef(!1),l=p.useRef(0);return p.useEffect(()=>{const u=l.current;return()=>window.clearTimeout(u)},[]),v.jsx(xC,{scope:t,isOpenDelayedRef:s,delayDuration:n,onOpen:p.useCallback(()=>{window.clearTimeout(l.current),s.current=!1},[]),onClose:p.useCallback(()=>{window.clearTimeout(l.current),l.current=window.setTimeout(()=>s.current=!0,r)},[r]),isPointerInTransitRef:a,onPointerInTransitChange:p.useCallback(u=>{a.current=u},[]),disableHoverableContent:o,children:i})};fg.displayName=cg;var pg="Tooltip",[hR,Ua]=Ba(pg),Vu="TooltipTrigger",SC=p.forwardRef((e,t)=>{const{__scopeTooltip:n,...r}=e,o=Ua(Vu,n),i=dg(Vu,n),s=cd(n),a=p.useRef(null),l=pe(t,a,o.onTriggerChange),u=p.useRef(!1),d=p.useRef(!1),c=p.useCallback(()=>u.current=!1,[]);return p.useEffect(()=>()=>document.removeEventListener("pointerup",c),[c]),v.jsx(vC,{asChild:!0,...s,children:v.jsx(ie.button,{"aria-describedby":o.open?o.contentId:void 0,"data-state":o.stateAttribute,...r,ref:l,onPointerMove:Z(e.onPointerMove,h=>{h.pointerType!=="touch"&&!d.current&&!i.isPointerInTransitRef.current&&(o.onTriggerEnter(),d.current=!0)}),onPointerLeave:Z(e.onPointerLeave,()=>{o.onTriggerLeave(),d.current=!1}),onPointerDown:Z(e.onPointerDown,()=>{o.open&&o.onClose(),u.current=!0,document.addEventListener("pointerup",c,{once:!0})}),onFocus:Z(e.onFocus,()=>{u.current||o.onOpen()}),onBlur:Z(e.onBlur,o.onClose),onClick:Z(e.onClick,o.onClose)})})});SC.displayName=Vu;var EC="TooltipPortal",[mR,CC]=Ba(EC,{forceMount:void 0}),Ro="TooltipContent",hg=p.forwardRef((e,t)=>{const n=CC(Ro,e.__scopeTooltip),{forceMount:r=n.forceMount,side:o="top",...i}=e,s=Ua(Ro,e.__scopeTooltip);return v.jsx(Ar,{present:r||s.open,children:s.disableHoverableContent?v.jsx(mg,{side:o,...i,ref:t}):v.jsx(bC,{side:o,...i,ref:t})})}),bC=p.forwardRef((e,t)=>{const n=Ua(Ro,e.__scopeTooltip),r=dg(Ro,e.__scopeTooltip),o=p.useRef(null),i=pe(t,o),[s,a]=p.useState(null),{trigger:l,onClose:u}=n,d=o.current,{onPointerInTransitChange:c}=r,h=p.useCallback(()=>{a(null),c(!1)},[c]),f=p.useCallback((S,m)=>{const x=S.currentTarget,g={x:S.clientX,y:S.clientY},y=TC(g,x.getBoundingClientRect()),w=jC(g,y),E=_C(m.getBoundingClientRect()),C=OC([...w,...E]);a(C),c(!0)},[c]);return p.useEffect(()=>()=>h(),[h]),p.useEffect(()=>{if(l&&d){const S=x=>f(x,d),m=x=>f(x,l);return l.addEventListener("pointerleave",S),d.addEventListener("pointerleave",m),()=>{l.removeEventListener("pointerleave",S),d.removeEventListener("pointerleave",m)}}},[l,d,f,h]),p.useEffect(()=>{if(s){const S=m=>{const x=m.target,g={x:m.clientX,y:m.clientY},y=(l==null?void 0:l.contains(x))||(d==null?void 0:d.contains(x)),w=!AC(g,s);y?h():w&&(h(),u())};return document.addEventListener("pointermove",S),()=>document.removeEventListener("pointermove",S)}},[l,d,s,u,h]),v.jsx(mg,{...e,ref:i})}),[kC,PC]=Ba(pg,{isInside:!1}),RC=zx("TooltipContent"),mg=p.forwardRef((e,t)=>{const{__scopeTooltip:n,children:r,"aria-label":o,onEscapeKeyDown:i,onPointerDownOutside:s,...a}=e,l=Ua(Ro,n),u=cd(n),{onClose:d}=l;return p.useEffect(()=>(document.addEventListener(up,d),()=>document.removeEventListener(up,d)),[d]),p.useEffect(()=>{if(l.trigger){const c=h=>{const f=h.target;f!=null&&f.contains(l.trigger)&&d()};return window.addEventListener("scroll",c,{capture:!0}),()=>window.removeEventListener("scroll",c,{capture:!0})}},[l.trigger,d]),v.jsx(Ia,{asChild:!0,disableOutsidePointerEvents:!1,onEscapeKeyDown:i,onPointerDownOutside:s,onFocusOutside:c=>c.preventDefault(),onDismiss:d,children:v.jsxs(gC,{"data-state":l.stateAttribute,...u,...a,ref:t,style:{...a.style,"--radix-tooltip-content-transform-origin":"var(--radix-popper-transform-origin)","--radix-tooltip-content-available-width":"var(--radix-popper-available-width)","--radix-tooltip-content-available-height":"var(--radix-popper-available-height)","--radix-tooltip-trigger-width":"var(--radix-popper-anchor-width)","--radix-tooltip-trigger-height":"var(--radix-popper-anchor-height)"},children:[v.jsx(RC,{children:r}),v.jsx(kC,{scope:n,isInside:!0,children:v.jsx(l1,{id:l.contentId,role:"tooltip",children:o||r})})]})})});hg.displayName=Ro;var vg="TooltipArrow",NC=p.forwardRef((e,t)=>{const{__scopeTooltip:n,...r}=e,o=cd(n);return PC(vg,n).isInside?null:v.jsx(yC,{...o,...r,ref:t})});NC.displayName=vg;function TC(e,t){const n=Math.abs(t.top-e.y),r=Math.abs(t.bottom-e.y),o=Math.abs(t.right-e.x),i=Math.abs(t.left-e.x);switch(Math.min(n,r,o,i)){case i:return"left";case o:return"right";case n:return"top";case r:return"bottom";default:throw new Error("unreachable")}}function jC(e,t,n=5){const r=[];switch(t){case"top":r.push({x:e.x-n,y:e.y+n},{x:e.x+n,y:e.y+n});break;case"bottom":r.push({x:e.x-n,y:e.y-n},{x:e.x+n,y:e.y-n});break;case"left":r.push({x:e.x+n,y:e.y-n},{x:e.x+n,y:e.y+n});break;case"right":r.push({x:e.x-n,y:e.y-n},{x:e.x-n,y:e.y+n});break}return r}function _C(e){const{top:t,right:n,bottom:r,left:o}=e;return[{x:o,y:t},{x:n,y:t},{x:n,y:r},{x:o,y:r}]}function AC(e,t){const{x:n,y:r}=e;let o=!1;for(let i=0,s=t.length-1;i<t.length;s=i++){const a=t[i],l=t[s],u=a.x,d=a.y,c=l.x,h=l.y;d>r!=h>r&&n<(c-u)*(r-d)/(h-d)+u&&(o=!o)}return o}function OC(e){const t=e.slice();return t.sort((n,r)=>n.x<r.x?-1:n.x>r.x?1:n.y<r.y?-1:n.y>r.y?1:0),MC(t)}function MC(e){if(e.length<=1)return e.slice();const t=[];for(let r=0;r<e.length;r++){const o=e[r];for(;t.length>=2;){const i=t[t.length-1],s=t[t.length-2];if((i.x-s.x)*(o.y-s.y)>=(i.y-s.y)*(o.x-s.x))t.pop();else break}t.push(o)}t.pop();const n=[];for(let r=e.length-1;r>=0;r--){const o=e[r];for(;n.length>=2;){const i=n[n.length-1],s=n[n.length-2];if((i.x-s.x)*(o.y-s.y)>=(i.y-s.y)*(o.x-s.x))n.pop();else break}n.push(o)}return n.pop(),t.length===1&&n.length===1&&t[0].x===n[0].x&&t[0].y===n[0].y?t:t.concat(n)}var IC=fg,gg=hg;const DC=IC,LC=p.forwardRef(({className:e,sideOffset:t=4,...n},r)=>v.jsx(gg,{ref:r,sideOffset:t,className:Me("z-50 overflow-hidden rounded-md border bg-popover px-3 py-1.5 text-sm text-popover-foreground shadow-md animate-in fade-in-0 zoom-in-95 data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=closed]:zoom-out-95 data-[side=bottom]:slide-in-from-top-2 data-[side=left]:slide-in-from-right-2 data-[side=right]:slide-in-from-left-2 data-[side=top]:slide-in-from-bottom-2",e),...n}));LC.displayName=gg.displayName;var Va=class{constructor(){this.listeners=new Set,this.subscribe=this.subscribe.bind(this)}subscribe(e){return this.listeners.add(e),this.onSubscribe(),()=>{this.listeners.delete(e),this.onUnsubscribe()}}hasListeners(){return this.listeners.size>0}onSubscribe(){}onUnsubscribe(){}},Wa=typeof window>"u"||"Deno"in globalThis;function _t(){}function FC(e,t){return typeof e=="function"?e(t):e}function zC(e){return typeof e=="number"&&e>=0&&e!==1/0}function $C(e,t){return Math.max(e+(t||0)-Date.now(),0)}function Wu(e,t){return typeof e=="function"?e(t):e}function BC(e,t){return typeof e=="function"?e(t):e}function cp(e,t){const{type:n="all",exact:r,fetchStatus:o,predicate:i,queryKey:s,stale:a}=e;if(s){if(r){if(t.queryHash!==dd(s,t.options))return!1}else if(!ji(t.queryKey,s))return!1}if(n!=="all"){const l=t.isActive();if(n==="active"&&!l||n==="inactive"&&l)return!1}return!(typeof a=="boolean"&&t.isStale()!==a||o&&o!==t.state.fetchStatus||i&&!i(t))}function dp(e,t){const{exact:n,status:r,predicate:o,mutationKey:i}=e;if(i){if(!t.options.mutationKey)return!1;if(n){if(Ti(t.options.mutationKey)!==Ti(i))return!1}else if(!ji(t.options.mutationKey,i))return!1}return!(r&&t.state.status!==r||o&&!o(t))}function dd(e,t){return((t==null?void 0:t.queryKeyHashFn)||Ti)(e)}function Ti(e){return JSON.stringify(e,(t,n)=>Hu(n)?Object.keys(n).sort().reduce((r,o)=>(r[o]=n[o],r),{}):n)}function ji(e,t){return e===t?!0:typeof e!=typeof t?!1:e&&t&&typeof e=="object"&&typeof t=="object"?Object.keys(t).every(n=>ji(e[n],t[n])):!1}function yg(e,t){if(e===t)return e;const n=fp(e)&&fp(t);if(n||Hu(e)&&Hu(t)){const r=n?e:Object.keys(e),o=r.length,i=n?t:Object.keys(t),s=i.length,a=n?[]:{},l=new Set(r);let u=0;for(let d=0;d<s;d++){const c=n?d:i[d];(!n&&l.has(c)||n)&&e[c]===void 0&&t[c]===void 0?(a[c]=void 0,u++):(a[c]=yg(e[c],t[c]),a[c]===e[c]&&e[c]!==void 0&&u++)}return o===s&&u===o?e:a}return t}function fp(e){return Array.isArray(e)&&e.length===Object.keys(e).length}function Hu(e){if(!pp(e))return!1;const t=e.constructor;if(t===void 0)return!0;const n=t.prototype;return!(!pp(n)||!n.hasOwnProperty("isPrototypeOf")||Object.getPrototypeOf(e)!==Object.prototype)}function pp(e){return Object.prototype.toString.call(e)==="[object Object]"}function UC(e){return new Promise(t=>{setTimeout(t,e)})}function VC(e,t,n){return typeof n.structuralSharing=="function"?n.structuralSharing(e,t):n.structuralSharing!==!1?yg(e,t):t}function WC(e,t,n=0){const r=[...e,t];return n&&r.length>n?r.slice(1):r}function HC(e,t,n=0){const r=[t,...e];return n&&r.length>n?r.slice(0,-1):r}var fd=Symbol();function wg(e,t){return!e.queryFn&&(t!=null&&t.initialPromise)?()=>t.initialPromise:!e.queryFn||e.queryFn===fd?()=>Promise.reject(new Error(`Missing queryFn: '${e.queryHash}'`)):e.queryFn}var hr,Ln,co,Mp,KC=(Mp=class extends Va{constructor(){super();oe(this,hr);oe(this,Ln);oe(this,co);q(this,co,t=>{if(!Wa&&window.addEventListener){const n=()=>t();return window.addEventListener("visibilitychange",n,!1),()=>{window.removeEventListener("visibilitychange",n)}}})}onSubscribe(){T(this,Ln)||this.setEventListener(T(this,co))}onUnsubscribe(){var t;this.hasListeners()||((t=T(this,Ln))==null||t.call(this),q(this,Ln,void 0))}setEventListener(t){var n;q(this,co,t),(n=T(this,Ln))==null||n.call(this),q(this,Ln,t(r=>{typeof r=="boolean"?this.setFocused(r):this.onFocus()}))}setFocused(t){T(this,hr)!==t&&(q(this,hr,t),this.onFocus())}onFocus(){const t=this.isFocused();this.listeners.forEach(n=>{n(t)})}isFocused(){var t;return typeof T(this,hr)=="boolean"?T(this,hr):((t=globalThis.document)==null?void 0:t.visibilityState)!=="hidden"}},hr=new WeakMap,Ln=new WeakMap,co=new WeakMap,Mp),xg=new KC,fo,Fn,po,Ip,QC=(Ip=class extends Va{constructor(){super();oe(this,fo,!0);oe(this,Fn);oe(this,po);q(this,po,t=>{if(!Wa&&window.addEventListener){const n=()=>t(!0),r=()=>t(!1);return window.addEventListener("online",n,!1),window.addEventListener("offline",r,!1),()=>{window.removeEventListener("online",n),window.removeEventListener("offline",r)}}})}onSubscribe(){T(this,Fn)||this.setEventListener(T(this,po))}onUnsubscribe(){var t;this.hasListeners()||((t=T(this,Fn))==null||t.call(this),q(this,Fn,void 0))}setEventListener(t){var n;q(this,po,t),(n=T(this,Fn))==null||n.call(this),q(this,Fn,t(this.setOnline.bind(this)))}setOnline(t){T(this,fo)!==t&&(q(this,fo,t),this.listeners.forEach(r=>{r(t)}))}isOnline(){return T(this,fo)}},fo=new WeakMap,Fn=new WeakMap,po=new WeakMap,Ip),ma=new QC;function qC(){let e,t;const n=new Promise((o,i)=>{e=o,t=i});n.status="pending",n.catch(()=>{});function r(o){Object.assign(n,o),delete n.resolve,delete n.reject}return n.resolve=o=>{r({status:"fulfilled",value:o}),e(o)},n.reject=o=>{r({status:"rejected",reason:o}),t(o)},n}function GC(e){return Math.min(1e3*2**e,3e4)}function Sg(e){return(e??"online")==="online"?ma.isOnline():!0}var Eg=class extends Error{constructor(e){super("CancelledError"),this.revert=e==null?void 0:e.revert,this.silent=e==null?void 0:e.silent}};function Al(e){return e instanceof Eg}function Cg(e){let t=!1,n=0,r=!1,o;const i=qC(),s=m=>{var x;r||(h(new Eg(m)),(x=e.abort)==null||x.call(e))},a=()=>{t=!0},l=()=>{t=!1},u=()=>xg.isFocused()&&(e.networkMode==="always"||ma.isOnline())&&e.canRun(),d=()=>Sg(e.networkMode)&&e.canRun(),c=m=>{var x;r||(r=!0,(x=e.onSuccess)==null||x.call(e,m),o==null||o(),i.resolve(m))},h=m=>{var x;r||(r=!0,(x=e.onError)==null||x.call(e,m),o==null||o(),i.reject(m))},f=()=>new Promise(m=>{var x;o=g=>{(r||u())&&m(g)},(x=e.onPause)==null||x.call(e)}).then(()=>{var m;o=void 0,r||(m=e.onContinue)==null||m.call(e)}),S=()=>{if(r)return;let m;const x=n===0?e.initialPromise:void 0;try{m=x??e.fn()}catch(g){m=Promise.reject(g)}Promise.resolve(m).then(c).catch(g=>{var b;if(r)return;const y=e.retry??(Wa?0:3),w=e.retryDelay??GC,E=typeof w=="function"?w(n,g):w,C=y===!0||typeof y=="number"&&n<y||typeof y=="function"&&y(n,g);if(t||!C){h(g);return}n++,(b=e.onFail)==null||b.call(e,n,g),UC(E).then(()=>u()?void 0:f()).then(()=>{t?h(g):S()})})};return{promise:i,cancel:s,continue:()=>(o==null||o(),i),cancelRetry:a,continueRetry:l,canStart:d,start:()=>(d()?S():f().then(S),i)}}var YC=e=>setTimeout(e,0);function XC(){let e=[],t=0,n=a=>{a()},r=a=>{a()},o=YC;const i=a=>{t?e.push(a):o(()=>{n(a)})},s=()=>{const a=e;e=[],a.length&&o(()=>{r(()=>{a.forEach(l=>{n(l)})})})};return{batch:a=>{let l;t++;try{l=a()}finally{t--,t||s()}return l},batchCalls:a=>(...l)=>{i(()=>{a(...l)})},schedule:i,setNotifyFunction:a=>{n=a},setBatchNotifyFunction:a=>{r=a},setScheduler:a=>{o=a}}}var Qe=XC(),mr,Dp,bg=(Dp=class{constructor(){oe(this,mr)}destroy(){this.clearGcTimeout()}scheduleGc(){this.clearGcTimeout(),zC(this.gcTime)&&q(this,mr,setTimeout(()=>{this.optionalRemove()},this.gcTime))}updateGcTime(e){this.gcTime=Math.max(this.gcTime||0,e??(Wa?1/0:5*60*1e3))}clearGcTimeout(){T(this,mr)&&(clearTimeout(T(this,mr)),q(this,mr,void 0))}},mr=new WeakMap,Dp),ho,vr,mt,gr,Be,Di,yr,At,an,Lp,JC=(Lp=class extends bg{constructor(t){super();oe(this,At);oe(this,ho);oe(this,vr);oe(this,mt);oe(this,gr);oe(this,Be);oe(this,Di);oe(this,yr);q(this,yr,!1),q(this,Di,t.defaultOptions),this.setOptions(t.options),this.observers=[],q(this,gr,t.client),q(this,mt,T(this,gr).getQueryCache()),this.queryKey=t.queryKey,this.queryHash=t.queryHash,q(this,ho,eb(this.options)),this.state=t.state??T(this,ho),this.scheduleGc()}get meta(){return this.options.meta}get promise(){var t;return(t=T(this,Be))==null?void 0:t.promise}setOptions(t){this.options={...T(this,Di),...t},this.updateGcTime(this.options.gcTime)}optionalRemove(){!this.observers.length&&this.state.fetchStatus==="idle"&&T(this,mt).remove(this)}setData(t,n){const r=VC(this.state.data,t,this.options);return Fe(this,At,an).call(this,{data:r,type:"success",dataUpdatedAt:n==null?void 0:n.updatedAt,manual:n==null?void 0:n.manual}),r}setState(t,n){Fe(this,At,an).call(this,{type:"setState",state:t,setStateOptions:n})}cancel(t){var r,o;const n=(r=T(this,Be))==null?void 0:r.promise;return(o=T(this,Be))==null||o.cancel(t),n?n.then(_t).catch(_t):Promise.resolve()}destroy(){super.destroy(),this.cancel({silent:!0})}reset(){this.destroy(),this.setState(T(this,ho))}isActive(){return this.observers.some(t=>BC(t.options.enabled,this)!==!1)}isDisabled(){return this.getObserversCount()>0?!this.isActive():this.options.queryFn===fd||this.state.dataUpdateCount+this.state.errorUpdateCount===0}isStatic(){return this.getObserversCount()>0?this.observers.some(t=>Wu(t.options.staleTime,this)==="static"):!1}isStale(){return this.getObserversCount()>0?this.observers.some(t=>t.getCurrentResult().isStale):this.state.data===void 0||this.state.isInvalidated}isStaleByTime(t=0){return this.state.data===void 0?!0:t==="static"?!1:this.state.isInvalidated?!0:!$C(this.state.dataUpdatedAt,t)}onFocus(){var n;const t=this.observers.find(r=>r.shouldFetchOnWindowFocus());t==null||t.refetch({cancelRefetch:!1}),(n=T(this,Be))==null||n.continue()}onOnline(){var n;const t=this.observers.find(r=>r.shouldFetchOnReconnect());t==null||t.refetch({cancelRefetch:!1}),(n=T(this,Be))==null||n.continue()}addObserver(t){this.observers.includes(t)||(this.observers.push(t),this.clearGcTimeout(),T(this,mt).notify({type:"observerAdded",query:this,observer:t}))}removeObserver(t){this.observers.includes(t)&&(this.observers=this.observers.filter(n=>n!==t),this.observers.length||(T(this,Be)&&(T(this,yr)?T(this,Be).cancel({revert:!0}):T(this,Be).cancelRetry()),this.scheduleGc()),T(this,mt).notify({type:"observerRemoved",query:this,observer:t}))}getObserversCount(){return this.observers.length}invalidate(){this.state.isInvalidated||Fe(this,At,an).call(this,{type:"invalidate"})}fetch(t,n){var u,d,c;if(this.state.fetchStatus!=="idle"){if(this.state.data!==void 0&&(n!=null&&n.cancelRefetch))this.cancel({silent:!0});else if(T(this,Be))return T(this,Be).continueRetry(),T(this,Be).promise}if(t&&this.setOptions(t),!this.options.queryFn){const h=this.observers.find(f=>f.options.queryFn);h&&this.setOptions(h.options)}const r=new AbortController,o=h=>{Object.defineProperty(h,"signal",{enumerable:!0,get:()=>(q(this,yr,!0),r.signal)})},i=()=>{const h=wg(this.options,n),S=(()=>{const m={client:T(this,gr),queryKey:this.queryKey,meta:this.meta};return o(m),m})();return q(this,yr,!1),this.options.persister?this.options.persister(h,S,this):h(S)},a=(()=>{const h={fetchOptions:n,options:this.options,queryKey:this.queryKey,client:T(this,gr),state:this.state,fetchFn:i};return o(h),h})();(u=this.options.behavior)==null||u.onFetch(a,this),q(this,vr,this.state),(this.state.fetchStatus==="idle"||this.state.fetchMeta!==((d=a.fetchOptions)==null?void 0:d.meta))&&Fe(this,At,an).call(this,{type:"fetch",meta:(c=a.fetchOptions)==null?void 0:c.meta});const l=h=>{var f,S,m,x;Al(h)&&h.silent||Fe(this,At,an).call(this,{type:"error",error:h}),Al(h)||((S=(f=T(this,mt).config).onError)==null||S.call(f,h,this),(x=(m=T(this,mt).config).onSettled)==null||x.call(m,this.state.data,h,this)),this.scheduleGc()};return q(this,Be,Cg({initialPromise:n==null?void 0:n.initialPromise,fn:a.fetchFn,abort:r.abort.bind(r),onSuccess:h=>{var f,S,m,x;if(h===void 0){l(new Error(`${this.queryHash} data is undefined`));return}try{this.setData(h)}catch(g){l(g);return}(S=(f=T(this,mt).config).onSuccess)==null||S.call(f,h,this),(x=(m=T(this,mt).config).onSettled)==null||x.call(m,h,this.state.error,this),this.scheduleGc()},onError:l,onFail:(h,f)=>{Fe(this,At,an).call(this,{type:"failed",failureCount:h,error:f})},onPause:()=>{Fe(this,At,an).call(this,{type:"pause"})},onContinue:()=>{Fe(this,At,an).call(this,{type:"continue"})},retry:a.options.retry,retryDelay:a.options.retryDelay,networkMode:a.options.networkMode,canRun:()=>!0})),T(this,Be).start()}},ho=new WeakMap,vr=new WeakMap,mt=new WeakMap,gr=new WeakMap,Be=new WeakMap,Di=new WeakMap,yr=new WeakMap,At=new WeakSet,an=function(t){const n=r=>{switch(t.type){case"failed":return{...r,fetchFailureCount:t.failureCount,fetchFailureReason:t.error};case"pause":return{...r,fetchStatus:"paused"};case"continue":return{...r,fetchStatus:"fetching"};case"fetch":return{...r,...ZC(r.data,this.options),fetchMeta:t.meta??null};case"success":return q(this,vr,void 0),{...r,data:t.data,dataUpdateCount:r.dataUpdateCount+1,dataUpdatedAt:t.dataUpdatedAt??Date.now(),error:null,isInvalidated:!1,status:"success",...!t.manual&&{fetchStatus:"idle",fetchFailureCount:0,fetchFailureReason:null}};case"error":const o=t.error;return Al(o)&&o.revert&&T(this,vr)?{...T(this,vr),fetchStatus:"idle"}:{...r,error:o,errorUpdateCount:r.errorUpdateCount+1,errorUpdatedAt:Date.now(),fetchFailureCount:r.fetchFailureCount+1,fetchFailureReason:o,fetchStatus:"idle",status:"error"};case"invalidate":return{...r,isInvalidated:!0};case"setState":return{...r,...t.state}}};this.state=n(this.state),Qe.batch(()=>{this.observers.forEach(r=>{r.onQueryUpdate()}),T(this,mt).notify({query:this,type:"updated",action:t})})},Lp);function ZC(e,t){return{fetchFailureCount:0,fetchFailureReason:null,fetchStatus:Sg(t.networkMode)?"fetching":"paused",...e===void 0&&{error:null,status:"pending"}}}function eb(e){const t=typeof e.initialData=="function"?e.initialData():e.initialData,n=t!==void 0,r=n?typeof e.initialDataUpdatedAt=="function"?e.initialDataUpdatedAt():e.initialDataUpdatedAt:0;return{data:t,dataUpdateCount:0,dataUpdatedAt:n?r??Date.now():0,error:null,errorUpdateCount:0,errorUpdatedAt:0,fetchFailureCount:0,fetchFailureReason:null,fetchMeta:null,isInvalidated:!1,status:n?"success":"pending",fetchStatus:"idle"}}var Qt,Fp,tb=(Fp=class extends Va{constructor(t={}){super();oe(this,Qt);this.config=t,q(this,Qt,new Map)}build(t,n,r){const o=n.queryKey,i=n.queryHash??dd(o,n);let s=this.get(i);return s||(s=new JC({client:t,queryKey:o,queryHash:i,options:t.defaultQueryOptions(n),state:r,defaultOptions:t.getQueryDefaults(o)}),this.add(s)),s}add(t){T(this,Qt).has(t.queryHash)||(T(this,Qt).set(t.queryHash,t),this.notify({type:"added",query:t}))}remove(t){const n=T(this,Qt).get(t.queryHash);n&&(t.destroy(),n===t&&T(this,Qt).delete(t.queryHash),this.notify({type:"removed",query:t}))}clear(){Qe.batch(()=>{this.getAll().forEach(t=>{this.remove(t)})})}get(t){return T(this,Qt).get(t)}getAll(){return[...T(this,Qt).values()]}find(t){const n={exact:!0,...t};return this.getAll().find(r=>cp(n,r))}findAll(t={}){const n=this.getAll();return Object.keys(t).length>0?n.filter(r=>cp(t,r)):n}notify(t){Qe.batch(()=>{this.listeners.forEach(n=>{n(t)})})}onFocus(){Qe.batch(()=>{this.getAll().forEach(t=>{t.onFocus()})})}onOnline(){Qe.batch(()=>{this.getAll().forEach(t=>{t.onOnline()})})}},Qt=new WeakMap,Fp),qt,He,wr,Gt,_n,zp,nb=(zp=class extends bg{constructor(t){super();oe(this,Gt);oe(this,qt);oe(this,He);oe(this,wr);this.mutationId=t.mutationId,q(this,He,t.mutationCache),q(this,qt,[]),this.state=t.state||rb(),this.setOptions(t.options),this.scheduleGc()}setOptions(t){this.options=t,this.updateGcTime(this.options.gcTime)}get meta(){return this.options.meta}addObserver(t){T(this,qt).includes(t)||(T(this,qt).push(t),this.clearGcTimeout(),T(this,He).notify({type:"observerAdded",mutation:this,observer:t}))}removeObserver(t){q(this,qt,T(this,qt).filter(n=>n!==t)),this.scheduleGc(),T(this,He).notify({type:"observerRemoved",mutation:this,observer:t})}optionalRemove(){T(this,qt).length||(this.state.status==="pending"?this.scheduleGc():T(this,He).remove(this))}continue(){var t;return((t=T(this,wr))==null?void 0:t.continue())??this.execute(this.state.variables)}async execute(t){var i,s,a,l,u,d,c,h,f,S,m,x,g,y,w,E,C,b,k,P;const n=()=>{Fe(this,Gt,_n).call(this,{type:"continue"})};q(this,wr,Cg({fn:()=>this.options.mutationFn?this.options.mutationFn(t):Promise.reject(new Error("No mutationFn found")),onFail:(O,_)=>{Fe(this,Gt,_n).call(this,{type:"failed",failureCount:O,error:_})},onPause:()=>{Fe(this,Gt,_n).call(this,{type:"pause"})},onContinue:n,retry:this.options.retry??0,retryDelay:this.options.retryDelay,networkMode:this.options.networkMode,canRun:()=>T(this,He).canRun(this)}));const r=this.state.status==="pending",o=!T(this,wr).canStart();try{if(r)n();else{Fe(this,Gt,_n).call(this,{type:"pending",variables:t,isPaused:o}),await((s=(i=T(this,He).config).onMutate)==null?void 0:s.call(i,t,this));const _=await((l=(a=this.options).onMutate)==null?void 0:l.call(a,t));_!==this.state.context&&Fe(this,Gt,_n).call(this,{type:"pending",context:_,variables:t,isPaused:o})}const O=await T(this,wr).start();return await((d=(u=T(this,He).config).onSuccess)==null?void 0:d.call(u,O,t,this.state.context,this)),await((h=(c=this.options).onSuccess)==null?void 0:h.call(c,O,t,this.state.context)),await((S=(f=T(this,He).config).onSettled)==null?void 0:S.call(f,O,null,this.state.variables,this.state.context,this)),await((x=(m=this.options).onSettled)==null?void 0:x.call(m,O,null,t,this.state.context)),Fe(this,Gt,_n).call(this,{type:"success",data:O}),O}catch(O){try{throw await((y=(g=T(this,He).config).onError)==null?void 0:y.call(g,O,t,this.state.context,this)),await((E=(w=this.options).onError)==null?void 0:E.call(w,O,t,this.state.context)),await((b=(C=T(this,He).config).onSettled)==null?void 0:b.call(C,void 0,O,this.state.variables,this.state.context,this)),await((P=(k=this.options).onSettled)==null?void 0:P.call(k,void 0,O,t,this.state.context)),O}finally{Fe(this,Gt,_n).call(this,{type:"error",error:O})}}finally{T(this,He).runNext(this)}}},qt=new WeakMap,He=new WeakMap,wr=new WeakMap,Gt=new WeakSet,_n=function(t){const n=r=>{switch(t.type){case"failed":return{...r,failureCount:t.failureCount,failureReason:t.error};case"pause":return{...r,isPaused:!0};case"continue":return{...r,isPaused:!1};case"pending":return{...r,context:t.context,data:void 0,failureCount:0,failureReason:null,error:null,isPaused:t.isPaused,status:"pending",variables:t.variables,submittedAt:Date.now()};case"success":return{...r,data:t.data,failureCount:0,failureReason:null,error:null,status:"success",isPaused:!1};case"error":return{...r,data:void 0,error:t.error,failureCount:r.failureCount+1,failureReason:t.error,isPaused:!1,status:"error"}}};this.state=n(this.state),Qe.batch(()=>{T(this,qt).forEach(r=>{r.onMutationUpdate(t)}),T(this,He).notify({mutation:this,type:"updated",action:t})})},zp);function rb(){return{context:void 0,data:void 0,error:null,failureCount:0,failureReason:null,isPaused:!1,status:"idle",variables:void 0,submittedAt:0}}var cn,Ot,Li,$p,ob=($p=class extends Va{constructor(t={}){super();oe(this,cn);oe(this,Ot);oe(this,Li);this.config=t,q(this,cn,new Set),q(this,Ot,new Map),q(this,Li,0)}build(t,n,r){const o=new nb({mutationCache:this,mutationId:++Yi(this,Li)._,options:t.defaultMutationOptions(n),state:r});return this.add(o),o}add(t){T(this,cn).add(t);const n=ys(t);if(typeof n=="string"){const r=T(this,Ot).get(n);r?r.push(t):T(this,Ot).set(n,[t])}this.notify({type:"added",mutation:t})}remove(t){if(T(this,cn).delete(t)){const n=ys(t);if(typeof n=="string"){const r=T(this,Ot).get(n);if(r)if(r.length>1){const o=r.indexOf(t);o!==-1&&r.splice(o,1)}else r[0]===t&&T(this,Ot).delete(n)}}this.notify({type:"removed",mutation:t})}canRun(t){const n=ys(t);if(typeof n=="string"){const r=T(this,Ot).get(n),o=r==null?void 0:r.find(i=>i.state.status==="pending");return!o||o===t}else return!0}runNext(t){var r;const n=ys(t);if(typeof n=="string"){const o=(r=T(this,Ot).get(n))==null?void 0:r.find(i=>i!==t&&i.state.isPaused);return(o==null?void 0:o.continue())??Promise.resolve()}else return Promise.resolve()}clear(){Qe.batch(()=>{T(this,cn).forEach(t=>{this.notify({type:"removed",mutation:t})}),T(this,cn).clear(),T(this,Ot).clear()})}getAll(){return Array.from(T(this,cn))}find(t){const n={exact:!0,...t};return this.getAll().find(r=>dp(n,r))}findAll(t={}){return this.getAll().filter(n=>dp(t,n))}notify(t){Qe.batch(()=>{this.listeners.forEach(n=>{n(t)})})}resumePausedMutations(){const t=this.getAll().filter(n=>n.state.isPaused);return Qe.batch(()=>Promise.all(t.map(n=>n.continue().catch(_t))))}},cn=new WeakMap,Ot=new WeakMap,Li=new WeakMap,$p);function ys(e){var t;return(t=e.options.scope)==null?void 0:t.id}function hp(e){return{onFetch:(t,n)=>{var d,c,h,f,S;const r=t.options,o=(h=(c=(d=t.fetchOptions)==null?void 0:d.meta)==null?void 0:c.fetchMore)==null?void 0:h.direction,i=((f=t.state.data)==null?void 0:f.pages)||[],s=((S=t.state.data)==null?void 0:S.pageParams)||[];let a={pages:[],pageParams:[]},l=0;const u=async()=>{let m=!1;const x=w=>{Object.defineProperty(w,"signal",{enumerable:!0,get:()=>(t.signal.aborted?m=!0:t.signal.addEventListener("abort",()=>{m=!0}),t.signal)})},g=wg(t.options,t.fetchOptions),y=async(w,E,C)=>{if(m)return Promise.reject();if(E==null&&w.pages.length)return Promise.resolve(w);const k=(()=>{const z={client:t.client,queryKey:t.queryKey,pageParam:E,direction:C?"backward":"forward",meta:t.options.meta};return x(z),z})(),P=await g(k),{maxPages:O}=t.options,_=C?HC:WC;return{pages:_(w.pages,P,O),pageParams:_(w.pageParams,E,O)}};if(o&&i.length){const w=o==="backward",E=w?ib:mp,C={pages:i,pageParams:s},b=E(r,C);a=await y(C,b,w)}else{const w=e??i.length;do{const E=l===0?s[0]??r.initialPageParam:mp(r,a);if(l>0&&E==null)break;a=await y(a,E),l++}while(l<w)}return a};t.options.persister?t.fetchFn=()=>{var m,x;return(x=(m=t.options).persister)==null?void 0:x.call(m,u,{client:t.client,queryKey:t.queryKey,meta:t.options.meta,signal:t.signal},n)}:t.fetchFn=u}}}function mp(e,{pages:t,pageParams:n}){const r=t.length-1;return t.length>0?e.getNextPageParam(t[r],t,n[r],n):void 0}function ib(e,{pages:t,pageParams:n}){var r;return t.length>0?(r=e.getPreviousPageParam)==null?void 0:r.call(e,t[0],t,n[0],n):void 0}var Ee,zn,$n,mo,vo,Bn,go,yo,Bp,sb=(Bp=class{constructor(e={}){oe(this,Ee);oe(this,zn);oe(this,$n);oe(this,mo);oe(this,vo);oe(this,Bn);oe(this,go);oe(this,yo);q(this,Ee,e.queryCache||new tb),q(this,zn,e.mutationCache||new ob),q(this,$n,e.defaultOptions||{}),q(this,mo,new Map),q(this,vo,new Map),q(this,Bn,0)}mount(){Yi(this,Bn)._++,T(this,Bn)===1&&(q(this,go,xg.subscribe(async e=>{e&&(await this.resumePausedMutations(),T(this,Ee).onFocus())})),q(this,yo,ma.subscribe(async e=>{e&&(await this.resumePausedMutations(),T(this,Ee).onOnline())})))}unmount(){var e,t;Yi(this,Bn)._--,T(this,Bn)===0&&((e=T(this,go))==null||e.call(this),q(this,go,void 0),(t=T(this,yo))==null||t.call(this),q(this,yo,void 0))}isFetching(e){return T(this,Ee).findAll({...e,fetchStatus:"fetching"}).length}isMutating(e){return T(this,zn).findAll({...e,status:"pending"}).length}getQueryData(e){var n;const t=this.defaultQueryOptions({queryKey:e});return(n=T(this,Ee).get(t.queryHash))==null?void 0:n.state.data}ensureQueryData(e){const t=this.defaultQueryOptions(e),n=T(this,Ee).build(this,t),r=n.state.data;return r===void 0?this.fetchQuery(e):(e.revalidateIfStale&&n.isStaleByTime(Wu(t.staleTime,n))&&this.prefetchQuery(t),Promise.resolve(r))}getQueriesData(e){return T(this,Ee).findAll(e).map(({queryKey:t,state:n})=>{const r=n.data;return[t,r]})}setQueryData(e,t,n){const r=this.defaultQueryOptions({queryKey:e}),o=T(this,Ee).get(r.queryHash),i=o==null?void 0:o.state.data,s=FC(t,i);if(s!==void 0)return T(this,Ee).build(this,r).setData(s,{...n,manual:!0})}setQueriesData(e,t,n){return Qe.batch(()=>T(this,Ee).findAll(e).map(({queryKey:r})=>[r,this.setQueryData(r,t,n)]))}getQueryState(e){var n;const t=this.defaultQueryOptions({queryKey:e});return(n=T(this,Ee).get(t.queryHash))==null?void 0:n.state}removeQueries(e){const t=T(this,Ee);Qe.batch(()=>{t.findAll(e).forEach(n=>{t.remove(n)})})}resetQueries(e,t){const n=T(this,Ee);return Qe.batch(()=>(n.findAll(e).forEach(r=>{r.reset()}),this.refetchQueries({type:"active",...e},t)))}cancelQueries(e,t={}){const n={revert:!0,...t},r=Qe.batch(()=>T(this,Ee).findAll(e).map(o=>o.cancel(n)));return Promise.all(r).then(_t).catch(_t)}invalidateQueries(e,t={}){return Qe.batch(()=>(T(this,Ee).findAll(e).forEach(n=>{n.invalidate()}),(e==null?void 0:e.refetchType)==="none"?Promise.resolve():this.refetchQueries({...e,type:(e==null?void 0:e.refetchType)??(e==null?void 0:e.type)??"active"},t)))}refetchQueries(e,t={}){const n={...t,cancelRefetch:t.cancelRefetch??!0},r=Qe.batch(()=>T(this,Ee).findAll(e).filter(o=>!o.isDisabled()&&!o.isStatic()).map(o=>{let i=o.fetch(void 0,n);return n.throwOnError||(i=i.catch(_t)),o.state.fetchStatus==="paused"?Promise.resolve():i}));return Promise.all(r).then(_t)}fetchQuery(e){const t=this.defaultQueryOptions(e);t.retry===void 0&&(t.retry=!1);const n=T(this,Ee).build(this,t);return n.isStaleByTime(Wu(t.staleTime,n))?n.fetch(t):Promise.resolve(n.state.data)}prefetchQuery(e){return this.fetchQuery(e).then(_t).catch(_t)}fetchInfiniteQuery(e){return e.behavior=hp(e.pages),this.fetchQuery(e)}prefetchInfiniteQuery(e){return this.fetchInfiniteQuery(e).then(_t).catch(_t)}ensureInfiniteQueryData(e){return e.behavior=hp(e.pages),this.ensureQueryData(e)}resumePausedMutations(){return ma.isOnline()?T(this,zn).resumePausedMutations():Promise.resolve()}getQueryCache(){return T(this,Ee)}getMutationCache(){return T(this,zn)}getDefaultOptions(){return T(this,$n)}setDefaultOptions(e){q(this,$n,e)}setQueryDefaults(e,t){T(this,mo).set(Ti(e),{queryKey:e,defaultOptions:t})}getQueryDefaults(e){const t=[...T(this,mo).values()],n={};return t.forEach(r=>{ji(e,r.queryKey)&&Object.assign(n,r.defaultOptions)}),n}setMutationDefaults(e,t){T(this,vo).set(Ti(e),{mutationKey:e,defaultOptions:t})}getMutationDefaults(e){const t=[...T(this,vo).values()],n={};return t.forEach(r=>{ji(e,r.mutationKey)&&Object.assign(n,r.defaultOptions)}),n}defaultQueryOptions(e){if(e._defaulted)return e;const t={...T(this,$n).queries,...this.getQueryDefaults(e.queryKey),...e,_defaulted:!0};return t.queryHash||(t.queryHash=dd(t.queryKey,t)),t.refetchOnReconnect===void 0&&(t.refetchOnReconnect=t.networkMode!=="always"),t.throwOnError===void 0&&(t.throwOnError=!!t.suspense),!t.networkMode&&t.persister&&(t.networkMode="offlineFirst"),t.queryFn===fd&&(t.enabled=!1),t}defaultMutationOptions(e){return e!=null&&e._defaulted?e:{...T(this,$n).mutations,...(e==null?void 0:e.mutationKey)&&this.getMutationDefaults(e.mutationKey),...e,_defaulted:!0}}clear(){T(this,Ee).clear(),T(this,zn).clear()}},Ee=new WeakMap,zn=new WeakMap,$n=new WeakMap,mo=new WeakMap,vo=new WeakMap,Bn=new WeakMap,go=new WeakMap,yo=new WeakMap,Bp),ab=p.createContext(void 0),lb=({client:e,children:t})=>(p.useEffect(()=>(e.mount(),()=>{e.unmount()}),[e]),v.jsx(ab.Provider,{value:e,children:t}));/**
- * @remix-run/router v1.23.0
- *
- * Copyright (c) Remix Software Inc.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE.md file in the root directory of this source tree.
- *
- * @license MIT
- */function _i(){return _i=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},_i.apply(this,arguments)}var Wn;(function(e){e.Pop="POP",e.Push="PUSH",e.Replace="REPLACE"})(Wn||(Wn={}));const vp="popstate";function ub(e){e===void 0&&(e={});function t(r,o){let{pathname:i,search:s,hash:a}=r.location;return Ku("",{pathname:i,search:s,hash:a},o.state&&o.state.usr||null,o.state&&o.state.key||"default")}function n(r,o){return typeof o=="string"?o:Pg(o)}return db(t,n,null,e)}function _e(e,t){if(e===!1||e===null||typeof e>"u")throw new Error(t)}function kg(e,t){if(!e){typeof console<"u"&&console.warn(t);try{throw new Error(t)}catch{}}}function cb(){return Math.random().toString(36).substr(2,8)}function gp(e,t){return{usr:e.state,key:e.key,idx:t}}function Ku(e,t,n,r){return n===void 0&&(n=null),_i({pathname:typeof e=="string"?e:e.pathname,search:"",hash:""},typeof t=="string"?Mo(t):t,{state:n,key:t&&t.key||r||cb()})}function Pg(e){let{pathname:t="/",search:n="",hash:r=""}=e;return n&&n!=="?"&&(t+=n.charAt(0)==="?"?n:"?"+n),r&&r!=="#"&&(t+=r.charAt(0)==="#"?r:"#"+r),t}function Mo(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substr(n),e=e.substr(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substr(r),e=e.substr(0,r)),e&&(t.pathname=e)}return t}function db(e,t,n,r){r===void 0&&(r={});let{window:o=document.defaultView,v5Compat:i=!1}=r,s=o.history,a=Wn.Pop,l=null,u=d();u==null&&(u=0,s.replaceState(_i({},s.state,{idx:u}),""));function d(){return(s.state||{idx:null}).idx}function c(){a=Wn.Pop;let x=d(),g=x==null?null:x-u;u=x,l&&l({action:a,location:m.location,delta:g})}function h(x,g){a=Wn.Push;let y=Ku(m.location,x,g);u=d()+1;let w=gp(y,u),E=m.createHref(y);try{s.pushState(w,"",E)}catch(C){if(C instanceof DOMException&&C.name==="DataCloneError")throw C;o.location.assign(E)}i&&l&&l({action:a,location:m.location,delta:1})}function f(x,g){a=Wn.Replace;let y=Ku(m.location,x,g);u=d();let w=gp(y,u),E=m.createHref(y);s.replaceState(w,"",E),i&&l&&l({action:a,location:m.location,delta:0})}function S(x){let g=o.location.origin!=="null"?o.location.origin:o.location.href,y=typeof x=="string"?x:Pg(x);return y=y.replace(/ $/,"%20"),_e(g,"No window.location.(origin|href) available to create URL for href: "+y),new URL(y,g)}let m={get action(){return a},get location(){return e(o,s)},listen(x){if(l)throw new Error("A history only accepts one active listener");return o.addEventListener(vp,c),l=x,()=>{o.removeEventListener(vp,c),l=null}},createHref(x){return t(o,x)},createURL:S,encodeLocation(x){let g=S(x);return{pathname:g.pathname,search:g.search,hash:g.hash}},push:h,replace:f,go(x){return s.go(x)}};return m}var yp;(function(e){e.data="data",e.deferred="deferred",e.redirect="redirect",e.error="error"})(yp||(yp={}));function fb(e,t,n){return n===void 0&&(n="/"),pb(e,t,n,!1)}function pb(e,t,n,r){let o=typeof t=="string"?Mo(t):t,i=Tg(o.pathname||"/",n);if(i==null)return null;let s=Rg(e);hb(s);let a=null;for(let l=0;a==null&&l<s.length;++l){let u=kb(i);a=Cb(s[l],u,r)}return a}function Rg(e,t,n,r){t===void 0&&(t=[]),n===void 0&&(n=[]),r===void 0&&(r="");let o=(i,s,a)=>{let l={relativePath:a===void 0?i.path||"":a,caseSensitive:i.caseSensitive===!0,childrenIndex:s,route:i};l.relativePath.startsWith("/")&&(_e(l.relativePath.startsWith(r),'Absolute route path "'+l.relativePath+'" nested under path '+('"'+r+'" is not valid. An absolute child route path ')+"must start with the combined path of all its parent routes."),l.relativePath=l.relativePath.slice(r.length));let u=Er([r,l.relativePath]),d=n.concat(l);i.children&&i.children.length>0&&(_e(i.index!==!0,"Index routes must not have child routes. Please remove "+('all child routes from route path "'+u+'".')),Rg(i.children,t,d,u)),!(i.path==null&&!i.index)&&t.push({path:u,score:Sb(u,i.index),routesMeta:d})};return e.forEach((i,s)=>{var a;if(i.path===""||!((a=i.path)!=null&&a.includes("?")))o(i,s);else for(let l of Ng(i.path))o(i,s,l)}),t}function Ng(e){let t=e.split("/");if(t.length===0)return[];let[n,...r]=t,o=n.endsWith("?"),i=n.replace(/\?$/,"");if(r.length===0)return o?[i,""]:[i];let s=Ng(r.join("/")),a=[];return a.push(...s.map(l=>l===""?i:[i,l].join("/"))),o&&a.push(...s),a.map(l=>e.startsWith("/")&&l===""?"/":l)}function hb(e){e.sort((t,n)=>t.score!==n.score?n.score-t.score:Eb(t.routesMeta.map(r=>r.childrenIndex),n.routesMeta.map(r=>r.childrenIndex)))}const mb=/^:[\w-]+$/,vb=3,gb=2,yb=1,wb=10,xb=-2,wp=e=>e==="*";function Sb(e,t){let n=e.split("/"),r=n.length;return n.some(wp)&&(r+=xb),t&&(r+=gb),n.filter(o=>!wp(o)).reduce((o,i)=>o+(mb.test(i)?vb:i===""?yb:wb),r)}function Eb(e,t){return e.length===t.length&&e.slice(0,-1).every((r,o)=>r===t[o])?e[e.length-1]-t[t.length-1]:0}function Cb(e,t,n){let{routesMeta:r}=e,o={},i="/",s=[];for(let a=0;a<r.length;++a){let l=r[a],u=a===r.length-1,d=i==="/"?t:t.slice(i.length)||"/",c=xp({path:l.relativePath,caseSensitive:l.caseSensitive,end:u},d),h=l.route;if(!c&&u&&n&&!r[r.length-1].route.index&&(c=xp({path:l.relativePath,caseSensitive:l.caseSensitive,end:!1},d)),!c)return null;Object.assign(o,c.params),s.push({params:o,pathname:Er([i,c.pathname]),pathnameBase:_b(Er([i,c.pathnameBase])),route:h}),c.pathnameBase!=="/"&&(i=Er([i,c.pathnameBase]))}return s}function xp(e,t){typeof e=="string"&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=bb(e.path,e.caseSensitive,e.end),o=t.match(n);if(!o)return null;let i=o[0],s=i.replace(/(.)\/+$/,"$1"),a=o.slice(1);return{params:r.reduce((u,d,c)=>{let{paramName:h,isOptional:f}=d;if(h==="*"){let m=a[c]||"";s=i.slice(0,i.length-m.length).replace(/(.)\/+$/,"$1")}const S=a[c];return f&&!S?u[h]=void 0:u[h]=(S||"").replace(/%2F/g,"/"),u},{}),pathname:i,pathnameBase:s,pattern:e}}function bb(e,t,n){t===void 0&&(t=!1),n===void 0&&(n=!0),kg(e==="*"||!e.endsWith("*")||e.endsWith("/*"),'Route path "'+e+'" will be treated as if it were '+('"'+e.replace(/\*$/,"/*")+'" because the `*` character must ')+"always follow a `/` in the pattern. To get rid of this warning, "+('please change the route path to "'+e.replace(/\*$/,"/*")+'".'));let r=[],o="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(s,a,l)=>(r.push({paramName:a,isOptional:l!=null}),l?"/?([^\\/]+)?":"/([^\\/]+)"));return e.endsWith("*")?(r.push({paramName:"*"}),o+=e==="*"||e==="/*"?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?o+="\\/*$":e!==""&&e!=="/"&&(o+="(?:(?=\\/|$))"),[new RegExp(o,t?void 0:"i"),r]}function kb(e){try{return e.split("/").map(t=>decodeURIComponent(t).replace(/\//g,"%2F")).join("/")}catch(t){return kg(!1,'The URL path "'+e+'" could not be decoded because it is is a malformed URL segment. This is probably due to a bad percent '+("encoding ("+t+").")),e}}function Tg(e,t){if(t==="/")return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&r!=="/"?null:e.slice(n)||"/"}function Pb(e,t){t===void 0&&(t="/");let{pathname:n,search:r="",hash:o=""}=typeof e=="string"?Mo(e):e;return{pathname:n?n.startsWith("/")?n:Rb(n,t):t,search:Ab(r),hash:Ob(o)}}function Rb(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach(o=>{o===".."?n.length>1&&n.pop():o!=="."&&n.push(o)}),n.length>1?n.join("/"):"/"}function Ol(e,t,n,r){return"Cannot include a '"+e+"' character in a manually specified "+("`to."+t+"` field ["+JSON.stringify(r)+"].  Please separate it out to the ")+("`to."+n+"` field. Alternatively you may provide the full path as ")+'a string in <Link to="..."> and the router will parse it for you.'}function Nb(e){return e.filter((t,n)=>n===0||t.route.path&&t.route.path.length>0)}function Tb(e,t){let n=Nb(e);return t?n.map((r,o)=>o===n.length-1?r.pathname:r.pathnameBase):n.map(r=>r.pathnameBase)}function jb(e,t,n,r){r===void 0&&(r=!1);let o;typeof e=="string"?o=Mo(e):(o=_i({},e),_e(!o.pathname||!o.pathname.includes("?"),Ol("?","pathname","search",o)),_e(!o.pathname||!o.pathname.includes("#"),Ol("#","pathname","hash",o)),_e(!o.search||!o.search.includes("#"),Ol("#","search","hash",o)));let i=e===""||o.pathname==="",s=i?"/":o.pathname,a;if(s==null)a=n;else{let c=t.length-1;if(!r&&s.startsWith("..")){let h=s.split("/");for(;h[0]==="..";)h.shift(),c-=1;o.pathname=h.join("/")}a=c>=0?t[c]:"/"}let l=Pb(o,a),u=s&&s!=="/"&&s.endsWith("/"),d=(i||s===".")&&n.endsWith("/");return!l.pathname.endsWith("/")&&(u||d)&&(l.pathname+="/"),l}const Er=e=>e.join("/").replace(/\/\/+/g,"/"),_b=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),Ab=e=>!e||e==="?"?"":e.startsWith("?")?e:"?"+e,Ob=e=>!e||e==="#"?"":e.startsWith("#")?e:"#"+e;function Mb(e){return e!=null&&typeof e.status=="number"&&typeof e.statusText=="string"&&typeof e.internal=="boolean"&&"data"in e}const jg=["post","put","patch","delete"];new Set(jg);const Ib=["get",...jg];new Set(Ib);/**
- * React Router v6.30.1
- *
- * Copyright (c) Remix Software Inc.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE.md file in the root directory of this source tree.
- *
- * @license MIT
- */function Ai(){return Ai=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Ai.apply(this,arguments)}const pd=p.createContext(null),Db=p.createContext(null),Ha=p.createContext(null),Ka=p.createContext(null),Io=p.createContext({outlet:null,matches:[],isDataRoute:!1}),_g=p.createContext(null);function Qa(){return p.useContext(Ka)!=null}function hd(){return Qa()||_e(!1),p.useContext(Ka).location}function Ag(e){p.useContext(Ha).static||p.useLayoutEffect(e)}function Og(){let{isDataRoute:e}=p.useContext(Io);return e?Gb():Lb()}function Lb(){Qa()||_e(!1);let e=p.useContext(pd),{basename:t,future:n,navigator:r}=p.useContext(Ha),{matches:o}=p.useContext(Io),{pathname:i}=hd(),s=JSON.stringify(Tb(o,n.v7_relativeSplatPath)),a=p.useRef(!1);return Ag(()=>{a.current=!0}),p.useCallback(function(u,d){if(d===void 0&&(d={}),!a.current)return;if(typeof u=="number"){r.go(u);return}let c=jb(u,JSON.parse(s),i,d.relative==="path");e==null&&t!=="/"&&(c.pathname=c.pathname==="/"?t:Er([t,c.pathname])),(d.replace?r.replace:r.push)(c,d.state,d)},[t,r,s,i,e])}function Fb(e,t){return zb(e,t)}function zb(e,t,n,r){Qa()||_e(!1);let{navigator:o}=p.useContext(Ha),{matches:i}=p.useContext(Io),s=i[i.length-1],a=s?s.params:{};s&&s.pathname;let l=s?s.pathnameBase:"/";s&&s.route;let u=hd(),d;if(t){var c;let x=typeof t=="string"?Mo(t):t;l==="/"||(c=x.pathname)!=null&&c.startsWith(l)||_e(!1),d=x}else d=u;let h=d.pathname||"/",f=h;if(l!=="/"){let x=l.replace(/^\//,"").split("/");f="/"+h.replace(/^\//,"").split("/").slice(x.length).join("/")}let S=fb(e,{pathname:f}),m=Wb(S&&S.map(x=>Object.assign({},x,{params:Object.assign({},a,x.params),pathname:Er([l,o.encodeLocation?o.encodeLocation(x.pathname).pathname:x.pathname]),pathnameBase:x.pathnameBase==="/"?l:Er([l,o.encodeLocation?o.encodeLocation(x.pathnameBase).pathname:x.pathnameBase])})),i,n,r);return t&&m?p.createElement(Ka.Provider,{value:{location:Ai({pathname:"/",search:"",hash:"",state:null,key:"default"},d),navigationType:Wn.Pop}},m):m}function $b(){let e=qb(),t=Mb(e)?e.status+" "+e.statusText:e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,o={padding:"0.5rem",backgroundColor:"rgba(200,200,200, 0.5)"};return p.createElement(p.Fragment,null,p.createElement("h2",null,"Unexpected Application Error!"),p.createElement("h3",{style:{fontStyle:"italic"}},t),n?p.createElement("pre",{style:o},n):null,null)}const Bb=p.createElement($b,null);class Ub extends p.Component{constructor(t){super(t),this.state={location:t.location,revalidation:t.revalidation,error:t.error}}static getDerivedStateFromError(t){return{error:t}}static getDerivedStateFromProps(t,n){return n.location!==t.location||n.revalidation!=="idle"&&t.revalidation==="idle"?{error:t.error,location:t.location,revalidation:t.revalidation}:{error:t.error!==void 0?t.error:n.error,location:n.location,revalidation:t.revalidation||n.revalidation}}componentDidCatch(t,n){console.error("React Router caught the following error during render",t,n)}render(){return this.state.error!==void 0?p.createElement(Io.Provider,{value:this.props.routeContext},p.createElement(_g.Provider,{value:this.state.error,children:this.props.component})):this.props.children}}function Vb(e){let{routeContext:t,match:n,children:r}=e,o=p.useContext(pd);return o&&o.static&&o.staticContext&&(n.route.errorElement||n.route.ErrorBoundary)&&(o.staticContext._deepestRenderedBoundaryId=n.route.id),p.createElement(Io.Provider,{value:t},r)}function Wb(e,t,n,r){var o;if(t===void 0&&(t=[]),n===void 0&&(n=null),r===void 0&&(r=null),e==null){var i;if(!n)return null;if(n.errors)e=n.matches;else if((i=r)!=null&&i.v7_partialHydration&&t.length===0&&!n.initialized&&n.matches.length>0)e=n.matches;else return null}let s=e,a=(o=n)==null?void 0:o.errors;if(a!=null){let d=s.findIndex(c=>c.route.id&&(a==null?void 0:a[c.route.id])!==void 0);d>=0||_e(!1),s=s.slice(0,Math.min(s.length,d+1))}let l=!1,u=-1;if(n&&r&&r.v7_partialHydration)for(let d=0;d<s.length;d++){let c=s[d];if((c.route.HydrateFallback||c.route.hydrateFallbackElement)&&(u=d),c.route.id){let{loaderData:h,errors:f}=n,S=c.route.loader&&h[c.route.id]===void 0&&(!f||f[c.route.id]===void 0);if(c.route.lazy||S){l=!0,u>=0?s=s.slice(0,u+1):s=[s[0]];break}}}return s.reduceRight((d,c,h)=>{let f,S=!1,m=null,x=null;n&&(f=a&&c.route.id?a[c.route.id]:void 0,m=c.route.errorElement||Bb,l&&(u<0&&h===0?(S=!0,x=null):u===h&&(S=!0,x=c.route.hydrateFallbackElement||null)));let g=t.concat(s.slice(0,h+1)),y=()=>{let w;return f?w=m:S?w=x:c.route.Component?w=p.createElement(c.route.Component,null):c.route.element?w=c.route.element:w=d,p.createElement(Vb,{match:c,routeContext:{outlet:d,matches:g,isDataRoute:n!=null},children:w})};return n&&(c.route.ErrorBoundary||c.route.errorElement||h===0)?p.createElement(Ub,{location:n.location,revalidation:n.revalidation,component:m,error:f,children:y(),routeContext:{outlet:null,matches:g,isDataRoute:!0}}):y()},null)}var Mg=function(e){return e.UseBlocker="useBlocker",e.UseRevalidator="useRevalidator",e.UseNavigateStable="useNavigate",e}(Mg||{}),va=function(e){return e.UseBlocker="useBlocker",e.UseLoaderData="useLoaderData",e.UseActionData="useActionData",e.UseRouteError="useRouteError",e.UseNavigation="useNavigation",e.UseRouteLoaderData="useRouteLoaderData",e.UseMatches="useMatches",e.UseRevalidator="useRevalidator",e.UseNavigateStable="useNavigate",e.UseRouteId="useRouteId",e}(va||{});function Hb(e){let t=p.useContext(pd);return t||_e(!1),t}function Kb(e){let t=p.useContext(Db);return t||_e(!1),t}function Qb(e){let t=p.useContext(Io);return t||_e(!1),t}function Ig(e){let t=Qb(),n=t.matches[t.matches.length-1];return n.route.id||_e(!1),n.route.id}function qb(){var e;let t=p.useContext(_g),n=Kb(va.UseRouteError),r=Ig(va.UseRouteError);return t!==void 0?t:(e=n.errors)==null?void 0:e[r]}function Gb(){let{router:e}=Hb(Mg.UseNavigateStable),t=Ig(va.UseNavigateStable),n=p.useRef(!1);return Ag(()=>{n.current=!0}),p.useCallback(function(o,i){i===void 0&&(i={}),n.current&&(typeof o=="number"?e.navigate(o):e.navigate(o,Ai({fromRouteId:t},i)))},[e,t])}function Yb(e,t){e==null||e.v7_startTransition,e==null||e.v7_relativeSplatPath}function Jo(e){_e(!1)}function Xb(e){let{basename:t="/",children:n=null,location:r,navigationType:o=Wn.Pop,navigator:i,static:s=!1,future:a}=e;Qa()&&_e(!1);let l=t.replace(/^\/*/,"/"),u=p.useMemo(()=>({basename:l,navigator:i,static:s,future:Ai({v7_relativeSplatPath:!1},a)}),[l,a,i,s]);typeof r=="string"&&(r=Mo(r));let{pathname:d="/",search:c="",hash:h="",state:f=null,key:S="default"}=r,m=p.useMemo(()=>{let x=Tg(d,l);return x==null?null:{location:{pathname:x,search:c,hash:h,state:f,key:S},navigationType:o}},[l,d,c,h,f,S,o]);return m==null?null:p.createElement(Ha.Provider,{value:u},p.createElement(Ka.Provider,{children:n,value:m}))}function Jb(e){let{children:t,location:n}=e;return Fb(Qu(t),n)}new Promise(()=>{});function Qu(e,t){t===void 0&&(t=[]);let n=[];return p.Children.forEach(e,(r,o)=>{if(!p.isValidElement(r))return;let i=[...t,o];if(r.type===p.Fragment){n.push.apply(n,Qu(r.props.children,i));return}r.type!==Jo&&_e(!1),!r.props.index||!r.props.children||_e(!1);let s={id:r.props.id||i.join("-"),caseSensitive:r.props.caseSensitive,element:r.props.element,Component:r.props.Component,index:r.props.index,path:r.props.path,loader:r.props.loader,action:r.props.action,errorElement:r.props.errorElement,ErrorBoundary:r.props.ErrorBoundary,hasErrorBoundary:r.props.ErrorBoundary!=null||r.props.errorElement!=null,shouldRevalidate:r.props.shouldRevalidate,handle:r.props.handle,lazy:r.props.lazy};r.props.children&&(s.children=Qu(r.props.children,i)),n.push(s)}),n}/**
- * React Router DOM v6.30.1
- *
- * Copyright (c) Remix Software Inc.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE.md file in the root directory of this source tree.
- *
- * @license MIT
- */const Zb="6";try{window.__reactRouterVersion=Zb}catch{}const ek="startTransition",Sp=rc[ek];function tk(e){let{basename:t,children:n,future:r,window:o}=e,i=p.useRef();i.current==null&&(i.current=ub({window:o,v5Compat:!0}));let s=i.current,[a,l]=p.useState({action:s.action,location:s.location}),{v7_startTransition:u}=r||{},d=p.useCallback(c=>{u&&Sp?Sp(()=>l(c)):l(c)},[l,u]);return p.useLayoutEffect(()=>s.listen(d),[s,d]),p.useEffect(()=>Yb(r),[r]),p.createElement(Xb,{basename:t,children:n,location:a.location,navigationType:a.action,navigator:s,future:r})}var Ep;(function(e){e.UseScrollRestoration="useScrollRestoration",e.UseSubmit="useSubmit",e.UseSubmitFetcher="useSubmitFetcher",e.UseFetcher="useFetcher",e.useViewTransitionState="useViewTransitionState"})(Ep||(Ep={}));var Cp;(function(e){e.UseFetcher="useFetcher",e.UseFetchers="useFetchers",e.UseScrollRestoration="useScrollRestoration"})(Cp||(Cp={}));const nk=Zc("inline-flex items-center justify-center gap-2 whitespace-nowrap rounded-md text-sm font-medium ring-offset-background transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring focus-visible:ring-offset-2 disabled:pointer-events-none disabled:opacity-50 [&_svg]:pointer-events-none [&_svg]:size-4 [&_svg]:shrink-0",{variants:{variant:{default:"bg-primary text-primary-foreground hover:bg-primary/90",destructive:"bg-destructive text-destructive-foreground hover:bg-destructive/90",outline:"border border-input bg-background hover:bg-accent hover:text-accent-foreground",secondary:"bg-secondary text-secondary-foreground hover:bg-secondary/80",ghost:"hover:bg-accent hover:text-accent-foreground",link:"text-primary underline-offset-4 hover:underline"},size:{default:"h-10 px-4 py-2",sm:"h-9 rounded-md px-3",lg:"h-11 rounded-md px-8",icon:"h-10 w-10"}},defaultVariants:{variant:"default",size:"default"}}),Ve=p.forwardRef(({className:e,variant:t,size:n,asChild:r=!1,...o},i)=>{const s=r?Lx:"button";return v.jsx(s,{className:Me(nk({variant:t,size:n,className:e})),ref:i,...o})});Ve.displayName="Button";const rk=()=>{const e=Og();return v.jsxs("div",{className:"min-h-screen bg-gradient-to-br from-background via-card to-muted overflow-hidden relative",children:[v.jsxs("div",{className:"absolute inset-0 overflow-hidden",children:[v.jsx("div",{className:"absolute top-20 left-10 w-72 h-72 bg-primary/10 rounded-full blur-3xl animate-pulse-soft"}),v.jsx("div",{className:"absolute bottom-20 right-10 w-96 h-96 bg-accent/10 rounded-full blur-3xl animate-pulse-soft",style:{animationDelay:"2s"}})]}),v.jsxs("div",{className:"relative z-10 flex flex-col items-center justify-center min-h-screen px-6 text-center",children:[v.jsx("div",{className:"mb-8 animate-float",children:v.jsxs("div",{className:"relative",children:[v.jsx(Kf,{className:"w-20 h-20 text-primary",strokeWidth:1.5}),v.jsx(Qf,{className:"w-12 h-12 text-accent absolute -bottom-2 -right-2 animate-pulse-soft",strokeWidth:1.5})]})}),v.jsxs("div",{className:"max-w-3xl animate-fade-in-up",children:[v.jsx("h1",{className:"text-5xl md:text-7xl font-bold mb-6 bg-gradient-to-r from-primary via-accent to-primary bg-clip-text text-transparent",children:"Be More Productive Now"}),v.jsx("p",{className:"text-xl md:text-2xl text-muted-foreground mb-12 max-w-2xl mx-auto leading-relaxed",children:"Harness the power of your brain waves with Muse 2. Let adaptive music guide you into deep focus and sustained productivity."}),v.jsx(Ve,{size:"lg",onClick:()=>e("/connect"),className:"px-10 py-6 text-lg rounded-full shadow-lg hover:shadow-glow transition-all duration-300 hover:scale-105",children:"Get Started"})]}),v.jsxs("div",{className:"mt-20 grid grid-cols-1 md:grid-cols-3 gap-8 max-w-4xl w-full",children:[v.jsxs("div",{className:"p-6 rounded-2xl bg-card/50 backdrop-blur-sm border border-border/50 hover:border-primary/50 transition-all duration-300",children:[v.jsx(Kf,{className:"w-10 h-10 text-primary mb-4 mx-auto",strokeWidth:1.5}),v.jsx("h3",{className:"font-semibold text-lg mb-2",children:"EEG Detection"}),v.jsx("p",{className:"text-sm text-muted-foreground",children:"Real-time brain activity monitoring"})]}),v.jsxs("div",{className:"p-6 rounded-2xl bg-card/50 backdrop-blur-sm border border-border/50 hover:border-primary/50 transition-all duration-300",children:[v.jsx(Qf,{className:"w-10 h-10 text-accent mb-4 mx-auto",strokeWidth:1.5}),v.jsx("h3",{className:"font-semibold text-lg mb-2",children:"Adaptive Music"}),v.jsx("p",{className:"text-sm text-muted-foreground",children:"Music that responds to your focus"})]}),v.jsxs("div",{className:"p-6 rounded-2xl bg-card/50 backdrop-blur-sm border border-border/50 hover:border-primary/50 transition-all duration-300",children:[v.jsx("div",{className:"w-10 h-10 rounded-full bg-gradient-to-br from-primary to-accent mb-4 mx-auto animate-scale-pulse"}),v.jsx("h3",{className:"font-semibold text-lg mb-2",children:"Flow State"}),v.jsx("p",{className:"text-sm text-muted-foreground",children:"Achieve peak performance effortlessly"})]})]})]})]})};var Ml="focusScope.autoFocusOnMount",Il="focusScope.autoFocusOnUnmount",bp={bubbles:!1,cancelable:!0},ok="FocusScope",Dg=p.forwardRef((e,t)=>{const{loop:n=!1,trapped:r=!1,onMountAutoFocus:o,onUnmountAutoFocus:i,...s}=e,[a,l]=p.useState(null),u=zt(o),d=zt(i),c=p.useRef(null),h=pe(t,m=>l(m)),f=p.useRef({paused:!1,pause(){this.paused=!0},resume(){this.paused=!1}}).current;p.useEffect(()=>{if(r){let m=function(w){if(f.paused||!a)return;const E=w.target;a.contains(E)?c.current=E:An(c.current,{select:!0})},x=function(w){if(f.paused||!a)return;const E=w.relatedTarget;E!==null&&(a.contains(E)||An(c.current,{select:!0}))},g=function(w){if(document.activeElement===document.body)for(const C of w)C.removedNodes.length>0&&An(a)};document.addEventListener("focusin",m),document.addEventListener("focusout",x);const y=new MutationObserver(g);return a&&y.observe(a,{childList:!0,subtree:!0}),()=>{document.removeEventListener("focusin",m),document.removeEventListener("focusout",x),y.disconnect()}}},[r,a,f.paused]),p.useEffect(()=>{if(a){Pp.add(f);const m=document.activeElement;if(!a.contains(m)){const g=new CustomEvent(Ml,bp);a.addEventListener(Ml,u),a.dispatchEvent(g),g.defaultPrevented||(ik(ck(Lg(a)),{select:!0}),document.activeElement===m&&An(a))}return()=>{a.removeEventListener(Ml,u),setTimeout(()=>{const g=new CustomEvent(Il,bp);a.addEventListener(Il,d),a.dispatchEvent(g),g.defaultPrevented||An(m??document.body,{select:!0}),a.removeEventListener(Il,d),Pp.remove(f)},0)}}},[a,u,d,f]);const S=p.useCallback(m=>{if(!n&&!r||f.paused)return;const x=m.key==="Tab"&&!m.altKey&&!m.ctrlKey&&!m.metaKey,g=document.activeElement;if(x&&g){const y=m.currentTarget,[w,E]=sk(y);w&&E?!m.shiftKey&&g===E?(m.preventDefault(),n&&An(w,{select:!0})):m.shiftKey&&g===w&&(m.preventDefault(),n&&An(E,{select:!0})):g===y&&m.preventDefault()}},[n,r,f.paused]);return v.jsx(ie.div,{tabIndex:-1,...s,ref:h,onKeyDown:S})});Dg.displayName=ok;function ik(e,{select:t=!1}={}){const n=document.activeElement;for(const r of e)if(An(r,{select:t}),document.activeElement!==n)return}function sk(e){const t=Lg(e),n=kp(t,e),r=kp(t.reverse(),e);return[n,r]}function Lg(e){const t=[],n=document.createTreeWalker(e,NodeFilter.SHOW_ELEMENT,{acceptNode:r=>{const o=r.tagName==="INPUT"&&r.type==="hidden";return r.disabled||r.hidden||o?NodeFilter.FILTER_SKIP:r.tabIndex>=0?NodeFilter.FILTER_ACCEPT:NodeFilter.FILTER_SKIP}});for(;n.nextNode();)t.push(n.currentNode);return t}function kp(e,t){for(const n of e)if(!ak(n,{upTo:t}))return n}function ak(e,{upTo:t}){if(getComputedStyle(e).visibility==="hidden")return!0;for(;e;){if(t!==void 0&&e===t)return!1;if(getComputedStyle(e).display==="none")return!0;e=e.parentElement}return!1}function lk(e){return e instanceof HTMLInputElement&&"select"in e}function An(e,{select:t=!1}={}){if(e&&e.focus){const n=document.activeElement;e.focus({preventScroll:!0}),e!==n&&lk(e)&&t&&e.select()}}var Pp=uk();function uk(){let e=[];return{add(t){const n=e[0];t!==n&&(n==null||n.pause()),e=Rp(e,t),e.unshift(t)},remove(t){var n;e=Rp(e,t),(n=e[0])==null||n.resume()}}}function Rp(e,t){const n=[...e],r=n.indexOf(t);return r!==-1&&n.splice(r,1),n}function ck(e){return e.filter(t=>t.tagName!=="A")}var Dl=0;function dk(){p.useEffect(()=>{const e=document.querySelectorAll("[data-radix-focus-guard]");return document.body.insertAdjacentElement("afterbegin",e[0]??Np()),document.body.insertAdjacentElement("beforeend",e[1]??Np()),Dl++,()=>{Dl===1&&document.querySelectorAll("[data-radix-focus-guard]").forEach(t=>t.remove()),Dl--}},[])}function Np(){const e=document.createElement("span");return e.setAttribute("data-radix-focus-guard",""),e.tabIndex=0,e.style.outline="none",e.style.opacity="0",e.style.position="fixed",e.style.pointerEvents="none",e}var Xt=function(){return Xt=Object.assign||function(t){for(var n,r=1,o=arguments.length;r<o;r++){n=arguments[r];for(var i in n)Object.prototype.hasOwnProperty.call(n,i)&&(t[i]=n[i])}return t},Xt.apply(this,arguments)};function Fg(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var o=0,r=Object.getOwnPropertySymbols(e);o<r.length;o++)t.indexOf(r[o])<0&&Object.prototype.propertyIsEnumerable.call(e,r[o])&&(n[r[o]]=e[r[o]]);return n}function fk(e,t,n){if(n||arguments.length===2)for(var r=0,o=t.length,i;r<o;r++)(i||!(r in t))&&(i||(i=Array.prototype.slice.call(t,0,r)),i[r]=t[r]);return e.concat(i||Array.prototype.slice.call(t))}var zs="right-scroll-bar-position",$s="width-before-scroll-bar",pk="with-scroll-bars-hidden",hk="--removed-body-scroll-bar-size";function Ll(e,t){return typeof e=="function"?e(t):e&&(e.current=t),e}function mk(e,t){var n=p.useState(function(){return{value:e,callback:t,facade:{get current(){return n.value},set current(r){var o=n.value;o!==r&&(n.value=r,n.callback(r,o))}}}})[0];return n.callback=t,n.facade}var vk=typeof window<"u"?p.useLayoutEffect:p.useEffect,Tp=new WeakMap;function gk(e,t){var n=mk(null,function(r){return e.forEach(function(o){return Ll(o,r)})});return vk(function(){var r=Tp.get(n);if(r){var o=new Set(r),i=new Set(e),s=n.current;o.forEach(function(a){i.has(a)||Ll(a,null)}),i.forEach(function(a){o.has(a)||Ll(a,s)})}Tp.set(n,e)},[e]),n}function yk(e){return e}function wk(e,t){t===void 0&&(t=yk);var n=[],r=!1,o={read:function(){if(r)throw new Error("Sidecar: could not `read` from an `assigned` medium. `read` could be used only with `useMedium`.");return n.length?n[n.length-1]:e},useMedium:function(i){var s=t(i,r);return n.push(s),function(){n=n.filter(function(a){return a!==s})}},assignSyncMedium:function(i){for(r=!0;n.length;){var s=n;n=[],s.forEach(i)}n={push:function(a){return i(a)},filter:function(){return n}}},assignMedium:function(i){r=!0;var s=[];if(n.length){var a=n;n=[],a.forEach(i),s=n}var l=function(){var d=s;s=[],d.forEach(i)},u=function(){return Promise.resolve().then(l)};u(),n={push:function(d){s.push(d),u()},filter:function(d){return s=s.filter(d),n}}}};return o}function xk(e){e===void 0&&(e={});var t=wk(null);return t.options=Xt({async:!0,ssr:!1},e),t}var zg=function(e){var t=e.sideCar,n=Fg(e,["sideCar"]);if(!t)throw new Error("Sidecar: please provide `sideCar` property to import the right car");var r=t.read();if(!r)throw new Error("Sidecar medium not found");return p.createElement(r,Xt({},n))};zg.isSideCarExport=!0;function Sk(e,t){return e.useMedium(t),zg}var $g=xk(),Fl=function(){},qa=p.forwardRef(function(e,t){var n=p.useRef(null),r=p.useState({onScrollCapture:Fl,onWheelCapture:Fl,onTouchMoveCapture:Fl}),o=r[0],i=r[1],s=e.forwardProps,a=e.children,l=e.className,u=e.removeScrollBar,d=e.enabled,c=e.shards,h=e.sideCar,f=e.noRelative,S=e.noIsolation,m=e.inert,x=e.allowPinchZoom,g=e.as,y=g===void 0?"div":g,w=e.gapMode,E=Fg(e,["forwardProps","children","className","removeScrollBar","enabled","shards","sideCar","noRelative","noIsolation","inert","allowPinchZoom","as","gapMode"]),C=h,b=gk([n,t]),k=Xt(Xt({},E),o);return p.createElement(p.Fragment,null,d&&p.createElement(C,{sideCar:$g,removeScrollBar:u,shards:c,noRelative:f,noIsolation:S,inert:m,setCallbacks:i,allowPinchZoom:!!x,lockRef:n,gapMode:w}),s?p.cloneElement(p.Children.only(a),Xt(Xt({},k),{ref:b})):p.createElement(y,Xt({},k,{className:l,ref:b}),a))});qa.defaultProps={enabled:!0,removeScrollBar:!0,inert:!1};qa.classNames={fullWidth:$s,zeroRight:zs};var Ek=function(){if(typeof __webpack_nonce__<"u")return __webpack_nonce__};function Ck(){if(!document)return null;var e=document.createElement("style");e.type="text/css";var t=Ek();return t&&e.setAttribute("nonce",t),e}function bk(e,t){e.styleSheet?e.styleSheet.cssText=t:e.appendChild(document.createTextNode(t))}function kk(e){var t=document.head||document.getElementsByTagName("head")[0];t.appendChild(e)}var Pk=function(){var e=0,t=null;return{add:function(n){e==0&&(t=Ck())&&(bk(t,n),kk(t)),e++},remove:function(){e--,!e&&t&&(t.parentNode&&t.parentNode.removeChild(t),t=null)}}},Rk=function(){var e=Pk();return function(t,n){p.useEffect(function(){return e.add(t),function(){e.remove()}},[t&&n])}},Bg=function(){var e=Rk(),t=function(n){var r=n.styles,o=n.dynamic;return e(r,o),null};return t},Nk={left:0,top:0,right:0,gap:0},zl=function(e){return parseInt(e||"",10)||0},Tk=function(e){var t=window.getComputedStyle(document.body),n=t[e==="padding"?"paddingLeft":"marginLeft"],r=t[e==="padding"?"paddingTop":"marginTop"],o=t[e==="padding"?"paddingRight":"marginRight"];return[zl(n),zl(r),zl(o)]},jk=function(e){if(e===void 0&&(e="margin"),typeof window>"u")return Nk;var t=Tk(e),n=document.documentElement.clientWidth,r=window.innerWidth;return{left:t[0],top:t[1],right:t[2],gap:Math.max(0,r-n+t[2]-t[0])}},_k=Bg(),uo="data-scroll-locked",Ak=function(e,t,n,r){var o=e.left,i=e.top,s=e.right,a=e.gap;return n===void 0&&(n="margin"),`
-  .`.concat(pk,` {
-   overflow: hidden `).concat(r,`;
-   padding-right: `).concat(a,"px ").concat(r,`;
-  }
-  body[`).concat(uo,`] {
-    overflow: hidden `).concat(r,`;
-    overscroll-behavior: contain;
-    `).concat([t&&"position: relative ".concat(r,";"),n==="margin"&&`
-    padding-left: `.concat(o,`px;
-    padding-top: `).concat(i,`px;
-    padding-right: `).concat(s,`px;
-    margin-left:0;
-    margin-top:0;
-    margin-right: `).concat(a,"px ").concat(r,`;
-    `),n==="padding"&&"padding-right: ".concat(a,"px ").concat(r,";")].filter(Boolean).join(""),`
-  }
-  
-  .`).concat(zs,` {
-    right: `).concat(a,"px ").concat(r,`;
-  }
-  
-  .`).concat($s,` {
-    margin-right: `).concat(a,"px ").concat(r,`;
-  }
-  
-  .`).concat(zs," .").concat(zs,` {
-    right: 0 `).concat(r,`;
-  }
-  
-  .`).concat($s," .").concat($s,` {
-    margin-right: 0 `).concat(r,`;
-  }
-  
-  body[`).concat(uo,`] {
-    `).concat(hk,": ").concat(a,`px;
-  }
-`)},jp=function(){var e=parseInt(document.body.getAttribute(uo)||"0",10);return isFinite(e)?e:0},Ok=function(){p.useEffect(function(){return document.body.setAttribute(uo,(jp()+1).toString()),function(){var e=jp()-1;e<=0?document.body.removeAttribute(uo):document.body.setAttribute(uo,e.toString())}},[])},Mk=function(e){var t=e.noRelative,n=e.noImportant,r=e.gapMode,o=r===void 0?"margin":r;Ok();var i=p.useMemo(function(){return jk(o)},[o]);return p.createElement(_k,{styles:Ak(i,!t,o,n?"":"!important")})},qu=!1;if(typeof window<"u")try{var ws=Object.defineProperty({},"passive",{get:function(){return qu=!0,!0}});window.addEventListener("test",ws,ws),window.removeEventListener("test",ws,ws)}catch{qu=!1}var $r=qu?{passive:!1}:!1,Ik=function(e){return e.tagName==="TEXTAREA"},Ug=function(e,t){if(!(e instanceof Element))return!1;var n=window.getComputedStyle(e);return n[t]!=="hidden"&&!(n.overflowY===n.overflowX&&!Ik(e)&&n[t]==="visible")},Dk=function(e){return Ug(e,"overflowY")},Lk=function(e){return Ug(e,"overflowX")},_p=function(e,t){var n=t.ownerDocument,r=t;do{typeof ShadowRoot<"u"&&r instanceof ShadowRoot&&(r=r.host);var o=Vg(e,r);if(o){var i=Wg(e,r),s=i[1],a=i[2];if(s>a)return!0}r=r.parentNode}while(r&&r!==n.body);return!1},Fk=function(e){var t=e.scrollTop,n=e.scrollHeight,r=e.clientHeight;return[t,n,r]},zk=function(e){var t=e.scrollLeft,n=e.scrollWidth,r=e.clientWidth;return[t,n,r]},Vg=function(e,t){return e==="v"?Dk(t):Lk(t)},Wg=function(e,t){return e==="v"?Fk(t):zk(t)},$k=function(e,t){return e==="h"&&t==="rtl"?-1:1},Bk=function(e,t,n,r,o){var i=$k(e,window.getComputedStyle(t).direction),s=i*r,a=n.target,l=t.contains(a),u=!1,d=s>0,c=0,h=0;do{if(!a)break;var f=Wg(e,a),S=f[0],m=f[1],x=f[2],g=m-x-i*S;(S||g)&&Vg(e,a)&&(c+=g,h+=S);var y=a.parentNode;a=y&&y.nodeType===Node.DOCUMENT_FRAGMENT_NODE?y.host:y}while(!l&&a!==document.body||l&&(t.contains(a)||t===a));return(d&&(Math.abs(c)<1||!o)||!d&&(Math.abs(h)<1||!o))&&(u=!0),u},xs=function(e){return"changedTouches"in e?[e.changedTouches[0].clientX,e.changedTouches[0].clientY]:[0,0]},Ap=function(e){return[e.deltaX,e.deltaY]},Op=function(e){return e&&"current"in e?e.current:e},Uk=function(e,t){return e[0]===t[0]&&e[1]===t[1]},Vk=function(e){return`
-  .block-interactivity-`.concat(e,` {pointer-events: none;}
-  .allow-interactivity-`).concat(e,` {pointer-events: all;}
-`)},Wk=0,Br=[];function Hk(e){var t=p.useRef([]),n=p.useRef([0,0]),r=p.useRef(),o=p.useState(Wk++)[0],i=p.useState(Bg)[0],s=p.useRef(e);p.useEffect(function(){s.current=e},[e]),p.useEffect(function(){if(e.inert){document.body.classList.add("block-interactivity-".concat(o));var m=fk([e.lockRef.current],(e.shards||[]).map(Op),!0).filter(Boolean);return m.forEach(function(x){return x.classList.add("allow-interactivity-".concat(o))}),function(){document.body.classList.remove("block-interactivity-".concat(o)),m.forEach(function(x){return x.classList.remove("allow-interactivity-".concat(o))})}}},[e.inert,e.lockRef.current,e.shards]);var a=p.useCallback(function(m,x){if("touches"in m&&m.touches.length===2||m.type==="wheel"&&m.ctrlKey)return!s.current.allowPinchZoom;var g=xs(m),y=n.current,w="deltaX"in m?m.deltaX:y[0]-g[0],E="deltaY"in m?m.deltaY:y[1]-g[1],C,b=m.target,k=Math.abs(w)>Math.abs(E)?"h":"v";if("touches"in m&&k==="h"&&b.type==="range")return!1;var P=_p(k,b);if(!P)return!0;if(P?C=k:(C=k==="v"?"h":"v",P=_p(k,b)),!P)return!1;if(!r.current&&"changedTouches"in m&&(w||E)&&(r.current=C),!C)return!0;var O=r.current||C;return Bk(O,x,m,O==="h"?w:E,!0)},[]),l=p.useCallback(function(m){var x=m;if(!(!Br.length||Br[Br.length-1]!==i)){var g="deltaY"in x?Ap(x):xs(x),y=t.current.filter(function(C){return C.name===x.type&&(C.target===x.target||x.target===C.shadowParent)&&Uk(C.delta,g)})[0];if(y&&y.should){x.cancelable&&x.preventDefault();return}if(!y){var w=(s.current.shards||[]).map(Op).filter(Boolean).filter(function(C){return C.contains(x.target)}),E=w.length>0?a(x,w[0]):!s.current.noIsolation;E&&x.cancelable&&x.preventDefault()}}},[]),u=p.useCallback(function(m,x,g,y){var w={name:m,delta:x,target:g,should:y,shadowParent:Kk(g)};t.current.push(w),setTimeout(function(){t.current=t.current.filter(function(E){return E!==w})},1)},[]),d=p.useCallback(function(m){n.current=xs(m),r.current=void 0},[]),c=p.useCallback(function(m){u(m.type,Ap(m),m.target,a(m,e.lockRef.current))},[]),h=p.useCallback(function(m){u(m.type,xs(m),m.target,a(m,e.lockRef.current))},[]);p.useEffect(function(){return Br.push(i),e.setCallbacks({onScrollCapture:c,onWheelCapture:c,onTouchMoveCapture:h}),document.addEventListener("wheel",l,$r),document.addEventListener("touchmove",l,$r),document.addEventListener("touchstart",d,$r),function(){Br=Br.filter(function(m){return m!==i}),document.removeEventListener("wheel",l,$r),document.removeEventListener("touchmove",l,$r),document.removeEventListener("touchstart",d,$r)}},[]);var f=e.removeScrollBar,S=e.inert;return p.createElement(p.Fragment,null,S?p.createElement(i,{styles:Vk(o)}):null,f?p.createElement(Mk,{noRelative:e.noRelative,gapMode:e.gapMode}):null)}function Kk(e){for(var t=null;e!==null;)e instanceof ShadowRoot&&(t=e.host,e=e.host),e=e.parentNode;return t}const Qk=Sk($g,Hk);var Hg=p.forwardRef(function(e,t){return p.createElement(qa,Xt({},e,{ref:t,sideCar:Qk}))});Hg.classNames=qa.classNames;var qk=function(e){if(typeof document>"u")return null;var t=Array.isArray(e)?e[0]:e;return t.ownerDocument.body},Ur=new WeakMap,Ss=new WeakMap,Es={},$l=0,Kg=function(e){return e&&(e.host||Kg(e.parentNode))},Gk=function(e,t){return t.map(function(n){if(e.contains(n))return n;var r=Kg(n);return r&&e.contains(r)?r:(console.error("aria-hidden",n,"in not contained inside",e,". Doing nothing"),null)}).filter(function(n){return!!n})},Yk=function(e,t,n,r){var o=Gk(t,Array.isArray(e)?e:[e]);Es[n]||(Es[n]=new WeakMap);var i=Es[n],s=[],a=new Set,l=new Set(o),u=function(c){!c||a.has(c)||(a.add(c),u(c.parentNode))};o.forEach(u);var d=function(c){!c||l.has(c)||Array.prototype.forEach.call(c.children,function(h){if(a.has(h))d(h);else try{var f=h.getAttribute(r),S=f!==null&&f!=="false",m=(Ur.get(h)||0)+1,x=(i.get(h)||0)+1;Ur.set(h,m),i.set(h,x),s.push(h),m===1&&S&&Ss.set(h,!0),x===1&&h.setAttribute(n,"true"),S||h.setAttribute(r,"true")}catch(g){console.error("aria-hidden: cannot operate on ",h,g)}})};return d(t),a.clear(),$l++,function(){s.forEach(function(c){var h=Ur.get(c)-1,f=i.get(c)-1;Ur.set(c,h),i.set(c,f),h||(Ss.has(c)||c.removeAttribute(r),Ss.delete(c)),f||c.removeAttribute(n)}),$l--,$l||(Ur=new WeakMap,Ur=new WeakMap,Ss=new WeakMap,Es={})}},Xk=function(e,t,n){n===void 0&&(n="data-aria-hidden");var r=Array.from(Array.isArray(e)?e:[e]),o=qk(e);return o?(r.push.apply(r,Array.from(o.querySelectorAll("[aria-live]"))),Yk(r,o,n,"aria-hidden")):function(){return null}},Ga="Dialog",[Qg,vR]=En(Ga),[Jk,Ut]=Qg(Ga),qg=e=>{const{__scopeDialog:t,children:n,open:r,defaultOpen:o,onOpenChange:i,modal:s=!0}=e,a=p.useRef(null),l=p.useRef(null),[u,d]=Wi({prop:r,defaultProp:o??!1,onChange:i,caller:Ga});return v.jsx(Jk,{scope:t,triggerRef:a,contentRef:l,contentId:Ls(),titleId:Ls(),descriptionId:Ls(),open:u,onOpenChange:d,onOpenToggle:p.useCallback(()=>d(c=>!c),[d]),modal:s,children:n})};qg.displayName=Ga;var Gg="DialogTrigger",Zk=p.forwardRef((e,t)=>{const{__scopeDialog:n,...r}=e,o=Ut(Gg,n),i=pe(t,o.triggerRef);return v.jsx(ie.button,{type:"button","aria-haspopup":"dialog","aria-expanded":o.open,"aria-controls":o.contentId,"data-state":gd(o.open),...r,ref:i,onClick:Z(e.onClick,o.onOpenToggle)})});Zk.displayName=Gg;var md="DialogPortal",[eP,Yg]=Qg(md,{forceMount:void 0}),Xg=e=>{const{__scopeDialog:t,forceMount:n,children:r,container:o}=e,i=Ut(md,t);return v.jsx(eP,{scope:t,forceMount:n,children:p.Children.map(r,s=>v.jsx(Ar,{present:n||i.open,children:v.jsx(Gc,{asChild:!0,container:o,children:s})}))})};Xg.displayName=md;var ga="DialogOverlay",Jg=p.forwardRef((e,t)=>{const n=Yg(ga,e.__scopeDialog),{forceMount:r=n.forceMount,...o}=e,i=Ut(ga,e.__scopeDialog);return i.modal?v.jsx(Ar,{present:r||i.open,children:v.jsx(nP,{...o,ref:t})}):null});Jg.displayName=ga;var tP=Pi("DialogOverlay.RemoveScroll"),nP=p.forwardRef((e,t)=>{const{__scopeDialog:n,...r}=e,o=Ut(ga,n);return v.jsx(Hg,{as:tP,allowPinchZoom:!0,shards:[o.contentRef],children:v.jsx(ie.div,{"data-state":gd(o.open),...r,ref:t,style:{pointerEvents:"auto",...r.style}})})}),Tr="DialogContent",Zg=p.forwardRef((e,t)=>{const n=Yg(Tr,e.__scopeDialog),{forceMount:r=n.forceMount,...o}=e,i=Ut(Tr,e.__scopeDialog);return v.jsx(Ar,{present:r||i.open,children:i.modal?v.jsx(rP,{...o,ref:t}):v.jsx(oP,{...o,ref:t})})});Zg.displayName=Tr;var rP=p.forwardRef((e,t)=>{const n=Ut(Tr,e.__scopeDialog),r=p.useRef(null),o=pe(t,n.contentRef,r);return p.useEffect(()=>{const i=r.current;if(i)return Xk(i)},[]),v.jsx(ey,{...e,ref:o,trapFocus:n.open,disableOutsidePointerEvents:!0,onCloseAutoFocus:Z(e.onCloseAutoFocus,i=>{var s;i.preventDefault(),(s=n.triggerRef.current)==null||s.focus()}),onPointerDownOutside:Z(e.onPointerDownOutside,i=>{const s=i.detail.originalEvent,a=s.button===0&&s.ctrlKey===!0;(s.button===2||a)&&i.preventDefault()}),onFocusOutside:Z(e.onFocusOutside,i=>i.preventDefault())})}),oP=p.forwardRef((e,t)=>{const n=Ut(Tr,e.__scopeDialog),r=p.useRef(!1),o=p.useRef(!1);return v.jsx(ey,{...e,ref:t,trapFocus:!1,disableOutsidePointerEvents:!1,onCloseAutoFocus:i=>{var s,a;(s=e.onCloseAutoFocus)==null||s.call(e,i),i.defaultPrevented||(r.current||(a=n.triggerRef.current)==null||a.focus(),i.preventDefault()),r.current=!1,o.current=!1},onInteractOutside:i=>{var l,u;(l=e.onInteractOutside)==null||l.call(e,i),i.defaultPrevented||(r.current=!0,i.detail.originalEvent.type==="pointerdown"&&(o.current=!0));const s=i.target;((u=n.triggerRef.current)==null?void 0:u.contains(s))&&i.preventDefault(),i.detail.originalEvent.type==="focusin"&&o.current&&i.preventDefault()}})}),ey=p.forwardRef((e,t)=>{const{__scopeDialog:n,trapFocus:r,onOpenAutoFocus:o,onCloseAutoFocus:i,...s}=e,a=Ut(Tr,n),l=p.useRef(null),u=pe(t,l);return dk(),v.jsxs(v.Fragment,{children:[v.jsx(Dg,{asChild:!0,loop:!0,trapped:r,onMountAutoFocus:o,onUnmountAutoFocus:i,children:v.jsx(Ia,{role:"dialog",id:a.contentId,"aria-describedby":a.descriptionId,"aria-labelledby":a.titleId,"data-state":gd(a.open),...s,ref:u,onDismiss:()=>a.onOpenChange(!1)})}),v.jsxs(v.Fragment,{children:[v.jsx(iP,{titleId:a.titleId}),v.jsx(aP,{contentRef:l,descriptionId:a.descriptionId})]})]})}),vd="DialogTitle",ty=p.forwardRef((e,t)=>{const{__scopeDialog:n,...r}=e,o=Ut(vd,n);return v.jsx(ie.h2,{id:o.titleId,...r,ref:t})});ty.displayName=vd;var ny="DialogDescription",ry=p.forwardRef((e,t)=>{const{__scopeDialog:n,...r}=e,o=Ut(ny,n);return v.jsx(ie.p,{id:o.descriptionId,...r,ref:t})});ry.displayName=ny;var oy="DialogClose",iy=p.forwardRef((e,t)=>{const{__scopeDialog:n,...r}=e,o=Ut(oy,n);return v.jsx(ie.button,{type:"button",...r,ref:t,onClick:Z(e.onClick,()=>o.onOpenChange(!1))})});iy.displayName=oy;function gd(e){return e?"open":"closed"}var sy="DialogTitleWarning",[gR,ay]=Ix(sy,{contentName:Tr,titleName:vd,docsSlug:"dialog"}),iP=({titleId:e})=>{const t=ay(sy),n=`\`${t.contentName}\` requires a \`${t.titleName}\` for the component to be accessible for screen reader users.
-
-If you want to hide the \`${t.titleName}\`, you can wrap it with our VisuallyHidden component.
-
-For more information, see https://radix-ui.com/primitives/docs/components/${t.docsSlug}`;return p.useEffect(()=>{e&&(document.getElementById(e)||console.error(n))},[n,e]),null},sP="DialogDescriptionWarning",aP=({contentRef:e,descriptionId:t})=>{const r=`Warning: Missing \`Description\` or \`aria-describedby={undefined}\` for {${ay(sP).contentName}}.`;return p.useEffect(()=>{var i;const o=(i=e.current)==null?void 0:i.getAttribute("aria-describedby");t&&o&&(document.getElementById(t)||console.warn(r))},[r,e,t]),null},lP=qg,uP=Xg,ly=Jg,uy=Zg,cy=ty,dy=ry,cP=iy;const ya=lP,dP=uP,fy=p.forwardRef(({className:e,...t},n)=>v.jsx(ly,{ref:n,className:Me("fixed inset-0 z-50 bg-black/80 data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0",e),...t}));fy.displayName=ly.displayName;const Oi=p.forwardRef(({className:e,children:t,...n},r)=>v.jsxs(dP,{children:[v.jsx(fy,{}),v.jsxs(uy,{ref:r,className:Me("fixed left-[50%] top-[50%] z-50 grid w-full max-w-lg translate-x-[-50%] translate-y-[-50%] gap-4 border bg-background p-6 shadow-lg duration-200 data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 data-[state=closed]:slide-out-to-left-1/2 data-[state=closed]:slide-out-to-top-[48%] data-[state=open]:slide-in-from-left-1/2 data-[state=open]:slide-in-from-top-[48%] sm:rounded-lg",e),...n,children:[t,v.jsxs(cP,{className:"absolute right-4 top-4 rounded-sm opacity-70 ring-offset-background transition-opacity data-[state=open]:bg-accent data-[state=open]:text-muted-foreground hover:opacity-100 focus:outline-none focus:ring-2 focus:ring-ring focus:ring-offset-2 disabled:pointer-events-none",children:[v.jsx(_v,{className:"h-4 w-4"}),v.jsx("span",{className:"sr-only",children:"Close"})]})]})]}));Oi.displayName=uy.displayName;const Mi=({className:e,...t})=>v.jsx("div",{className:Me("flex flex-col space-y-1.5 text-center sm:text-left",e),...t});Mi.displayName="DialogHeader";const yd=({className:e,...t})=>v.jsx("div",{className:Me("flex flex-col-reverse sm:flex-row sm:justify-end sm:space-x-2",e),...t});yd.displayName="DialogFooter";const Ii=p.forwardRef(({className:e,...t},n)=>v.jsx(cy,{ref:n,className:Me("text-lg font-semibold leading-none tracking-tight",e),...t}));Ii.displayName=cy.displayName;const fP=p.forwardRef(({className:e,...t},n)=>v.jsx(dy,{ref:n,className:Me("text-sm text-muted-foreground",e),...t}));fP.displayName=dy.displayName;var pP=p.createContext(void 0);function wd(e){const t=p.useContext(pP);return e||t||"ltr"}var Bl="rovingFocusGroup.onEntryFocus",hP={bubbles:!1,cancelable:!0},Qi="RovingFocusGroup",[Gu,py,mP]=qc(Qi),[vP,hy]=En(Qi,[mP]),[gP,yP]=vP(Qi),my=p.forwardRef((e,t)=>v.jsx(Gu.Provider,{scope:e.__scopeRovingFocusGroup,children:v.jsx(Gu.Slot,{scope:e.__scopeRovingFocusGroup,children:v.jsx(wP,{...e,ref:t})})}));my.displayName=Qi;var wP=p.forwardRef((e,t)=>{const{__scopeRovingFocusGroup:n,orientation:r,loop:o=!1,dir:i,currentTabStopId:s,defaultCurrentTabStopId:a,onCurrentTabStopIdChange:l,onEntryFocus:u,preventScrollOnEntryFocus:d=!1,...c}=e,h=p.useRef(null),f=pe(t,h),S=wd(i),[m,x]=Wi({prop:s,defaultProp:a??null,onChange:l,caller:Qi}),[g,y]=p.useState(!1),w=zt(u),E=py(n),C=p.useRef(!1),[b,k]=p.useState(0);return p.useEffect(()=>{const P=h.current;if(P)return P.addEventListener(Bl,w),()=>P.removeEventListener(Bl,w)},[w]),v.jsx(gP,{scope:n,orientation:r,dir:S,loop:o,currentTabStopId:m,onItemFocus:p.useCallback(P=>x(P),[x]),onItemShiftTab:p.useCallback(()=>y(!0),[]),onFocusableItemAdd:p.useCallback(()=>k(P=>P+1),[]),onFocusableItemRemove:p.useCallback(()=>k(P=>P-1),[]),children:v.jsx(ie.div,{tabIndex:g||b===0?-1:0,"data-orientation":r,...c,ref:f,style:{outline:"none",...e.style},onMouseDown:Z(e.onMouseDown,()=>{C.current=!0}),onFocus:Z(e.onFocus,P=>{const O=!C.current;if(P.target===P.currentTarget&&O&&!g){const _=new CustomEvent(Bl,hP);if(P.currentTarget.dispatchEvent(_),!_.defaultPrevented){const z=E().filter(L=>L.focusable),I=z.find(L=>L.active),D=z.find(L=>L.id===m),B=[I,D,...z].filter(Boolean).map(L=>L.ref.current);yy(B,d)}}C.current=!1}),onBlur:Z(e.onBlur,()=>y(!1))})})}),vy="RovingFocusGroupItem",gy=p.forwardRef((e,t)=>{const{__scopeRovingFocusGroup:n,focusable:r=!0,active:o=!1,tabStopId:i,children:s,...a}=e,l=Ls(),u=i||l,d=yP(vy,n),c=d.currentTabStopId===u,h=py(n),{onFocusableItemAdd:f,onFocusableItemRemove:S,currentTabStopId:m}=d;return p.useEffect(()=>{if(r)return f(),()=>S()},[r,f,S]),v.jsx(Gu.ItemSlot,{scope:n,id:u,focusable:r,active:o,children:v.jsx(ie.span,{tabIndex:c?0:-1,"data-orientation":d.orientation,...a,ref:t,onMouseDown:Z(e.onMouseDown,x=>{r?d.onItemFocus(u):x.preventDefault()}),onFocus:Z(e.onFocus,()=>d.onItemFocus(u)),onKeyDown:Z(e.onKeyDown,x=>{if(x.key==="Tab"&&x.shiftKey){d.onItemShiftTab();return}if(x.target!==x.currentTarget)return;const g=EP(x,d.orientation,d.dir);if(g!==void 0){if(x.metaKey||x.ctrlKey||x.altKey||x.shiftKey)return;x.preventDefault();let w=h().filter(E=>E.focusable).map(E=>E.ref.current);if(g==="last")w.reverse();else if(g==="prev"||g==="next"){g==="prev"&&w.reverse();const E=w.indexOf(x.currentTarget);w=d.loop?CP(w,E+1):w.slice(E+1)}setTimeout(()=>yy(w))}}),children:typeof s=="function"?s({isCurrentTabStop:c,hasTabStop:m!=null}):s})})});gy.displayName=vy;var xP={ArrowLeft:"prev",ArrowUp:"prev",ArrowRight:"next",ArrowDown:"next",PageUp:"first",Home:"first",PageDown:"last",End:"last"};function SP(e,t){return t!=="rtl"?e:e==="ArrowLeft"?"ArrowRight":e==="ArrowRight"?"ArrowLeft":e}function EP(e,t,n){const r=SP(e.key,n);if(!(t==="vertical"&&["ArrowLeft","ArrowRight"].includes(r))&&!(t==="horizontal"&&["ArrowUp","ArrowDown"].includes(r)))return xP[r]}function yy(e,t=!1){const n=document.activeElement;for(const r of e)if(r===n||(r.focus({preventScroll:t}),document.activeElement!==n))return}function CP(e,t){return e.map((n,r)=>e[(t+r)%e.length])}var bP=my,kP=gy;function wy(e){const t=p.useRef({value:e,previous:e});return p.useMemo(()=>(t.current.value!==e&&(t.current.previous=t.current.value,t.current.value=e),t.current.previous),[e])}var xd="Radio",[PP,xy]=En(xd),[RP,NP]=PP(xd),Sy=p.forwardRef((e,t)=>{const{__scopeRadio:n,name:r,checked:o=!1,required:i,disabled:s,value:a="on",onCheck:l,form:u,...d}=e,[c,h]=p.useState(null),f=pe(t,x=>h(x)),S=p.useRef(!1),m=c?u||!!c.closest("form"):!0;return v.jsxs(RP,{scope:n,checked:o,disabled:s,children:[v.jsx(ie.button,{type:"button",role:"radio","aria-checked":o,"data-state":ky(o),"data-disabled":s?"":void 0,disabled:s,value:a,...d,ref:f,onClick:Z(e.onClick,x=>{o||l==null||l(),m&&(S.current=x.isPropagationStopped(),S.current||x.stopPropagation())})}),m&&v.jsx(by,{control:c,bubbles:!S.current,name:r,value:a,checked:o,required:i,disabled:s,form:u,style:{transform:"translateX(-100%)"}})]})});Sy.displayName=xd;var Ey="RadioIndicator",Cy=p.forwardRef((e,t)=>{const{__scopeRadio:n,forceMount:r,...o}=e,i=NP(Ey,n);return v.jsx(Ar,{present:r||i.checked,children:v.jsx(ie.span,{"data-state":ky(i.checked),"data-disabled":i.disabled?"":void 0,...o,ref:t})})});Cy.displayName=Ey;var TP="RadioBubbleInput",by=p.forwardRef(({__scopeRadio:e,control:t,checked:n,bubbles:r=!0,...o},i)=>{const s=p.useRef(null),a=pe(s,i),l=wy(n),u=ld(t);return p.useEffect(()=>{const d=s.current;if(!d)return;const c=window.HTMLInputElement.prototype,f=Object.getOwnPropertyDescriptor(c,"checked").set;if(l!==n&&f){const S=new Event("click",{bubbles:r});f.call(d,n),d.dispatchEvent(S)}},[l,n,r]),v.jsx(ie.input,{type:"radio","aria-hidden":!0,defaultChecked:n,...o,tabIndex:-1,ref:a,style:{...o.style,...u,position:"absolute",pointerEvents:"none",opacity:0,margin:0}})});by.displayName=TP;function ky(e){return e?"checked":"unchecked"}var jP=["ArrowUp","ArrowDown","ArrowLeft","ArrowRight"],Ya="RadioGroup",[_P,yR]=En(Ya,[hy,xy]),Py=hy(),Ry=xy(),[AP,OP]=_P(Ya),Ny=p.forwardRef((e,t)=>{const{__scopeRadioGroup:n,name:r,defaultValue:o,value:i,required:s=!1,disabled:a=!1,orientation:l,dir:u,loop:d=!0,onValueChange:c,...h}=e,f=Py(n),S=wd(u),[m,x]=Wi({prop:i,defaultProp:o??null,onChange:c,caller:Ya});return v.jsx(AP,{scope:n,name:r,required:s,disabled:a,value:m,onValueChange:x,children:v.jsx(bP,{asChild:!0,...f,orientation:l,dir:S,loop:d,children:v.jsx(ie.div,{role:"radiogroup","aria-required":s,"aria-orientation":l,"data-disabled":a?"":void 0,dir:S,...h,ref:t})})})});Ny.displayName=Ya;var Ty="RadioGroupItem",jy=p.forwardRef((e,t)=>{const{__scopeRadioGroup:n,disabled:r,...o}=e,i=OP(Ty,n),s=i.disabled||r,a=Py(n),l=Ry(n),u=p.useRef(null),d=pe(t,u),c=i.value===o.value,h=p.useRef(!1);return p.useEffect(()=>{const f=m=>{jP.includes(m.key)&&(h.current=!0)},S=()=>h.current=!1;return document.addEventListener("keydown",f),document.addEventListener("keyup",S),()=>{document.removeEventListener("keydown",f),document.removeEventListener("keyup",S)}},[]),v.jsx(kP,{asChild:!0,...a,focusable:!s,active:c,children:v.jsx(Sy,{disabled:s,required:i.required,checked:c,...l,...o,name:i.name,ref:d,onCheck:()=>i.onValueChange(o.value),onKeyDown:Z(f=>{f.key==="Enter"&&f.preventDefault()}),onFocus:Z(o.onFocus,()=>{var f;h.current&&((f=u.current)==null||f.click())})})})});jy.displayName=Ty;var MP="RadioGroupIndicator",_y=p.forwardRef((e,t)=>{const{__scopeRadioGroup:n,...r}=e,o=Ry(n);return v.jsx(Cy,{...o,...r,ref:t})});_y.displayName=MP;var Ay=Ny,Oy=jy,IP=_y;const Sd=p.forwardRef(({className:e,...t},n)=>v.jsx(Ay,{className:Me("grid gap-2",e),...t,ref:n}));Sd.displayName=Ay.displayName;const Ed=p.forwardRef(({className:e,...t},n)=>v.jsx(Oy,{ref:n,className:Me("aspect-square h-4 w-4 rounded-full border border-primary text-primary ring-offset-background focus:outline-none focus-visible:ring-2 focus-visible:ring-ring focus-visible:ring-offset-2 disabled:cursor-not-allowed disabled:opacity-50",e),...t,children:v.jsx(IP,{className:"flex items-center justify-center",children:v.jsx(A1,{className:"h-2.5 w-2.5 fill-current text-current"})})}));Ed.displayName=Oy.displayName;var DP="Label",My=p.forwardRef((e,t)=>v.jsx(ie.label,{...e,ref:t,onMouseDown:n=>{var o;n.target.closest("button, input, select, textarea")||((o=e.onMouseDown)==null||o.call(e,n),!n.defaultPrevented&&n.detail>1&&n.preventDefault())}}));My.displayName=DP;var Iy=My;const LP=Zc("text-sm font-medium leading-none peer-disabled:cursor-not-allowed peer-disabled:opacity-70"),Cd=p.forwardRef(({className:e,...t},n)=>v.jsx(Iy,{ref:n,className:Me(LP(),e),...t}));Cd.displayName=Iy.displayName;const ht="http://localhost:8000",Je={async getStatus(){const e=await fetch(`${ht}/status`);if(!e.ok)throw new Error("Failed to get status");return e.json()},async connect(e){const t=await fetch(`${ht}/connect`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e||{})});if(!t.ok){const n=await t.json();throw new Error(n.detail||"Failed to connect")}return t.json()},async disconnect(){const e=await fetch(`${ht}/disconnect`,{method:"POST"});if(!e.ok){const t=await e.json();throw new Error(t.detail||"Failed to disconnect")}return e.json()},async getFocus(){const e=await fetch(`${ht}/focus`);if(!e.ok)throw new Error("Failed to get focus");return e.json()},getWebSocketUrl(){const e=ht.startsWith("https")?"wss":"ws",t=ht.replace(/^https?:\/\//,"");return`${e}://${t}/ws`},getMusicWebSocketUrl(){const e=ht.startsWith("https")?"wss":"ws",t=ht.replace(/^https?:\/\//,"");return`${e}://${t}/ws/music`},async startCalibration(e){const t=await fetch(`${ht}/calibration/start`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({phase:e})});if(!t.ok)throw new Error("Failed to start calibration");return t.json()},async stopCalibration(e){const t=await fetch(`${ht}/calibration/stop`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({phase:e})});if(!t.ok)throw new Error("Failed to stop calibration");return t.json()},async commitCalibration(){const e=await fetch(`${ht}/calibration/commit`,{method:"POST"});if(!e.ok)throw new Error("Failed to commit calibration");return e.json()},async getCalibrationStatus(){const e=await fetch(`${ht}/calibration/status`);if(!e.ok)throw new Error("Failed to get calibration status");return e.json()}},FP=()=>{const[e,t]=p.useState(!1),[n,r]=p.useState(!1),[o,i]=p.useState(!1),[s,a]=p.useState(!1),[l,u]=p.useState("idle"),[d,c]=p.useState(60),[h,f]=p.useState(null),[S,m]=p.useState(!1),[x,g]=p.useState({}),y=Og();p.useEffect(()=>{(async()=>{try{(await Je.getStatus()).is_connected&&(r(!0),ke.info("Device already connected"))}catch{}})();try{const N=localStorage.getItem("musicProfileAnswers"),B=localStorage.getItem("musicProfileInfo"),L=localStorage.getItem("calibrationMidpoint");N&&(g(JSON.parse(N)||{}),m(!0))}catch{}},[]);const w=[{id:"q1",question:"Do you have a diagnosed learning disability?",options:["No, I do not have a learning disability","Yes, I have ADHD (Attention Deficit Hyperactivity Disorder)","Yes, I have Autism Spectrum Disorder (ASD)","Yes, I have both ADHD and Autism","Yes, I have a different learning disability","I am not sure / Prefer not to answer"]},{id:"q2",question:"If you have a learning disability, which specific type? (Select 'Not applicable' if you don't have one)",options:["Not applicable","Dyslexia","Dyscalculia","Dysgraphia","Auditory Processing Disorder","Visual Processing Disorder","Non-Verbal Learning Disability","Other learning disability"]},{id:"q3",question:"How often do you experience difficulty maintaining focus or attention on tasks?",options:["Rarely or never","Occasionally (a few times a week)","Frequently (daily or most days)","Constantly (throughout most of the day)"]},{id:"q4",question:"How often do you experience restlessness or difficulty sitting still?",options:["Rarely or never","Occasionally","Frequently","Constantly"]},{id:"q5",question:"How often do you have difficulty organizing tasks or managing time?",options:["Rarely or never","Occasionally","Frequently","Constantly"]},{id:"q6",question:"How sensitive are you to sensory stimuli (sounds, lights, textures, smells)?",options:["Not sensitive at all","Slightly sensitive","Moderately sensitive","Very sensitive (often overwhelming)"]},{id:"q7",question:"How often do you experience difficulty with social interactions or understanding social cues?",options:["Rarely or never","Occasionally","Frequently","Constantly"]},{id:"q8",question:"How important are routines and predictability in your daily life?",options:["Not important - I'm flexible with changes","Somewhat important","Very important - I prefer routines","Extremely important - changes are very difficult"]}],E=D=>{const N={};let B="none";const L=(H,U)=>(D[H]||"").toLowerCase().includes(U.toLowerCase());L("q1","both")||L("q1","autism")?B="sensory":L("q1","adhd")&&(B="adhd");const W=(D.q6||"").toLowerCase();W.includes("very")||W.includes("moderately")?(B=B==="adhd"?B:"sensory",N.brightness=.08,N.drone_cut=400,N.drone_gain=.045):W.includes("slightly")&&(N.brightness=.1);const R=(D.q8||"").toLowerCase();(R.includes("very")||R.includes("extremely"))&&(N.hold_bars=Math.max(N.hold_bars||0,40),N.epsilon=Math.min(N.epsilon??1,.06),N.tempo=Math.min(N.tempo||48,48),B==="none"&&(B="sensory")),["q3","q4","q5"].reduce((H,U)=>{const G=(D[U]||"").toLowerCase();return H+(G.includes("frequently")||G.includes("constantly")?1:0)},0)>=2&&(B="adhd",N.tempo=Math.max(N.tempo||0,52),N.hold_bars=Math.min(N.hold_bars||24,32),N.epsilon=Math.max(N.epsilon||.12,.1),N.brightness=Math.max(N.brightness||.16,.16));const F=(D.q2||"").toLowerCase();return F&&!F.includes("not applicable")&&(N.hold_bars=Math.max(N.hold_bars||0,36),N.epsilon=Math.min(N.epsilon??1,.08)),{profile:B,overrides:N}},C=async()=>{if(n){if(!!!localStorage.getItem("calibrationMidpoint")){a(!0);return}S?y("/session"):i(!0);return}t(!0),ke.info("Searching for Muse 2 device...");try{if(await Je.connect(),ke.success("Connected to Muse 2!"),r(!0),!!!localStorage.getItem("calibrationMidpoint")){a(!0);return}if(!S){i(!0);return}y("/session")}catch(D){ke.error(D instanceof Error?D.message:"Failed to connect to device"),t(!1)}},b=(D,N)=>{g(B=>({...B,[D]:N}))},k=()=>{const D=E(x);try{localStorage.setItem("musicProfileAnswers",JSON.stringify(x)),localStorage.setItem("musicProfileInfo",JSON.stringify(D))}catch{}m(!0),i(!1),ke.success("Preferences saved. Starting your session."),y("/session")},P=(D,N)=>{c(D);const B=window.setInterval(()=>{c(L=>L<=1?(window.clearInterval(B),f(null),N(),0):L-1)},1e3);f(B)},O=async()=>{try{await Je.startCalibration("relax"),u("relax"),P(60,_)}catch{ke.error("Failed to start relax calibration")}},_=async()=>{try{await Je.stopCalibration("relax")}catch{}u("task"),c(60)},z=async()=>{try{await Je.startCalibration("task"),u("task"),P(60,I)}catch{ke.error("Failed to start task calibration")}},I=async()=>{try{await Je.stopCalibration("task")}catch{}try{const D=await Je.commitCalibration();localStorage.setItem("calibrationMidpoint",String(D.midpoint)),ke.success("Calibration complete"),u("done"),a(!1),S?y("/session"):i(!0)}catch{ke.error("Failed to finalize calibration")}};return v.jsxs("div",{className:"min-h-screen bg-gradient-to-br from-background via-card to-muted flex items-center justify-center px-6 relative overflow-hidden",children:[v.jsxs("div",{className:"absolute inset-0",children:[v.jsx("div",{className:"absolute top-1/4 left-1/4 w-64 h-64 bg-primary/20 rounded-full blur-3xl animate-pulse-soft"}),v.jsx("div",{className:"absolute bottom-1/4 right-1/4 w-80 h-80 bg-accent/20 rounded-full blur-3xl animate-pulse-soft",style:{animationDelay:"1.5s"}})]}),v.jsxs("div",{className:"relative z-10 text-center max-w-lg w-full",children:[v.jsx("div",{className:"mb-8 flex justify-center",children:v.jsx("div",{className:`relative ${e?"animate-scale-pulse":""}`,children:n?v.jsx(_1,{className:"w-24 h-24 text-primary",strokeWidth:1.5}):v.jsxs(v.Fragment,{children:[v.jsx(j1,{className:"w-24 h-24 text-primary",strokeWidth:1.5}),e&&v.jsx("div",{className:"absolute inset-0 flex items-center justify-center",children:v.jsx("div",{className:"w-32 h-32 border-4 border-primary/30 border-t-primary rounded-full animate-spin"})})]})})}),v.jsx("h1",{className:"text-4xl md:text-5xl font-bold mb-6 bg-gradient-to-r from-primary to-accent bg-clip-text text-transparent",children:"Connect Your Muse 2"}),v.jsx("p",{className:"text-lg text-muted-foreground mb-10 leading-relaxed",children:n?"Device connected! Ready to start your focus session.":e?"Establishing connection with your device...":"Make sure your Muse 2 headband is powered on and nearby."}),v.jsxs("div",{className:"flex items-center justify-center gap-3",children:[v.jsx(Ve,{size:"lg",onClick:C,disabled:e,className:"px-10 py-6 text-lg rounded-full shadow-lg hover:shadow-glow transition-all duration-300 hover:scale-105 disabled:opacity-50 disabled:cursor-not-allowed",children:e?v.jsxs(v.Fragment,{children:[v.jsx(O1,{className:"mr-2 h-5 w-5 animate-spin"}),"Connecting..."]}):n?S?"Start Session":"Continue to Preferences":"Connect Device"}),n&&v.jsx(Ve,{variant:"outline",onClick:()=>{try{h&&(window.clearInterval(h),f(null))}catch{}u("idle"),c(60),a(!0),ke.info("Recalibration will re-learn your neutral focus point.")},disabled:e,className:"px-6 py-6 rounded-full",children:"Recalibrate"})]}),v.jsxs("div",{className:"mt-12 p-6 rounded-2xl bg-card/50 backdrop-blur-sm border border-border/50",children:[v.jsx("h3",{className:"font-semibold mb-3",children:"Connection Tips"}),v.jsxs("ul",{className:"text-sm text-muted-foreground space-y-2 text-left",children:[v.jsxs("li",{className:"flex items-start",children:[v.jsx("span",{className:"text-primary mr-2",children:"•"}),v.jsx("span",{children:"Ensure Bluetooth is enabled on your device"})]}),v.jsxs("li",{className:"flex items-start",children:[v.jsx("span",{className:"text-primary mr-2",children:"•"}),v.jsx("span",{children:"Place the Muse 2 headband on your forehead"})]}),v.jsxs("li",{className:"flex items-start",children:[v.jsx("span",{className:"text-primary mr-2",children:"•"}),v.jsx("span",{children:"Keep the headband within 10 feet of your device"})]})]})]})]}),v.jsx(ya,{open:s,onOpenChange:a,children:v.jsxs(Oi,{children:[v.jsx(Mi,{children:v.jsx(Ii,{children:"Calibrate Neutral Focus"})}),l==="idle"&&v.jsxs("div",{className:"space-y-4",children:[v.jsx("p",{className:"text-sm text-muted-foreground",children:"We’ll measure your baseline in two 1-minute steps:"}),v.jsxs("ol",{className:"list-decimal pl-6 text-sm text-muted-foreground space-y-1",children:[v.jsx("li",{children:"Relaxation: close your eyes and breathe slowly."}),v.jsx("li",{children:"Mental math: solve simple problems to engage focus."})]}),v.jsx("div",{className:"flex justify-end",children:v.jsx(Ve,{onClick:O,children:"Start Relaxation"})})]}),l==="relax"&&v.jsxs("div",{className:"space-y-4",children:[v.jsx("p",{className:"text-sm",children:"Relax, breathe slowly. Recording baseline..."}),v.jsxs("div",{className:"text-2xl font-semibold",children:[d,"s"]})]}),l==="task"&&v.jsxs("div",{className:"space-y-4",children:[v.jsx("p",{className:"text-sm",children:"Mental math: solve in your head. Recording focus..."}),v.jsx(zP,{seconds:d,onStart:z})]})]})}),v.jsx(ya,{open:o,onOpenChange:i,children:v.jsxs(Oi,{children:[v.jsx(Mi,{children:v.jsx(Ii,{children:"Personalize Your Audio"})}),v.jsx("div",{className:"space-y-6 max-h-[60vh] overflow-auto pr-2",children:w.map(D=>v.jsxs("div",{children:[v.jsx("div",{className:"mb-2 font-medium",children:D.question}),v.jsx(Sd,{value:x[D.id]||"",onValueChange:N=>b(D.id,N),className:"space-y-2",children:D.options.map((N,B)=>{const L=`${D.id}-${B}`;return v.jsxs("div",{className:"flex items-center space-x-2",children:[v.jsx(Ed,{id:L,value:N}),v.jsx(Cd,{htmlFor:L,className:"cursor-pointer",children:N})]},L)})})]},D.id))}),v.jsx(yd,{children:v.jsx(Ve,{onClick:k,children:"Save & Start Session"})})]})})]})},zP=({seconds:e,onStart:t})=>{const[n,r]=p.useState(!1),[o,i]=p.useState(0),[s,a]=p.useState(0),[l,u]=p.useState("+"),[d,c]=p.useState("");p.useEffect(()=>{n&&e===60&&h()},[n]);const h=()=>{const S=Math.floor(10+Math.random()*90),m=Math.floor(10+Math.random()*90),x=["+","-"];u(x[Math.floor(Math.random()*x.length)]),i(S),a(m),c("")},f=()=>{h()};return n?v.jsxs("div",{className:"space-y-3",children:[v.jsxs("div",{className:"text-2xl font-semibold",children:[e,"s"]}),v.jsxs("div",{className:"text-xl",children:[o," ",l," ",s," = ?"]}),v.jsxs("div",{className:"flex gap-2",children:[v.jsx("input",{className:"border rounded px-3 py-2 w-32 bg-background",value:d,onChange:S=>c(S.target.value),onKeyDown:S=>{S.key==="Enter"&&f()}}),v.jsx(Ve,{onClick:f,children:"Next"})]})]}):v.jsx(Ve,{onClick:()=>{r(!0),t()},children:"Start Task"})},$P=()=>{const e=p.useRef(null);return p.useEffect(()=>{const t=e.current;if(!t)return;const n=t.getContext("2d");if(!n)return;const r=()=>{t.width=t.offsetWidth,t.height=t.offsetHeight};r(),window.addEventListener("resize",r);let o=0;const i=[{amplitude:30,frequency:.02,speed:.03,color:"185, 70%, 50%"},{amplitude:25,frequency:.025,speed:.025,color:"170, 60%, 55%"},{amplitude:20,frequency:.03,speed:.02,color:"195, 60%, 65%"}],s=()=>{n.clearRect(0,0,t.width,t.height);const a=t.height/2;i.forEach((l,u)=>{n.beginPath(),n.moveTo(0,a);for(let c=0;c<t.width;c++){const h=a+Math.sin(c*l.frequency+o*l.speed)*l.amplitude+Math.sin(c*l.frequency*2+o*l.speed*1.5)*(l.amplitude/2);n.lineTo(c,h)}const d=n.createLinearGradient(0,0,t.width,0);d.addColorStop(0,`hsla(${l.color}, 0.1)`),d.addColorStop(.5,`hsla(${l.color}, 0.6)`),d.addColorStop(1,`hsla(${l.color}, 0.1)`),n.strokeStyle=d,n.lineWidth=3,n.lineCap="round",n.stroke()}),o+=1,requestAnimationFrame(s)};return s(),()=>{window.removeEventListener("resize",r)}},[]),v.jsx("canvas",{ref:e,className:"w-full h-64 md:h-96",style:{filter:"blur(0.5px)"}})};function Dy(e,[t,n]){return Math.min(n,Math.max(t,e))}var Ly=["PageUp","PageDown"],Fy=["ArrowUp","ArrowDown","ArrowLeft","ArrowRight"],zy={"from-left":["Home","PageDown","ArrowDown","ArrowLeft"],"from-right":["Home","PageDown","ArrowDown","ArrowRight"],"from-bottom":["Home","PageDown","ArrowDown","ArrowLeft"],"from-top":["Home","PageDown","ArrowUp","ArrowLeft"]},Do="Slider",[Yu,BP,UP]=qc(Do),[$y,wR]=En(Do,[UP]),[VP,Xa]=$y(Do),By=p.forwardRef((e,t)=>{const{name:n,min:r=0,max:o=100,step:i=1,orientation:s="horizontal",disabled:a=!1,minStepsBetweenThumbs:l=0,defaultValue:u=[r],value:d,onValueChange:c=()=>{},onValueCommit:h=()=>{},inverted:f=!1,form:S,...m}=e,x=p.useRef(new Set),g=p.useRef(0),w=s==="horizontal"?WP:HP,[E=[],C]=Wi({prop:d,defaultProp:u,onChange:z=>{var D;(D=[...x.current][g.current])==null||D.focus(),c(z)}}),b=p.useRef(E);function k(z){const I=YP(E,z);_(z,I)}function P(z){_(z,g.current)}function O(){const z=b.current[g.current];E[g.current]!==z&&h(E)}function _(z,I,{commit:D}={commit:!1}){const N=eR(i),B=tR(Math.round((z-r)/i)*i+r,N),L=Dy(B,[r,o]);C((W=[])=>{const R=qP(W,L,I);if(ZP(R,l*i)){g.current=R.indexOf(L);const j=String(R)!==String(W);return j&&D&&h(R),j?R:W}else return W})}return v.jsx(VP,{scope:e.__scopeSlider,name:n,disabled:a,min:r,max:o,valueIndexToChangeRef:g,thumbs:x.current,values:E,orientation:s,form:S,children:v.jsx(Yu.Provider,{scope:e.__scopeSlider,children:v.jsx(Yu.Slot,{scope:e.__scopeSlider,children:v.jsx(w,{"aria-disabled":a,"data-disabled":a?"":void 0,...m,ref:t,onPointerDown:Z(m.onPointerDown,()=>{a||(b.current=E)}),min:r,max:o,inverted:f,onSlideStart:a?void 0:k,onSlideMove:a?void 0:P,onSlideEnd:a?void 0:O,onHomeKeyDown:()=>!a&&_(r,0,{commit:!0}),onEndKeyDown:()=>!a&&_(o,E.length-1,{commit:!0}),onStepKeyDown:({event:z,direction:I})=>{if(!a){const B=Ly.includes(z.key)||z.shiftKey&&Fy.includes(z.key)?10:1,L=g.current,W=E[L],R=i*B*I;_(W+R,L,{commit:!0})}}})})})})});By.displayName=Do;var[Uy,Vy]=$y(Do,{startEdge:"left",endEdge:"right",size:"width",direction:1}),WP=p.forwardRef((e,t)=>{const{min:n,max:r,dir:o,inverted:i,onSlideStart:s,onSlideMove:a,onSlideEnd:l,onStepKeyDown:u,...d}=e,[c,h]=p.useState(null),f=pe(t,w=>h(w)),S=p.useRef(void 0),m=wd(o),x=m==="ltr",g=x&&!i||!x&&i;function y(w){const E=S.current||c.getBoundingClientRect(),C=[0,E.width],k=bd(C,g?[n,r]:[r,n]);return S.current=E,k(w-E.left)}return v.jsx(Uy,{scope:e.__scopeSlider,startEdge:g?"left":"right",endEdge:g?"right":"left",direction:g?1:-1,size:"width",children:v.jsx(Wy,{dir:m,"data-orientation":"horizontal",...d,ref:f,style:{...d.style,"--radix-slider-thumb-transform":"translateX(-50%)"},onSlideStart:w=>{const E=y(w.clientX);s==null||s(E)},onSlideMove:w=>{const E=y(w.clientX);a==null||a(E)},onSlideEnd:()=>{S.current=void 0,l==null||l()},onStepKeyDown:w=>{const C=zy[g?"from-left":"from-right"].includes(w.key);u==null||u({event:w,direction:C?-1:1})}})})}),HP=p.forwardRef((e,t)=>{const{min:n,max:r,inverted:o,onSlideStart:i,onSlideMove:s,onSlideEnd:a,onStepKeyDown:l,...u}=e,d=p.useRef(null),c=pe(t,d),h=p.useRef(void 0),f=!o;function S(m){const x=h.current||d.current.getBoundingClientRect(),g=[0,x.height],w=bd(g,f?[r,n]:[n,r]);return h.current=x,w(m-x.top)}return v.jsx(Uy,{scope:e.__scopeSlider,startEdge:f?"bottom":"top",endEdge:f?"top":"bottom",size:"height",direction:f?1:-1,children:v.jsx(Wy,{"data-orientation":"vertical",...u,ref:c,style:{...u.style,"--radix-slider-thumb-transform":"translateY(50%)"},onSlideStart:m=>{const x=S(m.clientY);i==null||i(x)},onSlideMove:m=>{const x=S(m.clientY);s==null||s(x)},onSlideEnd:()=>{h.current=void 0,a==null||a()},onStepKeyDown:m=>{const g=zy[f?"from-bottom":"from-top"].includes(m.key);l==null||l({event:m,direction:g?-1:1})}})})}),Wy=p.forwardRef((e,t)=>{const{__scopeSlider:n,onSlideStart:r,onSlideMove:o,onSlideEnd:i,onHomeKeyDown:s,onEndKeyDown:a,onStepKeyDown:l,...u}=e,d=Xa(Do,n);return v.jsx(ie.span,{...u,ref:t,onKeyDown:Z(e.onKeyDown,c=>{c.key==="Home"?(s(c),c.preventDefault()):c.key==="End"?(a(c),c.preventDefault()):Ly.concat(Fy).includes(c.key)&&(l(c),c.preventDefault())}),onPointerDown:Z(e.onPointerDown,c=>{const h=c.target;h.setPointerCapture(c.pointerId),c.preventDefault(),d.thumbs.has(h)?h.focus():r(c)}),onPointerMove:Z(e.onPointerMove,c=>{c.target.hasPointerCapture(c.pointerId)&&o(c)}),onPointerUp:Z(e.onPointerUp,c=>{const h=c.target;h.hasPointerCapture(c.pointerId)&&(h.releasePointerCapture(c.pointerId),i(c))})})}),Hy="SliderTrack",Ky=p.forwardRef((e,t)=>{const{__scopeSlider:n,...r}=e,o=Xa(Hy,n);return v.jsx(ie.span,{"data-disabled":o.disabled?"":void 0,"data-orientation":o.orientation,...r,ref:t})});Ky.displayName=Hy;var Xu="SliderRange",Qy=p.forwardRef((e,t)=>{const{__scopeSlider:n,...r}=e,o=Xa(Xu,n),i=Vy(Xu,n),s=p.useRef(null),a=pe(t,s),l=o.values.length,u=o.values.map(h=>Yy(h,o.min,o.max)),d=l>1?Math.min(...u):0,c=100-Math.max(...u);return v.jsx(ie.span,{"data-orientation":o.orientation,"data-disabled":o.disabled?"":void 0,...r,ref:a,style:{...e.style,[i.startEdge]:d+"%",[i.endEdge]:c+"%"}})});Qy.displayName=Xu;var Ju="SliderThumb",qy=p.forwardRef((e,t)=>{const n=BP(e.__scopeSlider),[r,o]=p.useState(null),i=pe(t,a=>o(a)),s=p.useMemo(()=>r?n().findIndex(a=>a.ref.current===r):-1,[n,r]);return v.jsx(KP,{...e,ref:i,index:s})}),KP=p.forwardRef((e,t)=>{const{__scopeSlider:n,index:r,name:o,...i}=e,s=Xa(Ju,n),a=Vy(Ju,n),[l,u]=p.useState(null),d=pe(t,y=>u(y)),c=l?s.form||!!l.closest("form"):!0,h=ld(l),f=s.values[r],S=f===void 0?0:Yy(f,s.min,s.max),m=GP(r,s.values.length),x=h==null?void 0:h[a.size],g=x?XP(x,S,a.direction):0;return p.useEffect(()=>{if(l)return s.thumbs.add(l),()=>{s.thumbs.delete(l)}},[l,s.thumbs]),v.jsxs("span",{style:{transform:"var(--radix-slider-thumb-transform)",position:"absolute",[a.startEdge]:`calc(${S}% + ${g}px)`},children:[v.jsx(Yu.ItemSlot,{scope:e.__scopeSlider,children:v.jsx(ie.span,{role:"slider","aria-label":e["aria-label"]||m,"aria-valuemin":s.min,"aria-valuenow":f,"aria-valuemax":s.max,"aria-orientation":s.orientation,"data-orientation":s.orientation,"data-disabled":s.disabled?"":void 0,tabIndex:s.disabled?void 0:0,...i,ref:d,style:f===void 0?{display:"none"}:e.style,onFocus:Z(e.onFocus,()=>{s.valueIndexToChangeRef.current=r})})}),c&&v.jsx(Gy,{name:o??(s.name?s.name+(s.values.length>1?"[]":""):void 0),form:s.form,value:f},r)]})});qy.displayName=Ju;var QP="RadioBubbleInput",Gy=p.forwardRef(({__scopeSlider:e,value:t,...n},r)=>{const o=p.useRef(null),i=pe(o,r),s=wy(t);return p.useEffect(()=>{const a=o.current;if(!a)return;const l=window.HTMLInputElement.prototype,d=Object.getOwnPropertyDescriptor(l,"value").set;if(s!==t&&d){const c=new Event("input",{bubbles:!0});d.call(a,t),a.dispatchEvent(c)}},[s,t]),v.jsx(ie.input,{style:{display:"none"},...n,ref:i,defaultValue:t})});Gy.displayName=QP;function qP(e=[],t,n){const r=[...e];return r[n]=t,r.sort((o,i)=>o-i)}function Yy(e,t,n){const i=100/(n-t)*(e-t);return Dy(i,[0,100])}function GP(e,t){return t>2?`Value ${e+1} of ${t}`:t===2?["Minimum","Maximum"][e]:void 0}function YP(e,t){if(e.length===1)return 0;const n=e.map(o=>Math.abs(o-t)),r=Math.min(...n);return n.indexOf(r)}function XP(e,t,n){const r=e/2,i=bd([0,50],[0,r]);return(r-i(t)*n)*n}function JP(e){return e.slice(0,-1).map((t,n)=>e[n+1]-t)}function ZP(e,t){if(t>0){const n=JP(e);return Math.min(...n)>=t}return!0}function bd(e,t){return n=>{if(e[0]===e[1]||t[0]===t[1])return t[0];const r=(t[1]-t[0])/(e[1]-e[0]);return t[0]+r*(n-e[0])}}function eR(e){return(String(e).split(".")[1]||"").length}function tR(e,t){const n=Math.pow(10,t);return Math.round(e*n)/n}var Xy=By,nR=Ky,rR=Qy,oR=qy;const Jy=p.forwardRef(({className:e,...t},n)=>v.jsxs(Xy,{ref:n,className:Me("relative flex w-full touch-none select-none items-center",e),...t,children:[v.jsx(nR,{className:"relative h-2 w-full grow overflow-hidden rounded-full bg-secondary",children:v.jsx(rR,{className:"absolute h-full bg-primary"})}),v.jsx(oR,{className:"block h-5 w-5 rounded-full border-2 border-primary bg-background ring-offset-background transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring focus-visible:ring-offset-2 disabled:pointer-events-none disabled:opacity-50"})]}));Jy.displayName=Xy.displayName;const iR=()=>{const[e,t]=p.useState(!1),[n,r]=p.useState([70]),[o,i]=p.useState(0),[s,a]=p.useState(0),[l,u]=p.useState(!1),[d,c]=p.useState(!1),[h,f]=p.useState(!1),[S,m]=p.useState(!1),[x,g]=p.useState(!1),[y,w]=p.useState({}),[E,C]=p.useState(null),b=p.useRef(null),k=p.useRef(null),P=p.useRef(null),O=p.useRef(null),_=p.useRef(null),[z,I]=p.useState(!1),[D,N]=p.useState(!1),[B,L]=p.useState("idle"),[W,R]=p.useState(0),[j,F]=p.useState(0),[H,U]=p.useState(""),[G,X]=p.useState(!1),[he,Se]=p.useState("idle"),[te,Et]=p.useState(60),[Ct,bt]=p.useState(null);p.useEffect(()=>{const K=async()=>{try{const V=await Je.getStatus();u(V.is_connected),c(V.is_streaming),typeof V.focus_percentage=="number"&&i(Math.max(0,Math.min(100,V.focus_percentage))),typeof V.alpha_beta_ratio=="number"&&a(V.alpha_beta_ratio)}catch{}};return K(),O.current=window.setInterval(K,1e3),()=>{O.current&&(window.clearInterval(O.current),O.current=null)}},[]),p.useEffect(()=>{try{const K=localStorage.getItem("musicProfileAnswers"),V=localStorage.getItem("musicProfileInfo");if(K){const ne=JSON.parse(K);w(ne||{}),m(!0)}if(V){const ne=JSON.parse(V);ne&&ne.profile&&C(ne)}}catch{}},[]);const Vt=[{id:"q1",question:"Do you have a diagnosed learning disability?",options:["No, I do not have a learning disability","Yes, I have ADHD (Attention Deficit Hyperactivity Disorder)","Yes, I have Autism Spectrum Disorder (ASD)","Yes, I have both ADHD and Autism","Yes, I have a different learning disability","I am not sure / Prefer not to answer"]},{id:"q2",question:"If you have a learning disability, which specific type? (Select 'Not applicable' if you don't have one)",options:["Not applicable","Dyslexia","Dyscalculia","Dysgraphia","Auditory Processing Disorder","Visual Processing Disorder","Non-Verbal Learning Disability","Other learning disability"]},{id:"q3",question:"How often do you experience difficulty maintaining focus or attention on tasks?",options:["Rarely or never","Occasionally (a few times a week)","Frequently (daily or most days)","Constantly (throughout most of the day)"]},{id:"q4",question:"How often do you experience restlessness or difficulty sitting still?",options:["Rarely or never","Occasionally","Frequently","Constantly"]},{id:"q5",question:"How often do you have difficulty organizing tasks or managing time?",options:["Rarely or never","Occasionally","Frequently","Constantly"]},{id:"q6",question:"How sensitive are you to sensory stimuli (sounds, lights, textures, smells)?",options:["Not sensitive at all","Slightly sensitive","Moderately sensitive","Very sensitive (often overwhelming)"]},{id:"q7",question:"How often do you experience difficulty with social interactions or understanding social cues?",options:["Rarely or never","Occasionally","Frequently","Constantly"]},{id:"q8",question:"How important are routines and predictability in your daily life?",options:["Not important - I'm flexible with changes","Somewhat important","Very important - I prefer routines","Extremely important - changes are very difficult"]}],Cn=K=>{const V={};let ne="none";const J=(ge,pt)=>(K[ge]||"").toLowerCase().includes(pt.toLowerCase());J("q1","both")||J("q1","autism")?ne="sensory":J("q1","adhd")&&(ne="adhd");const le=(K.q6||"").toLowerCase();le.includes("very")||le.includes("moderately")?(ne=ne==="adhd"?ne:"sensory",V.brightness=.08,V.drone_cut=400,V.drone_gain=.045):le.includes("slightly")&&(V.brightness=.1);const be=(K.q8||"").toLowerCase();(be.includes("very")||be.includes("extremely"))&&(V.hold_bars=Math.max(V.hold_bars||0,40),V.epsilon=Math.min(V.epsilon??1,.06),V.tempo=Math.min(V.tempo||48,48),ne==="none"&&(ne="sensory")),["q3","q4","q5"].reduce((ge,pt)=>{const Dr=(K[pt]||"").toLowerCase();return ge+(Dr.includes("frequently")||Dr.includes("constantly")?1:0)},0)>=2&&(ne="adhd",V.tempo=Math.max(V.tempo||0,52),V.hold_bars=Math.min(V.hold_bars||24,32),V.epsilon=Math.max(V.epsilon||.12,.1),V.brightness=Math.max(V.brightness||.16,.16));const Re=(K.q2||"").toLowerCase();return Re&&!Re.includes("not applicable")&&(V.hold_bars=Math.max(V.hold_bars||0,36),V.epsilon=Math.min(V.epsilon??1,.08)),{profile:ne,overrides:V}};p.useEffect(()=>{const K=async()=>{try{const ne=window.AudioContext||window.webkitAudioContext,J=new ne;b.current=J,await J.audioWorklet.addModule("/worklets/pcm-player.js"),await J.resume();const le=new AudioWorkletNode(J,"pcm-player",{numberOfOutputs:1});k.current=le;const be=J.createGain();be.gain.value=1,le.connect(be),be.connect(J.destination);const ft=async()=>{try{le.port.postMessage({type:"flush"})}catch{}try{const ge=J.currentTime;be.gain.setValueAtTime(be.gain.value,ge),be.gain.exponentialRampToValueAtTime(1e-4,ge+.2)}catch{}try{le.disconnect()}catch{}try{be.disconnect()}catch{}try{await J.close()}catch{}k.current=null,b.current=null},Re=new WebSocket(Je.getMusicWebSocketUrl());Re.binaryType="arraybuffer",P.current=Re,Re.onopen=()=>{try{Re.send(JSON.stringify({type:"focus",value:o})),Re.send(JSON.stringify({type:"volume",value:((n==null?void 0:n[0])??70)/100}));const ge=E||(()=>{try{const pt=localStorage.getItem("musicProfileInfo");return pt?JSON.parse(pt):null}catch{return null}})();ge&&ge.profile&&Re.send(JSON.stringify({type:"profile",profile:ge.profile,overrides:ge.overrides||{}}))}catch{}},Re.onmessage=ge=>{var pt;ge.data instanceof ArrayBuffer&&((pt=k.current)==null||pt.port.postMessage({type:"chunk",payload:ge.data},[ge.data]))},Re.onerror=()=>{ke.error("Music connection error.")},Re.onclose=()=>{ft(),t(!1),ke.info("Music connection closed.")},_.current=window.setInterval(()=>{var ge;try{(ge=P.current)==null||ge.send(JSON.stringify({type:"focus",value:o}))}catch{}},750),window.addEventListener("beforeunload",ft),le._fadeAndClose=ft}catch{ke.error("Failed to start adaptive music."),t(!1)}},V=()=>{var ne,J,le,be,ft,Re;try{(ne=P.current)==null||ne.send(JSON.stringify({type:"stop"}))}catch{}try{(J=P.current)==null||J.close()}catch{}P.current=null,_.current&&(window.clearInterval(_.current),_.current=null);try{(le=k.current)==null||le.port.postMessage({type:"flush"})}catch{}try{const ge=(be=k.current)==null?void 0:be._fadeAndClose;typeof ge=="function"&&ge()}catch{}try{(ft=k.current)==null||ft.disconnect()}catch{}k.current=null;try{(Re=b.current)==null||Re.close()}catch{}b.current=null,window.removeEventListener("beforeunload",()=>{})};return e?K():V(),()=>V()},[e]);const Wt=()=>t(K=>!K),Or=K=>{var V;r(K);try{(V=P.current)==null||V.send(JSON.stringify({type:"volume",value:K[0]/100}))}catch{}},Mr=(K,V)=>{Et(K);const ne=window.setInterval(()=>{Et(J=>J<=1?(window.clearInterval(ne),bt(null),V(),0):J-1)},1e3);bt(ne)},Ir=async()=>{try{await Je.startCalibration("relax"),Se("relax"),Mr(60,Lo)}catch{ke.error("Failed to start relax calibration")}},Lo=async()=>{try{await Je.stopCalibration("relax")}catch{}Se("task"),Et(60)},sr=async()=>{try{await Je.startCalibration("task"),Se("task"),Mr(60,bn)}catch{ke.error("Failed to start task calibration")}},bn=async()=>{try{await Je.stopCalibration("task")}catch{}try{const K=await Je.commitCalibration();localStorage.setItem("calibrationMidpoint",String(K.midpoint)),ke.success("Calibration complete"),Se("done"),X(!1)}catch{ke.error("Failed to finalize calibration")}},qi=(K,V)=>{w(ne=>({...ne,[K]:V}))},ar=()=>{const K=Cn(y);C(K),m(!0),f(!1);try{localStorage.setItem("musicProfileAnswers",JSON.stringify(y)),localStorage.setItem("musicProfileInfo",JSON.stringify(K))}catch{}try{P.current&&P.current.readyState===WebSocket.OPEN&&P.current.send(JSON.stringify({type:"profile",profile:K.profile,overrides:K.overrides||{}}))}catch{}x&&(g(!1),t(!0)),ke.success("Preferences saved. Tailoring music to you.")},Gi=async()=>{var K;try{if(!b.current){const le=window.AudioContext||window.webkitAudioContext,be=new le;b.current=be,await be.audioWorklet.addModule("/worklets/pcm-player.js"),await be.resume();const ft=new AudioWorkletNode(be,"pcm-player",{numberOfOutputs:1});ft.connect(be.destination),k.current=ft,I(!0),N(!0)}const V=b.current,ne=Math.floor(V.sampleRate*1),J=new Float32Array(ne);for(let le=0;le<ne;le++)J[le]=Math.sin(2*Math.PI*440*(le/V.sampleRate))*.2;(K=k.current)==null||K.port.postMessage({type:"chunk",payload:J.buffer},[J.buffer]),ke.success("Test tone sent")}catch(V){U(String((V==null?void 0:V.message)||V)),ke.error("Test tone failed")}};return v.jsxs("div",{className:"min-h-screen bg-gradient-to-br from-background via-card to-muted flex flex-col relative overflow-hidden",children:[v.jsxs("div",{className:"absolute inset-0 pointer-events-none",children:[v.jsx("div",{className:"absolute top-1/4 left-1/4 w-96 h-96 rounded-full blur-3xl transition-all duration-1000",style:{backgroundColor:`hsla(${o>70?"185, 70%, 50%":o>40?"170, 60%, 55%":"0, 70%, 60%"}, 0.15)`,transform:`scale(${.8+o/100*.4})`}}),v.jsx("div",{className:"absolute bottom-1/4 right-1/4 w-80 h-80 rounded-full blur-3xl transition-all duration-1000",style:{backgroundColor:`hsla(${o>70?"180, 70%, 55%":o>40?"160, 60%, 55%":"20, 80%, 55%"}, 0.12)`,transform:`scale(${.9+o/100*.3})`}})]}),v.jsxs("main",{className:"relative z-10 container mx-auto max-w-5xl px-4 py-10",children:[v.jsxs("header",{className:"flex items-center justify-between mb-6",children:[v.jsxs("div",{children:[v.jsx("h1",{className:"text-2xl font-semibold",children:"Focus Session"}),v.jsx("p",{className:"text-sm text-muted-foreground",children:l?d?"Muse connected · streaming":"Muse connected":"Muse disconnected"})]}),v.jsxs("div",{className:"flex items-center gap-3",children:[v.jsx(Ve,{size:"icon",variant:e?"secondary":"default",onClick:Wt,"aria-label":e?"Pause adaptive music":"Play adaptive music",children:e?v.jsx(M1,{className:"w-5 h-5"}):v.jsx(I1,{className:"w-5 h-5"})}),v.jsxs("div",{className:"flex items-center gap-2 ml-2",children:[v.jsx(D1,{className:"w-5 h-5 text-muted-foreground"}),v.jsx("div",{className:"w-40",children:v.jsx(Jy,{value:n,max:100,step:1,onValueChange:Or,"aria-label":"Volume"})})]}),v.jsx(Ve,{variant:"outline",onClick:()=>{try{Ct&&(window.clearInterval(Ct),bt(null))}catch{}Se("idle"),Et(60),X(!0),ke.info("Recalibration will re-learn your neutral focus point.")},children:"Recalibrate"})]})]}),v.jsxs("div",{className:"mb-4 flex items-center justify-between",children:[v.jsx("p",{className:"text-sm text-muted-foreground",children:S?"Preferences loaded. You can retake the quiz anytime.":"Please complete a short pre-session questionnaire to tailor the music."}),v.jsx(Ve,{variant:"outline",onClick:()=>f(!0),children:S?"Retake Questionnaire":"Start Questionnaire"})]}),v.jsxs("section",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[v.jsxs("div",{className:"rounded-2xl border bg-card p-6",children:[v.jsxs("div",{className:"flex items-baseline justify-between",children:[v.jsx("h2",{className:"text-lg font-medium",children:"Focus"}),v.jsxs("span",{className:"text-3xl font-semibold",children:[Math.round(o),"%"]})]}),v.jsxs("p",{className:"text-sm text-muted-foreground mt-1",children:["α/β ratio: ",s.toFixed(2)]}),v.jsx("div",{className:"mt-6",children:v.jsx($P,{focusLevel:o})}),v.jsx("p",{className:"mt-4 text-muted-foreground text-sm",children:e?"Music adapting to your focus level...":"Paused"})]}),v.jsxs("div",{className:"rounded-2xl border bg-card p-6",children:[v.jsx("h2",{className:"text-lg font-medium mb-3",children:"Adaptive Music"}),v.jsxs("ul",{className:"text-sm text-muted-foreground space-y-1",children:[v.jsx("li",{children:"• Infinite, seamless generation (low-latency streaming)"}),v.jsx("li",{children:"• RL agent keeps what improves focus, explores when it dips"})]})]})]}),v.jsxs("div",{className:"mt-8 mb-6 rounded-xl border bg-card p-4 text-sm",children:[v.jsx("div",{className:"font-medium mb-2",children:"Audio Debug"}),v.jsxs("div",{className:"grid grid-cols-2 md:grid-cols-4 gap-2",children:[v.jsxs("div",{children:["Audio ready: ",v.jsx("span",{className:"font-mono",children:String(z)})]}),v.jsxs("div",{children:["Worklet loaded: ",v.jsx("span",{className:"font-mono",children:String(D)})]}),v.jsxs("div",{children:["WS state: ",v.jsx("span",{className:"font-mono",children:B})]}),v.jsxs("div",{children:["Last chunk: ",v.jsxs("span",{className:"font-mono",children:[W," bytes"]})]}),v.jsxs("div",{children:["Max amp: ",v.jsx("span",{className:"font-mono",children:j.toFixed(5)})]}),v.jsx("div",{className:"col-span-2 md:col-span-4",children:H&&v.jsxs("span",{className:"text-red-500",children:["Error: ",H]})})]}),v.jsx("div",{className:"mt-3",children:v.jsx(Ve,{variant:"outline",onClick:Gi,children:"Play 1s Test Tone"})})]}),"        ",v.jsx(ya,{open:h,onOpenChange:f,children:v.jsxs(Oi,{children:[v.jsx(Mi,{children:v.jsx(Ii,{children:"Personalize Your Audio"})}),v.jsx("div",{className:"space-y-6 max-h-[60vh] overflow-auto pr-2",children:Vt.map(K=>v.jsxs("div",{children:[v.jsx("div",{className:"mb-2 font-medium",children:K.question}),v.jsx(Sd,{value:y[K.id]||"",onValueChange:V=>qi(K.id,V),className:"space-y-2",children:K.options.map((V,ne)=>{const J=`${K.id}-${ne}`;return v.jsxs("div",{className:"flex items-center space-x-2",children:[v.jsx(Ed,{id:J,value:V}),v.jsx(Cd,{htmlFor:J,className:"cursor-pointer",children:V})]},J)})})]},K.id))}),v.jsx(yd,{children:v.jsx(Ve,{onClick:ar,children:"Save Preferences"})})]})})]}),v.jsx(ya,{open:G,onOpenChange:X,children:v.jsxs(Oi,{children:[v.jsx(Mi,{children:v.jsx(Ii,{children:"Recalibrate Neutral Focus"})}),he==="idle"&&v.jsxs("div",{className:"space-y-4",children:[v.jsx("p",{className:"text-sm text-muted-foreground",children:"We’ll measure your baseline in two 1-minute steps:"}),v.jsxs("ol",{className:"list-decimal pl-6 text-sm text-muted-foreground space-y-1",children:[v.jsx("li",{children:"Relaxation: close your eyes and breathe slowly."}),v.jsx("li",{children:"Mental math: solve simple problems to engage focus."})]}),v.jsx("div",{className:"flex justify-end",children:v.jsx(Ve,{onClick:Ir,children:"Start Relaxation"})})]}),he==="relax"&&v.jsxs("div",{className:"space-y-4",children:[v.jsx("p",{className:"text-sm",children:"Relax, breathe slowly. Recording baseline..."}),v.jsxs("div",{className:"text-2xl font-semibold",children:[te,"s"]})]}),he==="task"&&v.jsxs("div",{className:"space-y-4",children:[v.jsx("p",{className:"text-sm",children:"Mental math: solve in your head. Recording focus..."}),v.jsx(sR,{seconds:te,onStart:sr})]})]})})]})},sR=({seconds:e,onStart:t})=>{const[n,r]=p.useState(!1),[o,i]=p.useState(0),[s,a]=p.useState(0),[l,u]=p.useState("+"),[d,c]=p.useState("");p.useEffect(()=>{n&&e===60&&h()},[n]);const h=()=>{const S=Math.floor(10+Math.random()*90),m=Math.floor(10+Math.random()*90),x=["+","-"];u(x[Math.floor(Math.random()*x.length)]),i(S),a(m),c("")},f=()=>{h()};return n?v.jsxs("div",{className:"space-y-3",children:[v.jsxs("div",{className:"text-2xl font-semibold",children:[e,"s"]}),v.jsxs("div",{className:"text-xl",children:[o," ",l," ",s," = ?"]}),v.jsxs("div",{className:"flex gap-2",children:[v.jsx("input",{className:"border rounded px-3 py-2 w-32 bg-background",value:d,onChange:S=>c(S.target.value),onKeyDown:S=>{S.key==="Enter"&&f()}}),v.jsx(Ve,{onClick:f,children:"Next"})]})]}):v.jsx(Ve,{onClick:()=>{r(!0),t()},children:"Start Task"})},aR=()=>{const e=hd();return p.useEffect(()=>{console.error("404 Error: User attempted to access non-existent route:",e.pathname)},[e.pathname]),v.jsx("div",{className:"flex min-h-screen items-center justify-center bg-gray-100",children:v.jsxs("div",{className:"text-center",children:[v.jsx("h1",{className:"mb-4 text-4xl font-bold",children:"404"}),v.jsx("p",{className:"mb-4 text-xl text-gray-600",children:"Oops! Page not found"}),v.jsx("a",{href:"/",className:"text-blue-500 underline hover:text-blue-700",children:"Return to Home"})]})})},lR=new sb,uR=()=>v.jsx(lb,{client:lR,children:v.jsxs(DC,{children:[v.jsx(yS,{}),v.jsx(YS,{}),v.jsx(tk,{children:v.jsxs(Jb,{children:[v.jsx(Jo,{path:"/",element:v.jsx(rk,{})}),v.jsx(Jo,{path:"/connect",element:v.jsx(FP,{})}),v.jsx(Jo,{path:"/session",element:v.jsx(iR,{})}),v.jsx(Jo,{path:"*",element:v.jsx(aR,{})})]})})]})});nv(document.getElementById("root")).render(v.jsx(uR,{}));
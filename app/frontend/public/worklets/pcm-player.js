@@ -16,7 +16,10 @@ class PCMPlayer extends AudioWorkletProcessor {
       if (msg.type === 'chunk') {
         let arr;
         if (msg.payload instanceof ArrayBuffer) {
-          arr = new Float32Array(msg.payload);
+          // wire format from /ws/music: little-endian int16 PCM
+          const pcm = new Int16Array(msg.payload);
+          arr = new Float32Array(pcm.length);
+          for (let k = 0; k < pcm.length; k++) arr[k] = pcm[k] / 32768;
         } else if (msg.payload instanceof Float32Array) {
           arr = msg.payload;
         } else return;
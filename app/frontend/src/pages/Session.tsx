@@ -479,7 +479,7 @@ const Session = () => {
       const n = Math.floor(ctx.sampleRate * 1.0);
       const buf = new Float32Array(n);
       for (let i = 0; i < n; i++) buf[i] = Math.sin(2 * Math.PI * 440 * (i / ctx.sampleRate)) * 0.2;
-      workletRef.current?.port.postMessage({ type: "chunk", payload: buf.buffer }, [buf.buffer]);
+      workletRef.current?.port.postMessage({ type: "chunk", payload: buf }, [buf.buffer]);
       toast.success("Test tone sent");
     } catch (e: any) {
       setLastError(String(e?.message || e));